@@ -0,0 +1,22 @@
+"""Timing and command line helpers shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def time_best(func: Callable[[], object], repeat: int) -> float:
+    """Best wall time in seconds of func over repeat runs."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def get_parser(description: str | None) -> argparse.ArgumentParser:
+    """Argument parser with the --repeat option common to all benchmarks."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repeats, the best time is reported.")
+    return parser
@@ -0,0 +1,52 @@
+"""Benchmarks comparing the batched lattice distance and neighbor kernels to
+calling the per-lattice functions in a loop.
+
+Usage:
+    python dev_scripts/benchmarks/benchmark_lattice.py [--n-problems 2000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from _utils import get_parser, time_best
+
+from pymatgen.core.lattice import Lattice, get_all_distances_batch, get_points_in_sphere_batch
+from pymatgen.util.coord import pbc_shortest_vectors, pbc_shortest_vectors_batch
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    parser = get_parser(__doc__)
+    parser.add_argument("--n-problems", type=int, default=2000, help="Number of independent problems.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'n_sites':>8} {'function':>28} {'loop (s)':>10} {'batch (s)':>10} {'speedup':>8}")
+    for n_sites in (4, 16, 64):
+        lattices = [Lattice(4 * np.eye(3) + rng.normal(scale=0.5, size=(3, 3))) for _ in range(args.n_problems)]
+        fcoords1 = [rng.random((n_sites, 3)) for _ in lattices]
+        fcoords2 = [rng.random((n_sites, 3)) for _ in lattices]
+        centers = [lattice.get_cartesian_coords(fc) for lattice, fc in zip(lattices, fcoords1, strict=True)]
+        problems = list(zip(lattices, fcoords1, fcoords2, centers, strict=True))
+
+        cases = {
+            "pbc_shortest_vectors": (
+                lambda: [pbc_shortest_vectors(lat, fc1, fc2) for lat, fc1, fc2, _ in problems],
+                lambda: pbc_shortest_vectors_batch(lattices, fcoords1, fcoords2),
+            ),
+            "get_all_distances": (
+                lambda: [lat.get_all_distances(fc1, fc2) for lat, fc1, fc2, _ in problems],
+                lambda: get_all_distances_batch(lattices, fcoords1, fcoords2),
+            ),
+            "get_points_in_sphere": (
+                lambda: [[lat.get_points_in_sphere(fc2, ctr, 3) for ctr in cts] for lat, _, fc2, cts in problems],
+                lambda: get_points_in_sphere_batch(lattices, fcoords2, centers, 3),
+            ),
+        }
+        for name, (loop, batch) in cases.items():
+            t_loop, t_batch = time_best(loop, args.repeat), time_best(batch, args.repeat)
+            print(f"{n_sites:>8} {name:>28} {t_loop:>10.3f} {t_batch:>10.3f} {t_loop / t_batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmarks comparing the binary serialization of array-heavy objects to the
+JSON path (as_dict with arrays as nested lists, encoded with MontyEncoder).
+
+Usage:
+    python dev_scripts/benchmarks/benchmark_serialization.py [--scale 1] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+from _utils import get_parser, time_best
+from monty.json import MontyDecoder, MontyEncoder
+
+from pymatgen.core import Lattice, Structure
+from pymatgen.core.trajectory import Trajectory
+from pymatgen.electronic_structure.bandstructure import BandStructureSymmLine
+from pymatgen.electronic_structure.core import Orbital, Spin
+from pymatgen.electronic_structure.dos import CompleteDos, Dos
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+from pymatgen.io.vasp.outputs import Chgcar
+from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
+from pymatgen.util.serialization import from_binary, to_binary
+
+
+def _get_structure(n_sites: int, rng: np.random.Generator) -> Structure:
+    """Random Fe-O structure with n_sites sites."""
+    species = ["Fe", "O"] * (n_sites // 2) + ["Fe"] * (n_sites % 2)
+    return Structure(Lattice.cubic(2.5 * n_sites ** (1 / 3)), species, rng.random((n_sites, 3)))
+
+
+def _get_objects(scale: int, rng: np.random.Generator) -> dict:
+    """Synthetic objects of each benchmarked class, with sizes growing with scale."""
+    n_sites, n_energies, n_kpoints, n_bands = 10 * scale, 2000 * scale, 300 * scale, 60
+    struct = _get_structure(n_sites, rng)
+    energies = np.linspace(-10, 10, n_energies)
+    spins = (Spin.up, Spin.down)
+
+    tdos = Dos(0.0, energies, {spin: rng.random(n_energies) for spin in spins})
+    pdos = {site: {orb: {spin: rng.random(n_energies) for spin in spins} for orb in Orbital} for site in struct}
+
+    path = np.concatenate([np.linspace(start, end, n_kpoints // 3) for start, end in ((0, 0.5), (0.5, 0.5), (0.5, 0))])
+    kpoints = np.column_stack([path, np.linspace(0, 0.5, len(path)), np.zeros(len(path))])
+    labels_dict = {"G": kpoints[0], "X": kpoints[len(path) // 3 - 1], "M": kpoints[-1]}
+    reciprocal_lattice = struct.lattice.reciprocal_lattice
+    bands = {spin: np.sort(rng.normal(size=(n_bands, len(kpoints))), axis=0) for spin in spins}
+    projections = {spin: rng.random((n_bands, len(kpoints), len(Orbital), n_sites)) for spin in spins}
+
+    n_modes = 3 * n_sites
+    displacements = rng.random((n_modes, len(kpoints), n_sites, 3)) + 1j * rng.random(
+        (n_modes, len(kpoints), n_sites, 3)
+    )
+
+    n_grid = 40 * scale
+    frames = [struct.copy() for _ in range(200 * scale)]
+    for frame in frames:
+        frame.translate_sites(range(n_sites), rng.normal(scale=0.01, size=3))
+
+    return {
+        "CompleteDos": CompleteDos(struct, tdos, pdos),
+        "BandStructureSymmLine": BandStructureSymmLine(
+            kpoints, bands, reciprocal_lattice, 0.0, labels_dict, structure=struct, projections=projections
+        ),
+        "PhononBandStructureSymmLine": PhononBandStructureSymmLine(
+            kpoints,
+            rng.random((n_modes, len(kpoints))),
+            reciprocal_lattice,
+            eigendisplacements=displacements,
+            labels_dict=labels_dict,
+            structure=struct,
+        ),
+        "Trajectory": Trajectory.from_structures(frames, constant_lattice=True),
+        "Chgcar": Chgcar(struct, {key: rng.random((n_grid,) * 3) for key in ("total", "diff")}),
+        "ComputedStructureEntry": ComputedStructureEntry(_get_structure(100 * scale, rng), -100.0),
+    }
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings and sizes."""
+    parser = get_parser(__doc__)
+    parser.add_argument("--scale", type=int, default=1, help="Multiplier for the size of the objects.")
+    args = parser.parse_args()
+
+    decoder = MontyDecoder()
+    print(
+        f"{'class':>28} {'json dump (s)':>14} {'json load (s)':>14} {'json (MB)':>10}"
+        f" {'bin dump (s)':>13} {'bin load (s)':>13} {'bin (MB)':>9}"
+    )
+    for name, obj in _get_objects(args.scale, np.random.default_rng(0)).items():
+        json_str = json.dumps(obj.as_dict(), cls=MontyEncoder)
+        binary = to_binary(obj)
+        timings = (
+            time_best(lambda obj=obj: json.dumps(obj.as_dict(), cls=MontyEncoder), args.repeat),
+            time_best(lambda json_str=json_str: decoder.process_decoded(json.loads(json_str)), args.repeat),
+            time_best(lambda obj=obj: to_binary(obj), args.repeat),
+            time_best(lambda binary=binary: from_binary(binary), args.repeat),
+        )
+        print(
+            f"{name:>28} {timings[0]:>14.3f} {timings[1]:>14.3f} {len(json_str) / 1e6:>10.1f}"
+            f" {timings[2]:>13.3f} {timings[3]:>13.3f} {len(binary) / 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
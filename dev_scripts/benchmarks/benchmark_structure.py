@@ -0,0 +1,45 @@
+"""Benchmarks for constructing, copying and making supercells of large structures.
+
+Usage:
+    python dev_scripts/benchmarks/benchmark_structure.py [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from _utils import get_parser, time_best
+
+from pymatgen.core import Lattice, Structure
+
+SUPERCELL_SIZES = ((5, 5, 5), (10, 10, 10), (20, 20, 25))
+
+
+def _get_unit_cell() -> Structure:
+    """Rocksalt NaCl conventional cell with a site property."""
+    return Structure.from_spacegroup(
+        "Fm-3m", Lattice.cubic(5.64), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]], site_properties={"magmom": [0, 0]}
+    )
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    args = get_parser(__doc__).parse_args()
+
+    unit_cell = _get_unit_cell()
+    print(f"{'n_sites':>10} {'__init__':>10} {'from_sites':>10} {'copy':>10} {'__mul__':>10} {'sorted':>10}")
+    for scaling in SUPERCELL_SIZES:
+        supercell = unit_cell * scaling
+        species = [site.specie.symbol for site in supercell]
+        frac_coords = np.array(supercell.frac_coords)
+        timings = [
+            time_best(lambda: Structure(supercell.lattice, species, frac_coords), args.repeat),
+            time_best(lambda: Structure.from_sites(supercell.sites), args.repeat),
+            time_best(supercell.copy, args.repeat),
+            time_best(lambda: unit_cell * scaling, args.repeat),
+            time_best(supercell.get_sorted_structure, args.repeat),
+        ]
+        print(f"{len(supercell):>10} " + " ".join(f"{t:>10.3f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,15 @@ from collections import defaultdict
 from math import exp, sqrt
 from typing import TYPE_CHECKING
 
-import numpy as np
+from joblib import Parallel, delayed
 from monty.serialization import loadfn
 
 from pymatgen.core import Element, Species, get_el_sp
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from pymatgen.core import Structure
 
 # List of electronegative elements specified in M. O'Keefe, & N. Brese,
@@ -233,13 +235,14 @@ class BVAnalyzer:
         # Sort the equivalent sites by decreasing electronegativity.
         equi_sites = sorted(equi_sites, key=lambda sites: -sites[0].species.average_electroneg)
 
-        # Get a list of valences and probabilities for each symmetrically distinct site.
+        # Get a list of valences and probabilities for each symmetrically distinct site,
+        # using a single neighbor search for all of them.
+        all_nn = structure.get_all_neighbors(self.max_radius, sites=[sites[0] for sites in equi_sites])
         valences = []
         all_prob = []
         if structure.is_ordered:
-            for sites in equi_sites:
+            for sites, nn in zip(equi_sites, all_nn, strict=True):
                 test_site = sites[0]
-                nn = structure.get_neighbors(test_site, self.max_radius)
                 prob = self._calc_site_probabilities(test_site, nn)
                 all_prob.append(prob)
                 val = list(prob)
@@ -249,9 +252,8 @@ class BVAnalyzer:
                 valences.append(list(filter(lambda v: prob[v] > 0.01 * prob[val[0]], val)))
         else:
             full_all_prob = []
-            for sites in equi_sites:
+            for sites, nn in zip(equi_sites, all_nn, strict=True):
                 test_site = sites[0]
-                nn = structure.get_neighbors(test_site, self.max_radius)
                 prob = self._calc_site_probabilities_unordered(test_site, nn)
                 all_prob.append(prob)
                 full_all_prob.extend(prob.values())
@@ -265,145 +267,37 @@ class BVAnalyzer:
                     vals.append(filtered)
                 valences.append(vals)
 
-        # make variables needed for recursion
+        # Set up the variables of the search: each has a list of candidate valences,
+        # a weight in the total charge and the probability of each candidate
         attrib = []
         if structure.is_ordered:
-            n_sites = np.array(list(map(len, equi_sites)))
-            valence_min = np.array(list(map(min, valences)))
-            valence_max = np.array(list(map(max, valences)))
-
-            self._n = 0
-            self._best_score = 0
-            self._best_vset = None
-
-            def evaluate_assignment(v_set):
-                el_oxi = defaultdict(list)
-                for idx, sites in enumerate(equi_sites):
-                    el_oxi[sites[0].specie.symbol].append(v_set[idx])
-                max_diff = max(max(v) - min(v) for v in el_oxi.values())
-                if max_diff > 1:
-                    return
-                score = functools.reduce(operator.mul, [all_prob[idx][val] for idx, val in enumerate(v_set)])
-                if score > self._best_score:
-                    self._best_vset = v_set
-                    self._best_score = score
-
-            def _recurse(assigned=None):
-                # recurses to find permutations of valences based on whether a
-                # charge balanced assignment can still be found
-                if self._n > self.max_permutations:
-                    return
-                if assigned is None:
-                    assigned = []
-
-                i = len(assigned)
-                highest = valence_max.copy()
-                highest[:i] = assigned
-                highest *= n_sites
-                highest = np.sum(highest)
-
-                lowest = valence_min.copy()
-                lowest[:i] = assigned
-                lowest *= n_sites
-                lowest = np.sum(lowest)
-
-                if highest < 0 or lowest > 0:
-                    self._n += 1
-                    return
-
-                if i == len(valences):
-                    evaluate_assignment(assigned)
-                    self._n += 1
-                    return
-                for v in valences[i]:
-                    new_assigned = list(assigned)
-                    _recurse([*new_assigned, v])
-                return
-
+            weights = [len(sites) for sites in equi_sites]
+            candidates = valences
+            probs = all_prob
+            max_oxi_diff = 1
+            elements = [sites[0].specie.symbol for sites in equi_sites]
+            charge_tol: float = 0
         else:
-            n_sites = np.array([len(sites) for sites in equi_sites])
-            tmp = []
-            for idx, n_site in enumerate(n_sites):
-                for _ in valences[idx]:
-                    tmp.append(n_site)
-                    attrib.append(idx)
-            new_n_sites = np.array(tmp)
-            fractions = []
+            weights = []
             elements = []
-            for sites in equi_sites:
+            for idx, sites in enumerate(equi_sites):
                 for sp, occu in get_z_ordered_elmap(sites[0].species):
+                    weights.append(len(sites) * occu)
                     elements.append(sp.symbol)
-                    fractions.append(occu)
-            fractions = np.array(fractions, float)  # type: ignore[assignment]
-            new_valences = [val for vals in valences for val in vals]
-            valence_min = np.array([min(val) for val in new_valences], float)
-            valence_max = np.array([max(val) for val in new_valences], float)
-
-            self._n = 0
-            self._best_score = 0
-            self._best_vset = None
-
-            def evaluate_assignment(v_set):
-                el_oxi = defaultdict(list)
-                jj = 0
-                for sites in equi_sites:
-                    for specie, _ in get_z_ordered_elmap(sites[0].species):
-                        el_oxi[specie.symbol].append(v_set[jj])
-                        jj += 1
-                max_diff = max(max(v) - min(v) for v in el_oxi.values())
-                if max_diff > 2:
-                    return
-
-                score = functools.reduce(
-                    operator.mul,
-                    [all_prob[attrib[iv]][elements[iv]][vv] for iv, vv in enumerate(v_set)],
-                )
-                if score > self._best_score:
-                    self._best_vset = v_set
-                    self._best_score = score
-
-            def _recurse(assigned=None):
-                # recurses to find permutations of valences based on whether a
-                # charge balanced assignment can still be found
-                if self._n > self.max_permutations:
-                    return
-                if assigned is None:
-                    assigned = []
-
-                i = len(assigned)
-                highest = valence_max.copy()
-                highest[:i] = assigned
-                highest *= new_n_sites
-                highest *= fractions
-                highest = np.sum(highest)
-
-                lowest = valence_min.copy()
-                lowest[:i] = assigned
-                lowest *= new_n_sites
-                lowest *= fractions
-                lowest = np.sum(lowest)
-
-                if highest < -self.charge_neutrality_tolerance or lowest > self.charge_neutrality_tolerance:
-                    self._n += 1
-                    return
-
-                if i == len(new_valences):
-                    evaluate_assignment(assigned)
-                    self._n += 1
-                    return
-
-                for v in new_valences[i]:
-                    new_assigned = list(assigned)
-                    _recurse([*new_assigned, v])
-
-                return
+                    attrib.append(idx)
+            candidates = [val for vals in valences for val in vals]
+            probs = [all_prob[attrib[iv]][el] for iv, el in enumerate(elements)]
+            max_oxi_diff = 2
+            charge_tol = self.charge_neutrality_tolerance
 
-        _recurse()
+        best_vset = self._find_best_valences(
+            candidates, weights, probs, elements, max_oxi_diff=max_oxi_diff, charge_tol=charge_tol
+        )
 
-        if self._best_vset:
+        if best_vset:
             if structure.is_ordered:
                 assigned = {}
-                for val, sites in zip(self._best_vset, equi_sites, strict=True):
+                for val, sites in zip(best_vset, equi_sites, strict=True):
                     for site in sites:
                         assigned[site] = val
 
@@ -412,7 +306,7 @@ class BVAnalyzer:
             new_best_vset = []
             for _ in equi_sites:
                 new_best_vset.append([])
-            for ival, val in enumerate(self._best_vset):
+            for ival, val in enumerate(best_vset):
                 new_best_vset[attrib[ival]].append(val)
             for val, sites in zip(new_best_vset, equi_sites, strict=True):
                 for site in sites:
@@ -421,6 +315,105 @@ class BVAnalyzer:
             return [[int(frac_site) for frac_site in assigned[site]] for site in structure]
         raise ValueError("Valences cannot be assigned!")
 
+    def _find_best_valences(
+        self,
+        candidates: list[list[int]],
+        weights: list[float],
+        probs: list[dict[int, float]],
+        elements: list[str],
+        *,
+        max_oxi_diff: int,
+        charge_tol: float,
+    ) -> list[int] | None:
+        """Branch-and-bound search for the most probable charge neutral valence
+        assignment. Variables are assigned in order, trying candidates in order of
+        decreasing probability, and a partial assignment is abandoned as soon as it
+        can no longer be charge balanced or can no longer beat the best assignment
+        found so far. Returns the same assignment as an exhaustive search, but at
+        most max_permutations partial assignments are tested.
+
+        Args:
+            candidates: Candidate valences of each variable, most probable first.
+            weights: Weight of each variable in the total charge.
+            probs: Probability of each candidate valence of each variable.
+            elements: Element of each variable.
+            max_oxi_diff: Maximum difference between the valences of an element.
+            charge_tol: Tolerance on the charge neutrality.
+
+        Returns:
+            list[int] | None: The best valence of each variable, None if there is no
+                valid assignment.
+        """
+        n_vars = len(candidates)
+        # Lowest/highest charge and highest probability achievable by the unassigned variables
+        charge_min = [0.0] * (n_vars + 1)
+        charge_max = [0.0] * (n_vars + 1)
+        prob_max = [1.0] * (n_vars + 1)
+        for idx in range(n_vars - 1, -1, -1):
+            charge_min[idx] = min(candidates[idx]) * weights[idx] + charge_min[idx + 1]
+            charge_max[idx] = max(candidates[idx]) * weights[idx] + charge_max[idx + 1]
+            prob_max[idx] = max(probs[idx][val] for val in candidates[idx]) * prob_max[idx + 1]
+
+        best_vset: list[int] | None = None
+        best_score = 0.0
+        n_tested = 0
+
+        def is_valid(v_set: list[int]) -> bool:
+            el_oxi = defaultdict(list)
+            for el, val in zip(elements, v_set, strict=True):
+                el_oxi[el].append(val)
+            return max(max(v) - min(v) for v in el_oxi.values()) <= max_oxi_diff
+
+        def search(assigned: list[int], charge: float, prob: float) -> None:
+            nonlocal best_vset, best_score, n_tested
+            if n_tested > self.max_permutations:
+                return
+            idx = len(assigned)
+            if charge + charge_max[idx] < -charge_tol or charge + charge_min[idx] > charge_tol:
+                n_tested += 1
+                return
+            # Small slack so rounding in the bound can never prune the best assignment
+            if prob * prob_max[idx] * (1 + 1e-9) <= best_score:
+                n_tested += 1
+                return
+
+            if idx == n_vars:
+                n_tested += 1
+                if is_valid(assigned):
+                    score = functools.reduce(operator.mul, [probs[iv][val] for iv, val in enumerate(assigned)])
+                    if score > best_score:
+                        best_vset = assigned
+                        best_score = score
+                return
+            for val in candidates[idx]:
+                search([*assigned, val], charge + val * weights[idx], prob * probs[idx][val])
+
+        search([], 0, 1.0)
+        return best_vset
+
+    def _get_valences_or_none(self, structure: Structure) -> list | None:
+        """get_valences, but returns None if the valences cannot be determined."""
+        try:
+            return self.get_valences(structure)
+        except ValueError:
+            return None
+
+    def get_valences_batch(self, structures: Sequence[Structure], n_jobs: int = 1) -> list[list | None]:
+        """Get the valences of many structures.
+
+        Args:
+            structures (Sequence[Structure]): Structures to analyze.
+            n_jobs (int): Number of processes used. Defaults to 1, i.e. serial.
+                Set to -1 to use all CPUs.
+
+        Returns:
+            list[list | None]: The valences of each structure as returned by
+                get_valences, or None if they cannot be determined.
+        """
+        if n_jobs == 1:
+            return [self._get_valences_or_none(struct) for struct in structures]
+        return Parallel(n_jobs=n_jobs)(delayed(self._get_valences_or_none)(struct) for struct in structures)
+
     def get_oxi_state_decorated_structure(self, structure: Structure) -> Structure:
         """Get an oxidation state decorated structure. This currently works only
         for ordered structures only.
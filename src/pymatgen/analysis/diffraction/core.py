@@ -8,12 +8,15 @@ from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
 import numpy as np
+from joblib import Parallel, delayed
 
 from pymatgen.core.spectrum import Spectrum
 from pymatgen.util.plotting import add_fig_kwargs, pretty_plot
 
 if TYPE_CHECKING:
-    from pymatgen.core import Structure
+    from collections.abc import Sequence
+
+    from pymatgen.core import Lattice, Species, Structure
 
 
 class DiffractionPattern(Spectrum):
@@ -72,6 +75,141 @@ class AbstractDiffractionPatternCalculator(abc.ABC):
         """
         raise NotImplementedError
 
+    def get_patterns(
+        self,
+        structures: Sequence[Structure],
+        scaled: bool = True,
+        two_theta_range: tuple[float, float] | None = (0, 90),
+        n_jobs: int = 1,
+    ) -> list:
+        """
+        Calculates the diffraction patterns for many structures.
+
+        Args:
+            structures (Sequence[Structure]): Input structures
+            scaled (bool): Whether to return scaled intensities. See get_pattern.
+            two_theta_range ([float of length 2]): Tuple for range of
+                two_thetas to calculate in degrees. See get_pattern.
+            n_jobs (int): Number of processes used to compute the patterns.
+                Defaults to 1, i.e. serial. Set to -1 to use all CPUs.
+
+        Returns:
+            list: Diffraction patterns in the same order as structures.
+        """
+        if n_jobs == 1:
+            return [self.get_pattern(struct, scaled, two_theta_range) for struct in structures]
+        return Parallel(n_jobs=n_jobs)(
+            delayed(self.get_pattern)(struct, scaled, two_theta_range) for struct in structures
+        )
+
+    @staticmethod
+    def get_recip_points(
+        lattice: Lattice, wavelength: float, two_theta_range: tuple[float, float] | None = (0, 90)
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get all non-zero crystallographic reciprocal lattice points within the
+        limiting sphere, sorted by increasing length.
+
+        Args:
+            lattice (Lattice): Real space lattice.
+            wavelength (float): Wavelength in angstroms.
+            two_theta_range ([float of length 2]): Tuple for range of
+                two_thetas in degrees. None for the full limiting sphere.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Integer Miller indices of shape (n, 3)
+                and the corresponding reciprocal vector lengths |g_hkl| = 1 / d_hkl.
+        """
+        # Obtained from Bragg condition. Note that reciprocal lattice
+        # vector length is 1 / d_hkl.
+        min_r, max_r = (
+            (0, 2 / wavelength)
+            if two_theta_range is None
+            else [2 * np.sin(np.radians(t / 2)) / wavelength for t in two_theta_range]
+        )
+
+        recip_lattice = lattice.reciprocal_lattice_crystallographic
+        frac_coords, g_hkls, _, _ = recip_lattice.get_points_in_sphere([[0, 0, 0]], [0, 0, 0], max_r, zip_results=False)
+        if len(g_hkls) == 0:
+            return np.zeros((0, 3), dtype=int), np.zeros(0)
+
+        # Force Miller indices to be integers
+        hkls = np.rint(frac_coords).astype(int)
+        g_hkls = np.asarray(g_hkls, dtype=float)
+        mask = (g_hkls != 0) & (g_hkls >= min_r)
+        hkls, g_hkls = hkls[mask], g_hkls[mask]
+
+        order = np.lexsort((-hkls[:, 2], -hkls[:, 1], -hkls[:, 0], g_hkls))
+        return hkls[order], g_hkls[order]
+
+    def get_pattern_from_peaks(
+        self,
+        hkls: np.ndarray,
+        g_hkls: np.ndarray,
+        two_thetas: np.ndarray,
+        intensities: np.ndarray,
+        *,
+        is_hex: bool = False,
+        scaled: bool = True,
+    ) -> DiffractionPattern:
+        """Merge the contributions of individual reciprocal lattice points into
+        peaks and build the diffraction pattern.
+
+        Reflections within TWO_THETA_TOL of the first reflection of a peak are
+        merged into that peak. Since the inputs are sorted by two_theta, peak
+        boundaries are found by binary search instead of comparing all pairs.
+
+        Args:
+            hkls (np.ndarray): Integer Miller indices of shape (n, 3), sorted by two_theta.
+            g_hkls (np.ndarray): Reciprocal vector lengths |g_hkl| = 1 / d_hkl.
+            two_thetas (np.ndarray): Two theta angles in degrees.
+            intensities (np.ndarray): Intensity of each reflection.
+            is_hex (bool): Whether to use Miller-Bravais indices for hexagonal lattices.
+            scaled (bool): Whether to scale intensities so that the max peak is 100.
+
+        Returns:
+            DiffractionPattern
+        """
+        if len(two_thetas) == 0:
+            raise ValueError("No reciprocal lattice points within the given two_theta_range.")
+
+        # Index of the first reflection in each peak
+        n_refl = len(two_thetas)
+        starts = [0]
+        while (start := starts[-1]) < n_refl:
+            end = int(np.searchsorted(two_thetas, two_thetas[start] + self.TWO_THETA_TOL))
+            # Deal with floating point precision issues at the boundary
+            while end < n_refl and two_thetas[end] - two_thetas[start] < self.TWO_THETA_TOL:
+                end += 1
+            while end > start + 1 and two_thetas[end - 1] - two_thetas[start] >= self.TWO_THETA_TOL:
+                end -= 1
+            starts.append(end)
+        ends = starts[1:]
+        starts = starts[:-1]
+        peak_intensities = np.add.reduceat(intensities, starts)
+
+        if is_hex:
+            # Use Miller-Bravais indices for hexagonal lattices
+            hkls = np.column_stack((hkls[:, 0], hkls[:, 1], -hkls[:, 0] - hkls[:, 1], hkls[:, 2]))
+        hkl_tuples = list(map(tuple, hkls.tolist()))
+
+        # Scale intensities so that the max intensity is 100
+        max_intensity = peak_intensities.max()
+        x = []
+        y = []
+        peak_hkls = []
+        d_hkls = []
+        for start, end, intensity in zip(starts, ends, peak_intensities, strict=True):
+            if intensity / max_intensity * 100 > self.SCALED_INTENSITY_TOL:
+                fam = get_unique_families(hkl_tuples[start:end])
+                x.append(float(two_thetas[start]))
+                y.append(float(intensity))
+                peak_hkls.append([{"hkl": hkl, "multiplicity": mult} for hkl, mult in fam.items()])
+                d_hkls.append(float(1 / g_hkls[start]))
+        pattern = DiffractionPattern(x, y, peak_hkls, d_hkls)
+        if scaled:
+            pattern.normalize(mode="max", value=100)
+        return pattern
+
     def get_plot(
         self,
         structure: Structure,
@@ -206,26 +344,88 @@ def get_unique_families(hkls):
     Returns:
         {hkl: multiplicity}: A dict with unique hkl and multiplicity.
     """
-
-    # TODO can definitely be sped up
-    def is_perm(hkl1, hkl2) -> bool:
-        h1 = np.abs(hkl1)
-        h2 = np.abs(hkl2)
-        return np.all(np.sort(h1) == np.sort(h2))
-
+    # Two indices are permutations of each other (up to sign) iff their
+    # sorted absolute values are equal, so use that as the family key.
     unique = defaultdict(list)
-    for hkl1 in hkls:
-        found = False
-        for hkl2, v2 in unique.items():
-            if is_perm(hkl1, hkl2):
-                found = True
-                v2.append(hkl1)
-                break
-        if not found:
-            unique[hkl1].append(hkl1)
+    for hkl in hkls:
+        unique[tuple(sorted(abs(idx) for idx in hkl))].append(hkl)
 
     pretty_unique = {}
     for val in unique.values():
         pretty_unique[max(val)] = len(val)
 
     return pretty_unique
+
+
+def get_scatterers(structure: Structure) -> tuple[list[Species], np.ndarray, np.ndarray, np.ndarray]:
+    """Flatten a structure into arrays of scatterers. Note that these are not
+    necessarily the same size as the structure as each partially occupied
+    species occupies its own position in the flattened arrays.
+
+    Args:
+        structure (Structure): Input structure.
+
+    Returns:
+        tuple: Unique species (one per element symbol), index into the unique species
+            for each scatterer, fractional coordinates of shape (n, 3) and occupancies.
+    """
+    species: list[Species] = []
+    species_index: dict[str, int] = {}
+    species_indices = []
+    frac_coords = []
+    occus = []
+    for site in structure:
+        for sp, occu in site.species.items():
+            if sp.symbol not in species_index:
+                species_index[sp.symbol] = len(species)
+                species.append(sp)
+            species_indices.append(species_index[sp.symbol])
+            frac_coords.append(site.frac_coords)
+            occus.append(occu)
+
+    return (
+        species,
+        np.array(species_indices, dtype=int),
+        np.reshape(frac_coords, (-1, 3)),
+        np.array(occus, dtype=float),
+    )
+
+
+def get_structure_factors(
+    hkls: np.ndarray,
+    frac_coords: np.ndarray,
+    species_factors: np.ndarray,
+    species_indices: np.ndarray,
+    occus: np.ndarray,
+    *,
+    chunk_size: int = 2**20,
+) -> np.ndarray:
+    r"""Compute the structure factors of many reflections in one vectorized pass
+    over (hkl x scatterers):
+
+        F_{hkl} = \sum \limits_{j=1}^N o_j f_j(hkl) \exp(2 \pi i \mathbf{g_{hkl}} \cdot \mathbf{r_j})
+
+    Args:
+        hkls (np.ndarray): Miller indices of shape (n_hkl, 3).
+        frac_coords (np.ndarray): Fractional coordinates of the scatterers, shape (n_atoms, 3).
+        species_factors (np.ndarray): Scattering factor of each unique species for
+            each reflection, shape (n_hkl, n_species). Any Debye-Waller correction
+            should already be applied.
+        species_indices (np.ndarray): Index into species_factors for each scatterer.
+        occus (np.ndarray): Occupancy of each scatterer.
+        chunk_size (int): Max number of (hkl, scatterer) phase factors held in memory
+            at once. Bounds memory use for large cells.
+
+    Returns:
+        np.ndarray: Complex structure factors of shape (n_hkl,).
+    """
+    hkls = np.asarray(hkls, dtype=float)
+    n_hkl = len(hkls)
+    f_hkl = np.zeros(n_hkl, dtype=complex)
+    step = max(1, chunk_size // max(1, len(frac_coords)))
+    for start in range(0, n_hkl, step):
+        end = min(start + step, n_hkl)
+        g_dot_r = hkls[start:end] @ frac_coords.T
+        atomic_factors = species_factors[start:end][:, species_indices] * occus
+        f_hkl[start:end] = np.sum(atomic_factors * np.exp(2j * np.pi * g_dot_r), axis=1)
+    return f_hkl
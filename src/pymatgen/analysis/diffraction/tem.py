@@ -12,7 +12,12 @@ import pandas as pd
 import plotly.graph_objects as go
 import scipy.constants as sc
 
-from pymatgen.analysis.diffraction.core import AbstractDiffractionPatternCalculator
+from pymatgen.analysis.diffraction.core import (
+    AbstractDiffractionPatternCalculator,
+    get_scatterers,
+    get_structure_factors,
+)
+from pymatgen.analysis.diffraction.xrd import get_atomic_scattering_factors
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.util.string import latexify_spacegroup, unicodeify_spacegroup
 from pymatgen.util.typing import Tuple3Ints
@@ -185,21 +190,10 @@ class TEMCalculator(AbstractDiffractionPatternCalculator):
         Returns:
             dict of atomic symbol to another dict of hkl plane to x-ray factor (in angstroms).
         """
-        x_ray_factors = {}
-        s2 = self.get_s2(bragg_angles)
+        s2 = np.array(list(self.get_s2(bragg_angles).values()))
         atoms = structure.elements
-        scattering_factors_for_atom = {}
-        for atom in atoms:
-            coeffs = np.array(ATOMIC_SCATTERING_PARAMS[atom.symbol])
-            for plane in bragg_angles:
-                scattering_factor_curr = atom.Z - 41.78214 * s2[plane] * np.sum(
-                    coeffs[:, 0] * np.exp(-coeffs[:, 1] * s2[plane]),
-                    axis=None,
-                )
-                scattering_factors_for_atom[plane] = scattering_factor_curr
-            x_ray_factors[atom.symbol] = scattering_factors_for_atom
-            scattering_factors_for_atom = {}
-        return x_ray_factors
+        factors = get_atomic_scattering_factors(atoms, s2)
+        return {atom.symbol: dict(zip(bragg_angles, factors[:, idx], strict=True)) for idx, atom in enumerate(atoms)}
 
     def electron_scattering_factors(
         self, structure: Structure, bragg_angles: dict[Tuple3Ints, float]
@@ -214,18 +208,14 @@ class TEMCalculator(AbstractDiffractionPatternCalculator):
         Returns:
             dict from atomic symbol to another dict of hkl plane to factor (in angstroms)
         """
-        electron_scattering_factors = {}
         x_ray_factors = self.x_ray_factors(structure, bragg_angles)
-        s2 = self.get_s2(bragg_angles)
-        atoms = structure.elements
+        s2 = np.array(list(self.get_s2(bragg_angles).values()))
         prefactor = 0.023934
-        scattering_factors_for_atom = {}
-        for atom in atoms:
-            for plane in bragg_angles:
-                scattering_factor_curr = prefactor * (atom.Z - x_ray_factors[atom.symbol][plane]) / s2[plane]
-                scattering_factors_for_atom[plane] = scattering_factor_curr
-            electron_scattering_factors[atom.symbol] = scattering_factors_for_atom
-            scattering_factors_for_atom = {}
+        electron_scattering_factors = {}
+        for atom in structure.elements:
+            x_ray_factors_val = np.array(list(x_ray_factors[atom.symbol].values()))
+            factors = prefactor * (atom.Z - x_ray_factors_val) / s2
+            electron_scattering_factors[atom.symbol] = dict(zip(bragg_angles, factors, strict=True))
         return electron_scattering_factors
 
     def cell_scattering_factors(
@@ -241,19 +231,19 @@ class TEMCalculator(AbstractDiffractionPatternCalculator):
         Returns:
             dict of hkl plane (3-tuple) to scattering factor (in angstroms).
         """
-        cell_scattering_factors = {}
+        planes = list(bragg_angles)
+        if not planes:
+            return {}
         electron_scattering_factors = self.electron_scattering_factors(structure, bragg_angles)
-        scattering_factor_curr = 0
-        for plane in bragg_angles:
-            for site in structure:
-                for sp in site.species:
-                    g_dot_r = np.dot(np.array(plane), np.transpose(site.frac_coords))
-                    scattering_factor_curr += electron_scattering_factors[sp.symbol][plane] * np.exp(
-                        2j * np.pi * g_dot_r
-                    )
-            cell_scattering_factors[plane] = scattering_factor_curr
-            scattering_factor_curr = 0
-        return cell_scattering_factors
+        # Occupancies are not taken into account, each species contributes fully
+        species, species_indices, frac_coords, _ = get_scatterers(structure)
+        species_factors = np.array(
+            [list(electron_scattering_factors[sp.symbol].values()) for sp in species], dtype=float
+        ).T
+        cell_scattering_factors = get_structure_factors(
+            np.array(planes), frac_coords, species_factors, species_indices, np.ones(len(species_indices))
+        )
+        return dict(zip(planes, cell_scattering_factors, strict=True))
 
     def cell_intensity(self, structure: Structure, bragg_angles: dict[Tuple3Ints, float]) -> dict[Tuple3Ints, float]:
         """
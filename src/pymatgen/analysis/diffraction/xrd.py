@@ -4,20 +4,21 @@ from __future__ import annotations
 
 import json
 import os
-from math import asin, cos, degrees, pi, radians, sin
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from pymatgen.analysis.diffraction.core import (
     AbstractDiffractionPatternCalculator,
-    DiffractionPattern,
-    get_unique_families,
+    get_scatterers,
+    get_structure_factors,
 )
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 if TYPE_CHECKING:
-    from pymatgen.core import Structure
+    from collections.abc import Sequence
+
+    from pymatgen.core import Species, Structure
 
 # XRD wavelengths in angstroms
 WAVELENGTHS = {
@@ -148,130 +149,60 @@ class XRDCalculator(AbstractDiffractionPatternCalculator):
 
         wavelength = self.wavelength
         lattice = structure.lattice
-        is_hex = lattice.is_hexagonal()
-
-        # Obtained from Bragg condition. Note that reciprocal lattice
-        # vector length is 1 / d_hkl.
-        min_r, max_r = (
-            (0, 2 / wavelength)
-            if two_theta_range is None
-            else [2 * sin(radians(t / 2)) / wavelength for t in two_theta_range]
+
+        # Obtain crystallographic reciprocal lattice points within range,
+        # sorted by |g_hkl|
+        hkls, g_hkls = self.get_recip_points(lattice, wavelength, two_theta_range)
+
+        # Bragg condition
+        thetas = np.arcsin(wavelength * g_hkls / 2)
+
+        # s = sin(theta) / wavelength = 1 / 2d = |ghkl| / 2 (d =
+        # 1/|ghkl|). Store s^2 since we are using it a few times.
+        s2 = (g_hkls / 2) ** 2
+
+        # Atomic scattering factors are computed once per element for all
+        # reflections, then gathered for each (partially occupied) site.
+        species, species_indices, frac_coords, occus = get_scatterers(structure)
+        dw_factors = np.array([self.debye_waller_factors.get(sp.symbol, 0) for sp in species])
+        species_factors = get_atomic_scattering_factors(species, s2) * np.exp(-np.outer(s2, dw_factors))
+
+        # Structure factor = sum of atomic scattering factors (with
+        # position factor exp(2j * pi * g.r and occupancies).
+        f_hkl = get_structure_factors(hkls, frac_coords, species_factors, species_indices, occus)
+
+        # Lorentz polarization correction for hkl
+        lorentz_factors = (1 + np.cos(2 * thetas) ** 2) / (np.sin(thetas) ** 2 * np.cos(thetas))
+
+        # Intensity for hkl is modulus square of structure factor
+        intensities = (f_hkl * f_hkl.conjugate()).real * lorentz_factors
+
+        two_thetas = np.degrees(2 * thetas)
+        return self.get_pattern_from_peaks(
+            hkls, g_hkls, two_thetas, intensities, is_hex=lattice.is_hexagonal(), scaled=scaled
         )
 
-        # Obtain crystallographic reciprocal lattice points within range
-        recip_lattice = lattice.reciprocal_lattice_crystallographic
-        recip_pts = recip_lattice.get_points_in_sphere([[0, 0, 0]], [0, 0, 0], max_r)
-        if min_r:
-            recip_pts = [pt for pt in recip_pts if pt[1] >= min_r]
-
-        # Create a flattened array of zs, coeffs, frac_coords and occus. This is used to perform
-        # vectorized computation of atomic scattering factors later. Note that these are not
-        # necessarily the same size as the structure as each partially occupied specie occupies its
-        # own position in the flattened array.
-        _zs = []
-        _coeffs = []
-        _frac_coords = []
-        _occus = []
-        _dw_factors = []
-
-        for site in structure:
-            for sp, occu in site.species.items():
-                _zs.append(sp.Z)
-                try:
-                    c = ATOMIC_SCATTERING_PARAMS[sp.symbol]
-                except KeyError:
-                    raise ValueError(
-                        f"Unable to calculate XRD pattern as there is no scattering coefficients for {sp.symbol}."
-                    )
-                _coeffs.append(c)
-                _dw_factors.append(self.debye_waller_factors.get(sp.symbol, 0))
-                _frac_coords.append(site.frac_coords)
-                _occus.append(occu)
-
-        zs = np.array(_zs)
-        coeffs = np.array(_coeffs)
-        frac_coords = np.array(_frac_coords)
-        occus = np.array(_occus)
-        dw_factors = np.array(_dw_factors)
-        peaks: dict[float, list[float | list[tuple[int, ...]]]] = {}
-        two_thetas: list[float] = []
-
-        for hkl, g_hkl, ind, _ in sorted(recip_pts, key=lambda i: (i[1], -i[0][0], -i[0][1], -i[0][2])):
-            # Force miller indices to be integers
-            hkl = [int(round(i)) for i in hkl]
-            if g_hkl != 0:
-                # Bragg condition
-                theta = asin(wavelength * g_hkl / 2)
-
-                # s = sin(theta) / wavelength = 1 / 2d = |ghkl| / 2 (d =
-                # 1/|ghkl|)
-                s = g_hkl / 2
-
-                # Store s^2 since we are using it a few times
-                s2 = s**2
-
-                # Vectorized computation of g.r for all fractional coords and
-                # hkl
-                g_dot_r = np.dot(frac_coords, np.transpose([hkl])).T[0]
-
-                # Highly vectorized computation of atomic scattering factors.
-                # Equivalent non-vectorized code is:
-                #
-                #   for site in structure:
-                #      el = site.specie
-                #      coeff = ATOMIC_SCATTERING_PARAMS[el.symbol]
-                #      fs = el.Z - 41.78214 * s2 * sum(
-                #          [d[0] * exp(-d[1] * s2) for d in coeff])
-                fs = zs - 41.78214 * s2 * np.sum(
-                    coeffs[:, :, 0] * np.exp(-coeffs[:, :, 1] * s2),
-                    axis=1,
-                )
-
-                dw_correction = np.exp(-dw_factors * s2)
-
-                # Structure factor = sum of atomic scattering factors (with
-                # position factor exp(2j * pi * g.r and occupancies).
-                # Vectorized computation.
-                f_hkl = np.sum(fs * occus * np.exp(2j * pi * g_dot_r) * dw_correction)
-
-                # Lorentz polarization correction for hkl
-                lorentz_factor = (1 + cos(2 * theta) ** 2) / (sin(theta) ** 2 * cos(theta))
-
-                # Intensity for hkl is modulus square of structure factor
-                i_hkl = (f_hkl * f_hkl.conjugate()).real
-
-                two_theta = degrees(2 * theta)
-
-                if is_hex:
-                    # Use Miller-Bravais indices for hexagonal lattices
-                    hkl = (hkl[0], hkl[1], -hkl[0] - hkl[1], hkl[2])
-                # Deal with floating point precision issues
-                ind = np.where(
-                    np.abs(np.subtract(two_thetas, two_theta)) < AbstractDiffractionPatternCalculator.TWO_THETA_TOL
-                )
-                if len(ind[0]) > 0:
-                    peaks[two_thetas[ind[0][0]]][0] += i_hkl * lorentz_factor
-                    peaks[two_thetas[ind[0][0]]][1].append(tuple(hkl))  # type: ignore[union-attr]
-                else:
-                    d_hkl = 1 / g_hkl
-                    peaks[two_theta] = [i_hkl * lorentz_factor, [tuple(hkl)], d_hkl]
-                    two_thetas.append(two_theta)
-
-        # Scale intensities so that the max intensity is 100
-        max_intensity = max(v[0] for v in peaks.values())
-        x = []
-        y = []
-        hkls = []
-        d_hkls = []
-        for k in sorted(peaks):
-            v = peaks[k]
-            fam = get_unique_families(v[1])
-            if v[0] / max_intensity * 100 > AbstractDiffractionPatternCalculator.SCALED_INTENSITY_TOL:  # type: ignore[operator]
-                x.append(k)
-                y.append(v[0])
-                hkls.append([{"hkl": hkl, "multiplicity": mult} for hkl, mult in fam.items()])
-                d_hkls.append(v[2])
-        xrd = DiffractionPattern(x, y, hkls, d_hkls)
-        if scaled:
-            xrd.normalize(mode="max", value=100)
-        return xrd
+
+def get_atomic_scattering_factors(species: Sequence[Species], s2: np.ndarray) -> np.ndarray:
+    r"""X-ray atomic scattering factors of many species for many values of s^2,
+
+        f(s) = Z - 41.78214 \times s^2 \times \sum \limits_{i=1}^n a_i \exp(-b_is^2)
+
+    where s = \frac{\sin(\theta)}{\lambda}.
+
+    Args:
+        species (Sequence[Species]): Species or elements.
+        s2 (np.ndarray): Values of s^2.
+
+    Returns:
+        np.ndarray: Scattering factors of shape (len(s2), len(species)).
+    """
+    s2 = np.asarray(s2, dtype=float)
+    factors = np.empty((len(s2), len(species)))
+    for idx, sp in enumerate(species):
+        try:
+            coeffs = np.array(ATOMIC_SCATTERING_PARAMS[sp.symbol])
+        except KeyError:
+            raise ValueError(f"Unable to calculate XRD pattern as there is no scattering coefficients for {sp.symbol}.")
+        factors[:, idx] = sp.Z - 41.78214 * s2 * np.sum(coeffs[:, 0] * np.exp(-np.outer(s2, coeffs[:, 1])), axis=1)
+    return factors
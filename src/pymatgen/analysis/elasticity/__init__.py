@@ -10,6 +10,7 @@ from .elastic import (
     diff_fit,
     find_eq_stress,
     generate_pseudo,
+    get_batch_property_dict,
     get_diff_coeff,
     get_strain_state_dict,
     get_symbol_list,
@@ -7,8 +7,8 @@ stress-strain data.
 from __future__ import annotations
 
 import itertools
-import math
 import warnings
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -42,6 +42,30 @@ __email__ = "montoyjh@lbl.gov"
 __status__ = "Production"
 __date__ = "July 24, 2018"
 
+# Properties of ElasticTensor.property_dict, derived from the elastic tensor only
+BASE_PROPERTIES = (
+    "k_voigt",
+    "k_reuss",
+    "k_vrh",
+    "g_voigt",
+    "g_reuss",
+    "g_vrh",
+    "universal_anisotropy",
+    "homogeneous_poisson",
+    "y_mod",
+)
+# Properties of ElasticTensor.get_structure_property_dict which also depend on the structure
+STRUCTURE_PROPERTIES = (
+    "trans_v",
+    "long_v",
+    "snyder_ac",
+    "snyder_opt",
+    "snyder_total",
+    "clarke_thermalcond",
+    "cahill_thermalcond",
+    "debye_temperature",
+)
+
 
 class NthOrderElasticTensor(Tensor):
     """
@@ -203,27 +227,46 @@ class ElasticTensor(NthOrderElasticTensor):
         """
         return 9.0e9 * self.k_vrh * self.g_vrh / (3 * self.k_vrh + self.g_vrh)
 
-    def directional_poisson_ratio(self, n: ArrayLike, m: ArrayLike, tol: float = 1e-8) -> float:
+    def directional_poisson_ratio(self, n: ArrayLike, m: ArrayLike, tol: float = 1e-8) -> float | np.ndarray:
         """
         Calculates the poisson ratio for a specific direction
         relative to a second, orthogonal direction.
 
         Args:
-            n (3-d vector): principal direction
-            m (3-d vector): secondary direction orthogonal to n
+            n (3-d vector or Nx3 array): principal direction, or directions
+                to evaluate the ratios for at once
+            m (3-d vector or Nx3 array): secondary direction orthogonal to n
             tol (float): tolerance for testing of orthogonality
+
+        Returns:
+            float | np.ndarray: the poisson ratio, or ratios for N directions
         """
-        n, m = get_uvec(n), get_uvec(m)
-        if not np.abs(np.dot(n, m)) < tol:
+        n, m = _get_uvecs(n), _get_uvecs(m)
+        if not (np.abs(np.sum(n * m, axis=-1)) < tol).all():
             raise ValueError("n and m must be orthogonal")
-        v = self.compliance_tensor.einsum_sequence([n] * 2 + [m] * 2)
-        v *= -1 / self.compliance_tensor.einsum_sequence([n] * 4)
-        return v
+        compliance = self.compliance_tensor
+        if n.ndim == 1:
+            v = compliance.einsum_sequence([n] * 2 + [m] * 2)
+            v *= -1 / compliance.einsum_sequence([n] * 4)
+            return v
+        compliance = np.asarray(compliance)
+        v = np.einsum("ijkl,ni,nj,nk,nl->n", compliance, n, n, m, m, optimize=True)
+        return -v / np.einsum("ijkl,ni,nj,nk,nl->n", compliance, n, n, n, n, optimize=True)
+
+    def directional_elastic_mod(self, n: ArrayLike) -> float | np.ndarray:
+        """Calculate directional elastic modulus for a specific vector.
 
-    def directional_elastic_mod(self, n) -> float:
-        """Calculate directional elastic modulus for a specific vector."""
-        n = get_uvec(n)
-        return self.einsum_sequence([n] * 4)
+        Args:
+            n (3-d vector or Nx3 array): direction, or directions to evaluate
+                the moduli along at once, e.g. a dense grid on the unit sphere
+
+        Returns:
+            float | np.ndarray: the modulus, or moduli along N directions
+        """
+        n = _get_uvecs(n)
+        if n.ndim == 1:
+            return self.einsum_sequence([n] * 4)
+        return np.einsum("ijkl,ni,nj,nk,nl->n", np.asarray(self), n, n, n, n, optimize=True)
 
     @raise_if_unphysical
     def trans_v(self, structure: Structure) -> float:
@@ -411,18 +454,7 @@ class ElasticTensor(NthOrderElasticTensor):
     @property
     def property_dict(self):
         """A dictionary of properties derived from the elastic tensor."""
-        props = (
-            "k_voigt",
-            "k_reuss",
-            "k_vrh",
-            "g_voigt",
-            "g_reuss",
-            "g_vrh",
-            "universal_anisotropy",
-            "homogeneous_poisson",
-            "y_mod",
-        )
-        return {prop: getattr(self, prop) for prop in props}
+        return {prop: float(values[0]) for prop, values in get_batch_property_dict([self]).items()}
 
     def get_structure_property_dict(
         self, structure: Structure, include_base_props: bool = True, ignore_errors: bool = False
@@ -438,24 +470,17 @@ class ElasticTensor(NthOrderElasticTensor):
             ignore_errors (bool): if set to true, will set problem properties
                 that depend on a physical tensor to None, defaults to False
         """
-        s_props = (
-            "trans_v",
-            "long_v",
-            "snyder_ac",
-            "snyder_opt",
-            "snyder_total",
-            "clarke_thermalcond",
-            "cahill_thermalcond",
-            "debye_temperature",
-        )
+        props = get_batch_property_dict([self], [structure])
         sp_dict: dict[str, float | Structure | None]
-        if ignore_errors and (self.k_vrh < 0 or self.g_vrh < 0):
-            sp_dict = dict.fromkeys(s_props)
+        if props["k_vrh"][0] < 0 or props["g_vrh"][0] < 0:
+            if not ignore_errors:
+                raise ValueError("Bulk or shear modulus is negative, property cannot be determined")
+            sp_dict = dict.fromkeys(STRUCTURE_PROPERTIES)
         else:
-            sp_dict = {prop: getattr(self, prop)(structure) for prop in s_props}
+            sp_dict = {prop: float(props[prop][0]) for prop in STRUCTURE_PROPERTIES}
         sp_dict["structure"] = structure
         if include_base_props:
-            sp_dict.update(self.property_dict)
+            sp_dict.update({prop: float(props[prop][0]) for prop in BASE_PROPERTIES})
         return sp_dict
 
     @classmethod
@@ -475,9 +500,9 @@ class ElasticTensor(NthOrderElasticTensor):
             "Pseudo-inverse fitting of Strain/Stress lists may yield "
             "questionable results from vasp data, use with caution."
         )
-        stresses = np.array([Stress(stress).voigt for stress in stresses])
+        stresses = np.array(TensorCollection(stresses, base_class=Stress).voigt)
         with warnings.catch_warnings():
-            strains = np.array([Strain(strain).voigt for strain in strains])
+            strains = np.array(TensorCollection(strains, base_class=Strain).voigt)
 
         voigt_fit = np.transpose(np.dot(np.linalg.pinv(strains), stresses))
         return cls.from_voigt(voigt_fit)
@@ -507,8 +532,8 @@ class ElasticTensor(NthOrderElasticTensor):
         for ii in range(6):
             strains = ss_dict[strain_states[ii]]["strains"]
             stresses = ss_dict[strain_states[ii]]["stresses"]
-            for jj in range(6):
-                c_ij[ii, jj] = np.polyfit(strains[:, ii], stresses[:, jj], 1)[0]
+            # Linear fits of all the stress components at once
+            c_ij[ii] = np.polyfit(strains[:, ii], stresses, 1)[0]
         if vasp:
             c_ij *= -0.1  # Convert units/sign convention of vasp stress tensor
         instance = cls.from_voigt(c_ij)
@@ -827,6 +852,109 @@ class ElasticTensorExpansion(TensorCollection):
         return (comp.x, tens.x)
 
 
+def get_batch_property_dict(
+    elastic_tensors: Sequence[ArrayLike] | np.ndarray,
+    structures: Sequence[Structure] | None = None,
+) -> dict[str, np.ndarray]:
+    """Properties derived from many elastic tensors at once, evaluated on their
+    stacked Voigt matrices instead of one ElasticTensor at a time.
+
+    Args:
+        elastic_tensors (Nx3x3x3x3 or Nx6x6 array-like): elastic tensors, or their
+            Voigt notation matrices, in eV/A^3 or GPa like ElasticTensor.
+        structures (list[Structure]): structures associated with each tensor. If
+            given, the structure-dependent properties of get_structure_property_dict
+            are included, and set to NaN for unphysical tensors with a negative
+            bulk or shear modulus.
+
+    Returns:
+        dict[str, np.ndarray]: the properties of ElasticTensor.property_dict and, if
+            structures are given, of get_structure_property_dict, each an array of
+            length N.
+    """
+    tensors = [np.asarray(tensor, dtype=float) for tensor in elastic_tensors]
+    if structures is not None and len(structures) != len(tensors):
+        raise ValueError(f"Got {len(structures)} structures for {len(tensors)} elastic tensors")
+    if not tensors:
+        props = BASE_PROPERTIES if structures is None else BASE_PROPERTIES + STRUCTURE_PROPERTIES
+        return {prop: np.zeros(0) for prop in props}
+    c_voigt = np.array(tensors) if tensors[0].shape == (6, 6) else np.array(TensorCollection(tensors).voigt)
+    s_voigt = np.linalg.inv(c_voigt)
+
+    def trace(matrices: np.ndarray) -> np.ndarray:
+        return np.trace(matrices, axis1=-2, axis2=-1)
+
+    k_voigt = c_voigt[:, :3, :3].mean(axis=(1, 2))
+    g_voigt = (
+        2 * trace(c_voigt[:, :3, :3]) - np.triu(c_voigt[:, :3, :3]).sum(axis=(1, 2)) + 3 * trace(c_voigt[:, 3:, 3:])
+    ) / 15.0
+    k_reuss = 1 / s_voigt[:, :3, :3].sum(axis=(1, 2))
+    g_reuss = 15 / (
+        8 * trace(s_voigt[:, :3, :3]) - 4 * np.triu(s_voigt[:, :3, :3]).sum(axis=(1, 2)) + 3 * trace(s_voigt[:, 3:, 3:])
+    )
+    k_vrh = 0.5 * (k_voigt + k_reuss)
+    g_vrh = 0.5 * (g_voigt + g_reuss)
+    y_mod = 9.0e9 * k_vrh * g_vrh / (3 * k_vrh + g_vrh)
+    props = {
+        "k_voigt": k_voigt,
+        "k_reuss": k_reuss,
+        "k_vrh": k_vrh,
+        "g_voigt": g_voigt,
+        "g_reuss": g_reuss,
+        "g_vrh": g_vrh,
+        "universal_anisotropy": 5 * g_voigt / g_reuss + k_voigt / k_reuss - 6.0,
+        "homogeneous_poisson": (1 - 2 / 3 * g_vrh / k_vrh) / (2 + 2 / 3 * g_vrh / k_vrh),
+        "y_mod": y_mod,
+    }
+    if structures is None:
+        return props
+
+    n_sites = np.array([len(structure) for structure in structures], dtype=float)
+    n_atoms = np.array([structure.composition.num_atoms for structure in structures])
+    weight = np.array([float(structure.composition.weight) for structure in structures])
+    volume = np.array([structure.volume for structure in structures])
+    tot_mass = np.array([sum(spec.atomic_mass for spec in structure.species) for structure in structures])
+    mass_density = 1.6605e3 * n_sites * weight / (n_atoms * volume)
+    site_density = 1e30 * n_sites / volume
+    avg_mass = 1.6605e-27 * tot_mass / n_atoms
+
+    physical = (k_vrh >= 0) & (g_vrh >= 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        trans_v = np.where(physical, (1e9 * g_vrh / mass_density) ** 0.5, np.nan)
+        long_v = np.where(physical, (1e9 * (k_vrh + 4 / 3 * g_vrh) / mass_density) ** 0.5, np.nan)
+        snyder_ac = (
+            0.38483
+            * avg_mass
+            * ((long_v + 2 * trans_v) / 3) ** 3.0
+            / (300 * site_density ** (-2 / 3) * n_sites ** (1 / 3))
+        )
+        snyder_opt = 1.66914e-23 * (long_v + 2 * trans_v) / 3.0 / site_density ** (-2 / 3) * (1 - n_sites ** (-1 / 3))
+        vm = 3 ** (1 / 3) * (1 / long_v**3 + 2 / trans_v**3) ** (-1 / 3)
+        v0 = volume * 1e-30 / n_sites
+        props |= {
+            "trans_v": trans_v,
+            "long_v": long_v,
+            "snyder_ac": snyder_ac,
+            "snyder_opt": snyder_opt,
+            "snyder_total": snyder_ac + snyder_opt,
+            "clarke_thermalcond": np.where(
+                physical, 0.87 * 1.3806e-23 * avg_mass ** (-2 / 3) * mass_density ** (1 / 6) * y_mod**0.5, np.nan
+            ),
+            "cahill_thermalcond": 1.3806e-23 / 2.48 * site_density ** (2 / 3) * (long_v + 2 * trans_v),
+            "debye_temperature": 1.05457e-34 / 1.38065e-23 * vm * (6 * np.pi**2 / v0) ** (1 / 3),
+        }
+    return props
+
+
+def _get_uvecs(vecs: ArrayLike) -> np.ndarray:
+    """Unit vectors parallel to the input vector or to each row of an array of
+    vectors, leaving near-zero vectors unchanged as get_uvec does.
+    """
+    vecs = np.asarray(vecs, dtype=float)
+    norms = np.linalg.norm(vecs, axis=-1, keepdims=True)
+    return np.divide(vecs, norms, out=vecs.copy(), where=norms >= 1e-8)
+
+
 # TODO: abstract this for other tensor fitting procedures
 def diff_fit(strains, stresses, eq_stress=None, order=2, tol: float = 1e-10):
     """
@@ -881,10 +1009,9 @@ def diff_fit(strains, stresses, eq_stress=None, order=2, tol: float = 1e-10):
 
     m, _absent = generate_pseudo(list(strain_state_dict), order)
     for _ord in range(1, order):
-        cvec, carr = get_symbol_list(_ord + 1)
+        _, index_arr = _get_symmetric_indices(_ord + 1)
         svec = np.ravel(dei_dsi[_ord - 1].T)
-        cmap = dict(zip(cvec, np.dot(m[_ord - 1], svec), strict=True))
-        c_list.append(v_subs(carr, cmap))
+        c_list.append(np.dot(m[_ord - 1], svec)[index_arr])
     return [Tensor.from_voigt(c) for c in c_list]
 
 
@@ -936,8 +1063,8 @@ def get_strain_state_dict(strains, stresses, eq_stress=None, tol: float = 1e-10,
         dict: strain state keys and dictionaries with stress-strain data corresponding to strain state
     """
     # Recast stress/strains
-    vstrains = np.array([Strain(s).zeroed(tol).voigt for s in strains])
-    vstresses = np.array([Stress(s).zeroed(tol).voigt for s in stresses])
+    vstrains = np.array(TensorCollection(strains, base_class=Strain).zeroed(tol).voigt)
+    vstresses = np.array(TensorCollection(stresses, base_class=Stress).zeroed(tol).voigt)
     # Collect independent strain states:
     independent = {tuple(np.nonzero(vstrain)[0].tolist()) for vstrain in vstrains}
     strain_state_dict = {}
@@ -984,26 +1111,25 @@ def generate_pseudo(strain_states, order=3):
             difference derivative of the stress with respect to the strain state
         absent_syms: symbols of the tensor absent from the PI expression
     """
-    symb = sp.Symbol("s")
+    strain_states = np.array(strain_states, dtype=float)
     n_states = len(strain_states)
-    n_i = np.array(strain_states) * symb
     pseudo_inverses, absent_symbols = [], []
     for degree in range(2, order + 1):
-        c_vec, c_arr = get_symbol_list(degree)
-        s_arr = np.zeros((n_states, 6), dtype=object)
-        for n, strain_v in enumerate(n_i):
-            # Get expressions
-            exps = c_arr.copy()
-            for _ in range(degree - 1):
-                exps = np.dot(exps, strain_v)
-            exps /= math.factorial(degree - 1)
-            s_arr[n] = [sp.diff(exp, symb, degree - 1) for exp in exps]
-        s_vec = s_arr.ravel()
-        present_symbols = set.union(*(exp.atoms(sp.Symbol) for exp in s_vec))
-        absent_symbols += [set(c_vec) - present_symbols]
+        c_vec, _ = get_symbol_list(degree)
+        _, index_arr = _get_symmetric_indices(degree)
+        # The (degree - 1)th derivative of the stress s_a = C_ab..z e_b..e_z / (degree - 1)!
+        # along the strain state e = n * s is C_ab..z n_b..n_z, so the coefficient of each
+        # distinct constant is the sum of the strain products over its equivalent entries
+        strain_products = np.ones((n_states, *[1] * degree))
+        for axis in range(1, degree):
+            shape = [n_states] + [1] * degree
+            shape[axis + 1] = 6
+            strain_products = strain_products * strain_states.reshape(shape)
+        strain_products = np.broadcast_to(strain_products, (n_states, *[6] * degree)).reshape(6 * n_states, -1)
         pseudo_mat = np.zeros((6 * n_states, len(c_vec)))
-        for n, c in enumerate(c_vec):
-            pseudo_mat[:, n] = v_diff(s_vec, c)
+        rows = np.arange(6 * n_states)[:, None]
+        np.add.at(pseudo_mat, (rows, np.tile(index_arr.reshape(6, -1), (n_states, 1))), strain_products)
+        absent_symbols += [set(c_vec[~pseudo_mat.any(axis=0)])]
         pseudo_inverses.append(np.linalg.pinv(pseudo_mat))
     return pseudo_inverses, absent_symbols
 
@@ -1022,14 +1148,32 @@ def get_symbol_list(rank, dim=6):
         tuple[np.array, np.array]: tuple of arrays representing the distinct
             indices and the tensor with equivalent indices assigned as above
     """
+    indices, index_arr = _get_symmetric_indices(rank, dim)
+    c_vec = np.array([sp.Symbol("c_" + "".join(map(str, idx))) for idx in indices], dtype=object)
+    return c_vec, c_vec[index_arr]
+
+
+@lru_cache(maxsize=16)
+def _get_symmetric_indices(rank: int, dim: int = 6) -> tuple[list[tuple[int, ...]], np.ndarray]:
+    """Distinct indices of a tensor invariant under index transposition.
+
+    Args:
+        rank (int): rank of tensor
+        dim (int): dimension of matrix/tensor, e.g. 6 for voigt notation
+
+    Returns:
+        tuple[list[tuple[int, ...]], np.ndarray]: the sorted distinct indices, as in
+            get_symbol_list, and an integer array of shape [dim] * rank holding the
+            position in that list of the distinct index of each entry
+    """
     indices = list(itertools.combinations_with_replacement(range(dim), r=rank))
-    c_vec = np.zeros(len(indices), dtype=object)
-    c_arr = np.zeros([dim] * rank, dtype=object)
-    for n, idx in enumerate(indices):
-        c_vec[n] = sp.Symbol("c_" + "".join(map(str, idx)))
-        for perm in itertools.permutations(idx):
-            c_arr[perm] = c_vec[n]
-    return c_vec, c_arr
+    all_indices = np.indices([dim] * rank).reshape(rank, -1).T
+    index_arr = np.zeros([dim] * rank, dtype=int)
+    # Entries related by transposition share their sorted index, whose position among the
+    # combinations with replacement is found by searching their mixed-radix encoding
+    codes = np.sort(all_indices, axis=1) @ dim ** np.arange(rank - 1, -1, -1)
+    index_arr.flat = np.searchsorted(np.array(indices) @ dim ** np.arange(rank - 1, -1, -1), codes)
+    return indices, index_arr
 
 
 def subs(entry, cmap):
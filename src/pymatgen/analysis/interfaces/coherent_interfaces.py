@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from itertools import product
+from multiprocessing import cpu_count
 from typing import TYPE_CHECKING
 
 import numpy as np
+from joblib import Parallel, delayed
 from numpy.testing import assert_allclose
 from scipy.linalg import polar
 
@@ -16,8 +18,11 @@ from pymatgen.core.surface import SlabGenerator
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
+    from typing import Literal
 
+    from pymatgen.analysis.interfaces.zsl import ZSLMatch
     from pymatgen.core import Structure
+    from pymatgen.core.surface import Slab
     from pymatgen.util.typing import Tuple3Ints
 
 
@@ -60,37 +65,51 @@ class CoherentInterfaceBuilder:
         self.termination_ftol = termination_ftol
         self.label_index = label_index
         self.filter_out_sym_slabs = filter_out_sym_slabs
+        # SlabGenerators and slabs are reused between the match and termination search and
+        # all interfaces generated for the same termination and thickness
+        self._slab_generators: dict[tuple, SlabGenerator] = {}
+        self._slabs: dict[tuple, Slab] = {}
         self._find_matches()
         self._find_terminations()
 
+    def _get_slab_generator(
+        self, role: Literal["film", "substrate"], thickness: float = 1, in_layers: bool = True
+    ) -> SlabGenerator:
+        """Get the (cached) SlabGenerator of the film or substrate for a given thickness."""
+        key = (role, thickness, in_layers)
+        if key not in self._slab_generators:
+            structure, miller = (
+                (self.film_structure, self.film_miller)
+                if role == "film"
+                else (self.substrate_structure, self.substrate_miller)
+            )
+            self._slab_generators[key] = SlabGenerator(
+                structure,
+                miller,
+                min_slab_size=thickness,
+                min_vacuum_size=3,
+                in_unit_planes=in_layers,
+                center_slab=True,
+                primitive=True,
+                reorient_lattice=False,  # This is necessary to not screw up the lattice
+            )
+        return self._slab_generators[key]
+
+    def _get_slab(
+        self, role: Literal["film", "substrate"], shift: float = 0, thickness: float = 1, in_layers: bool = True
+    ) -> Slab:
+        """Get the (cached) film or substrate slab for a given termination shift and thickness."""
+        key = (role, shift, thickness, in_layers)
+        if key not in self._slabs:
+            self._slabs[key] = self._get_slab_generator(role, thickness, in_layers).get_slab(shift=shift)
+        return self._slabs[key]
+
     def _find_matches(self) -> None:
         """Find and stores the ZSL matches."""
         self.zsl_matches = []
 
-        film_sg = SlabGenerator(
-            self.film_structure,
-            self.film_miller,
-            min_slab_size=1,
-            min_vacuum_size=3,
-            in_unit_planes=True,
-            center_slab=True,
-            primitive=True,
-            reorient_lattice=False,  # This is necessary to not screw up the lattice
-        )
-
-        sub_sg = SlabGenerator(
-            self.substrate_structure,
-            self.substrate_miller,
-            min_slab_size=1,
-            min_vacuum_size=3,
-            in_unit_planes=True,
-            center_slab=True,
-            primitive=True,
-            reorient_lattice=False,  # This is necessary to not screw up the lattice
-        )
-
-        film_slab = film_sg.get_slab(shift=0)
-        sub_slab = sub_sg.get_slab(shift=0)
+        film_slab = self._get_slab("film")
+        sub_slab = self._get_slab("substrate")
 
         film_vectors = film_slab.lattice.matrix
         substrate_vectors = sub_slab.lattice.matrix
@@ -119,27 +138,8 @@ class CoherentInterfaceBuilder:
 
     def _find_terminations(self):
         """Find all terminations."""
-        film_sg = SlabGenerator(
-            self.film_structure,
-            self.film_miller,
-            min_slab_size=1,
-            min_vacuum_size=3,
-            in_unit_planes=True,
-            center_slab=True,
-            primitive=True,
-            reorient_lattice=False,  # This is necessary to not screw up the lattice
-        )
-
-        sub_sg = SlabGenerator(
-            self.substrate_structure,
-            self.substrate_miller,
-            min_slab_size=1,
-            min_vacuum_size=3,
-            in_unit_planes=True,
-            center_slab=True,
-            primitive=True,
-            reorient_lattice=False,  # This is necessary to not screw up the lattice
-        )
+        film_sg = self._get_slab_generator("film")
+        sub_sg = self._get_slab_generator("substrate")
 
         film_slabs = film_sg.get_slabs(ftol=self.termination_ftol, filter_out_sym_slabs=self.filter_out_sym_slabs)
         sub_slabs = sub_sg.get_slabs(ftol=self.termination_ftol, filter_out_sym_slabs=self.filter_out_sym_slabs)
@@ -176,6 +176,8 @@ class CoherentInterfaceBuilder:
         film_thickness: float = 1,
         substrate_thickness: float = 1,
         in_layers: bool = True,
+        *,
+        n_jobs: int = 1,
     ) -> Iterator[Interface]:
         """Generate interface structures given the film and substrate structure
         as well as the desired terminations.
@@ -187,96 +189,151 @@ class CoherentInterfaceBuilder:
             film_thickness (float, optional): the film thickness. Defaults to 1.
             substrate_thickness (float, optional): substrate thickness. Defaults to 1.
             in_layers (bool, optional): set the thickness in layer units. Defaults to True.
+            n_jobs (int, optional): number of processes used to build the interfaces. The
+                interfaces are still yielded in the order of self.zsl_matches. Defaults to 1.
 
         Yields:
             Iterator[Interface]: interfaces from slabs
         """
-        film_sg = SlabGenerator(
-            self.film_structure,
-            self.film_miller,
-            min_slab_size=film_thickness,
-            min_vacuum_size=3,
-            in_unit_planes=in_layers,
-            center_slab=True,
-            primitive=True,
-            reorient_lattice=False,  # This is necessary to not screw up the lattice
-        )
+        film_shift, sub_shift = self._terminations[termination]
 
-        sub_sg = SlabGenerator(
-            self.substrate_structure,
-            self.substrate_miller,
-            min_slab_size=substrate_thickness,
-            min_vacuum_size=3,
-            in_unit_planes=in_layers,
-            center_slab=True,
-            primitive=True,
-            reorient_lattice=False,  # This is necessary to not screw up the lattice
-        )
+        film_slab = self._get_slab("film", film_shift, film_thickness, in_layers)
+        sub_slab = self._get_slab("substrate", sub_shift, substrate_thickness, in_layers)
+        kwargs = {
+            "termination": termination,
+            "gap": gap,
+            "vacuum_over_film": vacuum_over_film,
+            "film_thickness": film_thickness,
+            "substrate_thickness": substrate_thickness,
+        }
 
-        film_shift, sub_shift = self._terminations[termination]
+        if n_jobs == 1:
+            for match in self.zsl_matches:
+                yield _build_interface(film_slab, sub_slab, match, **kwargs)
+            return
+
+        # Build the interfaces in chunks so that only a few of them are held in memory at once
+        chunk_size = 8 * (n_jobs if n_jobs > 0 else cpu_count())
+        with Parallel(n_jobs=n_jobs) as parallel:
+            for start in range(0, len(self.zsl_matches), chunk_size):
+                yield from parallel(
+                    delayed(_build_interface)(film_slab, sub_slab, match, **kwargs)
+                    for match in self.zsl_matches[start : start + chunk_size]
+                )
+
+    def get_interface(
+        self,
+        termination: tuple[str, str],
+        zsl_match: ZSLMatch,
+        *,
+        gap: float = 2.0,
+        vacuum_over_film: float = 20.0,
+        film_thickness: float = 1,
+        substrate_thickness: float = 1,
+        in_layers: bool = True,
+    ) -> Interface:
+        """Build the interface structure of a single ZSL match and termination.
 
-        film_slab = film_sg.get_slab(shift=film_shift)
-        sub_slab = sub_sg.get_slab(shift=sub_shift)
+        Together with the zsl_matches and terminations attributes, this allows enumerating
+        and screening the candidate interfaces and only building the structures of the
+        interesting ones.
 
-        for match in self.zsl_matches:
-            # Build film superlattice
-            super_film_transform = np.round(
-                from_2d_to_3d(get_2d_transform(film_slab.lattice.matrix[:2], match.film_sl_vectors))
-            ).astype(int)
-            film_sl_slab = film_slab.copy()
-            film_sl_slab.make_supercell(super_film_transform)
-            assert_allclose(
-                film_sl_slab.lattice.matrix[2],
-                film_slab.lattice.matrix[2],
-                atol=1e-08,
-                err_msg="2D transformation affected C-axis for Film transformation",
-            )
-            assert_allclose(
-                film_sl_slab.lattice.matrix[:2],
-                match.film_sl_vectors,
-                atol=1e-08,
-                err_msg="Transformation didn't make proper supercell for film",
-            )
+        Args:
+            termination (tuple[str, str]): termination from self.termination list
+            zsl_match (ZSLMatch): lattice match, e.g. from self.zsl_matches
+            gap (float, optional): gap between film and substrate. Defaults to 2.0.
+            vacuum_over_film (float, optional): vacuum over the top of the film. Defaults to 20.0.
+            film_thickness (float, optional): the film thickness. Defaults to 1.
+            substrate_thickness (float, optional): substrate thickness. Defaults to 1.
+            in_layers (bool, optional): set the thickness in layer units. Defaults to True.
 
-            # Build substrate superlattice
-            super_sub_transform = np.round(
-                from_2d_to_3d(get_2d_transform(sub_slab.lattice.matrix[:2], match.substrate_sl_vectors))
-            ).astype(int)
-            sub_sl_slab = sub_slab.copy()
-            sub_sl_slab.make_supercell(super_sub_transform)
-            assert_allclose(
-                sub_sl_slab.lattice.matrix[2],
-                sub_slab.lattice.matrix[2],
-                atol=1e-08,
-                err_msg="2D transformation affected C-axis for Film transformation",
-            )
-            assert_allclose(
-                sub_sl_slab.lattice.matrix[:2],
-                match.substrate_sl_vectors,
-                atol=1e-08,
-                err_msg="Transformation didn't make proper supercell for substrate",
-            )
+        Returns:
+            Interface: interface from slabs
+        """
+        film_shift, sub_shift = self._terminations[termination]
 
-            # Add extra info
-            match_dict = match.as_dict()
-            interface_properties = {k: match_dict[k] for k in match_dict if not k.startswith("@")}
-
-            dfm = Deformation(match.match_transformation)
-
-            strain = dfm.green_lagrange_strain
-            interface_properties["strain"] = strain
-            interface_properties["von_mises_strain"] = strain.von_mises_strain
-            interface_properties["termination"] = termination
-            interface_properties["film_thickness"] = film_thickness
-            interface_properties["substrate_thickness"] = substrate_thickness
-
-            yield Interface.from_slabs(
-                substrate_slab=sub_sl_slab,
-                film_slab=film_sl_slab,
-                gap=gap,
-                vacuum_over_film=vacuum_over_film,
-                interface_properties=interface_properties,
-            )
+        return _build_interface(
+            self._get_slab("film", film_shift, film_thickness, in_layers),
+            self._get_slab("substrate", sub_shift, substrate_thickness, in_layers),
+            zsl_match,
+            termination=termination,
+            gap=gap,
+            vacuum_over_film=vacuum_over_film,
+            film_thickness=film_thickness,
+            substrate_thickness=substrate_thickness,
+        )
+
+
+def _build_interface(
+    film_slab: Slab,
+    sub_slab: Slab,
+    match: ZSLMatch,
+    *,
+    termination: tuple[str, str],
+    gap: float,
+    vacuum_over_film: float,
+    film_thickness: float,
+    substrate_thickness: float,
+) -> Interface:
+    """Build an Interface from the film and substrate slabs of a termination and a ZSL match."""
+    # Build film superlattice
+    super_film_transform = np.round(
+        from_2d_to_3d(get_2d_transform(film_slab.lattice.matrix[:2], match.film_sl_vectors))
+    ).astype(int)
+    film_sl_slab = film_slab.copy()
+    film_sl_slab.make_supercell(super_film_transform)
+    assert_allclose(
+        film_sl_slab.lattice.matrix[2],
+        film_slab.lattice.matrix[2],
+        atol=1e-08,
+        err_msg="2D transformation affected C-axis for Film transformation",
+    )
+    assert_allclose(
+        film_sl_slab.lattice.matrix[:2],
+        match.film_sl_vectors,
+        atol=1e-08,
+        err_msg="Transformation didn't make proper supercell for film",
+    )
+
+    # Build substrate superlattice
+    super_sub_transform = np.round(
+        from_2d_to_3d(get_2d_transform(sub_slab.lattice.matrix[:2], match.substrate_sl_vectors))
+    ).astype(int)
+    sub_sl_slab = sub_slab.copy()
+    sub_sl_slab.make_supercell(super_sub_transform)
+    assert_allclose(
+        sub_sl_slab.lattice.matrix[2],
+        sub_slab.lattice.matrix[2],
+        atol=1e-08,
+        err_msg="2D transformation affected C-axis for Film transformation",
+    )
+    assert_allclose(
+        sub_sl_slab.lattice.matrix[:2],
+        match.substrate_sl_vectors,
+        atol=1e-08,
+        err_msg="Transformation didn't make proper supercell for substrate",
+    )
+
+    # Add extra info
+    match_dict = match.as_dict()
+    interface_properties = {k: match_dict[k] for k in match_dict if not k.startswith("@")}
+
+    dfm = Deformation(match.match_transformation)
+
+    strain = dfm.green_lagrange_strain
+    interface_properties["strain"] = strain
+    interface_properties["von_mises_strain"] = strain.von_mises_strain
+    interface_properties["termination"] = termination
+    interface_properties["film_thickness"] = film_thickness
+    interface_properties["substrate_thickness"] = substrate_thickness
+
+    return Interface.from_slabs(
+        substrate_slab=sub_sl_slab,
+        film_slab=film_sl_slab,
+        gap=gap,
+        vacuum_over_film=vacuum_over_film,
+        interface_properties=interface_properties,
+    )
 
 
 def get_rot_3d_for_2d(film_matrix, sub_matrix) -> np.ndarray:
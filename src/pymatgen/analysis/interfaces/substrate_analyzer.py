@@ -124,21 +124,20 @@ class SubstrateAnalyzer(ZSLGenerator):
             substrate_millers (array): all miller indices to generate slabs
                 for substrate
         """
+
+        def get_vectors(structure, miller):
+            slab = SlabGenerator(structure, miller, 20, 15, primitive=False).get_slab()
+            return reduce_vectors(slab.oriented_unit_cell.lattice.matrix[0], slab.oriented_unit_cell.lattice.matrix[1])
+
+        # The substrate slabs do not depend on the film facet, so only generate them once
+        substrate_vector_list = [get_vectors(substrate, s_miller) for s_miller in substrate_millers]
+
         vector_sets = []
 
         for f_miller in film_millers:
-            film_slab = SlabGenerator(film, f_miller, 20, 15, primitive=False).get_slab()
-            film_vectors = reduce_vectors(
-                film_slab.oriented_unit_cell.lattice.matrix[0], film_slab.oriented_unit_cell.lattice.matrix[1]
-            )
-
-            for s_miller in substrate_millers:
-                substrate_slab = SlabGenerator(substrate, s_miller, 20, 15, primitive=False).get_slab()
-                substrate_vectors = reduce_vectors(
-                    substrate_slab.oriented_unit_cell.lattice.matrix[0],
-                    substrate_slab.oriented_unit_cell.lattice.matrix[1],
-                )
+            film_vectors = get_vectors(film, f_miller)
 
+            for s_miller, substrate_vectors in zip(substrate_millers, substrate_vector_list, strict=True):
                 vector_sets.append((film_vectors, substrate_vectors, f_miller, s_miller))
 
         return vector_sets
@@ -152,6 +151,8 @@ class SubstrateAnalyzer(ZSLGenerator):
         substrate_millers: ArrayLike = None,
         ground_state_energy=0,
         lowest=False,
+        *,
+        n_jobs: int = 1,
     ):
         """Find all topological matches for the substrate and calculates elastic
         strain energy and total energy for the film if elasticity tensor and
@@ -169,6 +170,9 @@ class SubstrateAnalyzer(ZSLGenerator):
                 defined by miller indices
             ground_state_energy (float): ground state energy for the film
             lowest (bool): only consider lowest matching area for each surface
+            n_jobs (int): number of processes used to run the lattice matching of all
+                film/substrate Miller index combinations. Defaults to 1, which matches
+                the combinations lazily one at a time.
         """
         # Generate miller indices if none specified for film
         if film_millers is None:
@@ -180,13 +184,18 @@ class SubstrateAnalyzer(ZSLGenerator):
 
         # Check each miller index combination
         surface_vector_sets = self.generate_surface_vectors(film, substrate, film_millers, substrate_millers)
-        for [
-            film_vectors,
-            substrate_vectors,
-            film_miller,
-            substrate_miller,
-        ] in surface_vector_sets:
-            for match in self(film_vectors, substrate_vectors, lowest):
+        if n_jobs == 1:
+            all_matches = (
+                self(film_vectors, substrate_vectors, lowest)
+                for film_vectors, substrate_vectors, *_ in surface_vector_sets
+            )
+        else:
+            all_matches = self.get_matches_batch(
+                [vecs[:2] for vecs in surface_vector_sets], lowest=lowest, n_jobs=n_jobs
+            )
+
+        for (_, _, film_miller, substrate_miller), matches in zip(surface_vector_sets, all_matches, strict=True):
+            for match in matches:
                 sub_match = SubstrateMatch.from_zsl(
                     match=match,
                     film=film,
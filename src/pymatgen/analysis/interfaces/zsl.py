@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import product
 from typing import TYPE_CHECKING
 
 import numpy as np
+from joblib import Parallel, delayed
 from monty.json import MSONable
 
 from pymatgen.util.due import Doi, due
 from pymatgen.util.numba import njit
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
+
+    from numpy.typing import ArrayLike
 
 
 @dataclass
@@ -161,27 +163,21 @@ class ZSLGenerator(MSONable):
                 lattices
         """
         for film_transformations, substrate_transformations in transformation_sets:
-            # Apply transformations and reduce using Zur reduce methodology
-            films = np.array([reduce_vectors(*v) for v in np.dot(film_transformations, film_vectors)], dtype=float)
-
-            substrates = np.array(
-                [reduce_vectors(*v) for v in np.dot(substrate_transformations, substrate_vectors)], dtype=float
+            # Apply transformations and reduce all super lattices at once using Zur reduce methodology
+            films = reduce_vectors_batch(np.dot(film_transformations, film_vectors))
+            substrates = reduce_vectors_batch(np.dot(substrate_transformations, substrate_vectors))
+
+            # Check all film/substrate pairs for equivalent super lattices, in the order of
+            # itertools.product(films, substrates)
+            same = is_same_vectors_batch(
+                films,
+                substrates,
+                bidirectional=self.bidirectional,
+                max_length_tol=self.max_length_tol,
+                max_angle_tol=self.max_angle_tol,
             )
-
-            # Check if equivalent super lattices
-            for (f_trans, s_trans), (f, s) in zip(
-                product(film_transformations, substrate_transformations),
-                product(films, substrates),
-                strict=True,
-            ):
-                if is_same_vectors(
-                    f,
-                    s,
-                    bidirectional=self.bidirectional,
-                    max_length_tol=self.max_length_tol,
-                    max_angle_tol=self.max_angle_tol,
-                ):
-                    yield [f, s, f_trans, s_trans]
+            for f_idx, s_idx in zip(*np.nonzero(same), strict=True):
+                yield [films[f_idx], substrates[s_idx], film_transformations[f_idx], substrate_transformations[s_idx]]
 
     def __call__(self, film_vectors, substrate_vectors, lowest=False) -> Iterator[ZSLMatch]:
         """Runs the ZSL algorithm to generate all possible matching."""
@@ -212,6 +208,37 @@ class ZSLGenerator(MSONable):
             if lowest:
                 break
 
+    def get_matches_batch(
+        self,
+        vector_sets: Sequence[tuple[ArrayLike, ArrayLike]],
+        lowest: bool = False,
+        n_jobs: int = 1,
+    ) -> list[list[ZSLMatch]]:
+        """Run the ZSL algorithm for many film/substrate vector pairs, e.g. for all
+        combinations of films, substrates and Miller indices in a screening.
+
+        Args:
+            vector_sets (list[tuple]): (film_vectors, substrate_vectors) pairs.
+            lowest (bool): Whether to only return the lowest area match of each pair.
+            n_jobs (int): Number of processes to distribute the pairs over. Defaults to 1.
+
+        Returns:
+            list[list[ZSLMatch]]: The matches of each pair, in the order of vector_sets.
+        """
+        if n_jobs == 1:
+            return [
+                list(self(film_vectors, substrate_vectors, lowest)) for film_vectors, substrate_vectors in vector_sets
+            ]
+        return Parallel(n_jobs=n_jobs)(
+            delayed(_get_matches)(self, film_vectors, substrate_vectors, lowest)
+            for film_vectors, substrate_vectors in vector_sets
+        )
+
+
+def _get_matches(zsl: ZSLGenerator, film_vectors, substrate_vectors, lowest: bool) -> list[ZSLMatch]:
+    """Collect the matches of a ZSLGenerator, used to run it in a process pool."""
+    return list(zsl(film_vectors, substrate_vectors, lowest))
+
 
 @njit
 def gen_sl_transform_matrices(area_multiple):
@@ -306,6 +333,93 @@ def reduce_vectors(a, b):
     return (a, b)
 
 
+def _row_dot(vecs1: np.ndarray, vecs2: np.ndarray) -> np.ndarray:
+    """Row-wise dot products of two (n, 3) arrays, computed like np.dot on each row."""
+    return np.matmul(vecs1[:, None, :], vecs2[:, :, None])[:, 0, 0]
+
+
+def _row_norm(vecs: np.ndarray) -> np.ndarray:
+    """Row-wise fast_norm of an (n, 3) array."""
+    return np.sqrt(_row_dot(vecs, vecs))
+
+
+def _row_angle(vecs1: np.ndarray, vecs2: np.ndarray) -> np.ndarray:
+    """Row-wise vec_angle of two (n, 3) arrays."""
+    return np.arctan2(_row_norm(np.cross(vecs1, vecs2)), _row_dot(vecs1, vecs2))
+
+
+def reduce_vectors_batch(vector_sets: ArrayLike) -> np.ndarray:
+    """Vectorized version of reduce_vectors for many pairs of vectors at once.
+
+    Every pair goes through exactly the same sequence of reduction steps as in
+    reduce_vectors, so the results are identical.
+
+    Args:
+        vector_sets (ArrayLike): (n, 2, 3) array of n pairs of vectors.
+
+    Returns:
+        np.ndarray: (n, 2, 3) array of the reduced pairs of vectors.
+    """
+    vecs = np.array(vector_sets, dtype=np.float64).reshape(-1, 2, 3)
+    active = np.arange(len(vecs))
+    while len(active) > 0:
+        vec_a, vec_b = vecs[active, 0], vecs[active, 1]
+        norm_b = _row_norm(vec_b)
+        # apply the first applicable reduction step of each pair, as reduce_vectors does
+        flip = _row_dot(vec_a, vec_b) < 0
+        swap = ~flip & (_row_norm(vec_a) > norm_b)
+        add = ~flip & ~swap & (norm_b > _row_norm(vec_b + vec_a))
+        sub = ~flip & ~swap & ~add & (norm_b > _row_norm(vec_b - vec_a))
+
+        new_b = np.where(flip[:, None], -vec_b, vec_b)
+        new_b = np.where(add[:, None], vec_b + vec_a, new_b)
+        new_b = np.where(sub[:, None], vec_b - vec_a, new_b)
+        vecs[active, 0] = np.where(swap[:, None], vec_b, vec_a)
+        vecs[active, 1] = np.where(swap[:, None], vec_a, new_b)
+
+        active = active[flip | swap | add | sub]
+    return vecs
+
+
+def is_same_vectors_batch(
+    vec_sets1: ArrayLike,
+    vec_sets2: ArrayLike,
+    bidirectional: bool = False,
+    max_length_tol: float = 0.03,
+    max_angle_tol: float = 0.01,
+) -> np.ndarray:
+    """Vectorized version of is_same_vectors comparing every vector set in vec_sets1
+    with every vector set in vec_sets2 using broadcasted length and angle comparisons.
+
+    Args:
+        vec_sets1 (ArrayLike): (n, 2, 3) array of n sets of two vectors.
+        vec_sets2 (ArrayLike): (m, 2, 3) array of m sets of two vectors.
+        bidirectional (bool): Whether to also check the match from vec_sets2 onto vec_sets1.
+        max_length_tol (float): Maximum relative length tolerance.
+        max_angle_tol (float): Maximum relative angle tolerance.
+
+    Returns:
+        np.ndarray: (n, m) boolean array, True where is_same_vectors would be True.
+    """
+    vec_sets1 = np.asarray(vec_sets1, dtype=np.float64).reshape(-1, 2, 3)
+    vec_sets2 = np.asarray(vec_sets2, dtype=np.float64).reshape(-1, 2, 3)
+    norms1 = np.stack([_row_norm(vec_sets1[:, 0]), _row_norm(vec_sets1[:, 1])], axis=1)
+    norms2 = np.stack([_row_norm(vec_sets2[:, 0]), _row_norm(vec_sets2[:, 1])], axis=1)
+    angles1 = _row_angle(vec_sets1[:, 0], vec_sets1[:, 1])
+    angles2 = _row_angle(vec_sets2[:, 0], vec_sets2[:, 1])
+
+    def unidirectional(norms_from, norms_to, angles_from, angles_to):
+        # written with the same comparisons as _unidirectional_is_same_vectors, including NaN handling
+        strain = norms_to[None, :, :] / norms_from[:, None, :] - 1
+        same = ~(np.abs(strain) > max_length_tol).any(axis=-1)
+        return same & (np.abs(angles_to[None, :] / angles_from[:, None] - 1) <= max_angle_tol)
+
+    same = unidirectional(norms1, norms2, angles1, angles2)
+    if bidirectional:
+        same |= unidirectional(norms2, norms1, angles2, angles1).T
+    return same
+
+
 @njit
 def get_factors(n):
     """Generate all factors of n."""
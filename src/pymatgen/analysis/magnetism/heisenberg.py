@@ -6,13 +6,13 @@ model.
 
 from __future__ import annotations
 
-import copy
 import logging
 from ast import literal_eval
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from monty.json import MSONable, jsanitize
 from monty.serialization import dumpfn
 
@@ -32,6 +32,8 @@ __email__ = "ncfrey@lbl.gov"
 __status__ = "Development"
 __date__ = "June 2019"
 
+SHELL_LABELS = ("nn", "nnn", "nnnn")
+
 
 class HeisenbergMapper:
     """Compute exchange parameters from low energy magnetic orderings.
@@ -47,7 +49,7 @@ class HeisenbergMapper:
         ex_params (dict): Exchange parameter values (meV/atom)
     """
 
-    def __init__(self, ordered_structures, energies, cutoff=0, tol: float = 0.02):
+    def __init__(self, ordered_structures, energies, cutoff=0, tol: float = 0.02, n_jobs: int = 1):
         """Exchange parameters are computed by mapping to a classical Heisenberg
         model. Strategy is the scheme for generating neighbors. Currently only
         MinimumDistanceNN is implemented.
@@ -67,6 +69,8 @@ class HeisenbergMapper:
                 Defaults to 0 (only NN, no NNN, etc.)
             tol (float): Tolerance (in Angstrom) on nearest neighbor distances
                 being equal.
+            n_jobs (int): Number of processes used to construct the graphs of
+                the orderings. Defaults to 1, i.e. serial.
         """
         # Save original copies of inputs
         self.ordered_structures_ = ordered_structures
@@ -83,7 +87,8 @@ class HeisenbergMapper:
         self.tol = tol
 
         # Get graph representations
-        self.sgraphs = self._get_graphs(cutoff, ordered_structures)
+        self.sgraphs = self._get_graphs(cutoff, ordered_structures, n_jobs=n_jobs)
+        self._connections = [self._get_connections(sgraph) for sgraph in self.sgraphs]
 
         # Get unique site ids and wyckoff symbols
         self.unique_site_ids, self.wyckoff_ids = self._get_unique_sites(ordered_structures[0])
@@ -100,13 +105,14 @@ class HeisenbergMapper:
         self._get_exchange_df()
 
     @staticmethod
-    def _get_graphs(cutoff, ordered_structures):
+    def _get_graphs(cutoff, ordered_structures, n_jobs=1):
         """Generate graph representations of magnetic structures with nearest
         neighbor bonds. Right now this only works for MinimumDistanceNN.
 
         Args:
             cutoff (float): Cutoff in Angstrom for nearest neighbor search.
             ordered_structures (list): Structure objects.
+            n_jobs (int): Number of processes used. Defaults to 1, i.e. serial.
 
         Returns:
             sgraphs (list): StructureGraph objects.
@@ -115,7 +121,11 @@ class HeisenbergMapper:
         strategy = MinimumDistanceNN(cutoff=cutoff, get_all_sites=True) if cutoff else MinimumDistanceNN()  # only NN
 
         # Generate structure graphs
-        return [StructureGraph.from_local_env_strategy(s, strategy=strategy) for s in ordered_structures]
+        if n_jobs == 1:
+            return [StructureGraph.from_local_env_strategy(s, strategy=strategy) for s in ordered_structures]
+        return Parallel(n_jobs=n_jobs)(
+            delayed(StructureGraph.from_local_env_strategy)(s, strategy=strategy) for s in ordered_structures
+        )
 
     @staticmethod
     def _get_unique_sites(structure):
@@ -156,30 +166,76 @@ class HeisenbergMapper:
 
         return unique_site_ids, wyckoff_ids
 
+    @staticmethod
+    def _get_connections(sgraph):
+        """Get all connections in a graph from a single pass over its edges. As in
+        StructureGraph.get_connected_sites, each bond is listed from both of its sites.
+
+        Args:
+            sgraph (StructureGraph): Graph of a magnetic structure.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Site indices i, neighbor
+                indices j, periodic images of the neighbors and i <-> j distances, sorted
+                by site and distance.
+        """
+        edges = list(sgraph.graph.edges(data="to_jimage"))
+        from_idx = np.array([edge[0] for edge in edges], dtype=int)
+        to_idx = np.array([edge[1] for edge in edges], dtype=int)
+        images = np.array([edge[2] for edge in edges], dtype=int).reshape(-1, 3)
+
+        # Bonds seen from both sites, dropping bonds that are stored in both directions
+        connections = np.column_stack([np.r_[from_idx, to_idx], np.r_[to_idx, from_idx], np.r_[images, -images]])
+        connections = np.unique(connections, axis=0).reshape(-1, 5)
+        sites, neighbors, images = connections[:, 0], connections[:, 1], connections[:, 2:]
+
+        frac_coords = sgraph.structure.frac_coords
+        cart_vecs = sgraph.structure.lattice.get_cartesian_coords(frac_coords[neighbors] + images - frac_coords[sites])
+        dists = np.linalg.norm(cart_vecs, axis=1)
+
+        order = np.lexsort((dists, sites))
+        return sites[order], neighbors[order], images[order], dists[order]
+
+    def _get_site_ids(self, n_sites):
+        """Get the unique numerical identifiers of the first n_sites sites.
+
+        Args:
+            n_sites (int): Number of sites.
+
+        Returns:
+            np.ndarray: Identifier of each site, -1 for sites without one.
+        """
+        site_ids = np.full(n_sites, -1)
+        for indices, site_id in self.unique_site_ids.items():
+            site_ids[[idx for idx in indices if idx < n_sites]] = site_id
+        return site_ids
+
+    def _get_shells(self, dists):
+        """Get the neighbor shell of each i <-> j distance.
+
+        Args:
+            dists (np.ndarray): Distances (Angstrom) between sites.
+
+        Returns:
+            np.ndarray: 0, 1 or 2 for NN, NNN and NNNN distances, -1 otherwise.
+        """
+        conditions = [np.abs(dists - self.dists[label]) <= self.tol for label in SHELL_LABELS]
+        return np.select(conditions, range(len(SHELL_LABELS)), default=-1)
+
     def _get_nn_dict(self):
         """Set self.nn_interactions and self.dists instance variables describing unique
         nearest neighbor interactions.
         """
         tol = self.tol  # tolerance on NN distances
-        sgraph = self.sgraphs[0]
+        sites, neighbors, _, dists = self._connections[0]
+        dists = np.round(dists, 2)  # i<->j distances
         unique_site_ids = self.unique_site_ids
 
-        nn_dict = {}
-        nnn_dict = {}
-        nnnn_dict = {}
-
-        all_dists = []
-
         # Loop over unique sites and get neighbor distances up to NNNN
+        all_dists = []
         for k in unique_site_ids:
-            i = k[0]
-            i_key = unique_site_ids[k]
-            connected_sites = sgraph.get_connected_sites(i)
-            dists = [round(cs[-1], 2) for cs in connected_sites]  # i<->j distances
-            dists = sorted(set(dists))  # NN, NNN, NNNN, etc.
-
-            dists = dists[:3]  # keep up to NNNN
-            all_dists += dists
+            site_dists = np.unique(dists[sites == k[0]])  # NN, NNN, NNNN, etc.
+            all_dists += site_dists[:3].tolist()  # keep up to NNNN
 
         # Keep only up to NNNN and call dists equal if they are within tol
         all_dists = sorted(set(all_dists))
@@ -193,54 +249,30 @@ class HeisenbergMapper:
         if len(all_dists) < 3:  # pad with zeros
             all_dists += [0] * (3 - len(all_dists))
 
-        all_dists = all_dists[:3]
-        labels = ("nn", "nnn", "nnnn")
-        dists = dict(zip(labels, all_dists, strict=True))
+        self.dists = dict(zip(SHELL_LABELS, all_dists[:3], strict=True))
 
-        # Get dictionary keys for interactions
-        for k in unique_site_ids:
-            i = k[0]
-            i_key = unique_site_ids[k]
-            connected_sites = sgraph.get_connected_sites(i)
-
-            # Loop over sites and determine unique NN, NNN, etc. interactions
-            for cs in connected_sites:
-                dist = round(cs[-1], 2)  # i_j distance
-
-                j = cs[2]  # j index
-                j_key = None
-                for key, value in unique_site_ids.items():
-                    if j in key:
-                        j_key = value
-                if abs(dist - dists["nn"]) <= tol:
-                    nn_dict[i_key] = j_key
-                elif abs(dist - dists["nnn"]) <= tol:
-                    nnn_dict[i_key] = j_key
-                elif abs(dist - dists["nnnn"]) <= tol:
-                    nnnn_dict[i_key] = j_key
-
-        nn_interactions = {"nn": nn_dict, "nnn": nnn_dict, "nnnn": nnnn_dict}
+        # Determine unique NN, NNN, etc. interactions from the farthest neighbor
+        # of each unique site in each shell
+        shells = self._get_shells(dists)
+        site_ids = self._get_site_ids(len(self.sgraphs[0].structure))
+        nn_interactions = {label: {} for label in SHELL_LABELS}
+        for k, i_key in unique_site_ids.items():
+            for shell, label in enumerate(SHELL_LABELS):
+                j_sites = neighbors[(sites == k[0]) & (shells == shell)]
+                if len(j_sites) > 0:
+                    nn_interactions[label][i_key] = int(site_ids[j_sites[-1]])
 
-        self.dists = dists
         self.nn_interactions = nn_interactions
 
     def _get_exchange_df(self):
         """
-        Loop over all sites in a graph and count the number and types of
-        nearest neighbor interactions, computing +-|S_i . S_j| to construct
+        Count the number and types of nearest neighbor interactions in each
+        graph, summing +-|S_i . S_j| over all connections at once to construct
         a Heisenberg Hamiltonian for each graph. Sets self.ex_mat instance variable.
 
         TODO Deal with large variance in |S| across configs
         """
-        sgraphs = self.sgraphs
-        tol = self.tol
-        unique_site_ids = self.unique_site_ids
         nn_interactions = self.nn_interactions
-        dists = self.dists
-
-        # Get |site magmoms| from FM ordering so that S_i and S_j are consistent?
-        # Large S variations is throwing a loop
-        # fm_struct = self.get_low_energy_orderings()[0]
 
         # Total energy and nonmagnetic energy contribution
         columns = ["E", "E0"]
@@ -253,98 +285,66 @@ class HeisenbergMapper:
                 if c not in columns and c_rev not in columns:
                     columns.append(c)
 
-        n_sgraphs = len(sgraphs)
+        n_sgraphs = len(self.sgraphs)
 
         # Keep n interactions (not counting 'E') for n+1 structure graphs
         columns = columns[: n_sgraphs + 1]
-
-        n_nn_j = len(columns) - 1  # ignore total energy
-        j_columns = [name for name in columns if name not in ["E", "E0"]]
-        ex_mat_empty = pd.DataFrame(columns=columns)
-        ex_mat = ex_mat_empty.copy()
+        j_columns = columns[2:]
 
         if len(j_columns) < 2:
-            self.ex_mat = ex_mat  # Only <J> can be calculated here
-        else:
-            sgraphs_copy = copy.deepcopy(sgraphs)
-            sgraph_index = 0
-
-            # Loop over all sites in each graph and compute |S_i . S_j|
-            # for n+1 unique graphs to compute n exchange params
-            order = ""
-            for _graph in sgraphs:
-                sgraph = sgraphs_copy.pop(0)
-                ex_row = pd.DataFrame(np.zeros((1, n_nn_j + 1)), index=[sgraph_index], columns=columns)
-
-                for idx, _node in enumerate(sgraph.graph.nodes):
-                    # s_i_sign = np.sign(sgraph.structure.site_properties['magmom'][i])
-                    s_i = sgraph.structure.site_properties["magmom"][idx]
-
-                    i_index = None
-                    for k, v in unique_site_ids.items():
-                        if idx in k:
-                            i_index = v
-
-                    # Get all connections for ith site and compute |S_i . S_j|
-                    connections = sgraph.get_connected_sites(idx)
-                    # dists = [round(cs[-1], 2) for cs in connections]  # i<->j distances
-                    # dists = sorted(list(set(dists)))  # NN, NNN, NNNN, etc.
-
-                    for connection in connections:
-                        j_site = connection[2]
-                        dist = round(connection[-1], 2)  # i_j distance
-
-                        # s_j_sign = np.sign(sgraph.structure.site_properties['magmom'][j_site])
-                        s_j = sgraph.structure.site_properties["magmom"][j_site]
-
-                        j_index = None
-                        for k, v in unique_site_ids.items():
-                            if j_site in k:
-                                j_index = v
-
-                        # Determine order of connection
-                        if abs(dist - dists["nn"]) <= tol:
-                            order = "-nn"
-                        elif abs(dist - dists["nnn"]) <= tol:
-                            order = "-nnn"
-                        elif abs(dist - dists["nnnn"]) <= tol:
-                            order = "-nnnn"
-
-                        j_ij = f"{i_index}-{j_index}{order}"
-                        j_ji = f"{j_index}-{i_index}{order}"
-
-                        if j_ij in ex_mat.columns:
-                            ex_row.loc[sgraph_index, j_ij] -= s_i * s_j
-                        elif j_ji in ex_mat.columns:
-                            ex_row.loc[sgraph_index, j_ji] -= s_i * s_j
-
-                # Ignore the row if it is a duplicate to avoid singular matrix
-                # Create a temporary DataFrame with the new row
-                temp_df = pd.concat([ex_mat, ex_row], ignore_index=True)
-                if temp_df[j_columns].equals(temp_df[j_columns].drop_duplicates(keep="first")):
-                    e_index = self.ordered_structures.index(sgraph.structure)
-                    ex_row.loc[sgraph_index, "E"] = self.energies[e_index]
-                    sgraph_index += 1
-                    ex_mat = pd.concat([ex_mat, ex_row], ignore_index=True)
-                    # if sgraph_index == num_nn_j:  # check for zero columns
-                    #     zeros = [b for b in (ex_mat[j_columns] == 0).all(axis=0)]
-                    #     if True in zeros:
-                    #         sgraph_index -= 1  # keep looking
-
-            ex_mat[j_columns] = ex_mat[j_columns].div(2)  # 1/2 factor in Heisenberg Hamiltonian
-            ex_mat[["E0"]] = 1  # Nonmagnetic contribution
-
-            # Check for singularities and delete columns with all zeros
-            zeros = list((ex_mat == 0).all(axis=0))
-            if True in zeros:
-                c = ex_mat.columns[zeros.index(True)]
-                ex_mat = ex_mat.drop(columns=[c], axis=1)
-                # ex_mat = ex_mat.drop(ex_mat.tail(len_zeros).index)
-
-            # Force ex_mat to be square
-            ex_mat = ex_mat[: ex_mat.shape[1] - 1]
-
-            self.ex_mat = ex_mat
+            self.ex_mat = pd.DataFrame(columns=columns)  # Only <J> can be calculated here
+            return
+
+        # Map i-j-shell interactions between unique sites to columns, looking up
+        # the j-i-shell label if there is no i-j-shell one
+        n_ids = len(self.unique_site_ids)
+        column_lookup = np.full((n_ids, n_ids, len(SHELL_LABELS)), -1)
+        interactions = [name.split("-") for name in j_columns]
+        for col, (i_key, j_key, label) in enumerate(interactions):
+            column_lookup[int(i_key), int(j_key), SHELL_LABELS.index(label)] = col
+        for col, (i_key, j_key, label) in enumerate(interactions):
+            if column_lookup[int(j_key), int(i_key), SHELL_LABELS.index(label)] < 0:
+                column_lookup[int(j_key), int(i_key), SHELL_LABELS.index(label)] = col
+
+        # Sum -|S_i . S_j| over all connections for n+1 unique graphs to
+        # compute n exchange params
+        ex_rows = np.zeros((n_sgraphs, len(j_columns)))
+        last_shell = -1
+        for ex_row, sgraph, (sites, neighbors, _, dists) in zip(ex_rows, self.sgraphs, self._connections, strict=True):
+            magmoms = np.array(sgraph.structure.site_properties["magmom"], dtype=float)
+            site_ids = self._get_site_ids(len(magmoms))
+
+            # Connections outside of the NN, NNN and NNNN shells count towards
+            # the shell of the connection before them
+            shells = np.r_[last_shell, self._get_shells(np.round(dists, 2))]
+            shells = shells[np.maximum.accumulate(np.where(shells >= 0, np.arange(len(shells)), 0))][1:]
+            last_shell = shells[-1] if len(shells) > 0 else last_shell
+
+            i_ids, j_ids = site_ids[sites], site_ids[neighbors]
+
+            valid = (i_ids >= 0) & (j_ids >= 0) & (shells >= 0)
+            cols = np.full(len(sites), -1)
+            cols[valid] = column_lookup[i_ids[valid], j_ids[valid], shells[valid]]
+            np.add.at(ex_row, cols[cols >= 0], -(magmoms[sites] * magmoms[neighbors])[cols >= 0])
+
+        # Ignore duplicate rows to avoid singular matrix
+        _, unique_idx = np.unique(ex_rows, axis=0, return_index=True)
+        unique_idx = np.sort(unique_idx)
+
+        ex_mat = pd.DataFrame(ex_rows[unique_idx] / 2, columns=j_columns)  # 1/2 factor in Heisenberg Hamiltonian
+        ex_mat.insert(0, "E", np.asarray(self.energies, dtype=float)[unique_idx])
+        ex_mat.insert(1, "E0", 1.0)  # Nonmagnetic contribution
+
+        # Check for singularities and delete columns with all zeros
+        zeros = list((ex_mat == 0).all(axis=0))
+        if True in zeros:
+            c = ex_mat.columns[zeros.index(True)]
+            ex_mat = ex_mat.drop(columns=[c], axis=1)
+
+        # Force ex_mat to be square
+        ex_mat = ex_mat[: ex_mat.shape[1] - 1]
+
+        self.ex_mat = ex_mat
 
     def get_exchange(self):
         """
@@ -538,7 +538,7 @@ class HeisenbergMapper:
             StructureGraph: Exchange interaction graph.
         """
         structure = self.ordered_structures[0]
-        sgraph = self.sgraphs[0]
+        sites, neighbors, images, dists = self._connections[0]
 
         igraph = StructureGraph.from_empty_graph(
             structure, edge_weight_name="exchange_constant", edge_weight_units="meV"
@@ -551,17 +551,16 @@ class HeisenbergMapper:
                 """
             logging.warning(warning_msg)
 
-        # J_ij exchange interaction matrix
-        for idx in range(len(sgraph.graph.nodes)):
-            connections = sgraph.get_connected_sites(idx)
-            for c in connections:
-                jimage = c[1]  # relative integer coordinates of atom j
-                j = c[2]  # index of neighbor
-                dist = c[-1]  # i <-> j distance
+        # J_ij exchange interaction matrix, looked up once per unique interaction
+        site_ids = self._get_site_ids(len(structure))
+        interactions = np.column_stack([site_ids[sites], site_ids[neighbors], self._get_shells(dists)])
+        _, first_idx, inverse = np.unique(interactions, axis=0, return_index=True, return_inverse=True)
+        j_excs = [self._get_j_exc(sites[idx], neighbors[idx], dists[idx]) for idx in first_idx]
 
-                j_exc = self._get_j_exc(idx, j, dist)
-
-                igraph.add_edge(idx, j, to_jimage=jimage, weight=j_exc, warn_duplicates=False)
+        for i, j, jimage, interaction in zip(sites, neighbors, images, inverse.ravel(), strict=True):
+            igraph.add_edge(
+                int(i), int(j), to_jimage=tuple(jimage.tolist()), weight=j_excs[interaction], warn_duplicates=False
+            )
 
         # Save to a JSON file if desired
         if filename:
@@ -16,9 +16,9 @@ from collections import defaultdict
 import numpy as np
 from monty.dev import deprecated
 from scipy.constants import physical_constants
-from scipy.integrate import quadrature
 from scipy.misc import derivative
 from scipy.optimize import minimize
+from scipy.special import bernoulli, factorial
 
 from pymatgen.analysis.eos import EOS, PolynomialEOS
 from pymatgen.core.units import FloatWithUnit
@@ -30,6 +30,9 @@ __credits__ = "Cormac Toher"
 
 logger = logging.getLogger(__name__)
 
+# Number of terms of the series expansions of the Debye integral
+_N_DEBYE_TERMS = 40
+
 
 cite_gibbs = due.dcite(
     Doi("10.1016/j.comphy.2003.12.001"),
@@ -131,10 +134,13 @@ class QuasiHarmonicDebyeApprox:
             int(np.ceil((self.temperature_max - self.temperature_min) / self.temperature_step) + 1),
         )
 
-        for temp in temperatures:
+        # A_vib(V, T) on the whole temperature x volume grid in one pass
+        vib_free_energies = self.vibrational_free_energy(temperatures[:, None], np.asarray(self.volumes))
+
+        for temp, vib_free_energy in zip(temperatures, vib_free_energies, strict=True):
             G_opt = V_opt = None
             try:
-                G_opt, V_opt = self.optimizer(temp)
+                G_opt, V_opt = self._minimize_gibbs_free_energy(vib_free_energy)
             except Exception:
                 if len(temperatures) <= 1:
                     raise
@@ -159,14 +165,21 @@ class QuasiHarmonicDebyeApprox:
         Returns:
             float, float: G_opt(V_opt, T, P) in eV and V_opt in Ang^3.
         """
-        G_V = []  # G for each volume
-        # G = E(V) + PV + A_vib(V, T)
-        for idx, v in enumerate(self.volumes):
-            G_V.append(
-                self.energies[idx]
-                + self.pressure * v * self.gpa_to_ev_ang
-                + self.vibrational_free_energy(temperature, v)
-            )
+        return self._minimize_gibbs_free_energy(self.vibrational_free_energy(temperature, np.asarray(self.volumes)))
+
+    def _minimize_gibbs_free_energy(self, vib_free_energy: np.ndarray) -> tuple[float, float]:
+        """Minimize G(V, T, P) w.r.t. V given A_vib(V, T) at each volume.
+
+        Args:
+            vib_free_energy (np.ndarray): vibrational free energy in eV at each volume.
+
+        Returns:
+            float, float: G_opt(V_opt, T, P) in eV and V_opt in Ang^3.
+        """
+        # G = E(V) + PV + A_vib(V, T) for each volume
+        G_V = (
+            np.asarray(self.energies) + self.pressure * np.asarray(self.volumes) * self.gpa_to_ev_ang + vib_free_energy
+        )
 
         # fit equation of state, G(V, T, P)
         eos_fit = self.eos.fit(self.volumes, G_V)
@@ -185,11 +198,11 @@ class QuasiHarmonicDebyeApprox:
         Eq(4) in doi.org/10.1016/j.comphy.2003.12.001.
 
         Args:
-            temperature (float): temperature in K
-            volume (float)
+            temperature (float | np.ndarray): temperature in K
+            volume (float | np.ndarray): in Ang^3, broadcast against temperature
 
         Returns:
-            float: vibrational free energy in eV
+            float | np.ndarray: vibrational free energy in eV
         """
         y = self.debye_temperature(volume) / temperature
         return (
@@ -203,17 +216,17 @@ class QuasiHarmonicDebyeApprox:
         Eq(4) in doi.org/10.1016/j.comphy.2003.12.001.
 
         Args:
-            temperature (float): temperature in K
-            volume (float): in Ang^3
+            temperature (float | np.ndarray): temperature in K
+            volume (float | np.ndarray): in Ang^3, broadcast against temperature
 
         Returns:
-            float: vibrational internal energy in eV
+            float | np.ndarray: vibrational internal energy in eV
         """
         y = self.debye_temperature(volume) / temperature
         return self.kb * self.natoms * temperature * (9.0 / 8.0 * y + 3 * self.debye_integral(y))
 
     @cite_gibbs
-    def debye_temperature(self, volume: float) -> float:
+    def debye_temperature(self, volume: float | np.ndarray) -> float | np.ndarray:
         """
         Calculates the Debye temperature.
         Eq(6) in doi.org/10.1016/j.comphy.2003.12.001. Thanks to Joey.
@@ -228,10 +241,10 @@ class QuasiHarmonicDebyeApprox:
         to True or False in the QuasiHarmonicDebyeApprox constructor.
 
         Args:
-            volume (float): in Ang^3
+            volume (float | np.ndarray): in Ang^3
 
         Returns:
-            float: Debye temperature in K
+            float | np.ndarray: Debye temperature in K
         """
         term1 = (2.0 / 3.0 * (1.0 + self.poisson) / (1.0 - 2.0 * self.poisson)) ** 1.5
         term2 = (1 / 3 * (1.0 + self.poisson) / (1.0 - self.poisson)) ** 1.5
@@ -250,20 +263,36 @@ class QuasiHarmonicDebyeApprox:
         """
         Debye integral. Eq(5) in doi.org/10.1016/j.comphy.2003.12.001.
 
+        The integral of x^3 / (exp(x) - 1) from 0 to y is evaluated with its series
+        expansions, in Bernoulli numbers for small y and in exp(-k y) otherwise, so
+        that arrays of y are handled at once.
+
         Args:
-            y (float): Debye temperature / T, upper limit
+            y (float | np.ndarray): Debye temperature / T, upper limit
 
         Returns:
-            float: unitless
+            float | np.ndarray: unitless
         """
+        y = np.asarray(y, dtype=float)
         # floating point limit is reached around y=155, so values beyond that
-        # are set to the limiting value(T-->0, y --> \infty) of
-        # 6.4939394 (from wolfram alpha).
-        factor = 3.0 / y**3
-        if y < 155:
-            integral = quadrature(lambda x: x**3 / (np.exp(x) - 1.0), 0, y)
-            return next(iter(integral)) * factor
-        return 6.493939 * factor
+        # are set to the limiting value(T-->0, y --> \infty) of pi^4 / 15
+        integral = np.full(y.shape, np.pi**4 / 15)
+
+        small = y < 2
+        y_small = y[small]
+        n = np.arange(_N_DEBYE_TERMS)
+        coeffs = bernoulli(_N_DEBYE_TERMS - 1) / (factorial(n) * (n + 3))
+        integral[small] = y_small**3 * np.polynomial.polynomial.polyval(y_small, coeffs)
+
+        large = (y >= 2) & (y < 155)
+        y_large = y[large, None]
+        k = np.arange(1, _N_DEBYE_TERMS + 1)
+        terms = np.exp(-k * y_large) * (y_large**3 / k + 3 * y_large**2 / k**2 + 6 * y_large / k**3 + 6 / k**4)
+        integral[large] -= terms.sum(axis=1)
+
+        with np.errstate(divide="ignore"):
+            result = integral * 3.0 / y**3
+        return float(result) if result.ndim == 0 else result
 
     @cite_gibbs
     def gruneisen_parameter(self, temperature, volume):
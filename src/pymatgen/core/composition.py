@@ -10,11 +10,11 @@ import re
 import string
 import warnings
 from collections import defaultdict
-from functools import total_ordering
-from itertools import combinations_with_replacement, product
+from functools import lru_cache, total_ordering
 from math import isnan
 from typing import TYPE_CHECKING, cast
 
+from joblib import Parallel, delayed
 from monty.fractions import gcd, gcd_float
 from monty.json import MSONable
 from monty.serialization import loadfn
@@ -24,7 +24,7 @@ from pymatgen.core.units import Mass
 from pymatgen.util.string import Stringify, formula_double_format
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterator
+    from collections.abc import Generator, Iterator, Sequence
     from typing import Any, ClassVar
 
     from typing_extensions import Self
@@ -965,80 +965,23 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         if not all(amt == int(amt) for amt in comp.values()):
             raise ValueError("Charge balance analysis requires integer values in Composition!")
 
-        # For each element, determine all possible sum of oxidations
-        # (taking into account nsites for that particular element)
         el_amt = comp.get_el_amt_dict()
-        elements = list(el_amt)
-        el_sums: list = []  # matrix: dim1= el_idx, dim2=possible sums
-        el_sum_scores: defaultdict = defaultdict(set)  # dict of el_idx, sum -> score
-        el_best_oxid_combo: dict = {}  # dict of el_idx, sum -> oxid combo with best score
-        for idx, el in enumerate(elements):
-            el_sum_scores[idx] = {}
-            el_best_oxid_combo[idx] = {}
-            el_sums.append([])
+        el_oxids = []
+        for el, amt in el_amt.items():
             if oxi_states_override.get(el):
                 oxids: list | tuple = oxi_states_override[el]
             elif all_oxi_states:
                 oxids = Element(el).oxidation_states
             else:
                 oxids = Element(el).icsd_oxidation_states or Element(el).common_oxidation_states
+            el_oxids.append((el, int(amt), tuple(oxids)))
 
-            # Get all possible combinations of oxidation states
-            # and sum each combination
-            for oxid_combo in combinations_with_replacement(oxids, int(el_amt[el])):
-                # List this sum as a possible option
-                oxid_sum = sum(oxid_combo)
-                if oxid_sum not in el_sums[idx]:
-                    el_sums[idx].append(oxid_sum)
-
-                # Determine how probable is this combo?
-                score = sum(type(self).oxi_prob.get(Species(el, o), 0) for o in oxid_combo)  # type: ignore[union-attr]
-
-                # If it is the most probable combo for a certain sum,
-                # store the combination
-                if oxid_sum not in el_sum_scores[idx] or score > el_sum_scores[idx].get(oxid_sum, 0):
-                    el_sum_scores[idx][oxid_sum] = score
-                    el_best_oxid_combo[idx][oxid_sum] = oxid_combo
-
-        # Determine which combination of oxidation states for each element
-        # is the most probable
-        all_sols = []  # will contain all solutions
-        all_oxid_combo = []  # will contain the best combination of oxidation states for each site
-        all_scores = []  # will contain a score for each solution
-        for x in product(*el_sums):
-            # Each x is a trial of one possible oxidation sum for each element
-            if sum(x) == target_charge:  # charge balance condition
-                el_sum_sol = dict(zip(elements, x, strict=True))  # element->oxid_sum
-                # Normalize oxid_sum by amount to get avg oxid state
-                sol = {el: v / el_amt[el] for el, v in el_sum_sol.items()}
-                # Add the solution to the list of solutions
-                all_sols.append(sol)
-
-                # Determine the score for this solution
-                score = 0
-                for idx, v in enumerate(x):
-                    score += el_sum_scores[idx][v]
-                all_scores.append(score)
-
-                # Collect the combination of oxidation states for each site
-                all_oxid_combo.append(
-                    {e: el_best_oxid_combo[idx][v] for idx, (e, v) in enumerate(zip(elements, x, strict=True))}
-                )
-
-        # Sort the solutions from highest to lowest score
-        if all_scores:
-            all_sols, all_oxid_combo = zip(
-                *(
-                    (y, x)
-                    for (z, y, x) in sorted(
-                        zip(all_scores, all_sols, all_oxid_combo, strict=True),
-                        key=lambda pair: pair[0],
-                        reverse=True,
-                    )
-                ),
-                strict=True,
-            )
-        return tuple(all_sols), tuple(all_oxid_combo)
+        comp_cls = type(self)
+        all_sols, all_oxid_combo = _solve_oxi_state_guesses(
+            tuple(el_oxids), target_charge, comp_cls, id(comp_cls.oxi_prob)
+        )
+        # Copy the cached dicts so callers can't modify the cache
+        return tuple(map(dict, all_sols)), tuple(map(dict, all_oxid_combo))
 
     @staticmethod
     def ranked_compositions_from_indeterminate_formula(
@@ -1220,6 +1163,131 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
                         yield match
 
 
+def _get_oxi_state_sums(el: str, n_sites: int, oxids: tuple, oxi_prob: dict) -> tuple[list, dict, dict]:
+    """Find all possible sums of the oxidation states of n_sites sites of an element
+    and the most probable combination of oxidation states for each sum.
+
+    Equivalent to scoring every combinations_with_replacement(oxids, n_sites), but
+    solved as a knapsack over (number of sites, oxidation state sum) states so the
+    cost is polynomial rather than combinatorial in n_sites. Among combinations with
+    the same sum and score, the first in combinations_with_replacement order is kept.
+
+    Args:
+        el (str): Element symbol.
+        n_sites (int): Number of sites of the element.
+        oxids (tuple): Allowed oxidation states.
+        oxi_prob (dict): Prior probability of each Species, used to score combinations.
+
+    Returns:
+        tuple[list, dict, dict]: Possible sums in the order they first occur among the
+            combinations, the best score for each sum and the best combination for each sum.
+    """
+    # State (n_used, oxid_sum) -> counts of each oxidation state. Counts that are
+    # lexicographically larger correspond to combinations that come first.
+    first: dict[tuple, tuple] = {(0, 0): ()}
+    best: dict[tuple, tuple[float, tuple]] = {(0, 0): (0, ())}
+    for oxid in oxids:
+        prob = oxi_prob.get(Species(el, oxid), 0)
+        new_first: dict[tuple, tuple] = {}
+        new_best: dict[tuple, tuple[float, tuple]] = {}
+        for (n_used, oxid_sum), counts in first.items():
+            for count in range(n_sites - n_used + 1):
+                state, new_counts = (n_used + count, oxid_sum), (*counts, count)
+                if state not in new_first or new_counts > new_first[state]:
+                    new_first[state] = new_counts
+                oxid_sum += oxid
+        for (n_used, oxid_sum), (score, counts) in best.items():
+            for count in range(n_sites - n_used + 1):
+                state, candidate = (n_used + count, oxid_sum), (score, (*counts, count))
+                if state not in new_best or candidate > new_best[state]:
+                    new_best[state] = candidate
+                oxid_sum += oxid
+                score += prob
+        first, best = new_first, new_best
+
+    def to_combo(counts: tuple) -> tuple:
+        return tuple(oxid for oxid, count in zip(oxids, counts, strict=True) for _ in range(count))
+
+    sums = [state[1] for state in first if state[0] == n_sites]
+    sums.sort(key=lambda oxid_sum: tuple(-count for count in first[n_sites, oxid_sum]))
+    return (
+        sums,
+        {oxid_sum: best[n_sites, oxid_sum][0] for oxid_sum in sums},
+        {oxid_sum: to_combo(best[n_sites, oxid_sum][1]) for oxid_sum in sums},
+    )
+
+
+@lru_cache(maxsize=2**16)
+def _solve_oxi_state_guesses(
+    el_oxids: tuple[tuple[str, int, tuple], ...],
+    target_charge: float,
+    comp_cls: type[Composition],
+    oxi_prob_id: int,
+) -> tuple[tuple[dict, ...], tuple[dict, ...]]:
+    """Cached solver behind Composition._get_oxi_state_guesses.
+
+    Args:
+        el_oxids: (element symbol, number of sites, allowed oxidation states)
+            for each element of the composition.
+        target_charge (float): The desired total charge.
+        comp_cls (type[Composition]): Class whose oxi_prob priors are used to rank
+            the solutions. Composition subclasses may hold their own priors.
+        oxi_prob_id (int): id of comp_cls.oxi_prob, so that results are
+            recomputed if the prior probabilities are replaced.
+
+    Returns:
+        tuple: The charge balanced solutions (element -> average oxidation state)
+            and the best oxidation state combination for each, from most to least
+            probable.
+    """
+    elements = [el for el, _, _ in el_oxids]
+    el_sums, el_sum_scores, el_best_oxid_combo = zip(
+        *(_get_oxi_state_sums(el, n_sites, oxids, comp_cls.oxi_prob or {}) for el, n_sites, oxids in el_oxids),
+        strict=True,
+    )
+
+    # All charges reachable from each element onwards, used to prune partial solutions
+    # that cannot be balanced. Only exact for integer sums, so skip pruning otherwise.
+    reachable: list[set | None] = [None] * (len(elements) + 1)
+    if all(float(oxid_sum).is_integer() for sums in el_sums for oxid_sum in sums):
+        reachable[-1] = {0}
+        for idx in range(len(elements) - 1, -1, -1):
+            reachable[idx] = {oxid_sum + rest for oxid_sum in el_sums[idx] for rest in reachable[idx + 1]}  # type: ignore[union-attr]
+
+    # Enumerate the charge balanced combinations of sums in itertools.product order
+    solutions: list[tuple] = []
+
+    def add_solutions(idx: int, total: float, x: tuple) -> None:
+        if idx == len(elements):
+            if total == target_charge:
+                solutions.append(x)
+            return
+        for oxid_sum in el_sums[idx]:
+            if reachable[idx + 1] is not None and target_charge - (total + oxid_sum) not in reachable[idx + 1]:  # type: ignore[operator]
+                continue
+            add_solutions(idx + 1, total + oxid_sum, (*x, oxid_sum))
+
+    add_solutions(0, 0, ())
+
+    all_sols = []  # will contain all solutions
+    all_oxid_combo = []  # will contain the best combination of oxidation states for each site
+    all_scores = []  # will contain a score for each solution
+    for x in solutions:
+        # Normalize oxid_sum by amount to get avg oxid state
+        all_sols.append({el: v / n_sites for (el, n_sites, _), v in zip(el_oxids, x, strict=True)})
+        score = 0
+        for idx, v in enumerate(x):
+            score += el_sum_scores[idx][v]
+        all_scores.append(score)
+        all_oxid_combo.append(
+            {el: el_best_oxid_combo[idx][v] for idx, (el, v) in enumerate(zip(elements, x, strict=True))}
+        )
+
+    # Sort the solutions from highest to lowest score
+    order = sorted(range(len(all_scores)), key=lambda idx: all_scores[idx], reverse=True)
+    return tuple(all_sols[idx] for idx in order), tuple(all_oxid_combo[idx] for idx in order)
+
+
 def reduce_formula(
     sym_amt: dict[str, float] | dict[str, int],
     iupac_ordering: bool = False,
@@ -1271,6 +1339,45 @@ def reduce_formula(
     return "".join([*reduced_form, *poly_anions]), factor
 
 
+def oxi_state_guesses_batch(
+    compositions: Sequence[Composition | str],
+    oxi_states_override: dict | None = None,
+    target_charge: float = 0,
+    all_oxi_states: bool = False,
+    max_sites: int | None = None,
+    *,
+    n_jobs: int = 1,
+) -> list[tuple[dict[str, float], ...]]:
+    """Composition.oxi_state_guesses for many compositions, e.g. for charge
+    balance screening. Results for repeated compositions come from a cache.
+
+    Args:
+        compositions (Sequence[Composition | str]): Compositions or formulas.
+        oxi_states_override (dict): See Composition.oxi_state_guesses.
+        target_charge (float): See Composition.oxi_state_guesses.
+        all_oxi_states (bool): See Composition.oxi_state_guesses.
+        max_sites (int): See Composition.oxi_state_guesses.
+        n_jobs (int): Number of processes used. Defaults to 1, i.e. serial.
+            Set to -1 to use all CPUs.
+
+    Returns:
+        list[tuple[dict[str, float], ...]]: The oxidation state guesses in the
+            same order as compositions.
+    """
+    kwargs = {
+        "oxi_states_override": oxi_states_override,
+        "target_charge": target_charge,
+        "all_oxi_states": all_oxi_states,
+        "max_sites": max_sites,
+    }
+    if n_jobs == 1:
+        return [Composition(comp).oxi_state_guesses(**kwargs) for comp in compositions]
+
+    return Parallel(n_jobs=n_jobs, batch_size="auto")(
+        delayed(Composition.oxi_state_guesses)(Composition(comp), **kwargs) for comp in compositions
+    )
+
+
 class ChemicalPotential(dict, MSONable):
     """Represent set of chemical potentials. Can be: multiplied/divided by a Number
     multiplied by a Composition (returns an energy) added/subtracted with other ChemicalPotentials.
@@ -8,7 +8,7 @@ import logging
 import math
 import warnings
 from fractions import Fraction
-from functools import reduce
+from functools import lru_cache, reduce, wraps
 from itertools import chain, combinations, product
 from typing import TYPE_CHECKING, Literal, cast
 
@@ -310,6 +310,23 @@ class GrainBoundary(Structure):
         )
 
 
+def _memoize_sigmas(func: Callable[..., dict[int, list[float]]]) -> Callable[..., dict[int, list[float]]]:
+    """Memoize the sigma enumeration of GrainBoundaryGenerator per cutoff, rotation axis
+    and axial ratio. The callers get a copy of the cached {sigma: angles} dict.
+    """
+    cached_func = lru_cache(maxsize=1024)(func)
+
+    def to_hashable(arg: Any) -> Any:
+        return tuple(arg) if isinstance(arg, list | np.ndarray) else arg
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> dict[int, list[float]]:
+        sigmas = cached_func(*map(to_hashable, args), **{key: to_hashable(val) for key, val in kwargs.items()})
+        return {sigma: list(angles) for sigma, angles in sigmas.items()}
+
+    return wrapper
+
+
 class GrainBoundaryGenerator:
     """
     Generate grain boundaries (GBs) from bulk conventional cell (FCC, BCC can
@@ -1049,30 +1066,8 @@ class GrainBoundaryGenerator:
                 n = fraction.numerator
 
             # Construct the rotation matrix, check reference for details
-            r_list = [
-                (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
-                (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
-                2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
-                (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
-                (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
-                2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
-                (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
-                (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
-                (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
-            ]
-            m = -1 * m
-            r_list_inv = [
-                (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
-                (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
-                2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
-                (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
-                (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
-                2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
-                (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
-                (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
-                (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
-            ]
-            m = -1 * m
+            r_list = _get_hex_csl_rotation(u, v, w, mu=mu, mv=mv, m=m, n=n)
+            r_list_inv = _get_hex_csl_rotation(u, v, w, mu=mu, mv=mv, m=-m, n=n)
             F = 3 * mu * m**2 + d * n**2
             all_list = r_list + r_list_inv + [F]
             com_fac = reduce(math.gcd, all_list)
@@ -1106,48 +1101,8 @@ class GrainBoundaryGenerator:
                 n = fraction.numerator
 
             # Construct the rotation matrix, check reference for details
-            r_list = [
-                (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
-                + 2 * mv * (v - w) * m * n
-                - 2 * mv * v * w * n**2
-                + mu * m**2,
-                2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
-                + 2 * mv * (w - u) * m * n
-                - 2 * mv * u * w * n**2
-                + mu * m**2,
-                2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
-                + 2 * mv * (u - v) * m * n
-                - 2 * mv * u * v * n**2
-                + mu * m**2,
-            ]
-            m = -1 * m
-            r_list_inv = [
-                (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
-                + 2 * mv * (v - w) * m * n
-                - 2 * mv * v * w * n**2
-                + mu * m**2,
-                2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
-                + 2 * mv * (w - u) * m * n
-                - 2 * mv * u * w * n**2
-                + mu * m**2,
-                2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
-                + 2 * mv * (u - v) * m * n
-                - 2 * mv * u * v * n**2
-                + mu * m**2,
-            ]
-            m = -1 * m
+            r_list = _get_rho_csl_rotation(u, v, w, mu=mu, mv=mv, m=m, n=n)
+            r_list_inv = _get_rho_csl_rotation(u, v, w, mu=mu, mv=mv, m=-m, n=n)
             F = mu * m**2 + d * n**2
             all_list = r_list_inv + r_list + [F]
             com_fac = reduce(math.gcd, all_list)
@@ -1222,30 +1177,8 @@ class GrainBoundaryGenerator:
                 fraction = Fraction(np.tan(angle / 2 / 180.0 * np.pi) / np.sqrt(d / mu / lam)).limit_denominator()
                 m = fraction.denominator
                 n = fraction.numerator
-            r_list = [
-                (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                2 * lam * (v * u * mv * n**2 - w * mu * m * n),
-                2 * mu * (u * w * mv * n**2 + v * lam * m * n),
-                2 * mv * (u * v * mv * n**2 + w * mu * m * n),
-                (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                2 * mv * mu * (v * w * n**2 - u * m * n),
-                2 * mv * (u * w * mv * n**2 - v * lam * m * n),
-                2 * lam * mv * (v * w * n**2 + u * m * n),
-                (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
-            ]
-            m = -1 * m
-            r_list_inv = [
-                (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                2 * lam * (v * u * mv * n**2 - w * mu * m * n),
-                2 * mu * (u * w * mv * n**2 + v * lam * m * n),
-                2 * mv * (u * v * mv * n**2 + w * mu * m * n),
-                (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                2 * mv * mu * (v * w * n**2 - u * m * n),
-                2 * mv * (u * w * mv * n**2 - v * lam * m * n),
-                2 * lam * mv * (v * w * n**2 + u * m * n),
-                (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
-            ]
-            m = -1 * m
+            r_list = _get_ort_csl_rotation(u, v, w, mu=mu, lam=lam, mv=mv, m=m, n=n)
+            r_list_inv = _get_ort_csl_rotation(u, v, w, mu=mu, lam=lam, mv=mv, m=-m, n=n)
             F = mu * lam * m**2 + d * n**2
             all_list = r_list + r_list_inv + [F]
             com_fac = reduce(math.gcd, all_list)
@@ -1333,6 +1266,7 @@ class GrainBoundaryGenerator:
         return t1_final, t2_final
 
     @staticmethod
+    @_memoize_sigmas
     def enum_sigma_cubic(
         cutoff: int,
         r_axis: Tuple3Ints,
@@ -1406,6 +1340,7 @@ class GrainBoundaryGenerator:
         return sigmas
 
     @staticmethod
+    @_memoize_sigmas
     def enum_sigma_hex(
         cutoff: int,
         r_axis: Tuple3Ints | Tuple4Ints,
@@ -1469,59 +1404,22 @@ class GrainBoundaryGenerator:
         n_max = int(np.sqrt((cutoff * 12 * mu * mv) / abs(d)))
 
         # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
+        def get_m_max(n: int) -> int:
             if (c2_a2_ratio is None) and w == 0:
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * 12 * mu * mv - n**2 * d) / (3 * mu)))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
-                        (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
-                        (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
-                        (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
-                        (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of the rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
-                        (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
-                        (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
-                        (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
-                        (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = 3 * mu * m**2 + d * n**2
-                    all_list = R_list_inv + R_list + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse.
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round((3 * mu * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / 3.0 / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / 3.0 / mu)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-        return sigmas
+                return 0
+            return int(np.sqrt((cutoff * 12 * mu * mv - n**2 * d) / (3 * mu)))
+
+        return _enum_csl_sigmas(
+            cutoff,
+            n_max,
+            get_m_max=get_m_max,
+            get_rotation=lambda m, n: _get_hex_csl_rotation(u, v, w, mu=mu, mv=mv, m=m, n=n),
+            get_f=lambda m, n: 3 * mu * m**2 + d * n**2,
+            get_angle=lambda n, m: 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / 3.0 / mu)) / np.pi * 180,
+        )
 
     @staticmethod
+    @_memoize_sigmas
     def enum_sigma_rho(
         cutoff: int,
         r_axis: Tuple3Ints | Tuple4Ints,
@@ -1581,76 +1479,23 @@ class GrainBoundaryGenerator:
         n_max = int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv))) / abs(d)))
 
         # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
+        def get_m_max(n: int) -> int:
             if ratio_alpha is None and u + v + w == 0:
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv)) - n**2 * d) / (mu)))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
-                        + 2 * mv * (v - w) * m * n
-                        - 2 * mv * v * w * n**2
-                        + mu * m**2,
-                        2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
-                        + 2 * mv * (w - u) * m * n
-                        - 2 * mv * u * w * n**2
-                        + mu * m**2,
-                        2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
-                        + 2 * mv * (u - v) * m * n
-                        - 2 * mv * u * v * n**2
-                        + mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of the rotation matrix
-                    R_list_inv = [
-                        (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
-                        + 2 * mv * (v - w) * m * n
-                        - 2 * mv * v * w * n**2
-                        + mu * m**2,
-                        2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
-                        + 2 * mv * (w - u) * m * n
-                        - 2 * mv * u * w * n**2
-                        + mu * m**2,
-                        2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
-                        + 2 * mv * (u - v) * m * n
-                        - 2 * mv * u * v * n**2
-                        + mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * m**2 + d * n**2
-                    all_list = R_list_inv + R_list + [F]
-                    # Compute the max common factors for the elements of the rotation matrix and its inverse.
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round(abs(F / com_fac))
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180.0
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-        return sigmas
+                return 0
+            return int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv)) - n**2 * d) / (mu)))
+
+        return _enum_csl_sigmas(
+            cutoff,
+            n_max,
+            get_m_max=get_m_max,
+            get_rotation=lambda m, n: _get_rho_csl_rotation(u, v, w, mu=mu, mv=mv, m=m, n=n),
+            get_f=lambda m, n: mu * m**2 + d * n**2,
+            get_angle=lambda n, m: 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180,
+            abs_sigma=True,
+        )
 
     @staticmethod
+    @_memoize_sigmas
     def enum_sigma_tet(
         cutoff: int,
         r_axis: Tuple3Ints,
@@ -1702,57 +1547,20 @@ class GrainBoundaryGenerator:
         n_max = int(np.sqrt((cutoff * 4 * mu * mv) / d))
 
         # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
-            m_max = 0 if c2_a2_ratio is None and w == 0 else int(np.sqrt((cutoff * 4 * mu * mv - n**2 * d) / mu))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * u * mv * n**2 - 2 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * v * mu * m * n,
-                        2 * u * v * mv * n**2 + 2 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * u * mu * m * n,
-                        2 * u * w * mv * n**2 - 2 * v * mv * m * n,
-                        2 * v * w * mv * n**2 + 2 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * u * mv * n**2 - 2 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * v * mu * m * n,
-                        2 * u * v * mv * n**2 + 2 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * u * mu * m * n,
-                        2 * u * w * mv * n**2 - 2 * v * mv * m * n,
-                        2 * v * w * mv * n**2 + 2 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * m**2 + d * n**2
-                    all_list = R_list + R_list_inv + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round((mu * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-
-        return sigmas
+        def get_m_max(n: int) -> int:
+            return 0 if c2_a2_ratio is None and w == 0 else int(np.sqrt((cutoff * 4 * mu * mv - n**2 * d) / mu))
+
+        return _enum_csl_sigmas(
+            cutoff,
+            n_max,
+            get_m_max=get_m_max,
+            get_rotation=lambda m, n: _get_tet_csl_rotation(u, v, w, mu=mu, mv=mv, m=m, n=n),
+            get_f=lambda m, n: mu * m**2 + d * n**2,
+            get_angle=lambda n, m: 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180,
+        )
 
     @staticmethod
+    @_memoize_sigmas
     def enum_sigma_ort(
         cutoff: int,
         r_axis: Tuple3Ints,
@@ -1835,60 +1643,22 @@ class GrainBoundaryGenerator:
 
         # Compute the max n we need to enumerate
         n_max = int(np.sqrt((cutoff * 4 * mu * mv * mv * lam) / d))
+
         # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
+        def get_m_max(n: int) -> int:
             mu_temp, lam_temp, mv_temp = c2_b2_a2_ratio
             if (mu_temp is None and w == 0) or (lam_temp is None and v == 0) or (mv_temp is None and u == 0):
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * 4 * mu * mv * lam * mv - n**2 * d) / mu / lam))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * lam * (v * u * mv * n**2 - w * mu * m * n),
-                        2 * mu * (u * w * mv * n**2 + v * lam * m * n),
-                        2 * mv * (u * v * mv * n**2 + w * mu * m * n),
-                        (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * mv * mu * (v * w * n**2 - u * m * n),
-                        2 * mv * (u * w * mv * n**2 - v * lam * m * n),
-                        2 * lam * mv * (v * w * n**2 + u * m * n),
-                        (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * lam * (v * u * mv * n**2 - w * mu * m * n),
-                        2 * mu * (u * w * mv * n**2 + v * lam * m * n),
-                        2 * mv * (u * v * mv * n**2 + w * mu * m * n),
-                        (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * mv * mu * (v * w * n**2 - u * m * n),
-                        2 * mv * (u * w * mv * n**2 - v * lam * m * n),
-                        2 * lam * mv * (v * w * n**2 + u * m * n),
-                        (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * lam * m**2 + d * n**2
-                    all_list = R_list + R_list_inv + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse.
-                    com_fac = reduce(math.gcd, all_list)  # type: ignore[arg-type]
-                    sigma = round((mu * lam * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu / lam)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu / lam)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-
-        return sigmas
+                return 0
+            return int(np.sqrt((cutoff * 4 * mu * mv * lam * mv - n**2 * d) / mu / lam))
+
+        return _enum_csl_sigmas(
+            cutoff,
+            n_max,
+            get_m_max=get_m_max,
+            get_rotation=lambda m, n: _get_ort_csl_rotation(u, v, w, mu=mu, lam=lam, mv=mv, m=m, n=n),
+            get_f=lambda m, n: mu * lam * m**2 + d * n**2,
+            get_angle=lambda n, m: 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu / lam)) / np.pi * 180,
+        )
 
     @staticmethod
     def enum_possible_plane_cubic(
@@ -2163,8 +1933,6 @@ class GrainBoundaryGenerator:
                 return t_matrix
             max_j = abs(miller_nonzero[0])
         max_j = min(max_j, max_search)
-        # Area of a, b vectors
-        area = None
         # Length of c vector
         c_norm = np.linalg.norm(np.matmul(t_matrix[2], trans))
         # c vector length along the direction perpendicular to surface
@@ -2176,46 +1944,29 @@ class GrainBoundaryGenerator:
         else:
             normal_init = False
 
-        jj = np.arange(0, max_j + 1)
-        combination = []
-        for ii in product(jj, repeat=3):
-            if sum(abs(np.array(ii))) != 0:
-                combination.append(list(ii))
-            if len(np.nonzero(ii)[0]) == 3:
-                for i1 in range(3):
-                    new_i = list(ii).copy()
-                    new_i[i1] = -1 * new_i[i1]
-                    combination.append(new_i)
-            elif len(np.nonzero(ii)[0]) == 2:
-                new_i = list(ii).copy()
-                new_i[np.nonzero(ii)[0][0]] = -1 * new_i[np.nonzero(ii)[0][0]]
-                combination.append(new_i)
+        # Integer combinations of the csl vectors (in the order of _get_csl_combinations)
+        temps = _get_csl_combinations(max_j) @ csl
+        dots = temps @ np.array(surface)
+        in_plane = dots == 0
+        ab_vector.extend(temps[in_plane])
 
-        for ii in combination:  # type: ignore[assignment]
-            if reduce(math.gcd, ii) == 1:
-                temp = np.dot(np.array(ii), csl)
-                if abs(np.dot(temp, surface) - 0) < 1.0e-8:
-                    ab_vector.append(temp)
-                else:
-                    # c vector length along the direction perpendicular to surface
-                    c_len_temp = np.abs(np.dot(temp, surface))
-                    # c vector length itself
-                    c_norm_temp = np.linalg.norm(np.matmul(temp, trans))
-                    if normal:
-                        c_cross = np.cross(np.matmul(temp, trans), np.matmul(surface, ctrans))
-                        if np.linalg.norm(c_cross) < 1.0e-8:
-                            if normal_init:
-                                if c_norm_temp < c_norm:
-                                    t_matrix[2] = temp
-                                    c_norm = c_norm_temp
-                            else:
-                                c_norm = c_norm_temp
-                                normal_init = True
-                                t_matrix[2] = temp
-                    elif c_len_temp < c_length or (abs(c_len_temp - c_length) < 1.0e-8 and c_norm_temp < c_norm):
-                        t_matrix[2] = temp
-                        c_norm = c_norm_temp
-                        c_length = c_len_temp
+        # c vector candidates, keep the first one that has the shortest length
+        # perpendicular to the surface and then the shortest length itself
+        c_temps = temps[~in_plane]
+        c_norms = _get_row_norms(_to_cartesian(c_temps, trans))
+        if normal:
+            normal_idx = _get_normal_c_index(c_temps, c_norms, surface, trans, ctrans)
+            if normal_idx is not None and (not normal_init or c_norms[normal_idx] < c_norm):
+                t_matrix[2] = c_temps[normal_idx]
+                c_norm = c_norms[normal_idx]
+                normal_init = True
+        elif len(c_temps) > 0:
+            c_lens = np.abs(dots[~in_plane])
+            best = np.lexsort((c_norms, c_lens))[0]
+            if c_lens[best] < c_length or (c_lens[best] == c_length and c_norms[best] < c_norm):
+                t_matrix[2] = c_temps[best]
+                c_norm = c_norms[best]
+                c_length = c_lens[best]
 
         if normal and (not normal_init):
             logger.info("Did not find the perpendicular c vector, increase max_j")
@@ -2225,57 +1976,21 @@ class GrainBoundaryGenerator:
                     break
                 max_j *= 3
                 max_j = min(max_j, max_search)
-                jj = np.arange(0, max_j + 1)
-                combination = []
-                for ii in product(jj, repeat=3):
-                    if sum(abs(np.array(ii))) != 0:
-                        combination.append(list(ii))
-                    if len(np.nonzero(ii)[0]) == 3:
-                        for i1 in range(3):
-                            new_i = list(ii).copy()
-                            new_i[i1] = -1 * new_i[i1]
-                            combination.append(new_i)
-                    elif len(np.nonzero(ii)[0]) == 2:
-                        new_i = list(ii).copy()
-                        new_i[np.nonzero(ii)[0][0]] = -1 * new_i[np.nonzero(ii)[0][0]]
-                        combination.append(new_i)
-
-                for ii in combination:  # type: ignore[assignment]
-                    if reduce(math.gcd, ii) == 1:
-                        temp = np.dot(np.array(ii), csl)
-                        if abs(np.dot(temp, surface) - 0) > 1.0e-8:
-                            c_cross = np.cross(np.matmul(temp, trans), np.matmul(surface, ctrans))
-                            if np.linalg.norm(c_cross) < 1.0e-8:
-                                # c vector length itself
-                                c_norm_temp = np.linalg.norm(np.matmul(temp, trans))
-                                if normal_init:
-                                    if c_norm_temp < c_norm:
-                                        t_matrix[2] = temp
-                                        c_norm = c_norm_temp
-                                else:
-                                    c_norm = c_norm_temp
-                                    normal_init = True
-                                    t_matrix[2] = temp
+                temps = _get_csl_combinations(max_j) @ csl
+                c_temps = temps[temps @ np.array(surface) != 0]
+                c_norms = _get_row_norms(_to_cartesian(c_temps, trans))
+                normal_idx = _get_normal_c_index(c_temps, c_norms, surface, trans, ctrans)
+                if normal_idx is not None:
+                    t_matrix[2] = c_temps[normal_idx]
+                    c_norm = c_norms[normal_idx]
+                    normal_init = True
                 if normal_init:
                     logger.info("Found perpendicular c vector")
 
         # Find the best a, b vectors with their formed area smallest and average norm of a,b smallest
-        ab_norm = None
-        for ii in combinations(ab_vector, 2):
-            area_temp = np.linalg.norm(np.cross(np.matmul(ii[0], trans), np.matmul(ii[1], trans)))
-            if abs(area_temp - 0) > 1.0e-8:
-                ab_norm_temp = np.linalg.norm(np.matmul(ii[0], trans)) + np.linalg.norm(np.matmul(ii[1], trans))
-                if area is None:
-                    area = area_temp
-                    ab_norm = ab_norm_temp
-                    t_matrix[0] = ii[0]
-                    t_matrix[1] = ii[1]
-
-                elif area_temp < area or (abs(area - area_temp) < 1.0e-8 and ab_norm_temp < ab_norm):
-                    t_matrix[0] = ii[0]
-                    t_matrix[1] = ii[1]
-                    area = area_temp
-                    ab_norm = ab_norm_temp
+        ab_pair = _get_smallest_ab_pair(np.array(ab_vector), trans)
+        if ab_pair is not None:
+            t_matrix[0], t_matrix[1] = ab_pair
 
         # Make sure we have a left-handed crystallographic system
         if np.linalg.det(np.matmul(t_matrix, trans)) < 0:
@@ -2305,16 +2020,18 @@ class GrainBoundaryGenerator:
             kk = h + 1 if h < 2 else abs(2 - h)
             ll = h + 2 if h < 1 else abs(1 - h)
             jj = np.arange(-max_j, max_j + 1)
-            for j1, j2 in product(jj, repeat=2):
-                temp = mat[h] + j1 * mat[kk] + j2 * mat[ll]
-                if all(np.round(x, 5).is_integer() for x in list(temp / mag)):
-                    mat_copy = mat.copy()
-                    mat_copy[h] = np.array([round(ele / mag) for ele in temp])
-                    new_mat = np.dot(mat_copy, np.linalg.inv(r_matrix.T))
-                    if all(np.round(x, 5).is_integer() for x in list(np.ravel(new_mat))):
-                        reduced = True
-                        mat[h] = np.array([round(ele / mag) for ele in temp])
-                        break
+            j_pairs = np.array(list(product(jj, repeat=2))).reshape(-1, 2)
+            temps = mat[h] + j_pairs[:, :1] * mat[kk] + j_pairs[:, 1:] * mat[ll]
+            # Only the combinations divisible by mag are candidates for the reduction
+            divisible = np.all(np.round(temps / mag, 5) % 1 == 0, axis=1)
+            for temp in temps[divisible]:
+                mat_copy = mat.copy()
+                mat_copy[h] = np.array([round(ele / mag) for ele in temp])
+                new_mat = np.dot(mat_copy, np.linalg.inv(r_matrix.T))
+                if all(np.round(x, 5).is_integer() for x in list(np.ravel(new_mat))):
+                    reduced = True
+                    mat[h] = np.array([round(ele / mag) for ele in temp])
+                    break
             if reduced:
                 break
 
@@ -2434,6 +2151,243 @@ def symm_group_cubic(mat: NDArray) -> list:
     return np.unique(np.array(all_vectors), axis=0)
 
 
+@lru_cache(maxsize=16)
+def _get_csl_combinations(max_j: int) -> NDArray[np.int64]:
+    """All coprime integer combinations (i, j, k) with |i|, |j|, |k| <= max_j of
+    the csl vectors, up to an overall sign, in the search order of slab_from_csl.
+    """
+    jj = np.arange(0, max_j + 1)
+    combination = []
+    for ii in product(jj, repeat=3):
+        if sum(abs(np.array(ii))) != 0:
+            combination.append(list(ii))
+        if len(np.nonzero(ii)[0]) == 3:
+            for i1 in range(3):
+                new_i = list(ii).copy()
+                new_i[i1] = -1 * new_i[i1]
+                combination.append(new_i)
+        elif len(np.nonzero(ii)[0]) == 2:
+            new_i = list(ii).copy()
+            new_i[np.nonzero(ii)[0][0]] = -1 * new_i[np.nonzero(ii)[0][0]]
+            combination.append(new_i)
+
+    combinations_arr = np.array(combination, dtype=np.int64)
+    return combinations_arr[np.gcd.reduce(combinations_arr, axis=1) == 1]
+
+
+def _to_cartesian(vectors: NDArray, trans: NDArray) -> NDArray:
+    """Transform each row vector with trans, giving the same floats as np.matmul(vector, trans)."""
+    return np.matmul(vectors[:, None, :].astype(float), trans)[:, 0, :]
+
+
+def _get_row_norms(vectors: NDArray) -> NDArray:
+    """Norm of each row vector, giving the same floats as np.linalg.norm(vector)."""
+    return np.sqrt(np.matmul(vectors[:, None, :], vectors[:, :, None])[:, 0, 0])
+
+
+def _get_normal_c_index(
+    c_temps: NDArray,
+    c_norms: NDArray,
+    surface: Tuple3Ints,
+    trans: NDArray,
+    ctrans: NDArray,
+) -> int | None:
+    """Index of the first shortest c vector perpendicular to the surface, or None."""
+    c_cross = np.cross(_to_cartesian(c_temps, trans), np.matmul(surface, ctrans))
+    perpendicular = np.flatnonzero(_get_row_norms(c_cross) < 1.0e-8)
+    if len(perpendicular) == 0:
+        return None
+    return int(perpendicular[np.argmin(c_norms[perpendicular])])
+
+
+def _get_smallest_ab_pair(ab_vectors: NDArray, trans: NDArray) -> tuple[NDArray, NDArray] | None:
+    """Find the pair of in-plane vectors spanning the smallest area, and among pairs of
+    (nearly) equal area the one with the smallest summed norm.
+
+    The pairs are compared in the order of itertools.combinations with the same
+    tolerances as a sequential scan, but only the pairs with an area close to the
+    smallest one are scanned.
+    """
+    if len(ab_vectors) < 2:
+        return None
+    cart = _to_cartesian(ab_vectors, trans)
+    norms = _get_row_norms(cart)
+
+    def get_areas(idx: int) -> NDArray:
+        """Areas spanned by ab_vectors[idx] and all later vectors."""
+        return _get_row_norms(np.cross(cart[idx], cart[idx + 1 :]))
+
+    row_min_areas = np.full(len(cart) - 1, np.inf)
+    for idx in range(len(cart) - 1):
+        areas = get_areas(idx)
+        areas = areas[np.abs(areas - 0) > 1.0e-8]
+        if len(areas) > 0:
+            row_min_areas[idx] = areas.min()
+    min_area = row_min_areas.min()
+    if not np.isfinite(min_area):
+        return None
+
+    # Pairs with a larger area can never be selected over the smallest area pairs
+    area_cutoff = min_area + 1.0e-6
+    area = ab_norm = best_pair = None
+    for idx in np.flatnonzero(row_min_areas < area_cutoff):
+        areas = get_areas(idx)
+        for jdx in np.flatnonzero((np.abs(areas - 0) > 1.0e-8) & (areas < area_cutoff)):
+            area_temp = areas[jdx]
+            ab_norm_temp = norms[idx] + norms[idx + 1 + jdx]
+            if area is None or (
+                area_temp < area or (abs(area - area_temp) < 1.0e-8 and ab_norm_temp < ab_norm)  # type: ignore[operator]
+            ):
+                area, ab_norm, best_pair = area_temp, ab_norm_temp, (idx, idx + 1 + jdx)
+
+    return ab_vectors[best_pair[0]], ab_vectors[best_pair[1]]  # type: ignore[index]
+
+
+def _get_hex_csl_rotation(u, v, w, *, mu, mv, m, n) -> list:
+    """Integer entries of the (F-scaled) CSL rotation matrix in a hexagonal lattice,
+    refer to Acta Cryst, A38,550(1982). m and n can also be integer arrays.
+    """
+    return [
+        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
+        (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
+        2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
+        (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
+        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
+        2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
+        (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
+        (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
+        (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
+    ]
+
+
+def _get_rho_csl_rotation(u, v, w, *, mu, mv, m, n) -> list:
+    """Integer entries of the (F-scaled) CSL rotation matrix in a rhombohedral lattice,
+    refer to Acta Cryst, A45,505(1989). m and n can also be integer arrays.
+    """
+    return [
+        (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2 + 2 * mv * (v - w) * m * n - 2 * mv * v * w * n**2 + mu * m**2,
+        2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
+        2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
+        2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
+        (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2 + 2 * mv * (w - u) * m * n - 2 * mv * u * w * n**2 + mu * m**2,
+        2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
+        2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
+        2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
+        (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2 + 2 * mv * (u - v) * m * n - 2 * mv * u * v * n**2 + mu * m**2,
+    ]
+
+
+def _get_tet_csl_rotation(u, v, w, *, mu, mv, m, n) -> list:
+    """Integer entries of the (F-scaled) CSL rotation matrix in a tetragonal lattice,
+    refer to Acta Cryst, B46,117(1990). m and n can also be integer arrays.
+    """
+    return [
+        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
+        2 * v * u * mv * n**2 - 2 * w * mu * m * n,
+        2 * u * w * mu * n**2 + 2 * v * mu * m * n,
+        2 * u * v * mv * n**2 + 2 * w * mu * m * n,
+        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
+        2 * v * w * mu * n**2 - 2 * u * mu * m * n,
+        2 * u * w * mv * n**2 - 2 * v * mv * m * n,
+        2 * v * w * mv * n**2 + 2 * u * mv * m * n,
+        (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
+    ]
+
+
+def _get_ort_csl_rotation(u, v, w, *, mu, lam, mv, m, n) -> list:
+    """Integer entries of the (F-scaled) CSL rotation matrix in an orthorhombic lattice,
+    refer to Scipta Metallurgica 27, 291(1992). m and n can also be integer arrays.
+    """
+    return [
+        (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
+        2 * lam * (v * u * mv * n**2 - w * mu * m * n),
+        2 * mu * (u * w * mv * n**2 + v * lam * m * n),
+        2 * mv * (u * v * mv * n**2 + w * mu * m * n),
+        (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
+        2 * mv * mu * (v * w * n**2 - u * m * n),
+        2 * mv * (u * w * mv * n**2 - v * lam * m * n),
+        2 * lam * mv * (v * w * n**2 + u * m * n),
+        (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
+    ]
+
+
+def _enum_csl_sigmas(
+    cutoff: int,
+    n_max: int,
+    *,
+    get_m_max: Callable[[int], int],
+    get_rotation: Callable[[NDArray, NDArray], list],
+    get_f: Callable[[NDArray, NDArray], NDArray],
+    get_angle: Callable[[int, int], float],
+    abs_sigma: bool = False,
+) -> dict[int, list[float]]:
+    """Find the sigma values and rotation angles of all (m, n) pairs with n in [1, n_max],
+    m in [0, m_max(n)] and gcd(m, n) == 1 (or m == 0), vectorized over the integer pairs.
+
+    Args:
+        cutoff (int): the cutoff of sigma values.
+        n_max (int): the max n to enumerate.
+        get_m_max (Callable): the max m to enumerate for a given n. The enumeration
+            stops after the first n with m_max == 0.
+        get_rotation (Callable): the integer entries of the rotation matrix for arrays of m and n.
+        get_f (Callable): the common denominator F of the rotation matrix for arrays of m and n.
+        get_angle (Callable): the rotation angle for given n and m.
+        abs_sigma (bool): whether sigma is |F| / gcd instead of F / gcd.
+
+    Returns:
+        dict: {sigma: [angle1, angle2, ...], ...} in the order of enumeration.
+    """
+    n_values: list[int] = []
+    m_maxs: list[int] = []
+    for n in range(1, n_max + 1):
+        n_values.append(n)
+        m_maxs.append(get_m_max(n))
+        if m_maxs[-1] == 0:
+            break
+
+    sigmas: dict[int, list[float]] = {}
+    if not n_values:
+        return sigmas
+
+    # The rotation entries and F are homogeneous quadratic forms a*m**2 + b*m*n + c*n**2,
+    # so bound their values from the coefficients and only use Python integers if int64
+    # could overflow
+    m_top, n_top = max(m_maxs), n_values[-1]
+    value_bound = 0
+    for q_10, q_01, q_11 in zip(
+        *([*get_rotation(m, n), get_f(m, n)] for m, n in ((1, 0), (0, 1), (1, 1))), strict=True
+    ):
+        value_bound = max(
+            value_bound, abs(q_10) * m_top**2 + abs(q_11 - q_10 - q_01) * m_top * n_top + abs(q_01) * n_top**2
+        )
+    dtype = np.int64 if value_bound < 2**63 else object
+    n_all = np.repeat(np.array(n_values, dtype=dtype), np.array(m_maxs) + 1)
+    m_all = np.concatenate([np.arange(m_max + 1) for m_max in m_maxs]).astype(dtype)
+    coprime = (np.gcd(m_all, n_all) == 1) | (m_all == 0)
+    m_all, n_all = m_all[coprime], n_all[coprime]
+
+    chunk_size = 1 << 16
+    for start in range(0, len(m_all), chunk_size):
+        m_arr, n_arr = m_all[start : start + chunk_size], n_all[start : start + chunk_size]
+        f_arr = get_f(m_arr, n_arr)
+        # Compute the max common factors for the elements of the rotation matrix
+        # and its inverse (rotation with -m)
+        com_fac = np.abs(f_arr)
+        for entry in chain(get_rotation(-m_arr, n_arr), get_rotation(m_arr, n_arr)):
+            com_fac = np.gcd(com_fac, entry)
+        sigma_arr = (np.abs(f_arr) if abs_sigma else f_arr) // com_fac
+
+        for idx in np.flatnonzero((sigma_arr > 1) & (sigma_arr <= cutoff)):
+            sigma = int(sigma_arr[idx])
+            angle = get_angle(int(n_arr[idx]), int(m_arr[idx]))
+            if sigma not in sigmas:
+                sigmas[sigma] = [angle]
+            elif angle not in sigmas[sigma]:
+                sigmas[sigma].append(angle)
+
+    return sigmas
+
+
 class Interface(Structure):
     """Store data for defining an interface between two Structures."""
 
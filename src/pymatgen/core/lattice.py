@@ -18,11 +18,11 @@ from monty.dev import deprecated
 from monty.json import MSONable
 from scipy.spatial import Voronoi
 
-from pymatgen.util.coord import pbc_shortest_vectors
+from pymatgen.util.coord import pbc_shortest_vectors, pbc_shortest_vectors_batch
 from pymatgen.util.due import Doi, due
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
 
     from numpy.typing import ArrayLike
     from typing_extensions import Self
@@ -1890,6 +1890,94 @@ def get_points_in_spheres(
     return neighbors
 
 
+def get_points_in_sphere_batch(
+    lattices: Sequence[Lattice],
+    frac_points: Sequence[ArrayLike],
+    centers: Sequence[ArrayLike],
+    r: float | Sequence[float],
+) -> list[list[list[tuple[np.ndarray, float, int, np.ndarray]]]]:
+    """Batched version of Lattice.get_points_in_sphere for many lattices (e.g. one
+    per structure), each with many sphere centers. All centers of a lattice are
+    handled by a single call to the compiled neighbor search instead of one call
+    per center.
+
+    Args:
+        lattices: Sequence of lattices.
+        frac_points: For each lattice, all points in fractional coordinates.
+        centers: For each lattice, the Cartesian coordinates of the sphere centers.
+        r: Radius of the spheres, either shared by all lattices or one per lattice.
+
+    Returns:
+        list[list[list]]: result[i][j] is the list of (frac_coord, dist, index,
+            supercell_image) within r of center j in lattice i, as returned by
+            Lattice.get_points_in_sphere with zip_results=True (in no particular order).
+    """
+    radii = np.broadcast_to(np.asarray(r, dtype=float), (len(lattices),))
+    if not len(lattices) == len(frac_points) == len(centers):
+        raise ValueError("lattices, frac_points and centers must have the same length")
+    # The compiled extension is optional, as in Lattice.get_points_in_sphere
+    try:
+        from pymatgen.optimization.neighbors import find_points_in_spheres  # noqa: PLC0415
+    except ImportError:
+        return [
+            get_points_in_spheres(
+                all_coords=lattice.get_cartesian_coords(points),
+                center_coords=np.reshape(np.asarray(cents, dtype=float), (-1, 3)),
+                r=float(radius),
+                pbc=lattice.pbc,
+                numerical_tol=1e-8,
+                lattice=lattice,
+                return_fcoords=True,
+            )
+            for lattice, points, cents, radius in zip(lattices, frac_points, centers, radii, strict=True)
+        ]
+
+    results = []
+    for lattice, points, cents, radius in zip(lattices, frac_points, centers, radii, strict=True):
+        points = np.ascontiguousarray(points, dtype=float)
+        center_coords = np.ascontiguousarray(np.reshape(cents, (-1, 3)), dtype=float)
+        center_indices, indices, images, distances = find_points_in_spheres(
+            all_coords=np.ascontiguousarray(lattice.get_cartesian_coords(points), dtype=float),
+            center_coords=center_coords,
+            r=float(radius),
+            pbc=np.ascontiguousarray(lattice.pbc, dtype=np.int64),
+            lattice=np.ascontiguousarray(lattice.matrix, dtype=float),
+            tol=1e-8,
+        )
+        # Group the flat neighbor list by center
+        order = np.argsort(center_indices, kind="stable")
+        bounds = np.searchsorted(center_indices[order], np.arange(len(center_coords) + 1))
+        frac_coords = points[indices] + images if len(indices) else np.empty((0, 3))
+        results.append(
+            [
+                list(zip(frac_coords[idx], distances[idx], indices[idx], images[idx], strict=True))
+                for idx in (order[start:stop] for start, stop in itertools.pairwise(bounds))
+            ]
+        )
+    return results
+
+
+def get_all_distances_batch(
+    lattices: Sequence[Lattice],
+    frac_coords1: Sequence[ArrayLike],
+    frac_coords2: Sequence[ArrayLike],
+) -> list[np.ndarray]:
+    """Batched version of Lattice.get_all_distances for many lattices, computed
+    in a single compiled call.
+
+    Args:
+        lattices: Sequence of lattices.
+        frac_coords1: For each lattice, the first set of fractional coordinates.
+        frac_coords2: For each lattice, the second set of fractional coordinates.
+
+    Returns:
+        list[np.ndarray]: 2d arrays of Cartesian distances, result[i] is equal (up to
+            rounding) to lattices[i].get_all_distances(frac_coords1[i], frac_coords2[i]).
+    """
+    _vs, d2s = pbc_shortest_vectors_batch(lattices, frac_coords1, frac_coords2, return_d2=True)
+    return [np.sqrt(d2) for d2 in d2s]
+
+
 # The following internal functions are used in the get_points_in_sphere method
 def _compute_cube_index(
     coords: np.ndarray,
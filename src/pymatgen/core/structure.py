@@ -1038,25 +1038,28 @@ class IStructure(SiteCollection, MSONable):
 
         self._lattice = lattice if isinstance(lattice, Lattice) else Lattice(lattice)
 
-        sites = []
-        for idx, specie in enumerate(species):
-            prop = None
-            if site_properties:
-                prop = {key: val[idx] for key, val in site_properties.items() if val is not None}
+        # Convert and wrap all coordinates at once rather than site by site
+        frac_coords = np.reshape(np.array(coords, dtype=float), (len(species), 3))
+        if coords_are_cartesian:
+            frac_coords = self._lattice.get_fractional_coords(frac_coords)
+        if to_unit_cell:
+            pbc = np.array(self._lattice.pbc)
+            frac_coords[:, pbc] = np.mod(frac_coords[:, pbc], 1)
 
-            label = labels[idx] if labels else None
+        compositions = _get_site_compositions(species)
+        prop_items = [(key, val) for key, val in (site_properties or {}).items() if val is not None]
 
-            site = PeriodicSite(
-                specie,
-                coords[idx],
+        self._sites: tuple[PeriodicSite, ...] = tuple(
+            PeriodicSite(
+                comp,
+                frac_coords[idx],
                 self._lattice,
-                to_unit_cell,
-                coords_are_cartesian=coords_are_cartesian,
-                properties=prop,
-                label=label,
+                properties={key: val[idx] for key, val in prop_items} if prop_items else None,
+                label=labels[idx] if labels else None,
+                skip_checks=True,
             )
-            sites.append(site)
-        self._sites: tuple[PeriodicSite, ...] = tuple(sites)
+            for idx, comp in enumerate(compositions)
+        )
         if validate_proximity and not self.is_valid():
             raise StructureError(f"sites are less than {self.DISTANCE_TOLERANCE} Angstrom apart!")
         self._charge = charge
@@ -1118,24 +1121,35 @@ class IStructure(SiteCollection, MSONable):
 
         frac_lattice = lattice_points_in_supercell(scale_matrix)
         cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
+        n_images = len(cart_lattice)
 
-        new_sites = []
-        for site in self:
-            for vec in cart_lattice:
-                periodic_site = PeriodicSite(
-                    site.species,
-                    site.coords + vec,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                    skip_checks=True,
-                    label=site.label,
-                )
-                new_sites.append(periodic_site)
+        # All periodic images at once, ordered site by site as (n_sites * n_images, 3)
+        cart_coords = (self.cart_coords[:, None, :] + cart_lattice[None, :, :]).reshape(-1, 3)
+
+        site_props: dict[str, list] = {}
+        for idx, site in enumerate(self):
+            for key, val in site.properties.items():
+                if key not in site_props:
+                    site_props[key] = [None] * len(self)
+                site_props[key][idx] = val
+        for key, vals in site_props.items():
+            if any(val is None for val in vals):
+                warnings.warn(f"Not all sites have property {key}. Missing values are set to None.")
+
+        def repeat(values: Sequence) -> list:
+            return [val for val in values for _ in range(n_images)]
 
         new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
-        return Structure.from_sites(new_sites, charge=new_charge, to_unit_cell=True)
+        return Structure(
+            new_lattice,
+            repeat(self.species_and_occu),
+            cart_coords,
+            charge=new_charge,
+            coords_are_cartesian=True,
+            to_unit_cell=True,
+            site_properties={key: repeat(vals) for key, vals in site_props.items()},
+            labels=repeat(self.labels),
+        )
 
     def __rmul__(self, scaling_matrix):
         """Similar to __mul__ to preserve commutativeness."""
@@ -1216,7 +1230,8 @@ class IStructure(SiteCollection, MSONable):
         labels = [site.label for site in sites]
         lattice = sites[0].lattice
         for idx, site in enumerate(sites):
-            if site.lattice != lattice:
+            # Identity check first as comparing lattices is comparatively slow
+            if site.lattice is not lattice and site.lattice != lattice:
                 raise ValueError("Sites must belong to the same lattice")
             for key, val in site.properties.items():
                 if key not in prop_keys:
@@ -4536,8 +4551,10 @@ class Structure(IStructure, collections.abc.MutableSequence):
         struct: Structure = self if in_place else self.copy()
         supercell: Structure = struct * scaling_matrix
         if to_unit_cell:
-            for site in supercell:
-                site.to_unit_cell(in_place=True)
+            # __mul__ already wrapped the sites, only fix up coords that np.mod rounded up to 1
+            frac_coords = supercell.frac_coords[:, np.array(supercell.pbc)]
+            for idx in np.flatnonzero(np.any(frac_coords >= 1, axis=1)):
+                supercell[idx].to_unit_cell(in_place=True)
         struct.sites = supercell.sites
         struct.lattice = supercell.lattice
 
@@ -5219,6 +5236,56 @@ class Molecule(IMolecule, collections.abc.MutableSequence):
         return self._calculate(calculator, verbose=verbose)
 
 
+def _get_site_compositions(species: Sequence[CompositionLike]) -> list[Composition]:
+    """Convert the species of each site to a Composition, as done by Site.
+
+    Each distinct species is only parsed and validated once, and the resulting
+    (immutable) Composition is shared by all sites with that species. This
+    avoids most of the per-site cost when building large structures.
+
+    Args:
+        species (Sequence[CompositionLike]): Species on each site.
+
+    Raises:
+        ValueError: If the occupancies on a site sum to more than 1.
+
+    Returns:
+        list[Composition]: Composition of each site.
+    """
+    cache: dict[Any, Composition] = {}
+    validated: set[int] = set()
+
+    def to_composition(specie: CompositionLike) -> Composition:
+        comp = specie
+        if not isinstance(comp, Composition):
+            try:
+                comp = Composition({get_el_sp(comp): 1})  # type: ignore[arg-type]
+            except TypeError:
+                comp = Composition(comp)
+        if comp.num_atoms > 1 + Composition.amount_tolerance:
+            raise ValueError("Species occupancies sum to more than 1!")
+        return comp
+
+    compositions = []
+    for specie in species:
+        if isinstance(specie, Composition):
+            # Keep the original object, only skip repeated validation
+            if id(specie) not in validated:
+                to_composition(specie)
+                validated.add(id(specie))
+            compositions.append(specie)
+            continue
+        try:
+            # Key on type too, e.g. so that 1 (H) and True are not conflated
+            key = (type(specie), specie)
+            if key not in cache:
+                cache[key] = to_composition(specie)
+            compositions.append(cache[key])
+        except TypeError:  # unhashable, e.g. dict of species and occupancies
+            compositions.append(to_composition(specie))
+    return compositions
+
+
 class StructureError(Exception):
     """Exception class for Structure.
     Raised when the structure has problems, e.g. atoms that are too close.
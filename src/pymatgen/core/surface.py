@@ -21,11 +21,12 @@ import logging
 import math
 import os
 import warnings
-from functools import reduce
+from functools import lru_cache, reduce
 from math import gcd, isclose
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
+from joblib import Parallel, delayed
 from monty.fractions import lcm
 from scipy.cluster.hierarchy import fcluster, linkage
 from scipy.spatial.distance import squareform
@@ -33,7 +34,6 @@ from scipy.spatial.distance import squareform
 from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core import Lattice, PeriodicSite, Structure, get_el_sp
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
-from pymatgen.util.coord import in_coord_list
 from pymatgen.util.due import Doi, due
 from pymatgen.util.typing import Tuple3Ints
 
@@ -45,6 +45,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from pymatgen.core.composition import Element, Species
+    from pymatgen.core.operations import SymmOp
     from pymatgen.symmetry.groups import CrystalSystem
     from pymatgen.util.typing import MillerIndex
 
@@ -732,6 +733,24 @@ class Slab(Structure):
             warnings.warn("Equivalent sites could not be found for some indices. Surface unchanged.")
 
 
+def _add_bulk_site_properties(structure: Structure, spg_analyzer: SpacegroupAnalyzer | None = None) -> None:
+    """Add Wyckoff symbols and equivalent sites (bulk_wyckoff and bulk_equivalent
+    site properties) to a bulk structure in place, unless they are already present.
+
+    Args:
+        structure (Structure): The bulk structure.
+        spg_analyzer (SpacegroupAnalyzer): An existing analyzer of the structure
+            to avoid repeating the symmetry analysis.
+    """
+    if "bulk_wyckoff" in structure.site_properties and "bulk_equivalent" in structure.site_properties:
+        return
+
+    spg_analyzer = spg_analyzer or SpacegroupAnalyzer(structure)
+    dataset = spg_analyzer.get_symmetry_dataset()
+    structure.add_site_property("bulk_wyckoff", dataset.wyckoffs)
+    structure.add_site_property("bulk_equivalent", dataset.equivalent_atoms.tolist())
+
+
 def center_slab(slab: Structure) -> Structure:
     """Relocate the slab to the center such that its center
     (the slab region) is close to z=0.5.
@@ -942,18 +961,6 @@ class SlabGenerator:
             divisor = abs(reduce(gcd, vector))  # type: ignore[arg-type]
             return cast(Tuple3Ints, tuple(int(idx / divisor) for idx in vector))
 
-        def add_site_types() -> None:
-            """Add Wyckoff symbols and equivalent sites to the initial structure."""
-            if (
-                "bulk_wyckoff" not in initial_structure.site_properties
-                or "bulk_equivalent" not in initial_structure.site_properties
-            ):
-                spg_analyzer = SpacegroupAnalyzer(initial_structure)
-                initial_structure.add_site_property("bulk_wyckoff", spg_analyzer.get_symmetry_dataset().wyckoffs)
-                initial_structure.add_site_property(
-                    "bulk_equivalent", spg_analyzer.get_symmetry_dataset().equivalent_atoms.tolist()
-                )
-
         def calculate_surface_normal() -> np.ndarray:
             """Calculate the unit surface normal vector using the reciprocal
             lattice vector.
@@ -1035,7 +1042,7 @@ class SlabGenerator:
 
         # Add Wyckoff symbols and equivalent sites to the initial structure,
         # to help identify types of sites in the generated slab
-        add_site_types()
+        _add_bulk_site_properties(initial_structure)
 
         # Calculate the surface normal
         lattice = initial_structure.lattice
@@ -1195,6 +1202,8 @@ class SlabGenerator:
         repair: bool = False,
         ztol: float = 0,
         filter_out_sym_slabs: bool = True,
+        *,
+        n_jobs: int = 1,
     ) -> list[Slab]:
         """Generate slabs with shift values calculated from the internal
         gen_possible_terminations func. If the user decide to avoid breaking
@@ -1219,6 +1228,8 @@ class SlabGenerator:
             ztol (float): Fractional tolerance for determine overlapping z-ranges,
                 smaller ztol might result in more possible Slabs.
             filter_out_sym_slabs (bool): If True filter out identical slabs with different terminations.
+            n_jobs (int): Number of processes used to build (and repair) the slabs of
+                the different terminations. The result does not depend on it. Defaults to 1.
 
         Returns:
             list[Slab]: All possible Slabs of a particular surface,
@@ -1321,7 +1332,7 @@ class SlabGenerator:
         # Get occupied z_ranges
         z_ranges = [] if bonds is None else get_z_ranges(bonds, ztol)
 
-        slabs = []
+        terminations_to_build = []
         for termination in gen_possible_terminations(ftol=ftol):
             # Calculate total number of bonds broken (how often the
             # termination fall within the z_range occupied by a bond)
@@ -1330,18 +1341,19 @@ class SlabGenerator:
                 if z_range[0] <= termination <= z_range[1]:
                     bonds_broken += 1
 
-            # DEBUG(@DanielYang59): number of bonds broken passed to energy
-            # As per the docstring this is to sort final Slabs by number
-            # of bonds broken, but this may very likely lead to errors
-            # if the "energy" is used literally (Maybe reset energy to None?)
-            slab = self.get_slab(shift=termination, tol=tol, energy=bonds_broken)
-
-            if bonds_broken <= max_broken_bonds:
-                slabs.append(slab)
-
             # If the number of broken bonds is exceeded, repair the broken bonds
-            elif repair and bonds is not None:
-                slabs.append(self.repair_broken_bonds(slab=slab, bonds=bonds))
+            # or skip the termination without building its slab
+            if bonds_broken <= max_broken_bonds or (repair and bonds is not None):
+                terminations_to_build.append((termination, bonds_broken))
+
+        slab_args = [
+            (termination, bonds_broken, tol, bonds if bonds_broken > max_broken_bonds else None)
+            for termination, bonds_broken in terminations_to_build
+        ]
+        if n_jobs == 1 or len(slab_args) < 2:
+            slabs = list(itertools.starmap(self._get_termination_slab, slab_args))
+        else:
+            slabs = Parallel(n_jobs=n_jobs)(delayed(self._get_termination_slab)(*args) for args in slab_args)
 
         # Filter out surfaces that might be the same
         if filter_out_sym_slabs:
@@ -1366,6 +1378,26 @@ class SlabGenerator:
 
         return cast(list[Slab], sorted(final_slabs, key=lambda slab: slab.energy))
 
+    def _get_termination_slab(
+        self,
+        termination: float,
+        bonds_broken: int,
+        tol: float,
+        repair_bonds: dict[tuple[Species | Element, Species | Element], float] | None,
+    ) -> Slab:
+        """Build the Slab of a single termination for get_slabs, repairing the
+        given broken bonds if repair_bonds is not None.
+        """
+        # DEBUG(@DanielYang59): number of bonds broken passed to energy
+        # As per the docstring this is to sort final Slabs by number
+        # of bonds broken, but this may very likely lead to errors
+        # if the "energy" is used literally (Maybe reset energy to None?)
+        slab = self.get_slab(shift=termination, tol=tol, energy=bonds_broken)
+
+        if repair_bonds is not None:
+            slab = self.repair_broken_bonds(slab=slab, bonds=repair_bonds)
+        return slab
+
     def repair_broken_bonds(
         self,
         slab: Slab,
@@ -1577,6 +1609,8 @@ def generate_all_slabs(
     repair: bool = False,
     include_reconstructions: bool = False,
     in_unit_planes: bool = False,
+    *,
+    n_jobs: int = 1,
 ) -> list[Slab]:
     """Find all unique Slabs up to a given Miller index.
 
@@ -1637,36 +1671,49 @@ def generate_all_slabs(
             Fe(100) will have more layers. The slab thickness
             will be in min_slab_size/math.ceil(self._proj_height/dhkl)
             multiples of oriented unit cells.
+        n_jobs (int): Number of processes used to generate the slabs of the
+            different Miller indices. The slabs are returned in the same order
+            regardless. Defaults to 1.
     """
-    all_slabs: list[Slab] = []
-
-    for miller in get_symmetrically_distinct_miller_indices(structure, max_index):
-        gen = SlabGenerator(
-            structure,
-            miller,
-            min_slab_size,
-            min_vacuum_size,
-            lll_reduce=lll_reduce,
-            center_slab=center_slab,
-            primitive=primitive,
-            max_normal_search=max_normal_search,
-            in_unit_planes=in_unit_planes,
-        )
-        slabs = gen.get_slabs(
-            bonds=bonds,
-            tol=tol,
-            ftol=ftol,
-            symmetrize=symmetrize,
-            max_broken_bonds=max_broken_bonds,
-            repair=repair,
+    # Analyze the bulk symmetry only once and share the resulting bulk site
+    # properties with the SlabGenerators of all Miller indices
+    spg_analyzer = SpacegroupAnalyzer(structure)
+    _add_bulk_site_properties(structure, spg_analyzer)
+
+    generator_kwargs = {
+        "min_slab_size": min_slab_size,
+        "min_vacuum_size": min_vacuum_size,
+        "lll_reduce": lll_reduce,
+        "center_slab": center_slab,
+        "primitive": primitive,
+        "max_normal_search": max_normal_search,
+        "in_unit_planes": in_unit_planes,
+    }
+    slab_kwargs = {
+        "bonds": bonds,
+        "tol": tol,
+        "ftol": ftol,
+        "symmetrize": symmetrize,
+        "max_broken_bonds": max_broken_bonds,
+        "repair": repair,
+    }
+
+    millers = get_symmetrically_distinct_miller_indices(structure, max_index)
+    if n_jobs == 1:
+        slabs_per_miller = [_get_miller_slabs(structure, miller, generator_kwargs, slab_kwargs) for miller in millers]
+    else:
+        slabs_per_miller = Parallel(n_jobs=n_jobs)(
+            delayed(_get_miller_slabs)(structure, miller, generator_kwargs, slab_kwargs) for miller in millers
         )
 
+    all_slabs: list[Slab] = []
+    for miller, slabs in zip(millers, slabs_per_miller, strict=True):
         if len(slabs) > 0:
             logger.debug(f"{miller} has {len(slabs)} slabs... ")
             all_slabs.extend(slabs)
 
     if include_reconstructions:
-        symbol = SpacegroupAnalyzer(structure).get_space_group_symbol()
+        symbol = spg_analyzer.get_space_group_symbol()
         # Enumerate through all reconstructions in the
         # archive available for this particular spacegroup
         for name, instructions in RECONSTRUCTIONS_ARCHIVE.items():
@@ -1684,6 +1731,16 @@ def generate_all_slabs(
     return all_slabs
 
 
+def _get_miller_slabs(
+    structure: Structure,
+    miller: MillerIndex,
+    generator_kwargs: dict[str, Any],
+    slab_kwargs: dict[str, Any],
+) -> list[Slab]:
+    """Generate all slabs of a single Miller index for generate_all_slabs."""
+    return SlabGenerator(structure, miller, **generator_kwargs).get_slabs(**slab_kwargs)
+
+
 # Load the reconstructions_archive JSON file
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 with open(f"{MODULE_DIR}/reconstructions_archive.json", encoding="utf-8") as data_file:
@@ -1964,11 +2021,11 @@ def get_symmetrically_equivalent_miller_indices(
             index for hexagonal systems, or hkl (False).
         system: The crystal system of the structure.
     """
-    # Convert to hkl if hkil, because in_coord_list only handles tuples of 3
+    # Convert to hkl if hkil
     if len(miller_index) >= 3:
-        _miller_index: MillerIndex = (miller_index[0], miller_index[1], miller_index[-1])
+        _miller_index: MillerIndex = (int(miller_index[0]), int(miller_index[1]), int(miller_index[-1]))
     else:
-        _miller_index = (miller_index[0], miller_index[1], miller_index[2])
+        _miller_index = (int(miller_index[0]), int(miller_index[1]), int(miller_index[2]))
 
     max_idx = max(np.abs(miller_index))
     idx_range = list(range(-max_idx, max_idx + 1))
@@ -1991,22 +2048,29 @@ def get_symmetrically_equivalent_miller_indices(
     else:
         symm_ops = structure.lattice.get_recp_symmetry_operation()
 
+    # Apply all symmetry operations to all candidate indices at once
+    candidates = [
+        miller
+        for miller in itertools.product(idx_range, idx_range, idx_range)
+        if miller != _miller_index and any(idx != 0 for idx in miller)
+    ]
+    all_images = _get_miller_images(np.array(candidates), _get_miller_rotations(symm_ops)).tolist()
+
     equivalent_millers: list[Tuple3Ints] = [_miller_index]
-    for miller in itertools.product(idx_range, idx_range, idx_range):
-        if miller == _miller_index:
-            continue
-
-        if any(idx != 0 for idx in miller):
-            if _is_in_miller_family(miller, equivalent_millers, symm_ops):
-                equivalent_millers += [miller]
-
-            # Include larger Miller indices in the family of planes
-            if (
-                all(max_idx > i for i in np.abs(miller))
-                and not in_coord_list(equivalent_millers, miller)
-                and _is_in_miller_family(max_idx * np.array(miller), equivalent_millers, symm_ops)
-            ):
-                equivalent_millers += [miller]
+    family = {_miller_index}
+    for miller, images in zip(candidates, all_images, strict=True):
+        if any(tuple(image) in family for image in images):
+            equivalent_millers.append(miller)
+            family.add(miller)
+
+        # Include larger Miller indices in the family of planes
+        if (
+            all(max_idx > i for i in np.abs(miller))
+            and miller not in family
+            and any(tuple(max_idx * idx for idx in image) in family for image in images)
+        ):
+            equivalent_millers.append(miller)
+            family.add(miller)
 
     # Convert hkl to hkil if necessary
     if return_hkil and system in {"trigonal", "hexagonal"}:
@@ -2032,66 +2096,93 @@ def get_symmetrically_distinct_miller_indices(
         return_hkil (bool): Whether to return hkil (True) form of Miller
             index for hexagonal systems, or hkl (False).
     """
-    # Get a list of all hkls for conventional (including equivalent)
-    rng = list(range(-max_index, max_index + 1))[::-1]
-    conv_hkl_list = [miller for miller in itertools.product(rng, rng, rng) if any(i != 0 for i in miller)]
-
-    # Sort by the maximum absolute values of Miller indices so that
-    # low-index planes come first. This is important for trigonal systems.
-    conv_hkl_list = sorted(conv_hkl_list, key=lambda x: max(np.abs(x)))
-
     # Get distinct hkl planes from the rhombohedral setting if trigonal
     spg_analyzer = SpacegroupAnalyzer(structure)
-    if spg_analyzer.get_crystal_system() == "trigonal":
+    crystal_system = spg_analyzer.get_crystal_system()
+    if crystal_system == "trigonal":
         transf = spg_analyzer.get_conventional_to_primitive_transformation_matrix()
-        miller_list: list[Tuple3Ints] = [hkl_transformation(transf, hkl) for hkl in conv_hkl_list]
-        prim_structure = SpacegroupAnalyzer(structure).get_primitive_standard_structure()
+        transf_key: tuple | None = tuple(map(tuple, transf.tolist()))
+        prim_structure = spg_analyzer.get_primitive_standard_structure()
         symm_ops = prim_structure.lattice.get_recp_symmetry_operation()
 
     else:
-        miller_list = conv_hkl_list
+        transf_key = None
         symm_ops = structure.lattice.get_recp_symmetry_operation()
 
-    unique_millers: list = []
-    unique_millers_conv: list = []
-
-    for idx, miller in enumerate(miller_list):
-        denom = abs(reduce(gcd, miller))  # type: ignore[arg-type]
-        miller = cast(Tuple3Ints, tuple(int(idx / denom) for idx in miller))
-        if not _is_in_miller_family(miller, unique_millers, symm_ops):
-            if spg_analyzer.get_crystal_system() == "trigonal":
-                # Now we find the distinct primitive hkls using
-                # the primitive symmetry operations and their
-                # corresponding hkls in the conventional setting
-                unique_millers.append(miller)
-                denom = abs(reduce(gcd, conv_hkl_list[idx]))  # type: ignore[arg-type]
-                cmiller = tuple(int(idx / denom) for idx in conv_hkl_list[idx])
-                unique_millers_conv.append(cmiller)
-            else:
-                unique_millers.append(miller)
-                unique_millers_conv.append(miller)
+    rotations_key = tuple(map(tuple, _get_miller_rotations(symm_ops).reshape(-1, 9).tolist()))
+    unique_millers_conv = list(_get_distinct_miller_indices(rotations_key, max_index, transf_key))
 
-    if return_hkil and spg_analyzer.get_crystal_system() in {"trigonal", "hexagonal"}:
+    if return_hkil and crystal_system in {"trigonal", "hexagonal"}:
         return [(hkl[0], hkl[1], -1 * hkl[0] - hkl[1], hkl[2]) for hkl in unique_millers_conv]
 
     return unique_millers_conv
 
 
-def _is_in_miller_family(
-    miller_index: MillerIndex,
-    miller_list: list[MillerIndex],
-    symm_ops: list,
-) -> bool:
-    """Helper function to check if the given Miller index belongs
-    to the same family of any index in the provided list.
+@lru_cache(maxsize=256)
+def _get_distinct_miller_indices(
+    rotations: tuple[tuple[int, ...], ...],
+    max_index: int,
+    transf: tuple[tuple[float, ...], ...] | None,
+) -> tuple[Tuple3Ints, ...]:
+    """Find the symmetrically distinct (conventional) Miller indices up to max_index.
+
+    The result only depends on the symmetry operations of the reciprocal lattice (and the
+    conventional to primitive transformation for trigonal systems), so it is cached for
+    all structures with the same symmetry and setting.
 
     Args:
-        miller_index (MillerIndex): The Miller index to analyze.
-        miller_list (list): List of Miller indices.
-        symm_ops (list): Symmetry operations for a lattice,
-            used to define the indices family.
+        rotations (tuple): Flattened integer rotation matrices of the reciprocal lattice.
+        max_index (int): The maximum index.
+        transf (tuple | None): The conventional to primitive transformation matrix if the
+            indices are compared in the rhombohedral setting (trigonal systems), else None.
+    """
+    # Get a list of all hkls for conventional (including equivalent)
+    rng = list(range(-max_index, max_index + 1))[::-1]
+    conv_hkl_list = [miller for miller in itertools.product(rng, rng, rng) if any(i != 0 for i in miller)]
+
+    # Sort by the maximum absolute values of Miller indices so that
+    # low-index planes come first. This is important for trigonal systems.
+    conv_hkl_list = sorted(conv_hkl_list, key=lambda x: max(np.abs(x)))
+
+    conv_millers = np.array(conv_hkl_list)
+    if transf is None:
+        millers = conv_millers
+    else:
+        millers = np.array([hkl_transformation(np.array(transf), hkl) for hkl in conv_hkl_list])
+
+    # Reduce all indices, e.g. (2, 2, 0) -> (1, 1, 0)
+    millers //= np.gcd.reduce(millers, axis=1)[:, None]
+    conv_millers //= np.gcd.reduce(conv_millers, axis=1)[:, None]
+
+    # Indices are equivalent if their orbits under the symmetry operations share a
+    # canonical representative, the first index of each orbit is its distinct index
+    orbit_keys = _get_miller_orbit_keys(millers, np.array(rotations).reshape(-1, 3, 3))
+    _, first_indices = np.unique(orbit_keys, return_index=True)
+
+    return tuple(cast(Tuple3Ints, tuple(conv_millers[idx].tolist())) for idx in np.sort(first_indices))
+
+
+def _get_miller_rotations(symm_ops: list[SymmOp]) -> NDArray[np.int64]:
+    """Get the integer (n_ops, 3, 3) rotation matrices of the symmetry operations
+    of a reciprocal lattice, which map Miller indices onto Miller indices.
+    """
+    return np.rint([op.rotation_matrix for op in symm_ops]).astype(np.int64)
+
+
+def _get_miller_images(millers: NDArray[np.int64], rotations: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Apply all rotations to all Miller indices, giving an (n_millers, n_ops, 3) array."""
+    return np.einsum("oij,nj->noi", rotations, millers)
+
+
+def _get_miller_orbit_keys(millers: NDArray[np.int64], rotations: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Get a canonical integer key of the symmetry orbit of each Miller index, i.e. the
+    encoding of its lexicographically smallest image under the rotations.
     """
-    return any(in_coord_list(miller_list, op.operate(miller_index)) for op in symm_ops)
+    images = _get_miller_images(millers, rotations)
+    offset = int(np.abs(images).max(initial=0))
+    base = 2 * offset + 1
+    codes = ((images[..., 0] + offset) * base + images[..., 1] + offset) * base + images[..., 2] + offset
+    return codes.min(axis=1)
 
 
 def hkl_transformation(
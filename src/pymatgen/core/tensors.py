@@ -10,6 +10,7 @@ import itertools
 import os
 import string
 import warnings
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -23,7 +24,7 @@ from pymatgen.core.operations import SymmOp
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
     from typing import Any
 
     from numpy.typing import NDArray
@@ -37,6 +38,10 @@ __credits__ = "Maarten de Jong, Shyam Dwaraknath, Wei Chen, Mark Asta, Anubhav J
 
 DEFAULT_QUAD = loadfn(os.path.join(os.path.dirname(__file__), "quad_data.json"))
 
+# Number of structures whose symmetry operations are kept by _get_symmetry_operations
+SYMM_OPS_CACHE_SIZE = 32
+_symm_ops_cache: dict[tuple, tuple[list[SymmOp], NDArray]] = {}
+
 
 class Tensor(np.ndarray, MSONable):
     """Base class for doing useful general operations on Nth order tensors,
@@ -317,9 +322,8 @@ class Tensor(np.ndarray, MSONable):
             symprec (float): symmetry tolerance for the Spacegroup Analyzer
                 used to generate the symmetry operations
         """
-        sga = SpacegroupAnalyzer(structure, symprec)
-        symm_ops = sga.get_symmetry_operations(cartesian=True)
-        return sum(self.transform(symm_op) for symm_op in symm_ops) / len(symm_ops)
+        _, rotations = _get_symmetry_operations(structure, symprec)
+        return type(self)(_transform_tensor_array(np.asarray(self)[None], rotations)[0] / len(rotations))
 
     def is_fit_to_structure(self, structure: Structure, tol: float = 1e-2) -> bool:
         """Test whether a tensor is invariant with respect to the
@@ -337,9 +341,8 @@ class Tensor(np.ndarray, MSONable):
     def voigt(self) -> NDArray:
         """The tensor in Voigt notation."""
         v_matrix = np.zeros(self._vscale.shape, dtype=self.dtype)
-        this_voigt_map = self.get_voigt_dict(self.rank)
-        for ind, v in this_voigt_map.items():
-            v_matrix[v] = self[ind]
+        tensor_indices, voigt_indices = _get_voigt_indices(self.rank)
+        v_matrix[voigt_indices] = np.asarray(self)[tensor_indices]
         if not self.is_voigt_symmetric():
             warnings.warn("Tensor is not symmetric, information may be lost in Voigt conversion.")
         return v_matrix * self._vscale
@@ -349,16 +352,10 @@ class Tensor(np.ndarray, MSONable):
         by grouping indices into pairs and constructing a sequence of
         possible permutations to be used in a tensor transpose.
         """
-        transpose_pieces = [[[0 for _ in range(self.rank % 2)]]]
-        transpose_pieces += [[list(range(j, j + 2))] for j in range(self.rank % 2, self.rank, 2)]
-        for n in range(self.rank % 2, len(transpose_pieces)):
-            if len(transpose_pieces[n][0]) == 2:
-                transpose_pieces[n] += [transpose_pieces[n][0][::-1]]
-        for trans_seq in itertools.product(*transpose_pieces):
-            transpose_seq = list(itertools.chain(*trans_seq))
-            if (self - self.transpose(transpose_seq) > tol).any():
-                return False
-        return True
+        return all(
+            not (self - self.transpose(transpose_seq) > tol).any()
+            for transpose_seq in _get_voigt_transpositions(self.rank)
+        )
 
     @staticmethod
     def get_voigt_dict(rank: int) -> dict[tuple[int, ...], tuple[int, ...]]:
@@ -392,9 +389,8 @@ class Tensor(np.ndarray, MSONable):
         if voigt_input.shape != t._vscale.shape:
             raise ValueError("Invalid shape for Voigt matrix")
         voigt_input = voigt_input / t._vscale  # (ruff-preview) noqa: PLR6104
-        this_voigt_map = t.get_voigt_dict(rank)
-        for ind, v in this_voigt_map.items():
-            t[ind] = voigt_input[v]
+        tensor_indices, voigt_indices = _get_voigt_indices(rank, unique=False)
+        t[tensor_indices] = voigt_input[voigt_indices]
         return cls(t)
 
     @staticmethod
@@ -705,6 +701,9 @@ class Tensor(np.ndarray, MSONable):
 class TensorCollection(collections.abc.Sequence, MSONable):
     """A sequence of tensors that can be used for fitting data
     or for having a tensor expansion.
+
+    The tensors of each rank are stored as views into a single stacked array,
+    so that the collection methods operate on all of them at once.
     """
 
     def __init__(self, tensor_list: Sequence, base_class=Tensor) -> None:
@@ -713,7 +712,19 @@ class TensorCollection(collections.abc.Sequence, MSONable):
             tensor_list: List of tensors.
             base_class: Class to be used.
         """
-        self.tensors = [tensor if isinstance(tensor, base_class) else base_class(tensor) for tensor in tensor_list]
+        tensors = [tensor if isinstance(tensor, base_class) else base_class(tensor) for tensor in tensor_list]
+
+        # {(rank, dtype): (indices of the tensors in the collection, stacked tensors)}
+        self._stacks: dict[tuple[int, np.dtype], tuple[NDArray, NDArray]] = {}
+        for key in dict.fromkeys((tensor.rank, tensor.dtype) for tensor in tensors):
+            indices = np.array([idx for idx, tensor in enumerate(tensors) if (tensor.rank, tensor.dtype) == key])
+            stack = np.stack([np.asarray(tensors[idx]) for idx in indices])
+            for idx, array in zip(indices, stack, strict=True):
+                view = array.view(type(tensors[idx]))
+                view.__dict__.update(tensors[idx].__dict__)
+                tensors[idx] = view
+            self._stacks[key] = (indices, stack)
+        self.tensors = tensors
 
     def __len__(self) -> int:
         return len(self.tensors)
@@ -724,6 +735,24 @@ class TensorCollection(collections.abc.Sequence, MSONable):
     def __iter__(self):
         return iter(self.tensors)
 
+    def _map_stacks(self, func: Callable[[NDArray], NDArray]) -> list[Tensor]:
+        """Apply a tensor-valued function to the stacked tensors of each rank.
+
+        Args:
+            func: function mapping an array of stacked tensors of shape
+                (n_tensors, 3, ..., 3) to an array of the same shape.
+
+        Returns:
+            list[Tensor]: The resulting tensors in the order of the collection,
+                with the class and attributes of the original tensors.
+        """
+        results: list[Tensor] = [None] * len(self)  # type: ignore[list-item]
+        for indices, stack in self._stacks.values():
+            for idx, array in zip(indices, func(stack), strict=True):
+                results[idx] = array.view(type(self.tensors[idx]))
+                results[idx].__dict__.update(self.tensors[idx].__dict__)
+        return results
+
     def zeroed(self, tol: float = 1e-3) -> Self:
         """
         Args:
@@ -732,7 +761,7 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection where small values are set to 0.
         """
-        return type(self)([tensor.zeroed(tol) for tensor in self])
+        return type(self)(self._map_stacks(lambda stack: np.where(abs(stack) < tol, 0, stack)))
 
     def transform(self, symm_op: SymmOp) -> Self:
         """Transforms TensorCollection with a symmetry operation.
@@ -743,7 +772,7 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.transform(symm_op) for tensor in self])
+        return type(self)(self._map_stacks(lambda stack: _transform_tensor_array(stack, symm_op.rotation_matrix)))
 
     def rotate(self, matrix, tol: float = 1e-3) -> Self:
         """Rotates TensorCollection.
@@ -755,12 +784,15 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.rotate(matrix, tol) for tensor in self])
+        matrix = SquareTensor(matrix)
+        if not matrix.is_rotation(tol):
+            raise ValueError("Rotation matrix is not valid.")
+        return type(self)(self._map_stacks(lambda stack: _transform_tensor_array(stack, np.asarray(matrix))))
 
     @property
     def symmetrized(self) -> Self:
         """TensorCollection where all tensors are symmetrized."""
-        return type(self)([tensor.symmetrized for tensor in self])
+        return type(self)(self._map_stacks(_symmetrize_tensor_array))
 
     def is_symmetric(self, tol: float = 1e-5) -> bool:
         """
@@ -770,7 +802,7 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are symmetric.
         """
-        return all(tensor.is_symmetric(tol) for tensor in self)
+        return all((stack - _symmetrize_tensor_array(stack) < tol).all() for _, stack in self._stacks.values())
 
     def fit_to_structure(
         self,
@@ -786,7 +818,8 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.fit_to_structure(structure, symprec) for tensor in self])
+        _, rotations = _get_symmetry_operations(structure, symprec)
+        return type(self)(self._map_stacks(lambda stack: _transform_tensor_array(stack, rotations) / len(rotations)))
 
     def is_fit_to_structure(
         self,
@@ -801,12 +834,26 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are fitted to Structure.
         """
-        return all(tensor.is_fit_to_structure(structure, tol) for tensor in self)
+        _, rotations = _get_symmetry_operations(structure, symprec=0.1)
+        return all(
+            (stack - _transform_tensor_array(stack, rotations) / len(rotations) < tol).all()
+            for _, stack in self._stacks.values()
+        )
 
     @property
     def voigt(self) -> list[NDArray]:
         """TensorCollection where all tensors are in Voigt form."""
-        return [tensor.voigt for tensor in self]
+        if not self.is_voigt_symmetric():
+            warnings.warn("Tensor is not symmetric, information may be lost in Voigt conversion.")
+        v_matrices: list[NDArray] = [None] * len(self)  # type: ignore[list-item]
+        for (rank, _), (indices, stack) in self._stacks.items():
+            vscales = np.array([self.tensors[idx]._vscale for idx in indices])
+            tensor_indices, voigt_indices = _get_voigt_indices(rank)
+            v_stack = np.zeros(vscales.shape, dtype=stack.dtype)
+            v_stack[(slice(None), *voigt_indices)] = stack[(slice(None), *tensor_indices)]
+            for idx, v_matrix in zip(indices, v_stack * vscales, strict=True):
+                v_matrices[idx] = v_matrix
+        return v_matrices
 
     @property
     def ranks(self) -> list:
@@ -821,7 +868,11 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are voigt symmetric.
         """
-        return all(tensor.is_voigt_symmetric(tol) for tensor in self)
+        return all(
+            not (stack - stack.transpose(0, *np.add(transpose_seq, 1)) > tol).any()
+            for (rank, _), (_, stack) in self._stacks.items()
+            for transpose_seq in _get_voigt_transpositions(rank)
+        )
 
     @classmethod
     def from_voigt(
@@ -856,7 +907,9 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.convert_to_ieee(structure, initial_fit, refine_rotation) for tensor in self])
+        rotation = Tensor.get_ieee_rotation(structure, refine_rotation)
+        result = self.fit_to_structure(structure) if initial_fit else self
+        return result.rotate(rotation, tol=1e-2)
 
     def round(self, *args, **kwargs) -> Self:
         """Round all tensors.
@@ -868,7 +921,7 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.round(*args, **kwargs) for tensor in self])
+        return type(self)(self._map_stacks(lambda stack: np.round(stack, *args, **kwargs)))
 
     @property
     def voigt_symmetrized(self) -> Self:
@@ -1039,21 +1092,130 @@ def symmetry_reduce(
         corresponding to those which will reconstruct the remaining
         tensors as values
     """
-    sga = SpacegroupAnalyzer(structure, **kwargs)
-    symm_ops = sga.get_symmetry_operations(cartesian=True)
+    symm_ops, rotations = _get_symmetry_operations(structure, **kwargs)
     unique_mapping = TensorMapping([tensors[0]], [[]], tol=tol)
+    # Images of each unique tensor under all the symmetry operations
+    unique_images = [_transform_tensor_array(np.asarray(tensors[0])[None], rotations, sum_ops=False)[:, 0]]
     for tensor in tensors[1:]:
         is_unique = True
-        for unique_tensor, symm_op in itertools.product(unique_mapping, symm_ops):
-            if np.allclose(unique_tensor.transform(symm_op), tensor, atol=tol):
-                unique_mapping[unique_tensor].append(symm_op)
+        for unique_tensor, images in zip(unique_mapping, unique_images, strict=True):
+            if images.shape[1:] != np.shape(tensor):
+                continue
+            matches = np.isclose(images, tensor, atol=tol).reshape(len(images), -1).all(axis=1)
+            if matches.any():
+                unique_mapping[unique_tensor].append(symm_ops[np.argmax(matches)])
                 is_unique = False
                 break
         if is_unique:
             unique_mapping[tensor] = []
+            unique_images.append(_transform_tensor_array(np.asarray(tensor)[None], rotations, sum_ops=False)[:, 0])
     return unique_mapping
 
 
+def _get_symmetry_operations(
+    structure: Structure,
+    symprec: float = 0.01,
+    angle_tolerance: float = 5,
+) -> tuple[list[SymmOp], NDArray]:
+    """Cartesian symmetry operations of a structure, as found by SpacegroupAnalyzer.
+
+    The operations of the last SYMM_OPS_CACHE_SIZE structures are cached, so that
+    symmetrizing or reducing many tensors for the same structure only determines
+    and converts them once.
+
+    Args:
+        structure (Structure): structure from which to get symmetry
+        symprec (float): symmetry tolerance for the SpacegroupAnalyzer
+        angle_tolerance (float): angle tolerance for the SpacegroupAnalyzer
+
+    Returns:
+        tuple[list[SymmOp], NDArray]: The symmetry operations and their rotation
+            matrices stacked in an array of shape (n_ops, 3, 3).
+    """
+    key = (
+        structure.lattice.matrix.tobytes(),
+        structure.frac_coords.tobytes(),
+        tuple(site.species for site in structure),
+        repr(structure.site_properties.get("magmom")),
+        symprec,
+        angle_tolerance,
+    )
+    if key not in _symm_ops_cache:
+        sga = SpacegroupAnalyzer(structure, symprec, angle_tolerance=angle_tolerance)
+        symm_ops = sga.get_symmetry_operations(cartesian=True)
+        if len(_symm_ops_cache) >= SYMM_OPS_CACHE_SIZE:
+            del _symm_ops_cache[next(iter(_symm_ops_cache))]
+        _symm_ops_cache[key] = (symm_ops, np.array([symm_op.rotation_matrix for symm_op in symm_ops]))
+    symm_ops, rotations = _symm_ops_cache[key]
+    return list(symm_ops), rotations
+
+
+def _transform_tensor_array(tensors: NDArray, rotations: NDArray, sum_ops: bool = True) -> NDArray:
+    """Rotate every index of stacked tensors of the same rank, as in SymmOp.transform_tensor.
+
+    Args:
+        tensors (NDArray): tensors of shape (n_tensors, 3, ..., 3).
+        rotations (NDArray): a rotation matrix of shape (3, 3), or a stack of rotation
+            matrices of shape (n_ops, 3, 3).
+        sum_ops (bool): for a stack of rotations, whether to sum the rotated tensors
+            over the operations (True) or return each of them (False).
+
+    Returns:
+        NDArray: The rotated tensors, with shape (n_tensors, 3, ..., 3) for a single
+            rotation or summed operations, else (n_ops, n_tensors, 3, ..., 3).
+    """
+    rank = tensors.ndim - 1
+    lc = string.ascii_lowercase
+    old, new = lc[:rank], lc[rank : 2 * rank]
+    ops = "y" if np.ndim(rotations) == 3 else ""
+    einsum_string = ",".join(f"{ops}{a}{i}" for a, i in zip(new, old, strict=True))
+    einsum_string += f",z{old}->{'' if sum_ops else ops}z{new}"
+    return np.einsum(einsum_string, *[rotations] * rank, tensors, optimize=True)
+
+
+def _symmetrize_tensor_array(tensors: NDArray) -> NDArray:
+    """Average of stacked tensors over all the permutations of their indices, as in Tensor.symmetrized."""
+    perms = list(itertools.permutations(range(1, tensors.ndim)))
+    return sum(tensors.transpose(0, *perm) for perm in perms) / len(perms)
+
+
+@lru_cache(maxsize=16)
+def _get_voigt_indices(rank: int, unique: bool = True) -> tuple[tuple[NDArray, ...], tuple[NDArray, ...]]:
+    """Indices of the tensor entries and of their Voigt notation entries, from Tensor.get_voigt_dict.
+
+    Args:
+        rank (int): Tensor rank.
+        unique (bool): whether to only keep the last tensor entry for each Voigt entry,
+            for a conversion to Voigt notation. If False, all tensor entries are kept,
+            for a conversion from Voigt notation.
+
+    Returns:
+        tuple[tuple[NDArray, ...], tuple[NDArray, ...]]: The index arrays of the tensor
+            entries and of the Voigt entries, to be used for fancy indexing.
+    """
+    voigt_dict = Tensor.get_voigt_dict(rank)
+    if unique:
+        voigt_dict = {v_ind: ind for ind, v_ind in voigt_dict.items()}
+        voigt_dict = {ind: v_ind for v_ind, ind in voigt_dict.items()}
+    tensor_indices = tuple(np.array(idx, dtype=int) for idx in zip(*voigt_dict, strict=True))
+    voigt_indices = tuple(np.array(idx, dtype=int) for idx in zip(*voigt_dict.values(), strict=True))
+    return tensor_indices, voigt_indices
+
+
+@lru_cache(maxsize=16)
+def _get_voigt_transpositions(rank: int) -> list[list[int]]:
+    """Transpositions of the tensor indices under which a tensor of the given rank
+    must be invariant for its conversion to Voigt notation, grouping indices into
+    pairs as in Tensor.is_voigt_symmetric.
+    """
+    transpose_pieces = [[[0 for _ in range(rank % 2)]]]
+    transpose_pieces += [[list(range(j, j + 2))] for j in range(rank % 2, rank, 2)]
+    for n in range(rank % 2, len(transpose_pieces)):
+        if len(transpose_pieces[n][0]) == 2:
+            transpose_pieces[n] += [transpose_pieces[n][0][::-1]]
+    return [list(itertools.chain(*trans_seq)) for trans_seq in itertools.product(*transpose_pieces)]
+
+
 class TensorMapping(collections.abc.MutableMapping):
     """Base class for tensor mappings, which function much like
     a dictionary, but use numpy routines to determine approximate
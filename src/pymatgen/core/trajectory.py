@@ -16,6 +16,7 @@ from monty.json import MSONable
 
 from pymatgen.core.structure import Composition, DummySpecies, Element, Lattice, Molecule, Species, Structure
 from pymatgen.io.ase import AseAtomsAdaptor
+from pymatgen.util.serialization import encode_array
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -23,6 +24,7 @@ if TYPE_CHECKING:
 
     from typing_extensions import Self
 
+    from pymatgen.util.serialization import ArrayMode
     from pymatgen.util.typing import Matrix3D, PathLike, SitePropsType, Vector3D
 
 
@@ -469,15 +471,21 @@ class Trajectory(MSONable):
         with zopen(filename, mode="wt") as file:
             file.write(xdatcar_str)
 
-    def as_dict(self) -> dict:
-        """Return the trajectory as a MSONable dict."""
-        lat = self.lattice.tolist() if self.lattice is not None else None
+    def as_dict(self, array_mode: ArrayMode = "list") -> dict:
+        """Return the trajectory as a MSONable dict.
+
+        Args:
+            array_mode ("list" | "numpy"): How to store the coordinates and lattices.
+                "numpy" keeps them as arrays for binary serialization with
+                pymatgen.util.serialization.to_binary. Defaults to "list".
+        """
+        lat = encode_array(self.lattice, array_mode) if self.lattice is not None else None
 
         return {
             "@module": type(self).__module__,
             "@class": type(self).__name__,
             "species": self.species,
-            "coords": self.coords.tolist(),
+            "coords": encode_array(self.coords, array_mode),
             "charge": self.charge,
             "spin_multiplicity": self.spin_multiplicity,
             "lattice": lat,
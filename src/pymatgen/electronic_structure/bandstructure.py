@@ -7,6 +7,7 @@ import math
 import re
 import warnings
 from collections import defaultdict
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, overload
 
 import numpy as np
@@ -16,13 +17,17 @@ from pymatgen.core import Element, Lattice, Structure, get_el_sp
 from pymatgen.electronic_structure.core import Orbital, Spin
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.util.coord import pbc_diff
+from pymatgen.util.serialization import encode_array
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Iterator
+    from typing import Any, Literal
 
-    from numpy.typing import NDArray
+    from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
+    from pymatgen.util.serialization import ArrayMode
+
 __author__ = "Geoffroy Hautier, Shyue Ping Ong, Michael Kocher"
 __copyright__ = "Copyright 2012, The Materials Project"
 __version__ = "1.0"
@@ -146,12 +151,150 @@ class Kpoint(MSONable):
         return cls(coords=dct["fcoords"], lattice=lattice, coords_are_cartesian=False, label=dct["label"])
 
 
+class KpointArray(Sequence):
+    """A sequence of Kpoints stored as a single array of fractional coordinates.
+
+    The Kpoint objects are only created when accessed and are kept afterwards,
+    so that changes to their labels persist. The coordinates of all kpoints are
+    available as arrays through frac_coords and cart_coords.
+    """
+
+    def __init__(self, frac_coords: ArrayLike, lattice: Lattice, labels: Sequence[str | None] | None = None) -> None:
+        """
+        Args:
+            frac_coords (ArrayLike): Fractional coordinates of the kpoints, with
+                shape (n_kpoints, 3).
+            lattice (Lattice): The reciprocal lattice of the kpoints.
+            labels (Sequence[str | None]): The label of each kpoint if any.
+                Defaults to no labels.
+        """
+        self.frac_coords = np.array(frac_coords, dtype=float).reshape(-1, 3)
+        self.lattice = lattice
+        self._labels = list(labels) if labels is not None else [None] * len(self.frac_coords)
+        if len(self._labels) != len(self.frac_coords):
+            raise ValueError(f"Got {len(self._labels)} labels for {len(self.frac_coords)} kpoints")
+        self._kpoints: list[Kpoint | None] = [None] * len(self.frac_coords)
+        self._cart_coords: NDArray | None = None
+
+    @overload
+    def __getitem__(self, index: int) -> Kpoint:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Kpoint]:
+        pass
+
+    def __getitem__(self, index: int | slice) -> Kpoint | list[Kpoint]:
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+
+        idx = range(len(self))[index]
+        if (kpoint := self._kpoints[idx]) is None:
+            kpoint = self._kpoints[idx] = Kpoint(self.frac_coords[idx], self.lattice, label=self._labels[idx])
+        return kpoint
+
+    def __len__(self) -> int:
+        return len(self.frac_coords)
+
+    def __iter__(self) -> Iterator[Kpoint]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n_kpoints={len(self)})"
+
+    @property
+    def cart_coords(self) -> NDArray:
+        """The Cartesian coordinates of the kpoints as a (n_kpoints, 3) array."""
+        if self._cart_coords is None:
+            self._cart_coords = self.lattice.get_cartesian_coords(self.frac_coords)
+        return self._cart_coords
+
+    @property
+    def labels(self) -> list[str | None]:
+        """The label of each kpoint, None for the unlabeled ones."""
+        return [
+            label if kpoint is None else kpoint.label for label, kpoint in zip(self._labels, self._kpoints, strict=True)
+        ]
+
+    def get_distances_and_branches(self) -> tuple[list[float], list[dict[str, Any]]]:
+        """Get the distance along the path of each kpoint and the branches, for
+        kpoints along symmetry lines.
+
+        Two consecutive labeled kpoints start a new branch, with no distance between
+        them.
+
+        Returns:
+            tuple[list[float], list[dict]]: The distance of each kpoint and the branches
+                as {"start_index", "end_index", "name"} dicts.
+        """
+        labels = self.labels
+        is_labeled = np.array([label is not None for label in labels], dtype=bool)
+        steps = np.zeros(len(self))
+        steps[1:] = np.linalg.norm(np.diff(self.cart_coords, axis=0), axis=1)
+        steps[1:][is_labeled[1:] & is_labeled[:-1]] = 0
+        distances = np.cumsum(steps).tolist()
+
+        # An empty label does not start a new branch
+        has_label = np.array([bool(label) for label in labels], dtype=bool)
+        starts = [0, *(np.flatnonzero(has_label[1:] & has_label[:-1]) + 1).tolist()]
+        ends = [*(start - 1 for start in starts[1:]), len(self) - 1]
+        branches = [
+            {"start_index": start, "end_index": end, "name": f"{labels[start]}-{labels[end]}"}
+            for start, end in zip(starts, ends, strict=True)
+            if len(self) > 0
+        ]
+        return distances, branches
+
+    @classmethod
+    def from_coords(
+        cls,
+        coords: ArrayLike,
+        lattice: Lattice,
+        labels_dict: dict[str, ArrayLike] | None = None,
+        coords_are_cartesian: bool = False,
+    ) -> tuple[Self, dict[str, Kpoint]]:
+        """Create from kpoint coordinates, labeling the kpoints found in labels_dict.
+
+        Args:
+            coords (ArrayLike): Coordinates of the kpoints, with shape (n_kpoints, 3).
+            lattice (Lattice): The reciprocal lattice of the kpoints.
+            labels_dict (dict[str, ArrayLike]): Coordinates of the labeled kpoints,
+                in the same coordinate system as coords.
+            coords_are_cartesian (bool): Whether the coordinates are Cartesian.
+
+        Returns:
+            tuple[KpointArray, dict[str, Kpoint]]: The kpoints and, for each label
+                found among them, the Kpoint of its last occurrence.
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+        frac_coords = lattice.get_fractional_coords(coords) if coords_are_cartesian else coords
+
+        labels: list[str | None] = [None] * len(coords)
+        matches: dict[int, list[str]] = defaultdict(list)
+        for label, label_coords in (labels_dict or {}).items():
+            for idx in np.flatnonzero(np.linalg.norm(coords - np.array(label_coords), axis=1) < 0.0001):
+                matches[idx].append(label)
+
+        # A kpoint matching several labels gets the last one
+        label_kpoints: dict[str, Kpoint] = {}
+        for idx in sorted(matches):
+            for label in matches[idx]:
+                labels[idx] = label
+                label_kpoints[label] = Kpoint(
+                    coords[idx], lattice, label=label, coords_are_cartesian=coords_are_cartesian
+                )
+
+        return cls(frac_coords, lattice, labels), label_kpoints
+
+
 class BandStructure:
     """Generic band structure data, defined by a list of Kpoints
         and corresponding energies for each of them.
 
     Attributes:
-        kpoints (list[Kpoint]): Kpoints in the band structure.
+        kpoints (KpointArray): Kpoints in the band structure, backed by an array
+            of their fractional coordinates.
         lattice_rec (Lattice): The reciprocal lattice of the band structure.
         efermi (float): The Fermi level.
         is_spin_polarized (bool): Whether the band structure is spin-polarized.
@@ -202,35 +345,21 @@ class BandStructure:
         """
         self.efermi = efermi
         self.lattice_rec = lattice
-        self.kpoints = []
-        self.labels_dict = {}
         self.structure = structure
-        self.projections = projections or {}
-        self.projections = {k: np.array(v) for k, v in self.projections.items()}
-
-        if labels_dict is None:
-            labels_dict = {}
+        self.projections = {k: np.array(v) for k, v in (projections or {}).items()}
 
         if self.projections and self.structure is None:
             raise RuntimeError("if projections are provided a structure object is also required")
 
-        for kpt in kpoints:
-            # Check if this Kpoint has a label
-            label = None
-            for c in labels_dict:
-                if np.linalg.norm(kpt - np.array(labels_dict[c])) < 0.0001:
-                    label = c
-                    self.labels_dict[label] = Kpoint(
-                        kpt,
-                        lattice,
-                        label=label,
-                        coords_are_cartesian=coords_are_cartesian,
-                    )
-            self.kpoints.append(Kpoint(kpt, lattice, label=label, coords_are_cartesian=coords_are_cartesian))
+        self.kpoints, self.labels_dict = KpointArray.from_coords(kpoints, lattice, labels_dict, coords_are_cartesian)
         self.bands = {spin: np.array(v) for spin, v in eigenvals.items()}
         self.nb_bands = len(eigenvals[Spin.up])
         self.is_spin_polarized = len(self.bands) == 2
 
+        # Point group rotations of the structure, used for symmetry-equivalent kpoints
+        self._point_group_structure: Structure | None = None
+        self._point_group_rotations: dict[bool, NDArray] = {}
+
     def get_projection_on_elements(self) -> dict[Spin, NDArray]:
         """Get projections on elements.
 
@@ -295,11 +424,58 @@ class BandStructure:
             bool: True if is metal.
         """
         for vals in self.bands.values():
-            for idx in range(self.nb_bands):
-                if np.any(vals[idx, :] - self.efermi < -efermi_tol) and np.any(vals[idx, :] - self.efermi > efermi_tol):
-                    return True
+            shifted = vals - self.efermi
+            if np.any(np.any(shifted < -efermi_tol, axis=1) & np.any(shifted > efermi_tol, axis=1)):
+                return True
         return False
 
+    def _get_band_edge(self, edge: Literal["vbm", "cbm"]) -> dict[str, Any]:
+        """Locate the VBM or CBM of a non-metal with array reductions over the bands.
+
+        The first extremum in (spin, band, kpoint) order is used, as in a scan of
+        all eigenvalues below (VBM) or above (CBM) the Fermi level.
+        """
+        energy = -float("inf") if edge == "vbm" else float("inf")
+        index = kpoint = None
+        for value in self.bands.values():
+            if edge == "vbm":
+                candidates = np.where(value < self.efermi, value, -np.inf)
+                flat_idx = np.argmax(candidates)
+                is_better = candidates.flat[flat_idx] > energy
+            else:
+                candidates = np.where(value >= self.efermi, value, np.inf)
+                flat_idx = np.argmin(candidates)
+                is_better = candidates.flat[flat_idx] < energy
+            if is_better:
+                energy = float(candidates.flat[flat_idx])
+                index = int(np.unravel_index(flat_idx, value.shape)[1])
+                kpoint = self.kpoints[index]
+
+        if kpoint is not None and kpoint.label is not None:
+            kpoint_indices = [idx for idx, label in enumerate(self.kpoints.labels) if label == kpoint.label]
+        else:
+            kpoint_indices = [index]
+
+        # Get all other bands sharing the band edge
+        band_indices: defaultdict[Spin, list[int]] = defaultdict(list)
+        if index is not None:
+            for spin, value in self.bands.items():
+                if shared := np.flatnonzero(np.abs(value[:, index] - energy) < 0.001).tolist():
+                    band_indices[spin] = shared
+        proj = {}
+        for spin, value in self.projections.items():
+            if len(band_indices[spin]) == 0:
+                continue
+            proj[spin] = value[band_indices[spin][0]][kpoint_indices[0]]
+
+        return {
+            "band_index": band_indices,
+            "kpoint_index": kpoint_indices,
+            "kpoint": kpoint,
+            "energy": energy,
+            "projections": proj,
+        }
+
     def get_vbm(self) -> dict[str, Any]:
         """Get data about the valence band maximum (VBM).
 
@@ -330,42 +506,7 @@ class BandStructure:
                 "projections": {},
             }
 
-        max_tmp = -float("inf")
-        index = kpoint_vbm = None
-        for value in self.bands.values():
-            for idx, j in zip(*np.where(value < self.efermi), strict=True):
-                if value[idx, j] > max_tmp:
-                    max_tmp = float(value[idx, j])
-                    index = j
-                    kpoint_vbm = self.kpoints[j]
-
-        list_ind_kpts = []
-        if kpoint_vbm is not None and kpoint_vbm.label is not None:
-            for idx, kpt in enumerate(self.kpoints):
-                if kpt.label == kpoint_vbm.label:
-                    list_ind_kpts.append(idx)
-        else:
-            list_ind_kpts.append(index)
-
-        # Get all other bands sharing the VBM
-        list_ind_band = defaultdict(list)
-        for spin in self.bands:
-            for idx in range(self.nb_bands):
-                if math.fabs(self.bands[spin][idx][index] - max_tmp) < 0.001:
-                    list_ind_band[spin].append(idx)
-        proj = {}
-        for spin, value in self.projections.items():
-            if len(list_ind_band[spin]) == 0:
-                continue
-            proj[spin] = value[list_ind_band[spin][0]][list_ind_kpts[0]]
-
-        return {
-            "band_index": list_ind_band,
-            "kpoint_index": list_ind_kpts,
-            "kpoint": kpoint_vbm,
-            "energy": max_tmp,
-            "projections": proj,
-        }
+        return self._get_band_edge("vbm")
 
     def get_cbm(self) -> dict[str, Any]:
         """Get data about the conduction band minimum (CBM).
@@ -396,42 +537,7 @@ class BandStructure:
                 "projections": {},
             }
 
-        max_tmp = float("inf")
-        index = kpoint_cbm = None
-        for value in self.bands.values():
-            for idx, j in zip(*np.where(value >= self.efermi), strict=True):
-                if value[idx, j] < max_tmp:
-                    max_tmp = float(value[idx, j])
-                    index = j
-                    kpoint_cbm = self.kpoints[j]
-
-        list_index_kpoints = []
-        if kpoint_cbm is not None and kpoint_cbm.label is not None:
-            for idx, kpt in enumerate(self.kpoints):
-                if kpt.label == kpoint_cbm.label:
-                    list_index_kpoints.append(idx)
-        else:
-            list_index_kpoints.append(index)
-
-        # Get all other bands sharing the CBM
-        list_index_band = defaultdict(list)
-        for spin in self.bands:
-            for idx in range(self.nb_bands):
-                if math.fabs(self.bands[spin][idx][index] - max_tmp) < 0.001:
-                    list_index_band[spin].append(idx)
-        proj = {}
-        for spin, value in self.projections.items():
-            if len(list_index_band[spin]) == 0:
-                continue
-            proj[spin] = value[list_index_band[spin][0]][list_index_kpoints[0]]
-
-        return {
-            "band_index": list_index_band,
-            "kpoint_index": list_index_kpoints,
-            "kpoint": kpoint_cbm,
-            "energy": max_tmp,
-            "projections": proj,
-        }
+        return self._get_band_edge("cbm")
 
     def get_band_gap(self) -> dict[str, Any]:
         r"""Get band gap.
@@ -445,8 +551,9 @@ class BandStructure:
         if self.is_metal():
             return {"energy": 0.0, "direct": False, "transition": None}
 
-        cbm = self.get_cbm()
-        vbm = self.get_vbm()
+        # The metal check is already done, so locate the band edges directly
+        cbm = self._get_band_edge("cbm")
+        vbm = self._get_band_edge("vbm")
         result = {
             "direct": False,
             "transition": None,
@@ -477,6 +584,10 @@ class BandStructure:
         if self.is_metal():
             raise ValueError("get_direct_band_gap_dict should only be used with non-metals")
 
+        return self._get_direct_band_gap_dict()
+
+    def _get_direct_band_gap_dict(self) -> dict[Spin, dict[str, Any]]:
+        """Direct band gap of each spin channel, without checking for a metal."""
         direct_gap_dict = {}
         for spin, v in self.bands.items():
             above = v[np.all(v > self.efermi, axis=1)]
@@ -505,7 +616,7 @@ class BandStructure:
         if self.is_metal():
             return 0.0
 
-        dg = self.get_direct_band_gap_dict()
+        dg = self._get_direct_band_gap_dict()
         return min(v["value"] for v in dg.values())
 
     def get_sym_eq_kpoints(
@@ -527,17 +638,24 @@ class BandStructure:
         if not self.structure:
             return None
 
-        sg = SpacegroupAnalyzer(self.structure)
-        symm_ops = sg.get_point_group_operations(cartesian=cartesian)
-        points = np.dot(kpoint, [m.rotation_matrix for m in symm_ops])
-        rm_list = []
-        # Identify and remove duplicates from equivalent k-points
-        for i in range(len(points) - 1):
-            for j in range(i + 1, len(points)):
-                if np.allclose(pbc_diff(points[i], points[j]), [0, 0, 0], tol):
-                    rm_list.append(i)
-                    break
-        return np.delete(points, rm_list, axis=0)
+        rotations = self._get_point_group_rotations(cartesian)
+        points = np.dot(kpoint, rotations)
+        # Identify and remove duplicates from equivalent k-points, keeping the last
+        # of each group of equivalent points
+        is_dupe = np.all(np.isclose(pbc_diff(points[:, None], points[None]), 0, tol), axis=-1)
+        return points[~np.triu(is_dupe, k=1).any(axis=1)]
+
+    def _get_point_group_rotations(self, cartesian: bool) -> NDArray:
+        """Rotation matrices of the point group of the structure, cached until the
+        structure is replaced.
+        """
+        if self._point_group_structure is not self.structure:
+            self._point_group_structure = self.structure
+            self._point_group_rotations = {}
+        if cartesian not in self._point_group_rotations:
+            symm_ops = SpacegroupAnalyzer(self.structure).get_point_group_operations(cartesian=cartesian)
+            self._point_group_rotations[cartesian] = np.array([op.rotation_matrix for op in symm_ops])
+        return self._point_group_rotations[cartesian]
 
     def get_kpoint_degeneracy(
         self,
@@ -558,21 +676,25 @@ class BandStructure:
         all_kpts = self.get_sym_eq_kpoints(kpoint, cartesian, tol=tol)
         return len(all_kpts) if all_kpts is not None else None
 
-    def as_dict(self) -> dict[str, Any]:
-        """JSON-serializable dict representation of BandStructure."""
+    def as_dict(self, array_mode: ArrayMode = "list") -> dict[str, Any]:
+        """JSON-serializable dict representation of BandStructure.
+
+        Args:
+            array_mode ("list" | "numpy"): How to store the kpoints, bands and
+                projections. "numpy" keeps them as arrays for binary serialization
+                with pymatgen.util.serialization.to_binary. Defaults to "list".
+        """
         dct: dict[str, Any] = {
             "@module": type(self).__module__,
             "@class": type(self).__name__,
             "lattice_rec": self.lattice_rec.as_dict(),
             "efermi": self.efermi,
-            "kpoints": [],
+            # kpoints are not kpoint objects dicts but are frac coords (this makes
+            # the dict smaller and avoids the repetition of the lattice).
+            "kpoints": encode_array(self.kpoints.frac_coords, array_mode),
         }
-        # kpoints are not kpoint objects dicts but are frac coords (this makes
-        # the dict smaller and avoids the repetition of the lattice).
-        for k in self.kpoints:
-            dct["kpoints"].append(k.as_dict()["fcoords"])
 
-        dct["bands"] = {str(int(spin)): self.bands[spin].tolist() for spin in self.bands}
+        dct["bands"] = {str(int(spin)): encode_array(self.bands[spin], array_mode) for spin in self.bands}
         dct["is_metal"] = self.is_metal()
         vbm = self.get_vbm()
         dct["vbm"] = {
@@ -599,7 +721,7 @@ class BandStructure:
         dct["projections"] = {}
         if len(self.projections) != 0 and self.structure is not None:
             dct["structure"] = self.structure.as_dict()
-            dct["projections"] = {str(int(spin)): np.array(v).tolist() for spin, v in self.projections.items()}
+            dct["projections"] = {str(int(spin)): encode_array(v, array_mode) for spin, v in self.projections.items()}
         return dct
 
     @classmethod
@@ -744,40 +866,7 @@ class BandStructureSymmLine(BandStructure, MSONable):
             structure,
             projections,
         )
-        self.distance = []
-        self.branches = []
-        one_group: list = []
-        branches_tmp = []
-        # Get labels and distance for each kpoint
-        previous_kpoint = self.kpoints[0]
-        previous_distance = 0.0
-
-        previous_label = self.kpoints[0].label
-        for i, kpt in enumerate(self.kpoints):
-            label = kpt.label
-            if label is not None and previous_label is not None:
-                self.distance.append(previous_distance)
-            else:
-                self.distance.append(np.linalg.norm(kpt.cart_coords - previous_kpoint.cart_coords) + previous_distance)
-            previous_kpoint = kpt
-            previous_distance = self.distance[i]
-            if label and previous_label:
-                if len(one_group) != 0:
-                    branches_tmp.append(one_group)
-                one_group = []
-            previous_label = label
-            one_group.append(i)
-
-        if len(one_group) != 0:
-            branches_tmp.append(one_group)
-        for branch in branches_tmp:
-            self.branches.append(
-                {
-                    "start_index": branch[0],
-                    "end_index": branch[-1],
-                    "name": f"{self.kpoints[branch[0]].label}-{self.kpoints[branch[-1]].label}",
-                }
-            )
+        self.distance, self.branches = self.kpoints.get_distances_and_branches()
 
         self.is_spin_polarized = False
         if len(self.bands) == 2:
@@ -800,12 +889,8 @@ class BandStructureSymmLine(BandStructure, MSONable):
         if self.kpoints[index].label is None:
             return [index]
 
-        list_index_kpoints = []
-        for idx, kpt in enumerate(self.kpoints):
-            if kpt.label == self.kpoints[index].label:
-                list_index_kpoints.append(idx)
-
-        return list_index_kpoints
+        label = self.kpoints[index].label
+        return [idx for idx, kpt_label in enumerate(self.kpoints.labels) if kpt_label == label]
 
     def get_branch(self, index: int) -> list[dict[str, Any]]:
         """Get what branch(es) is the kpoint. It takes into account the
@@ -887,9 +972,15 @@ class BandStructureSymmLine(BandStructure, MSONable):
 
         return self.from_dict(old_dict)
 
-    def as_dict(self) -> dict[str, Any]:
-        """JSON-serializable dict representation of BandStructureSymmLine."""
-        dct = super().as_dict()
+    def as_dict(self, array_mode: ArrayMode = "list") -> dict[str, Any]:
+        """JSON-serializable dict representation of BandStructureSymmLine.
+
+        Args:
+            array_mode ("list" | "numpy"): How to store the kpoints, bands and
+                projections. "numpy" keeps them as arrays for binary serialization
+                with pymatgen.util.serialization.to_binary. Defaults to "list".
+        """
+        dct = super().as_dict(array_mode=array_mode)
         dct["branches"] = self.branches
         return dct
 
@@ -904,12 +995,10 @@ class LobsterBandStructureSymmLine(BandStructureSymmLine):
             "@class": type(self).__name__,
             "lattice_rec": self.lattice_rec.as_dict(),
             "efermi": self.efermi,
-            "kpoints": [],
+            # kpoints are not kpoint objects dicts but are frac coords (this makes
+            # the dict smaller and avoids the repetition of the lattice
+            "kpoints": self.kpoints.frac_coords.tolist(),
         }
-        # kpoints are not kpoint objects dicts but are frac coords (this makes
-        # the dict smaller and avoids the repetition of the lattice
-        for k in self.kpoints:
-            dct["kpoints"].append(k.as_dict()["fcoords"])
         dct["branches"] = self.branches
         dct["bands"] = {str(int(spin)): self.bands[spin].tolist() for spin in self.bands}
         dct["is_metal"] = self.is_metal()
@@ -1111,7 +1200,7 @@ def get_reconstructed_band_structure(
     rec_lattice = list_bs[0].lattice_rec
     nb_bands = min(list_bs[i].nb_bands for i in range(len(list_bs)))
 
-    kpoints = np.concatenate([[kpt.frac_coords for kpt in bs.kpoints] for bs in list_bs])
+    kpoints = np.concatenate([bs.kpoints.frac_coords for bs in list_bs])
     dicts = [bs.labels_dict for bs in list_bs]
     labels_dict = {key: val.frac_coords for dct in dicts for key, val in dct.items()}
 
@@ -26,11 +26,15 @@ Todo:
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import os
 import warnings
 from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
 import numpy as np
+from joblib import Parallel, delayed
 from monty.serialization import dumpfn, loadfn
 from tqdm import tqdm
 
@@ -46,6 +50,7 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Literal
 
+    from numpy.typing import NDArray
     from typing_extensions import Self
 
 try:
@@ -404,6 +409,7 @@ class BztInterpolator:
         load_bztInterp=False,
         save_bands=False,
         fname="bztInterp.json.gz",
+        cache_dir: str | Path | None = None,
     ) -> None:
         """
         Args:
@@ -427,10 +433,16 @@ class BztInterpolator:
             save_bands: Default False. If True interpolated bands are also stored.
                 It can be slower than interpolate them. Not recommended.
             fname: File path where to store/load from the coefficients and equivalences.
+            cache_dir: Directory of cached coefficients and equivalences. If given, the
+                interpolation is looked up there under a hash of the band data, the
+                lattice and lpfac, and is computed and stored only when missing. It overrides
+                fname, load_bztInterp and save_bztInterp. Defaults to None.
 
         Example:
             data = VasprunLoader().from_file('vasprun.xml')
             bztInterp = BztInterpolator(data)
+            # Reuse the interpolation of previous runs on the same data
+            bztInterp = BztInterpolator(data, cache_dir="bzt_cache")
         """
         bands_loaded = False
         self.data = data
@@ -442,6 +454,12 @@ class BztInterpolator:
             emax=(middle_gap_en + energy_range) * units.eV,
         )
 
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            fname = os.path.join(cache_dir, f"bztInterp_{self.get_cache_key(lpfac)}.json.gz")
+            load_bztInterp = os.path.isfile(fname)
+            save_bztInterp = not load_bztInterp
+
         if load_bztInterp:
             bands_loaded = self.load(fname)
         else:
@@ -456,6 +474,38 @@ class BztInterpolator:
         if save_bztInterp:
             self.save(fname, save_bands)
 
+    def get_cache_key(self, lpfac=10) -> str:
+        """Hash of the inputs that determine the interpolation coefficients: the
+        kpoints and energies of the accepted bands, the structure, the magnetic
+        moments, the momentum matrix and lpfac.
+
+        Args:
+            lpfac: the number of interpolation points in the real space.
+
+        Returns:
+            str: The SHA-256 hex digest.
+        """
+        atoms = self.data.atoms
+        inputs = (
+            self.data.kpoints,
+            self.data.ebands,
+            self.data.lattvec,
+            atoms.get_scaled_positions(),
+            atoms.get_atomic_numbers(),
+            self.data.magmom,
+            self.data.mommat,
+            lpfac,
+        )
+        sha = hashlib.sha256()
+        for value in inputs:
+            if value is None:
+                sha.update(b"None")
+                continue
+            array = np.ascontiguousarray(value)
+            sha.update(f"{array.dtype}{array.shape}".encode())
+            sha.update(array.tobytes())
+        return sha.hexdigest()
+
     def load(self, fname="bztInterp.json.gz"):
         """Load the coefficient, equivalences, bands from fname."""
         dct = loadfn(fname)
@@ -640,6 +690,8 @@ class BztTransportProperties:
         save_bztTranspProps=False,
         load_bztTranspProps=False,
         fname="bztTranspProps.json.gz",
+        *,
+        n_jobs: int = 1,
     ) -> None:
         """
         Args:
@@ -657,6 +709,8 @@ class BztTransportProperties:
             load_bztTranspProps: Default False. If True all computed transport properties
                 will be loaded from fname file.
             fname: File path where to save/load transport properties.
+            n_jobs: number of processes used to compute the properties, split over the
+                temperatures and, for the doping levels, the doping types. Defaults to 1.
 
         Upon creation, it contains properties tensors w.r.t. the chemical potential
         of size (len(temp_r),npts_mu,3,3):
@@ -706,14 +760,15 @@ class BztTransportProperties:
             self.mu_r = self.epsilon[mur_indices]  # mu range
             self.mu_r_eV = self.mu_r / units.eV - self.efermi
 
-            N, L0, L1, L2, Lm11 = BL.fermiintegrals(
+            N, L0, L1, L2, Lm11 = _get_fermi_integrals(
                 self.epsilon,
                 self.dos,
                 self.vvdos,
                 mur=self.mu_r,
-                Tr=temp_r,
+                temp_r=temp_r,
                 dosweight=self.dosweight,
                 cdos=self.cdos,
+                n_jobs=n_jobs,
             )
 
             # Compute the Onsager coefficients from those Fermi integrals
@@ -733,19 +788,13 @@ class BztTransportProperties:
             self.Carrier_conc_mu = (N + self.nelect) / (self.volume / (units.Meter / 100.0) ** 3)
 
             # Derived properties
-            cond_eff_mass = np.zeros((len(self.temp_r), len(self.mu_r), 3, 3))
-            for temp in range(len(self.temp_r)):
-                for i in range(len(self.mu_r)):
-                    try:
-                        cond_eff_mass[temp, i] = (
-                            np.linalg.inv(self.Conductivity_mu[temp, i])
-                            * self.Carrier_conc_mu[temp, i]
-                            * units.qe_SI**2
-                            / units.me_SI
-                            * 1e6
-                        )
-                    except np.linalg.LinAlgError:
-                        pass
+            cond_eff_mass = (
+                _inv_tensors(self.Conductivity_mu)
+                * self.Carrier_conc_mu[..., None, None]
+                * units.qe_SI**2
+                / units.me_SI
+                * 1e6
+            )
 
             self.Effective_mass_mu = cond_eff_mass * CRTA
 
@@ -755,17 +804,19 @@ class BztTransportProperties:
             self.contain_props_doping = False
 
             if isinstance(doping, np.ndarray):
-                self.compute_properties_doping(doping, temp_r)
+                self.compute_properties_doping(doping, temp_r, n_jobs=n_jobs)
 
             if save_bztTranspProps:
                 self.save(fname)
 
-    def compute_properties_doping(self, doping, temp_r=None) -> None:
+    def compute_properties_doping(self, doping, temp_r=None, n_jobs: int = 1) -> None:
         """Calculate all the properties w.r.t. the doping levels in input.
 
         Args:
             doping: numpy array specifying the doping levels
             temp_r: numpy array specifying the temperatures
+            n_jobs: number of processes used to solve for the chemical potentials and
+                compute the properties of each doping type and temperature. Defaults to 1.
 
         When executed, it add the following variable at the BztTransportProperties
         object:
@@ -783,65 +834,40 @@ class BztTransportProperties:
         self.Power_Factor_doping, self.Effective_mass_doping = {}, {}
 
         mu_doping = {}
-        doping_carriers = [dop * (self.volume / (units.Meter / 100.0) ** 3) for dop in doping]
-
-        for dop_type in ["n", "p"]:
-            sbk = np.zeros((len(temp_r), len(doping), 3, 3))
-            cond = np.zeros((len(temp_r), len(doping), 3, 3))
-            kappa = np.zeros((len(temp_r), len(doping), 3, 3))
-            hall = np.zeros((len(temp_r), len(doping), 3, 3, 3))
-            dc = np.zeros((len(temp_r), len(doping)))
-
-            if dop_type == "p":
-                doping_carriers = [-dop for dop in doping_carriers]
-
-            mu_doping[dop_type] = np.zeros((len(temp_r), len(doping)))
-            for idx_t, temp in enumerate(temp_r):
-                for idx_d, dop_car in enumerate(doping_carriers):
-                    mu_doping[dop_type][idx_t, idx_d] = BL.solve_for_mu(
-                        self.epsilon,
-                        self.dos,
-                        self.nelect + dop_car,
-                        temp,
-                        self.dosweight,
-                        refine=True,
-                        try_center=False,
-                    )
-
-                N, L0, L1, L2, Lm11 = BL.fermiintegrals(
-                    self.epsilon,
-                    self.dos,
-                    self.vvdos,
-                    mur=mu_doping[dop_type][idx_t],
-                    Tr=np.array([temp]),
-                    dosweight=self.dosweight,
-                )
+        volume_cm3 = self.volume / (units.Meter / 100.0) ** 3
+        doping_carriers = {"n": [dop * volume_cm3 for dop in doping], "p": [-dop * volume_cm3 for dop in doping]}
 
-                cond[idx_t], sbk[idx_t], kappa[idx_t], hall[idx_t] = BL.calc_Onsager_coefficients(
-                    L0, L1, L2, mu_doping[dop_type][idx_t], np.array([temp]), self.volume, Lm11
-                )
+        # Each doping type and temperature is independent
+        tasks = [(dop_type, temp) for dop_type in ("n", "p") for temp in temp_r]
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_get_doping_properties)(
+                self.epsilon,
+                self.dos,
+                self.vvdos,
+                nelect=self.nelect,
+                dosweight=self.dosweight,
+                volume=self.volume,
+                doping_carriers=doping_carriers[dop_type],
+                temp=temp,
+            )
+            for dop_type, temp in tasks
+        )
 
-                dc[idx_t] = self.nelect + N
+        for type_idx, dop_type in enumerate(("n", "p")):
+            type_results = results[type_idx * len(temp_r) : (type_idx + 1) * len(temp_r)]
+            mu, cond, sbk, kappa, dc = (np.array(arrays) for arrays in zip(*type_results, strict=True))
 
+            mu_doping[dop_type] = mu
             self.Conductivity_doping[dop_type] = cond * self.CRTA  # S / m
             self.Seebeck_doping[dop_type] = sbk * 1e6  # microVolt / K
             self.Kappa_doping[dop_type] = kappa * self.CRTA  # W / (m K)
-            # self.Hall_doping[dop_type] = hall
-            self.Carriers_conc_doping[dop_type] = dc / (self.volume / (units.Meter / 100.0) ** 3)
+            self.Carriers_conc_doping[dop_type] = dc / volume_cm3
 
             self.Power_Factor_doping[dop_type] = (sbk @ sbk) @ cond * self.CRTA * 1e3
 
-            cond_eff_mass = np.zeros((len(temp_r), len(doping), 3, 3))
-            for idx_t in range(len(temp_r)):
-                for idx_d, dop in enumerate(doping):
-                    try:
-                        cond_eff_mass[idx_t, idx_d] = (
-                            np.linalg.inv(cond[idx_t, idx_d]) * dop * units.qe_SI**2 / units.me_SI * 1e6
-                        )
-                    except np.linalg.LinAlgError:
-                        pass
-
-            self.Effective_mass_doping[dop_type] = cond_eff_mass
+            self.Effective_mass_doping[dop_type] = (
+                _inv_tensors(cond) * np.asarray(doping)[:, None, None] * units.qe_SI**2 / units.me_SI * 1e6
+            )
 
         self.doping = doping
         self.mu_doping = mu_doping
@@ -1202,3 +1228,53 @@ def merge_up_down_doses(dos_up, dos_dn):
         cdos = CompleteDos(dos_up.structure, total_dos=cdos, pdoss=pdoss)
 
     return cdos
+
+
+def _get_fermi_integrals(epsilon, dos, vvdos, *, mur, temp_r, dosweight, cdos=None, n_jobs: int = 1) -> tuple:
+    """Compute the Fermi integrals of BoltzTraP2 at each temperature, in parallel
+    over the temperatures if n_jobs is not 1.
+
+    Returns:
+        tuple: N, L0, L1, L2 and Lm11 as returned by BL.fermiintegrals.
+    """
+    if n_jobs == 1 or len(temp_r) == 1:
+        return BL.fermiintegrals(epsilon, dos, vvdos, mur=mur, Tr=temp_r, dosweight=dosweight, cdos=cdos)
+
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(BL.fermiintegrals)(
+            epsilon, dos, vvdos, mur=mur, Tr=temp_r[idx : idx + 1], dosweight=dosweight, cdos=cdos
+        )
+        for idx in range(len(temp_r))
+    )
+    return tuple(None if parts[0] is None else np.concatenate(parts) for parts in zip(*results, strict=True))
+
+
+def _get_doping_properties(epsilon, dos, vvdos, *, nelect, dosweight, volume, doping_carriers, temp) -> tuple:
+    """Solve for the chemical potential of each doping level at one temperature and
+    compute the Onsager coefficients there.
+
+    Returns:
+        tuple: The chemical potentials, conductivity, Seebeck and kappa tensors, and
+            the number of electrons of each doping level.
+    """
+    mu = np.array(
+        [
+            BL.solve_for_mu(epsilon, dos, nelect + dop_car, temp, dosweight, refine=True, try_center=False)
+            for dop_car in doping_carriers
+        ]
+    )
+    N, L0, L1, L2, Lm11 = BL.fermiintegrals(epsilon, dos, vvdos, mur=mu, Tr=np.array([temp]), dosweight=dosweight)
+    cond, sbk, kappa, _hall = BL.calc_Onsager_coefficients(L0, L1, L2, mu, np.array([temp]), volume, Lm11)
+    return mu, cond[0], sbk[0], kappa[0], nelect + N[0]
+
+
+def _inv_tensors(tensors: NDArray) -> NDArray:
+    """Invert a stack of 3x3 tensors, giving zeros for the singular ones."""
+    try:
+        return np.linalg.inv(tensors)
+    except np.linalg.LinAlgError:
+        inv = np.zeros_like(tensors)
+        for idx in np.ndindex(tensors.shape[:-2]):
+            with contextlib.suppress(np.linalg.LinAlgError):
+                inv[idx] = np.linalg.inv(tensors[idx])
+        return inv
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import functools
 import warnings
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, NamedTuple, cast
 
 import numpy as np
@@ -19,18 +20,21 @@ from pymatgen.core import Structure, get_el_sp
 from pymatgen.core.spectrum import Spectrum
 from pymatgen.electronic_structure.core import Orbital, OrbitalType, Spin
 from pymatgen.util.coord import get_linear_interpolated_value
+from pymatgen.util.serialization import encode_array
 
 if version.parse(np.__version__) < version.parse("2.0.0"):
     np.trapezoid = np.trapz  # noqa: NPY201
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
     from typing import Any, Literal
 
     from numpy.typing import NDArray
     from typing_extensions import Self
 
     from pymatgen.core.sites import PeriodicSite
+    from pymatgen.phonon.dos import PhononDosFingerprint
+    from pymatgen.util.serialization import ArrayMode
     from pymatgen.util.typing import SpeciesLike, Tuple3Floats
 
 
@@ -420,14 +424,20 @@ class Dos(MSONable):
             {Spin(int(k)): v for k, v in dct["densities"].items()},
         )
 
-    def as_dict(self) -> dict[str, Any]:
-        """JSON-serializable dict representation of Dos."""
+    def as_dict(self, array_mode: ArrayMode = "list") -> dict[str, Any]:
+        """JSON-serializable dict representation of Dos.
+
+        Args:
+            array_mode ("list" | "numpy"): How to store the energies and densities.
+                "numpy" keeps them as arrays for binary serialization with
+                pymatgen.util.serialization.to_binary. Defaults to "list".
+        """
         return {
             "@module": type(self).__module__,
             "@class": type(self).__name__,
             "efermi": self.efermi,
-            "energies": self.energies.tolist(),
-            "densities": {str(spin): dens.tolist() for spin, dens in self.densities.items()},
+            "energies": encode_array(self.energies, array_mode),
+            "densities": {str(spin): encode_array(dens, array_mode) for spin, dens in self.densities.items()},
         }
 
 
@@ -639,14 +649,20 @@ class FermiDos(Dos, MSONable):
         )
         return cls(dos, structure=Structure.from_dict(dct["structure"]), nelecs=dct["nelecs"])
 
-    def as_dict(self) -> dict[str, Any]:
-        """JSON-serializable dict representation of FermiDos."""
+    def as_dict(self, array_mode: ArrayMode = "list") -> dict[str, Any]:
+        """JSON-serializable dict representation of FermiDos.
+
+        Args:
+            array_mode ("list" | "numpy"): How to store the energies and densities.
+                "numpy" keeps them as arrays for binary serialization with
+                pymatgen.util.serialization.to_binary. Defaults to "list".
+        """
         return {
             "@module": type(self).__module__,
             "@class": type(self).__name__,
             "efermi": self.efermi,
-            "energies": self.energies.tolist(),
-            "densities": {str(spin): dens.tolist() for spin, dens in self.densities.items()},
+            "energies": encode_array(self.energies, array_mode),
+            "densities": {str(spin): encode_array(dens, array_mode) for spin, dens in self.densities.items()},
             "structure": self.structure,
             "nelecs": self.nelecs,
         }
@@ -674,6 +690,147 @@ class DosFingerprint(NamedTuple):
     bin_width: float
 
 
+@dataclass(frozen=True, eq=False)
+class DosFingerprintMatrix:
+    """DOS fingerprints of many materials stacked into a matrix, for vectorized
+    similarity searches.
+
+    Works with both electronic (DosFingerprint) and phonon (PhononDosFingerprint)
+    fingerprints, as long as all of them have the same number of bins. The
+    similarities are the same as the ones of CompleteDos.get_dos_fp_similarity
+    with col=1 and pt="All".
+
+    Args:
+        densities: The fingerprint densities, with shape (n_fingerprints, n_bins).
+        bin_widths: The bin width of each fingerprint, with shape (n_fingerprints,).
+    """
+
+    densities: np.ndarray
+    bin_widths: np.ndarray
+
+    @classmethod
+    def from_fingerprints(cls, fingerprints: Sequence[DosFingerprint | PhononDosFingerprint]) -> Self:
+        """Stack fingerprints into a matrix.
+
+        Args:
+            fingerprints (Sequence[DosFingerprint | PhononDosFingerprint]): Fingerprints
+                with the same number of bins, e.g. from CompleteDos.get_dos_fp.
+
+        Raises:
+            ValueError: If the fingerprints do not all have the same number of bins.
+
+        Returns:
+            DosFingerprintMatrix
+        """
+        densities = [np.ravel(fp.densities) for fp in fingerprints]
+        if len({len(dens) for dens in densities}) > 1:
+            raise ValueError("All fingerprints must have the same number of bins")
+        return cls(
+            np.array(densities, dtype=float).reshape(len(densities), -1),
+            np.array([fp.bin_width for fp in fingerprints], dtype=float),
+        )
+
+    @property
+    def n_fingerprints(self) -> int:
+        """Number of fingerprints in the matrix."""
+        return len(self.densities)
+
+    def get_top_k_similar(
+        self,
+        query: DosFingerprint | PhononDosFingerprint | DosFingerprintMatrix,
+        k: int = 10,
+        normalize: bool = False,
+        metric: Literal["tanimoto", "wasserstein", "cosine-sim"] = "tanimoto",
+        chunk_size: int = 10_000,
+    ) -> tuple[NDArray, NDArray]:
+        """Find the k fingerprints most similar to the query.
+
+        The similarities are computed as matrix products over chunks of at most
+        chunk_size fingerprints, which bounds the memory use for large matrices.
+
+        Args:
+            query (DosFingerprint | PhononDosFingerprint | DosFingerprintMatrix):
+                The fingerprint to search for, or a matrix of fingerprints to search
+                for all at once.
+            k (int): Number of most similar fingerprints to return. Default is 10.
+            normalize (bool): If True normalize the scalar product to 1 (default is False)
+            metric (Literal): Metric used to compute similarity default is "tanimoto".
+                The most similar fingerprints have the largest "tanimoto" and
+                "cosine-sim" values and the smallest "wasserstein" distances.
+            chunk_size (int): Number of fingerprints compared at once. Default is 10000.
+
+        Raises:
+            ValueError: If metric other than tanimoto, wasserstein and "cosine-sim" is requested.
+            ValueError: If normalize is set to True along with the metric.
+
+        Returns:
+            tuple[NDArray, NDArray]: The indices of the most similar fingerprints in
+                this matrix and their similarities, sorted from most to least similar.
+                With shape (k,) for a single query, (n_queries, k) for a matrix.
+        """
+        valid_metrics = ("tanimoto", "wasserstein", "cosine-sim")
+        if metric not in valid_metrics:
+            raise ValueError(f"Invalid {metric=}, choose from {valid_metrics}.")
+        if normalize and metric != "cosine-sim":
+            raise ValueError("Cannot compute similarity index. When normalize=True, then please set metric=cosine-sim")
+
+        single_query = not isinstance(query, DosFingerprintMatrix)
+        queries = type(self).from_fingerprints([query]) if single_query else query
+        if queries.densities.shape[1] != self.densities.shape[1]:
+            raise ValueError("The query and the matrix fingerprints must have the same number of bins")
+
+        k = min(k, self.n_fingerprints)
+        # Searching the largest scores, so use negative distances for the wasserstein metric
+        sign = -1 if metric == "wasserstein" else 1
+        if metric == "wasserstein":
+            query_vecs = np.sort(np.cumsum(queries.densities * queries.bin_widths[:, None], axis=1), axis=1)
+        else:
+            query_vecs = queries.densities
+            query_norms = np.sum(query_vecs**2, axis=1)[:, None]
+
+        best_scores = np.empty((queries.n_fingerprints, 0))
+        best_indices = np.empty((queries.n_fingerprints, 0), dtype=int)
+        for start in range(0, self.n_fingerprints, chunk_size):
+            chunk = self.densities[start : start + chunk_size]
+            if metric == "wasserstein":
+                chunk_vecs = np.sort(
+                    np.cumsum(chunk * self.bin_widths[start : start + chunk_size, None], axis=1), axis=1
+                )
+                scores = np.array([np.mean(np.abs(chunk_vecs - vec), axis=1) for vec in query_vecs])
+            else:
+                dots = query_vecs @ chunk.T
+                chunk_norms = np.sum(chunk**2, axis=1)[None, :]
+                if metric == "tanimoto":
+                    scores = dots / (query_norms + chunk_norms - dots)
+                elif normalize:
+                    scores = dots / (np.sqrt(query_norms) * np.sqrt(chunk_norms))
+                else:
+                    scores = dots
+
+            # Keep the k best scores among the previous best ones and this chunk
+            scores = np.concatenate([best_scores, sign * scores], axis=1)
+            indices = np.concatenate(
+                [
+                    best_indices,
+                    np.broadcast_to(np.arange(start, start + len(chunk)), (queries.n_fingerprints, len(chunk))),
+                ],
+                axis=1,
+            )
+            if scores.shape[1] > k:
+                keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, keep, axis=1)
+                indices = np.take_along_axis(indices, keep, axis=1)
+            best_scores, best_indices = scores, indices
+
+        # Sort from the most similar, by index for equal scores
+        order = np.lexsort((best_indices, -best_scores), axis=1)
+        best_indices = np.take_along_axis(best_indices, order, axis=1)
+        best_scores = sign * np.take_along_axis(best_scores, order, axis=1)
+        if single_query:
+            return best_indices[0], best_scores[0]
+        return best_indices, best_scores
+
+
 class CompleteDos(Dos):
     """Define total DOS, and projected DOS (PDOS).
 
@@ -714,6 +871,103 @@ class CompleteDos(Dos):
     def __str__(self) -> str:
         return f"Complete DOS for {self.structure}"
 
+    @property
+    def pdos(self) -> dict[PeriodicSite, dict[Orbital, dict[Spin, NDArray]]]:
+        """The PDOSs as {Site: {Orbital: {Spin: Densities}}}. The densities are
+        views into a single (n_sites, n_orbitals, n_spins, n_energies) array.
+        """
+        return self._pdos
+
+    @pdos.setter
+    def pdos(self, pdoss: dict[PeriodicSite, dict[Orbital, dict[Spin, NDArray]]]) -> None:
+        """Stack the PDOSs into one array, indexed by site, orbital and spin.
+
+        Orbitals missing on a site are stored as zeros and flagged in a mask, so
+        that the aggregations only report the orbital types actually present.
+        """
+        sites = list(pdoss)
+        orbitals = list(dict.fromkeys(orb for site_dos in pdoss.values() for orb in site_dos))
+        spins = list(
+            dict.fromkeys(spin for site_dos in pdoss.values() for orb_dos in site_dos.values() for spin in orb_dos)
+        )
+        n_energies = next(
+            (len(dens) for site_dos in pdoss.values() for orb_dos in site_dos.values() for dens in orb_dos.values()), 0
+        )
+
+        densities = np.zeros((len(sites), len(orbitals), len(spins), n_energies))
+        present = np.zeros((len(sites), len(orbitals)), dtype=bool)
+        orb_indices = {orb: idx for idx, orb in enumerate(orbitals)}
+        spin_indices = {spin: idx for idx, spin in enumerate(spins)}
+        for site_idx, site_dos in enumerate(pdoss.values()):
+            for orb, orb_dos in site_dos.items():
+                present[site_idx, orb_indices[orb]] = True
+                for spin, dens in orb_dos.items():
+                    densities[site_idx, orb_indices[orb], spin_indices[spin]] = dens
+
+        self._pdos_densities = densities
+        self._pdos_present = present
+        self._pdos_sites = sites
+        self._pdos_orbitals = orbitals
+        self._pdos_spins = spins
+        self._pdos_site_indices = {site: idx for idx, site in enumerate(sites)}
+        self._pdos_site_ids = {id(site): idx for idx, site in enumerate(sites)}
+        self._pdos_cache: dict[tuple, Any] = {}
+        self._pdos = {
+            site: {
+                orb: {spin: densities[site_idx, orb_indices[orb], spin_indices[spin]] for spin in orb_dos}
+                for orb, orb_dos in site_dos.items()
+            }
+            for site_idx, (site, site_dos) in enumerate(pdoss.items())
+        }
+
+    def _get_pdos_site_index(self, site: PeriodicSite) -> int:
+        """Index of a site in the PDOS array, matching by identity before equality."""
+        site_idx = self._pdos_site_ids.get(id(site))
+        return self._pdos_site_indices[site] if site_idx is None else site_idx
+
+    def _sum_pdos_groups(self, weights: NDArray, site_idx: int | None = None) -> list[dict[Spin, NDArray]]:
+        """Sum the PDOSs of each group of (site, orbital) pairs in a single matrix product.
+
+        Args:
+            weights (NDArray): (n_groups, n_sites, n_orbitals) boolean mask of the
+                pairs in each group.
+            site_idx (int | None): If given, the groups only span this site and
+                weights has shape (n_groups, 1, n_orbitals).
+
+        Returns:
+            list[dict[Spin, NDArray]]: The summed densities of each group.
+        """
+        densities = self._pdos_densities if site_idx is None else self._pdos_densities[site_idx : site_idx + 1]
+        n_sites, n_orbitals, n_spins, n_energies = densities.shape
+        summed = weights.reshape(len(weights), -1).astype(float) @ densities.reshape(n_sites * n_orbitals, -1)
+        return [dict(zip(self._pdos_spins, group.reshape(n_spins, n_energies), strict=True)) for group in summed]
+
+    def _get_orbital_type_masks(self) -> dict[OrbitalType, NDArray]:
+        """Boolean masks over the PDOS orbitals of each orbital type, in order of first appearance."""
+
+        def get_masks() -> dict[OrbitalType, NDArray]:
+            orb_types = [_get_orb_type(orb) for orb in self._pdos_orbitals]
+            return {
+                orb_type: np.array([other == orb_type for other in orb_types]) for orb_type in dict.fromkeys(orb_types)
+            }
+
+        return self._get_cached_pdos(("orbital_types",), get_masks)
+
+    def _get_element_masks(self) -> dict[SpeciesLike, NDArray]:
+        """Boolean masks over the PDOS sites of each species, in order of first appearance."""
+
+        def get_masks() -> dict[SpeciesLike, NDArray]:
+            species = [site.specie for site in self._pdos_sites]
+            return {sp: np.array([other == sp for other in species]) for sp in dict.fromkeys(species)}
+
+        return self._get_cached_pdos(("elements",), get_masks)
+
+    def _get_cached_pdos(self, key: tuple, func: Callable[[], Any]) -> Any:
+        """Get an aggregated PDOS from the cache, computing it on the first query."""
+        if key not in self._pdos_cache:
+            self._pdos_cache[key] = func()
+        return self._pdos_cache[key]
+
     def get_normalized(self) -> Self:
         """Get normalized CompleteDos."""
         if self.norm_vol is not None:
@@ -747,7 +1001,11 @@ class CompleteDos(Dos):
         Returns:
             Dos: Total DOS for a site with all orbitals.
         """
-        site_dos = functools.reduce(add_densities, self.pdos[site].values())
+        site_idx = self._get_pdos_site_index(site)
+        site_dos = self._get_cached_pdos(
+            ("site", site_idx),
+            lambda: self._sum_pdos_groups(self._pdos_present[None, site_idx : site_idx + 1], site_idx)[0],
+        )
         return Dos(self.efermi, self.energies, site_dos)
 
     def get_site_spd_dos(self, site: PeriodicSite) -> dict[OrbitalType, Dos]:
@@ -759,13 +1017,21 @@ class CompleteDos(Dos):
         Returns:
             dict[OrbitalType, Dos]
         """
-        spd_dos: dict[OrbitalType, dict[Spin, np.ndarray]] = {}
-        for orb, pdos in self.pdos[site].items():
-            orbital_type = _get_orb_type(orb)
-            if orbital_type in spd_dos:
-                spd_dos[orbital_type] = add_densities(spd_dos[orbital_type], pdos)
-            else:
-                spd_dos[orbital_type] = pdos  # type: ignore[assignment]
+        site_idx = self._get_pdos_site_index(site)
+
+        def sum_site() -> dict[OrbitalType, dict[Spin, NDArray]]:
+            present = self._pdos_present[site_idx]
+            weights = {
+                orb_type: mask & present
+                for orb_type, mask in self._get_orbital_type_masks().items()
+                if (mask & present).any()
+            }
+            if not weights:
+                return {}
+            summed = self._sum_pdos_groups(np.array(list(weights.values()))[:, None], site_idx)
+            return dict(zip(weights, summed, strict=True))
+
+        spd_dos = self._get_cached_pdos(("site_spd", site_idx), sum_site)
         return {orb: Dos(self.efermi, self.energies, densities) for orb, densities in spd_dos.items()}
 
     def get_site_t2g_eg_resolved_dos(
@@ -800,14 +1066,18 @@ class CompleteDos(Dos):
         Returns:
             dict[OrbitalType, Dos]
         """
-        spd_dos = {}
-        for atom_dos in self.pdos.values():
-            for orb, pdos in atom_dos.items():
-                orbital_type = _get_orb_type(orb)
-                if orbital_type not in spd_dos:
-                    spd_dos[orbital_type] = pdos
-                else:
-                    spd_dos[orbital_type] = add_densities(spd_dos[orbital_type], pdos)
+
+        def sum_orbital_types() -> dict[OrbitalType, dict[Spin, NDArray]]:
+            weights = {
+                orb_type: self._pdos_present & mask
+                for orb_type, mask in self._get_orbital_type_masks().items()
+                if (self._pdos_present & mask).any()
+            }
+            if not weights:
+                return {}
+            return dict(zip(weights, self._sum_pdos_groups(np.array(list(weights.values()))), strict=True))
+
+        spd_dos = self._get_cached_pdos(("spd",), sum_orbital_types)
         return {orb: Dos(self.efermi, self.energies, densities) for orb, densities in spd_dos.items()}
 
     def get_element_dos(self) -> dict[SpeciesLike, Dos]:
@@ -816,12 +1086,15 @@ class CompleteDos(Dos):
         Returns:
             dict[Element, Dos]
         """
-        el_dos: dict[SpeciesLike, dict[Spin, NDArray]] = {}
-        for site, atom_dos in self.pdos.items():
-            el = site.specie
-            for pdos in atom_dos.values():
-                el_dos[el] = add_densities(el_dos[el], pdos) if el in el_dos else pdos
 
+        def sum_elements() -> dict[SpeciesLike, dict[Spin, NDArray]]:
+            el_masks = self._get_element_masks()
+            if not el_masks:
+                return {}
+            weights = self._pdos_present & np.array(list(el_masks.values()))[:, :, None]
+            return dict(zip(el_masks, self._sum_pdos_groups(weights), strict=True))
+
+        el_dos = self._get_cached_pdos(("element",), sum_elements)
         return {el: Dos(self.efermi, self.energies, densities) for el, densities in el_dos.items()}
 
     def get_element_spd_dos(self, el: SpeciesLike) -> dict[OrbitalType, Dos]:
@@ -833,17 +1106,25 @@ class CompleteDos(Dos):
         Returns:
             dict[OrbitalType, Dos]
         """
-        el = get_el_sp(el)
-        el_dos = {}
-        for site, atom_dos in self.pdos.items():
-            if site.specie == el:
-                for orb, pdos in atom_dos.items():
-                    orbital_type = _get_orb_type(orb)
-                    if orbital_type not in el_dos:
-                        el_dos[orbital_type] = pdos
-                    else:
-                        el_dos[orbital_type] = add_densities(el_dos[orbital_type], pdos)
 
+        def sum_element_orbital_types() -> dict[SpeciesLike, dict[OrbitalType, dict[Spin, NDArray]]]:
+            # All elements are summed at once, as they are usually queried in turn
+            groups = {}
+            for species, el_mask in self._get_element_masks().items():
+                for orb_type, orb_mask in self._get_orbital_type_masks().items():
+                    weights = self._pdos_present & el_mask[:, None] & orb_mask
+                    if weights.any():
+                        groups[species, orb_type] = weights
+            if not groups:
+                return {}
+            el_spd_dos: dict[SpeciesLike, dict[OrbitalType, dict[Spin, NDArray]]] = {}
+            for (species, orb_type), densities in zip(
+                groups, self._sum_pdos_groups(np.array(list(groups.values()))), strict=True
+            ):
+                el_spd_dos.setdefault(species, {})[orb_type] = densities
+            return el_spd_dos
+
+        el_dos = self._get_cached_pdos(("element_spd",), sum_element_orbital_types).get(get_el_sp(el), {})
         return {orb: Dos(self.efermi, self.energies, densities) for orb, densities in el_dos.items()}
 
     @property
@@ -1384,25 +1665,34 @@ class CompleteDos(Dos):
             pdoss[at] = orb_dos
         return cls(struct, tdos, pdoss)
 
-    def as_dict(self) -> dict[str, Any]:
-        """JSON-serializable dict representation of CompleteDos."""
+    def as_dict(self, array_mode: ArrayMode = "list") -> dict[str, Any]:
+        """JSON-serializable dict representation of CompleteDos.
+
+        Args:
+            array_mode ("list" | "numpy"): How to store the energies, densities and
+                projected densities. "numpy" keeps them as arrays for binary
+                serialization with pymatgen.util.serialization.to_binary.
+                Defaults to "list".
+        """
         dct = {
             "@module": type(self).__module__,
             "@class": type(self).__name__,
             "efermi": self.efermi,
             "structure": self.structure.as_dict(),
-            "energies": self.energies.tolist(),
-            "densities": {str(spin): dens.tolist() for spin, dens in self.densities.items()},
+            "energies": encode_array(self.energies, array_mode),
+            "densities": {str(spin): encode_array(dens, array_mode) for spin, dens in self.densities.items()},
             "pdos": [],
         }
         if len(self.pdos) > 0:
             for at in self.structure:
                 dd = {}
                 for orb, pdos in self.pdos[at].items():
-                    dd[str(orb)] = {"densities": {str(int(spin)): list(dens) for spin, dens in pdos.items()}}
+                    dd[str(orb)] = {
+                        "densities": {str(int(spin)): encode_array(dens, array_mode) for spin, dens in pdos.items()}
+                    }
                 dct["pdos"].append(dd)
-            dct["atom_dos"] = {str(at): dos.as_dict() for at, dos in self.get_element_dos().items()}
-            dct["spd_dos"] = {str(orb): dos.as_dict() for orb, dos in self.get_spd_dos().items()}
+            dct["atom_dos"] = {str(at): dos.as_dict(array_mode) for at, dos in self.get_element_dos().items()}
+            dct["spd_dos"] = {str(orb): dos.as_dict(array_mode) for orb, dos in self.get_spd_dos().items()}
         return dct
 
 
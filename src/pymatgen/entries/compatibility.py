@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import abc
 import copy
+import functools
 import os
 import warnings
 from collections import defaultdict
@@ -213,6 +214,18 @@ class PotcarCorrection(Correction):
         return ufloat(0.0, 0.0)
 
 
+@functools.cache
+def _get_potcar_correction(
+    input_set: type[VaspInputSet],
+    check_potcar: bool = True,
+    check_hash: bool = False,
+) -> PotcarCorrection:
+    """Get a shared PotcarCorrection so the valid POTCAR table of an input set
+    is built once instead of for every processed entry.
+    """
+    return PotcarCorrection(input_set, check_potcar=check_potcar, check_hash=check_hash)
+
+
 @cached_class
 class GasCorrection(Correction):
     """Correct gas energies to obtain the right formation energies. Note that
@@ -595,7 +608,6 @@ class Compatibility(MSONable, abc.ABC):
         Returns:
             tuple[AnyComputedEntry, ignore_entry (bool)] if entry is compatible, else None.
         """
-        ignore_entry: bool = False
         # If clean, remove all previous adjustments from the entry
         if clean:
             entry.energy_adjustments = []
@@ -611,6 +623,54 @@ class Compatibility(MSONable, abc.ABC):
                 warnings.warn(str(exc))
             return None
 
+        return entry, self._apply_adjustments(entry, adjustments)
+
+    def _get_adjustments_and_data(
+        self,
+        entry: AnyComputedEntry,
+        clean: bool = True,
+    ) -> tuple[list[EnergyAdjustment] | None, dict[str, Any], CompatibilityError | None]:
+        """Compute the energy adjustments of an entry without returning the entry itself.
+
+        Used by the parallel path of process_entries() so that only the (small) adjustments
+        and the entry.data keys added by get_adjustments() travel back from the workers.
+
+        Args:
+            entry (AnyComputedEntry): An AnyComputedEntry object. It is modified in place,
+                so this should be a copy owned by the worker.
+            clean (bool): Whether to remove any previously-applied energy adjustments.
+
+        Returns:
+            tuple[list[EnergyAdjustment] | None, dict, CompatibilityError | None]: The adjustments
+                (None if the entry is incompatible), the entry.data items that were added or
+                changed, and the CompatibilityError raised, if any.
+        """
+        if clean:
+            entry.energy_adjustments = []
+        data_before = dict(entry.data)
+        try:
+            adjustments = self.get_adjustments(entry)
+        except CompatibilityError as exc:
+            return None, {}, exc
+
+        new_data = {
+            key: val for key, val in entry.data.items() if key not in data_before or data_before[key] is not val
+        }
+        return adjustments, new_data, None
+
+    @staticmethod
+    def _apply_adjustments(entry: AnyComputedEntry, adjustments: list[EnergyAdjustment]) -> bool:
+        """Append energy adjustments to an entry, skipping exact duplicates.
+
+        Args:
+            entry (AnyComputedEntry): The entry to adjust in place.
+            adjustments (list[EnergyAdjustment]): Adjustments returned by get_adjustments().
+
+        Returns:
+            bool: True if the entry should be discarded because it already has an
+                adjustment with the same name but a different value.
+        """
+        ignore_entry: bool = False
         for e_adj in adjustments:
             # Check if this correction already been applied
             if (e_adj.name, e_adj.cls, e_adj.value) in [
@@ -633,7 +693,7 @@ class Compatibility(MSONable, abc.ABC):
                 # Add the correction to the energy_adjustments list
                 entry.energy_adjustments.append(e_adj)
 
-        return entry, ignore_entry
+        return ignore_entry
 
     def process_entries(
         self,
@@ -658,7 +718,9 @@ class Compatibility(MSONable, abc.ABC):
             verbose (bool): Whether to display progress bar for processing multiple entries.
                 Defaults to False.
             inplace (bool): Whether to adjust input entries in place. Defaults to True.
-            n_workers (int): Number of workers to use for parallel processing. Defaults to 1.
+            n_workers (int): Number of workers to use for parallel processing. Workers only
+                compute the adjustments, which are then applied to the entries in this process,
+                so parallel processing works with inplace=True as well. Defaults to 1.
             on_error ('ignore' | 'warn' | 'raise'): What to do when get_adjustments(entry)
                 raises CompatibilityError. Defaults to 'ignore'.
 
@@ -684,20 +746,26 @@ class Compatibility(MSONable, abc.ABC):
                 entry, ignore_entry = result
                 if not ignore_entry:
                     processed_entry_list.append(entry)
-        elif not inplace:
-            # set python warnings to ignore otherwise warnings will be printed multiple times
+        else:
+            # Workers only send back the adjustments (and any entry.data they filled in), which
+            # are then applied here. This avoids shipping whole entries back and also works inplace.
+            # Set python warnings to ignore otherwise warnings will be printed multiple times
             with tqdm_joblib(tqdm(total=len(entries), disable=not verbose)), set_python_warnings("ignore"):
                 results = Parallel(n_jobs=n_workers)(
-                    delayed(self._process_entry_inplace)(entry, clean, on_error) for entry in entries
+                    delayed(self._get_adjustments_and_data)(entry, clean) for entry in entries
                 )
-            for result in results:
-                if result is None:
+            for entry, (adjustments, new_data, exc) in zip(entries, results, strict=True):
+                if clean:
+                    entry.energy_adjustments = []
+                if exc is not None:
+                    if on_error == "raise":
+                        raise exc
+                    if on_error == "warn":
+                        warnings.warn(str(exc))
                     continue
-                entry, ignore_entry = result
-                if not ignore_entry:
+                entry.data.update(new_data)
+                if not self._apply_adjustments(entry, adjustments):
                     processed_entry_list.append(entry)
-        else:
-            raise ValueError("Parallel processing is not possible with for 'inplace=True'")
 
         return processed_entry_list
 
@@ -1060,21 +1128,23 @@ class MaterialsProject2020Compatibility(Compatibility):
         # check the POTCAR symbols
         # this should return ufloat(0, 0) or raise a CompatibilityError or ValueError
         if entry.parameters.get("software", "vasp") == "vasp":
-            pc = PotcarCorrection(MPRelaxSet, check_hash=self.check_potcar_hash, check_potcar=self.check_potcar)
+            pc = _get_potcar_correction(MPRelaxSet, check_potcar=self.check_potcar, check_hash=self.check_potcar_hash)
             pc.get_correction(entry)
 
         # apply energy adjustments
         adjustments: list[CompositionEnergyAdjustment] = []
 
         comp = entry.composition
-        rform = comp.reduced_formula
-        # sorted list of elements, ordered by electronegativity
-        sorted_elements = sorted((el for el in comp.elements if comp[el] > 0), key=lambda el: el.X)
 
         # Skip single elements
         if len(comp) == 1:
             return adjustments
 
+        # sorted list of elements, ordered by electronegativity
+        sorted_elements = sorted((el for el in comp.elements if comp[el] > 0), key=lambda el: el.X)
+        # serialize the scheme only once, it is shared by all adjustments of this entry
+        cls_dict = self.as_dict()
+
         # Check for sulfide corrections
         if Element("S") in comp:
             sf_type = "sulfide"
@@ -1094,7 +1164,7 @@ class MaterialsProject2020Compatibility(Compatibility):
                         comp["S"],
                         uncertainty_per_atom=self.comp_errors["S"],
                         name="MP2020 anion correction (S)",
-                        cls=self.as_dict(),
+                        cls=cls_dict,
                     )
                 )
 
@@ -1116,6 +1186,7 @@ class MaterialsProject2020Compatibility(Compatibility):
                     common_superoxides = "LiO2 NaO2 KO2 RbO2 CsO2".split()
                     ozonides = "LiO3 NaO3 KO3 NaO5".split()
 
+                    rform = comp.reduced_formula
                     if rform in common_peroxides:
                         ox_type = "peroxide"
                     elif rform in common_superoxides:
@@ -1136,7 +1207,7 @@ class MaterialsProject2020Compatibility(Compatibility):
                     comp["O"],
                     uncertainty_per_atom=self.comp_errors[ox_type],
                     name=f"MP2020 anion correction ({ox_type})",
-                    cls=self.as_dict(),
+                    cls=cls_dict,
                 )
             )
 
@@ -1198,7 +1269,7 @@ class MaterialsProject2020Compatibility(Compatibility):
                             comp[anion],
                             uncertainty_per_atom=self.comp_errors[anion],
                             name=f"MP2020 anion correction ({anion})",
-                            cls=self.as_dict(),
+                            cls=cls_dict,
                         )
                     )
 
@@ -1226,7 +1297,7 @@ class MaterialsProject2020Compatibility(Compatibility):
                         comp[el],
                         uncertainty_per_atom=u_errors[symbol],
                         name=f"MP2020 GGA/GGA+U mixing correction ({symbol})",
-                        cls=self.as_dict(),
+                        cls=cls_dict,
                     )
                 )
 
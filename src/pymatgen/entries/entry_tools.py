@@ -7,19 +7,18 @@ from __future__ import annotations
 import collections
 import csv
 import itertools
-import json
 import logging
-import multiprocessing as mp
 import re
 from collections import defaultdict
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from monty.json import MontyDecoder, MontyEncoder, MSONable
+from joblib import Parallel, delayed
+from monty.json import MSONable
 
 from pymatgen.analysis.phase_diagram import PDEntry
 from pymatgen.analysis.structure_matcher import SpeciesComparator, StructureMatcher
-from pymatgen.core import Composition, Element
+from pymatgen.core import Composition, Element, Structure
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -41,37 +40,38 @@ def _get_host(structure, species_to_remove):
     return structure
 
 
-def _perform_grouping(args):
-    entries_json, hosts_json, ltol, stol, angle_tol, primitive_cell, scale, comparator, groups = args
-
-    entries = json.loads(entries_json, cls=MontyDecoder)
-    hosts = json.loads(hosts_json, cls=MontyDecoder)
-    unmatched = list(zip(entries, hosts, strict=True))
-    while len(unmatched) > 0:
-        ref_host = unmatched[0][1]
-        logger.info(f"Reference tid = {unmatched[0][0].entry_id}, formula = {ref_host.formula}")
-        ref_formula = ref_host.reduced_formula
-        logger.info(f"Reference host = {ref_formula}")
-        matches = [unmatched[0]]
-        for idx in range(1, len(unmatched)):
-            test_host = unmatched[idx][1]
-            logger.info(f"Testing tid = {unmatched[idx][0].entry_id}, formula = {test_host.formula}")
-            test_formula = test_host.reduced_formula
-            logger.info(f"Test host = {test_formula}")
-            matcher = StructureMatcher(
-                ltol=ltol,
-                stol=stol,
-                angle_tol=angle_tol,
-                primitive_cell=primitive_cell,
-                scale=scale,
-                comparator=comparator,
-            )
-            if matcher.fit(ref_host, test_host):
+def _group_hosts(hosts, matcher):
+    """Greedily group structures that fit the first unmatched structure.
+
+    Args:
+        hosts (list[Structure]): Structures already reduced by the matcher.
+        matcher (StructureMatcher): The matcher used to fit the structures.
+
+    Returns:
+        list[list[int]]: Indices of the structures in each group.
+    """
+    unmatched = list(range(len(hosts)))
+    groups = []
+    while unmatched:
+        ref_idx, *others = unmatched
+        ref_host = hosts[ref_idx]
+        logger.info(f"Reference host = {ref_host.reduced_formula}")
+        matches = [ref_idx]
+        unmatched = []
+        for idx in others:
+            if matcher.fit(ref_host, hosts[idx], skip_structure_reduction=True):
                 logger.info("Fit found")
-                matches.append(unmatched[idx])
-        groups.append(json.dumps([m[0] for m in matches], cls=MontyEncoder))
-        unmatched = list(filter(lambda x: x not in matches, unmatched))
+                matches.append(idx)
+            else:
+                unmatched.append(idx)
+        groups.append(matches)
         logger.info(f"{len(unmatched)} unmatched remaining")
+    return groups
+
+
+def _group_host_buckets(buckets, matcher):
+    """Group the structures in several fingerprint buckets, see _group_hosts."""
+    return [_group_hosts(hosts, matcher) for hosts in buckets]
 
 
 def group_entries_by_structure(
@@ -88,6 +88,11 @@ def group_entries_by_structure(
     """Given a sequence of ComputedStructureEntries, use structure fitter to group
     them by structural similarity.
 
+    The structures are first reduced once and bucketed by a cheap fingerprint (the
+    comparator hash of the composition and the number of sites in the reduced cell),
+    since StructureMatcher.fit can only match structures with the same fingerprint.
+    The pairwise fits are then only performed within each bucket.
+
     Args:
         entries: Sequence of ComputedStructureEntries.
         species_to_remove: Sometimes you want to compare a host framework
@@ -104,7 +109,8 @@ def group_entries_by_structure(
             declares equivalency of sites. Default is SpeciesComparator,
             which implies rigid species mapping.
         ncpus: Number of cpus to use. Use of multiple cpus can greatly improve
-            fitting speed. Default of None means serial processing.
+            fitting speed. The buckets are distributed over the cpus balanced by
+            their estimated fitting cost. Default of None means serial processing.
 
     Returns:
         Sequence of sequence of entries by structural similarity. e.g,
@@ -114,55 +120,58 @@ def group_entries_by_structure(
         comparator = SpeciesComparator()
     start = datetime.now(tz=timezone.utc)
     logger.info(f"Started at {start}")
-    entries_host = [(entry, _get_host(entry.structure, species_to_remove)) for entry in entries]
-    if ncpus:
-        symm_entries = defaultdict(list)
-        for entry, host in entries_host:
-            symm_entries[comparator.get_structure_hash(host)].append((entry, host))
-
-        logging.info(f"Using {ncpus} cpus")
-        manager = mp.Manager()
-        groups = manager.list()
-        with mp.Pool(ncpus) as pool:
-            # Parallel processing only supports Python primitives and not objects.
-            pool.map(
-                _perform_grouping,
-                [
-                    (
-                        json.dumps([e[0] for e in eh], cls=MontyEncoder),
-                        json.dumps([e[1] for e in eh], cls=MontyEncoder),
-                        ltol,
-                        stol,
-                        angle_tol,
-                        primitive_cell,
-                        scale,
-                        comparator,
-                        groups,
-                    )
-                    for eh in symm_entries.values()
-                ],
-            )
-    else:
-        groups = []
-        hosts = [host for entry, host in entries_host]
-        _perform_grouping(
-            (
-                json.dumps(entries, cls=MontyEncoder),
-                json.dumps(hosts, cls=MontyEncoder),
-                ltol,
-                stol,
-                angle_tol,
-                primitive_cell,
-                scale,
-                comparator,
-                groups,
+    matcher = StructureMatcher(
+        ltol=ltol,
+        stol=stol,
+        angle_tol=angle_tol,
+        primitive_cell=primitive_cell,
+        scale=scale,
+        comparator=comparator,
+    )
+
+    # reduce every host once and bucket them by fingerprint
+    buckets: dict[tuple, list[int]] = defaultdict(list)
+    hosts = []
+    for idx, entry in enumerate(entries):
+        host = _get_host(entry.structure, species_to_remove)
+        host = matcher._get_reduced_structure(Structure.from_sites(host), primitive_cell, niggli=True)
+        hosts.append(host)
+        buckets[comparator.get_hash(host.composition), len(host)].append(idx)
+    bucket_indices = list(buckets.values())
+
+    if ncpus and ncpus > 1 and len(bucket_indices) > 1:
+        logger.info(f"Using {ncpus} cpus")
+        # balance the work by assigning the most expensive buckets first to the least loaded cpu
+        loads = [0] * ncpus
+        tasks: list[list[int]] = [[] for _ in range(ncpus)]
+        costs = [len(indices) ** 2 * len(hosts[indices[0]]) for indices in bucket_indices]
+        for bucket_idx in sorted(range(len(bucket_indices)), key=lambda idx: -costs[idx]):
+            cpu = loads.index(min(loads))
+            loads[cpu] += costs[bucket_idx]
+            tasks[cpu].append(bucket_idx)
+        tasks = [task for task in tasks if task]
+        results = Parallel(n_jobs=len(tasks))(
+            delayed(_group_host_buckets)(
+                [[hosts[idx] for idx in bucket_indices[bucket_idx]] for bucket_idx in task], matcher
             )
+            for task in tasks
         )
-    entry_groups = []
-    for g in groups:
-        entry_groups.append(json.loads(g, cls=MontyDecoder))
-    logging.info(f"Finished at {datetime.now(tz=timezone.utc)}")
-    logging.info(f"Took {datetime.now(tz=timezone.utc) - start}")
+        bucket_groups = dict(zip(itertools.chain(*tasks), itertools.chain(*results), strict=True))
+    else:
+        bucket_groups = {
+            bucket_idx: _group_hosts([hosts[idx] for idx in indices], matcher)
+            for bucket_idx, indices in enumerate(bucket_indices)
+        }
+
+    index_groups = [
+        [bucket_indices[bucket_idx][idx] for idx in group]
+        for bucket_idx, groups in bucket_groups.items()
+        for group in groups
+    ]
+    # order the groups as if all entries had been grouped at once
+    entry_groups = [[entries[idx] for idx in group] for group in sorted(index_groups)]
+    logger.info(f"Finished at {datetime.now(tz=timezone.utc)}")
+    logger.info(f"Took {datetime.now(tz=timezone.utc) - start}")
     return entry_groups
 
 
@@ -5,12 +5,16 @@ functionals.
 from __future__ import annotations
 
 import copy
+import itertools
+import json
 import os
 import warnings
 from itertools import groupby
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 
 from pymatgen.analysis.phase_diagram import PhaseDiagram
 from pymatgen.analysis.structure_matcher import StructureMatcher
@@ -23,6 +27,9 @@ from pymatgen.entries.compatibility import (
 from pymatgen.entries.computed_entries import ComputedStructureEntry, ConstantEnergyAdjustment
 from pymatgen.entries.entry_tools import EntrySet
 
+if TYPE_CHECKING:
+    from pymatgen.core import Composition
+
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 __author__ = "Ryan Kingsbury"
@@ -121,6 +128,9 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         verbose: bool = False,
         inplace: bool = True,
         mixing_state_data=None,
+        *,
+        n_workers: int = 1,
+        mixing_state_cache: dict | None = None,
     ) -> list[AnyComputedEntry]:
         """Process a sequence of entries with the DFT mixing scheme. Note
         that this method will change the data of the original entries.
@@ -147,6 +157,11 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
                 reasons. In general, it should always be left at the default value (None) to avoid
                 inconsistencies between the mixing state data and the properties of the
                 ComputedStructureEntry in entries.
+            n_workers (int): Number of processes used to generate the mixing state data, which is
+                partitioned by chemical system. Defaults to 1.
+            mixing_state_cache (dict): Optional dict caching the mixing state of each chemical
+                space between calls, so that only chemical spaces whose entries changed are
+                recomputed. See get_mixing_state_data. Defaults to None.
 
         Returns:
             list[AnyComputedEntry]: Adjusted entries. Entries in the original list incompatible with
@@ -176,7 +191,9 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         if mixing_state_data is None:
             if verbose:
                 print("  Generating mixing state data from provided entries.")
-            mixing_state_data = self.get_mixing_state_data(entries_type_1 + entries_type_2)
+            mixing_state_data = self.get_mixing_state_data(
+                entries_type_1 + entries_type_2, n_workers=n_workers, mixing_state_cache=mixing_state_cache
+            )
 
         if verbose:
             # how many stable entries from run_type_1 do we have in run_type_2?
@@ -447,13 +464,33 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
             f"an edge case in {type(self).__name__}. Inspect your input carefully and post a bug report."
         )
 
-    def get_mixing_state_data(self, entries: list[ComputedStructureEntry]):
+    def get_mixing_state_data(
+        self,
+        entries: list[ComputedStructureEntry],
+        *,
+        n_workers: int = 1,
+        mixing_state_cache: dict | None = None,
+    ):
         """Generate internal state data to be passed to get_adjustments.
 
+        The work is partitioned by chemical system: the entries are split into the largest
+        chemical spaces they span, and the phase diagrams, spacegroup lookups and structure
+        matching are done independently for each space. Hull energies and stabilities only
+        depend on the entries within the chemical system of a composition, so the result is
+        the same as building a single PhaseDiagram from all entries, but scales to large
+        datasets spanning many chemical systems.
+
         Args:
             entries: The list of ComputedStructureEntry to process. It is assumed that the entries have
                 already been filtered using _filter_and_sort_entries() to remove any irrelevant run types,
                 apply compat_1 and compat_2, and confirm that all have unique entry_id.
+            n_workers (int): Number of processes used to process the chemical spaces in parallel.
+                Defaults to 1.
+            mixing_state_cache (dict): Optional dict used to cache the mixing state of each chemical
+                space between calls. Pass the same (initially empty) dict on every call and only the
+                chemical spaces whose entries (identified by entry_id, run_type and energy_per_atom)
+                changed since the last call are recomputed, e.g. when adding new run_type_2 entries.
+                The dict is updated in place. Defaults to None (no caching).
 
         Returns:
             DataFrame: A pandas DataFrame that contains information associating structures from
@@ -491,24 +528,11 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         entries_type_1 = [e for e in filtered_entries if e.parameters["run_type"] in self.valid_rtypes_1]
         entries_type_2 = [e for e in filtered_entries if e.parameters["run_type"] in self.valid_rtypes_2]
 
-        # construct PhaseDiagram for each run_type, if possible
-        pd_type_1, pd_type_2 = None, None
-        try:
-            pd_type_1 = PhaseDiagram(entries_type_1)
-        except ValueError:
-            warnings.warn(f"{self.run_type_1} entries do not form a complete PhaseDiagram.")
-
-        try:
-            pd_type_2 = PhaseDiagram(entries_type_2)
-        except ValueError:
-            warnings.warn(f"{self.run_type_2} entries do not form a complete PhaseDiagram.")
-
         # Objective: loop through all the entries, group them by structure matching (or fuzzy structure matching
         # where relevant). For each group, put a row in a pandas DataFrame with the composition of the run_type_1 entry,
         # the run_type_2 entry, whether or not that entry is a ground state (not necessarily on the hull), its energy,
         # and the energy of the hull at that composition
         all_entries = list(entries_type_1) + list(entries_type_2)
-        row_list = []
         columns = [
             "formula",
             "spacegroup",
@@ -524,6 +548,115 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
             "hull_energy_2",
         ]
 
+        for entry in all_entries:
+            entry.structure.entry_id = entry.entry_id
+
+        # partition the entries into the largest chemical spaces they span. Each chemical system is
+        # assigned to exactly one of these spaces, whose phase diagrams only need the entries in the space
+        entries_by_chemsys: dict[frozenset[str], list[int]] = {}
+        for idx, entry in enumerate(all_entries):
+            chemsys = frozenset(el.symbol for el in entry.composition.elements)
+            entries_by_chemsys.setdefault(chemsys, []).append(idx)
+
+        spaces: list[frozenset[str]] = []
+        spaces_by_element: dict[str, set[int]] = {}
+        space_of_chemsys: dict[frozenset[str], int] = {}
+        for chemsys in sorted(entries_by_chemsys, key=lambda cs: (-len(cs), sorted(cs))):
+            containing = set.intersection(*(spaces_by_element.get(el, set()) for el in chemsys))
+            if containing:
+                space_of_chemsys[chemsys] = min(containing)
+                continue
+            space_of_chemsys[chemsys] = len(spaces)
+            for el in chemsys:
+                spaces_by_element.setdefault(el, set()).add(len(spaces))
+            spaces.append(chemsys)
+
+        # the settings that affect the mixing state of a chemical space, used to validate the cache
+        settings = (
+            self.run_type_1,
+            self.run_type_2,
+            self.fuzzy_matching,
+            json.dumps(self.structure_matcher.as_dict(), sort_keys=True, default=str),
+        )
+        space_keys: list[tuple] = []
+        space_args: list[tuple[list[ComputedStructureEntry], list[frozenset[str]]]] = []
+        for space_idx, space in enumerate(spaces):
+            own_chemsys = [cs for cs, idx in space_of_chemsys.items() if idx == space_idx]
+            members = sorted(
+                idx
+                for size in range(1, len(space) + 1)
+                for combo in itertools.combinations(sorted(space), size)
+                for idx in entries_by_chemsys.get(frozenset(combo), [])
+            )
+            space_entries = [all_entries[idx] for idx in members]
+            entry_keys = frozenset(
+                (entry.entry_id, entry.parameters["run_type"], entry.energy_per_atom) for entry in space_entries
+            )
+            space_keys.append((settings, space, frozenset(own_chemsys), entry_keys))
+            space_args.append((space_entries, own_chemsys))
+
+        cache = {} if mixing_state_cache is None else mixing_state_cache
+        todo = [idx for idx, key in enumerate(space_keys) if key not in cache]
+        if n_workers == 1 or len(todo) <= 1:
+            results = [self._get_mixing_state_rows(*space_args[idx]) for idx in todo]
+        else:
+            results = Parallel(n_jobs=n_workers)(delayed(self._get_mixing_state_rows)(*space_args[idx]) for idx in todo)
+        new_cache = {key: cache[key] for key in space_keys if key in cache}
+        new_cache.update({space_keys[idx]: result for idx, result in zip(todo, results, strict=True)})
+        if mixing_state_cache is not None:
+            # only keep the chemical spaces of the current entries so the cache does not grow without bound
+            mixing_state_cache.clear()
+            mixing_state_cache.update(new_cache)
+
+        rows_by_comp: dict[Composition, list[list]] = {}
+        failed_1 = failed_2 = not spaces
+        for key in space_keys:
+            space_rows, space_failed_1, space_failed_2 = new_cache[key]
+            rows_by_comp.update(space_rows)
+            failed_1 |= space_failed_1
+            failed_2 |= space_failed_2
+
+        if failed_1:
+            warnings.warn(f"{self.run_type_1} entries do not form a complete PhaseDiagram.")
+        if failed_2:
+            warnings.warn(f"{self.run_type_2} entries do not form a complete PhaseDiagram.")
+
+        # order the rows by composition, as if all entries had been grouped at once
+        row_list = [row for comp in sorted(rows_by_comp) for row in rows_by_comp[comp]]
+        mixing_state_data = pd.DataFrame(row_list, columns=columns)
+        return mixing_state_data.sort_values(["formula", "energy_1", "spacegroup", "num_sites"], ignore_index=True)
+
+    def _get_mixing_state_rows(
+        self,
+        entries: list[ComputedStructureEntry],
+        chemsystems: list[frozenset[str]],
+    ) -> tuple[dict[Composition, list[list]], bool, bool]:
+        """Get the mixing state DataFrame rows of all materials in some chemical systems.
+
+        Args:
+            entries: All entries in the chemical space spanned by chemsystems, including those
+                in its subsystems, which are needed to construct the phase diagrams.
+            chemsystems: The chemical systems (sets of element symbols) whose materials to process.
+
+        Returns:
+            tuple[dict, bool, bool]: The rows grouped by composition and whether the
+                run_type_1 and run_type_2 PhaseDiagrams could not be constructed.
+        """
+        entries_type_1 = [e for e in entries if e.parameters["run_type"] in self.valid_rtypes_1]
+        entries_type_2 = [e for e in entries if e.parameters["run_type"] in self.valid_rtypes_2]
+
+        # construct PhaseDiagram for each run_type, if possible
+        pd_type_1, pd_type_2 = None, None
+        try:
+            pd_type_1 = PhaseDiagram(entries_type_1)
+        except ValueError:
+            pass
+
+        try:
+            pd_type_2 = PhaseDiagram(entries_type_2)
+        except ValueError:
+            pass
+
         def _get_sg(struct) -> int:
             """Helper function to get spacegroup with a loose tolerance."""
             try:
@@ -533,24 +666,26 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
 
         # loop through all structures
         # this logic follows emmet.builders.vasp.materials.MaterialsBuilder.filter_and_group_tasks
-        structures = []
-        for entry in all_entries:
-            struct = entry.structure
-            struct.entry_id = entry.entry_id
-            structures.append(struct)
+        chemsystems = set(chemsystems)
+        own_entries = [e for e in entries if frozenset(el.symbol for el in e.composition.elements) in chemsystems]
+        structures = [entry.structure for entry in own_entries]
 
-        # First group by composition, then by spacegroup number, then by structure matching
+        # First group by composition, then by spacegroup number, then by structure matching.
+        # The spacegroup is the most expensive key, so it is computed only once per structure
+        rows_by_comp: dict[Composition, list[list]] = {}
         for comp, comp_group in groupby(sorted(structures, key=lambda s: s.composition), key=lambda s: s.composition):
-            l_comp_group = list(comp_group)
+            sg_structs = sorted(((_get_sg(struct), struct) for struct in comp_group), key=lambda x: x[0])
+            comp_entries = [e for e in own_entries if e.composition == comp]
+            row_list = rows_by_comp.setdefault(comp, [])
             # group by spacegroup, then by number of sites (for diatmics) or by structure matching
-            for sg, pre_group in groupby(sorted(l_comp_group, key=_get_sg), key=_get_sg):
-                l_pre_group = list(pre_group)
+            for sg, pre_group in groupby(sg_structs, key=lambda x: x[0]):
+                l_pre_group = [struct for _, struct in pre_group]
                 if comp.reduced_formula in ["O2", "H2", "Cl2", "F2", "N2", "I", "Br", "H2O"] and self.fuzzy_matching:
                     # group by number of sites
                     for idx, site_group in groupby(sorted(l_pre_group, key=len), key=len):
                         l_sitegroup = list(site_group)
                         row_list.append(
-                            self._populate_df_row(l_sitegroup, comp, sg, idx, pd_type_1, pd_type_2, all_entries)
+                            self._populate_df_row(l_sitegroup, comp, sg, idx, pd_type_1, pd_type_2, comp_entries)
                         )
                 else:
                     for group in self.structure_matcher.group_structures(l_pre_group):
@@ -558,10 +693,9 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
                         idx = len(group[0])
                         # StructureMatcher.group_structures returns a list of lists,
                         # so each group should be a list containing matched structures
-                        row_list.append(self._populate_df_row(group, comp, sg, idx, pd_type_1, pd_type_2, all_entries))
+                        row_list.append(self._populate_df_row(group, comp, sg, idx, pd_type_1, pd_type_2, comp_entries))
 
-        mixing_state_data = pd.DataFrame(row_list, columns=columns)
-        return mixing_state_data.sort_values(["formula", "energy_1", "spacegroup", "num_sites"], ignore_index=True)
+        return rows_by_comp, pd_type_1 is None, pd_type_2 is None
 
     def _filter_and_sort_entries(self, entries, verbose=False):
         """Given a single list of entries, separate them by run_type and return two lists, one containing
@@ -659,22 +793,15 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         """
         # within the group of matched structures, keep the lowest energy entry from
         # each run_type
+        group_ids = {s.entry_id for s in struct_group}
         entries_type_1 = sorted(
-            (
-                e
-                for e in all_entries
-                if e.entry_id in [s.entry_id for s in struct_group] and e.parameters["run_type"] in self.valid_rtypes_1
-            ),
+            (e for e in all_entries if e.entry_id in group_ids and e.parameters["run_type"] in self.valid_rtypes_1),
             key=lambda x: x.energy_per_atom,
         )
         first_entry = entries_type_1[0] if len(entries_type_1) > 0 else None
 
         entries_type_2 = sorted(
-            (
-                e
-                for e in all_entries
-                if e.entry_id in [s.entry_id for s in struct_group] and e.parameters["run_type"] in self.valid_rtypes_2
-            ),
+            (e for e in all_entries if e.entry_id in group_ids and e.parameters["run_type"] in self.valid_rtypes_2),
             key=lambda x: x.energy_per_atom,
         )
         second_entry = entries_type_2[0] if len(entries_type_2) > 0 else None
@@ -13,8 +13,10 @@ import math
 import os
 import re
 import subprocess
+import tempfile
 import warnings
 from enum import Enum, unique
+from functools import cache
 from glob import glob
 from hashlib import sha256
 from pathlib import Path
@@ -1737,6 +1739,88 @@ PYMATGEN_POTCAR_HASHES = loadfn(f"{MODULE_DIR}/vasp_potcar_pymatgen_hashes.json"
 # Written to some newer POTCARs by VASP
 VASP_POTCAR_HASHES = loadfn(f"{MODULE_DIR}/vasp_potcar_file_hashes.json")
 POTCAR_STATS_PATH: str = os.path.join(MODULE_DIR, "potcar-summary-stats.json.bz2")
+# Bump when the way PotcarSingle summary stats are computed changes to invalidate on-disk caches
+_POTCAR_CACHE_VERSION: int = 1
+# In-memory cache of PotcarSingle data block summary stats, keyed by the MD5 hash of the POTCAR contents
+_POTCAR_SUMMARY_STATS_CACHE: dict[str, tuple[list[str], dict]] = {}
+
+
+def _get_pmg_cache_dir() -> str | None:
+    """Directory used to persist expensive-to-compute POTCAR data between runs.
+
+    The on-disk cache is opt-in: it is only used if the PMG_CACHE_DIR setting
+    (or environment variable) is set to a non-empty path.
+    """
+    return SETTINGS.get("PMG_CACHE_DIR") or None
+
+
+def _read_cached_json(filename: str) -> Any:
+    """Load a JSON file from the pymatgen cache dir, returning None if disabled, missing or unreadable."""
+    if (cache_dir := _get_pmg_cache_dir()) is None:
+        return None
+    try:
+        with open(os.path.join(cache_dir, filename), encoding="utf-8") as file:
+            return json.load(file)
+    except Exception:
+        return None
+
+
+def _write_cached_json(filename: str, obj: Any) -> None:
+    """Atomically write a JSON file to the pymatgen cache dir. Failures only raise a warning."""
+    if (cache_dir := _get_pmg_cache_dir()) is None:
+        return
+    path = os.path.join(cache_dir, filename)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file and rename so concurrent processes never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, mode="w", encoding="utf-8") as file:
+            json.dump(obj, file)
+        os.replace(tmp_path, path)
+    except Exception:
+        warnings.warn(f"Could not write POTCAR cache file {path}")
+
+
+@cache
+def _load_potcar_summary_stats_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Load the decompressed reference POTCAR summary stats. mtime_ns and size make
+    the in-memory cache and the on-disk copy follow changes to the source file.
+    """
+    key = sha256(f"{path}:{mtime_ns}:{size}:{_POTCAR_CACHE_VERSION}".encode()).hexdigest()
+    filename = f"potcar-summary-stats-{key}.json"
+    if (summary_stats := _read_cached_json(filename)) is None:
+        summary_stats = loadfn(path)
+        _write_cached_json(filename, summary_stats)
+    return summary_stats
+
+
+def _load_potcar_summary_stats(path: str = POTCAR_STATS_PATH) -> dict:
+    """Reference POTCAR summary stats used to validate and identify POTCARs.
+
+    Decompressing and parsing the bz2 file is slow, so it is only done on first
+    use and the result is cached in memory and, if PMG_CACHE_DIR is set, on disk.
+    """
+    stat = os.stat(path)
+    return _load_potcar_summary_stats_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _potcar_data_stats(data_list: Sequence) -> dict:
+    """Used for hash-less and therefore less brittle POTCAR validity checking."""
+    arr = np.array(data_list)
+    return {
+        "MEAN": np.mean(arr),
+        "ABSMEAN": np.mean(np.abs(arr)),
+        "VAR": np.mean(arr**2),
+        "MIN": arr.min(),
+        "MAX": arr.max(),
+    }
+
+
+class _LazyPotcarSummaryStats:
+    """Class-level descriptor deferring the loading of the reference POTCAR summary stats."""
+
+    def __get__(self, obj: object, objtype: type | None = None) -> dict:
+        return _load_potcar_summary_stats()
 
 
 class PmgVaspPspDirError(ValueError):
@@ -1832,8 +1916,8 @@ class PotcarSingle:
         "COPYR": str.strip,
     }
 
-    # Used for POTCAR validation
-    _potcar_summary_stats = loadfn(POTCAR_STATS_PATH)
+    # Used for POTCAR validation, loaded on first access
+    _potcar_summary_stats = _LazyPotcarSummaryStats()
 
     def __init__(self, data: str, symbol: str | None = None) -> None:
         """
@@ -2079,6 +2163,96 @@ class PotcarSingle:
         md5.update(hash_str.lower().encode("utf-8"))
         return md5.hexdigest()
 
+    @property
+    def _summary_stats(self) -> dict[str, dict]:
+        """Keywords and summary statistics of the header and data blocks, used to
+        validate and identify POTCARs without storing the copyrighted data itself.
+        """
+        keyword_vals = []
+        for kwd in self.keywords:
+            val = self.keywords[kwd]
+            if isinstance(val, bool):
+                # has to come first since bools are also ints
+                keyword_vals.append(1.0 if val else 0.0)
+            elif isinstance(val, float | int):
+                keyword_vals.append(val)
+            elif hasattr(val, "__len__"):
+                keyword_vals += [num for num in val if isinstance(num, float | int)]
+
+        data_keywords, data_stats = self._data_summary_stats()
+
+        # NB: to add future summary stats in a way that's consistent with PMG,
+        # it's easiest to save the summary stats as an attr of PotcarSingle
+        return {  # for this PotcarSingle instance
+            "keywords": {
+                "header": [kwd.lower() for kwd in self.keywords],
+                "data": list(data_keywords),
+            },
+            "stats": {
+                "header": _potcar_data_stats(keyword_vals),
+                "data": dict(data_stats),
+            },
+        }
+
+    def _data_summary_stats(self) -> tuple[list[str], dict]:
+        """Keywords and summary statistics of the POTCAR data block.
+
+        Parsing the data block is slow, so results are cached in memory and, if
+        PMG_CACHE_DIR is set, on disk, keyed by the MD5 hash of the POTCAR contents.
+        """
+        data_hash = self.md5_computed_file_hash
+        if (cached := _POTCAR_SUMMARY_STATS_CACHE.get(data_hash)) is not None:
+            return cached
+
+        cache_file = os.path.join("potcar-summary-stats", f"{data_hash}-v{_POTCAR_CACHE_VERSION}.json")
+        if (cached := _read_cached_json(cache_file)) is not None:
+            data_summary_stats = (cached[0], cached[1])  # JSON stores the tuple as a list
+            _POTCAR_SUMMARY_STATS_CACHE[data_hash] = data_summary_stats
+            return data_summary_stats
+
+        def parse_fortran_style_str(input_str: str) -> str | bool | float | int:
+            """Parse any input string as bool, int, float, or failing that, str.
+            Used to parse FORTRAN-generated POTCAR files where it's unknown
+            a priori what type of data will be encountered.
+            """
+            input_str = input_str.strip()
+
+            if input_str.lower() in {"t", "f", "true", "false"}:
+                return input_str[0].lower() == "t"
+
+            if input_str.upper() == input_str.lower() and input_str[0].isnumeric():
+                # NB: fortran style floats always include a decimal point.
+                #     While you can set, e.g. x = 1E4, you cannot print/write x without
+                #     a decimal point:
+                #         `write(6,*) x`          -->   `10000.0000` in stdout
+                #         `write(6,'(E10.0)') x`  -->   segfault
+                #     The (E10.0) means write an exponential-format number with 10
+                #         characters before the decimal, and 0 characters after
+                return float(input_str) if "." in input_str else int(input_str)
+
+            try:
+                return float(input_str)
+            except ValueError:
+                return input_str
+
+        psp_keys, psp_vals = [], []
+        potcar_body = self.data.split("END of PSCTR-controll parameters\n")[1]
+        for row in re.split(r"\n+|;", potcar_body):  # FORTRAN allows ; to delimit multiple lines merged into 1 line
+            tmp_str = ""
+            for raw_val in row.split():
+                parsed_val = parse_fortran_style_str(raw_val)
+                if isinstance(parsed_val, str):
+                    tmp_str += parsed_val.strip()
+                elif isinstance(parsed_val, float | int):
+                    psp_vals.append(parsed_val)
+            if len(tmp_str) > 0:
+                psp_keys.append(tmp_str.lower())
+
+        data_summary_stats = (psp_keys, _potcar_data_stats(psp_vals))
+        _POTCAR_SUMMARY_STATS_CACHE[data_hash] = data_summary_stats
+        _write_cached_json(cache_file, data_summary_stats)
+        return data_summary_stats
+
     @property
     def is_valid(self) -> bool:
         """
@@ -2127,95 +2301,24 @@ class PotcarSingle:
 
         # Thus we have to look for matches in all POTCAR dirs, not just the ones with
         # consistent values of LEXCH
+        potcar_summary_stats = self._potcar_summary_stats
         for func in self.functional_dir:
-            for titel_no_spc in self._potcar_summary_stats[func]:
+            for titel_no_spc in potcar_summary_stats[func]:
                 if self.TITEL.replace(" ", "") == titel_no_spc:
-                    for potcar_subvariant in self._potcar_summary_stats[func][titel_no_spc]:
+                    for potcar_subvariant in potcar_summary_stats[func][titel_no_spc]:
                         if self.VRHFIN.replace(" ", "") == potcar_subvariant["VRHFIN"]:
                             possible_match = {"POTCAR_FUNCTIONAL": func, "TITEL": titel_no_spc, **potcar_subvariant}
                             possible_potcar_matches.append(possible_match)
 
-        def parse_fortran_style_str(input_str: str) -> str | bool | float | int:
-            """Parse any input string as bool, int, float, or failing that, str.
-            Used to parse FORTRAN-generated POTCAR files where it's unknown
-            a priori what type of data will be encountered.
-            """
-            input_str = input_str.strip()
-
-            if input_str.lower() in {"t", "f", "true", "false"}:
-                return input_str[0].lower() == "t"
-
-            if input_str.upper() == input_str.lower() and input_str[0].isnumeric():
-                # NB: fortran style floats always include a decimal point.
-                #     While you can set, e.g. x = 1E4, you cannot print/write x without
-                #     a decimal point:
-                #         `write(6,*) x`          -->   `10000.0000` in stdout
-                #         `write(6,'(E10.0)') x`  -->   segfault
-                #     The (E10.0) means write an exponential-format number with 10
-                #         characters before the decimal, and 0 characters after
-                return float(input_str) if "." in input_str else int(input_str)
-
-            try:
-                return float(input_str)
-            except ValueError:
-                return input_str
-
-        psp_keys, psp_vals = [], []
-        potcar_body = self.data.split("END of PSCTR-controll parameters\n")[1]
-        for row in re.split(r"\n+|;", potcar_body):  # FORTRAN allows ; to delimit multiple lines merged into 1 line
-            tmp_str = ""
-            for raw_val in row.split():
-                parsed_val = parse_fortran_style_str(raw_val)
-                if isinstance(parsed_val, str):
-                    tmp_str += parsed_val.strip()
-                elif isinstance(parsed_val, float | int):
-                    psp_vals.append(parsed_val)
-            if len(tmp_str) > 0:
-                psp_keys.append(tmp_str.lower())
-
-        keyword_vals = []
-        for kwd in self.keywords:
-            val = self.keywords[kwd]
-            if isinstance(val, bool):
-                # has to come first since bools are also ints
-                keyword_vals.append(1.0 if val else 0.0)
-            elif isinstance(val, float | int):
-                keyword_vals.append(val)
-            elif hasattr(val, "__len__"):
-                keyword_vals += [num for num in val if isinstance(num, float | int)]
-
-        def data_stats(data_list: Sequence) -> dict:
-            """Used for hash-less and therefore less brittle POTCAR validity checking."""
-            arr = np.array(data_list)
-            return {
-                "MEAN": np.mean(arr),
-                "ABSMEAN": np.mean(np.abs(arr)),
-                "VAR": np.mean(arr**2),
-                "MIN": arr.min(),
-                "MAX": arr.max(),
-            }
-
-        # NB: to add future summary stats in a way that's consistent with PMG,
-        # it's easiest to save the summary stats as an attr of PotcarSingle
-        self._summary_stats: dict[str, dict] = {  # for this PotcarSingle instance
-            "keywords": {
-                "header": [kwd.lower() for kwd in self.keywords],
-                "data": psp_keys,
-            },
-            "stats": {
-                "header": data_stats(keyword_vals),
-                "data": data_stats(psp_vals),
-            },
-        }
-
+        summary_stats = self._summary_stats
         data_match_tol: float = 1e-6
         for ref_psp in possible_potcar_matches:
             key_match = all(
-                set(ref_psp["keywords"][key]) == set(self._summary_stats["keywords"][key]) for key in ["header", "data"]
+                set(ref_psp["keywords"][key]) == set(summary_stats["keywords"][key]) for key in ["header", "data"]
             )
 
             data_diff = [
-                abs(ref_psp["stats"][key][stat] - self._summary_stats["stats"][key][stat])
+                abs(ref_psp["stats"][key][stat] - summary_stats["stats"][key][stat])
                 for stat in ["MEAN", "ABSMEAN", "VAR", "MIN", "MAX"]
                 for key in ["header", "data"]
             ]
@@ -2364,18 +2467,20 @@ class PotcarSingle:
         else:
             raise ValueError(f"Bad {mode=}. Choose 'data' or 'file'.")
 
+        summary_stats = self._summary_stats
+        potcar_summary_stats = self._potcar_summary_stats
         identity: dict[str, list] = {"potcar_functionals": [], "potcar_symbols": []}
         for func in self.functional_dir:
-            for ref_psp in self._potcar_summary_stats[func].get(self.TITEL.replace(" ", ""), []):
+            for ref_psp in potcar_summary_stats[func].get(self.TITEL.replace(" ", ""), []):
                 if self.VRHFIN.replace(" ", "") != ref_psp["VRHFIN"]:
                     continue
 
                 key_match = all(
-                    set(ref_psp["keywords"][key]) == set(self._summary_stats["keywords"][key]) for key in check_modes
+                    set(ref_psp["keywords"][key]) == set(summary_stats["keywords"][key]) for key in check_modes
                 )
 
                 data_diff = [
-                    abs(ref_psp["stats"][key][stat] - self._summary_stats["stats"][key][stat])
+                    abs(ref_psp["stats"][key][stat] - summary_stats["stats"][key][stat])
                     for stat in ["MEAN", "ABSMEAN", "VAR", "MIN", "MAX"]
                     for key in check_modes
                 ]
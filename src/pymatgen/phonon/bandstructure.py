@@ -10,7 +10,8 @@ from monty.json import MSONable
 
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Structure
-from pymatgen.electronic_structure.bandstructure import Kpoint
+from pymatgen.electronic_structure.bandstructure import Kpoint, KpointArray
+from pymatgen.util.serialization import encode_array
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     from numpy.typing import ArrayLike
     from typing_extensions import Self
 
+    from pymatgen.util.serialization import ArrayMode
     from pymatgen.util.typing import Tuple3Ints
 
 
@@ -113,24 +115,12 @@ class PhononBandStructure(MSONable):
                 projections of the band structure.
         """
         self.lattice_rec = lattice
-        self.qpoints: list[Kpoint] = []
-        self.labels_dict = {}
         self.structure = structure
         if eigendisplacements is None:
             eigendisplacements = np.array([])
         self.eigendisplacements = eigendisplacements
-        if labels_dict is None:
-            labels_dict = {}
-
-        for q_pt in qpoints:
-            label = None  # check below if this qpoint has an assigned label
-            for key in labels_dict:
-                if np.linalg.norm(q_pt - np.array(labels_dict[key])) < 0.0001:
-                    label = key
-                    self.labels_dict[label] = Kpoint(
-                        q_pt, lattice, label=label, coords_are_cartesian=coords_are_cartesian
-                    )
-            self.qpoints += [Kpoint(q_pt, lattice, label=label, coords_are_cartesian=coords_are_cartesian)]
+
+        self.qpoints, self.labels_dict = KpointArray.from_coords(qpoints, lattice, labels_dict, coords_are_cartesian)
         self.bands = np.asarray(frequencies)
         self.nb_bands = len(self.bands)
         self.nb_qpoints = len(self.qpoints)
@@ -276,31 +266,40 @@ class PhononBandStructure(MSONable):
 
         return None
 
-    def as_dict(self) -> dict[str, Any]:
-        """MSONable dict."""
+    def as_dict(self, array_mode: ArrayMode = "list") -> dict[str, Any]:
+        """MSONable dict.
+
+        Args:
+            array_mode ("list" | "numpy"): How to store the qpoints, frequencies and
+                eigendisplacements. "numpy" keeps them as arrays for binary serialization
+                with pymatgen.util.serialization.to_binary. Defaults to "list".
+        """
         dct: dict[str, Any] = {
             "@module": type(self).__module__,
             "@class": type(self).__name__,
             "lattice_rec": self.lattice_rec.as_dict(),
             # qpoints are not Kpoint objects dicts but are frac coords. This makes
             # the dict smaller and avoids the repetition of the lattice
-            "qpoints": [q_pt.as_dict()["fcoords"] for q_pt in self.qpoints],
+            "qpoints": encode_array(self.qpoints.frac_coords, array_mode),
         }
-        dct["bands"] = self.bands.tolist()
+        dct["bands"] = encode_array(self.bands, array_mode)
         dct["labels_dict"] = {}
         for kpoint_letter, kpoint_object in self.labels_dict.items():
             dct["labels_dict"][kpoint_letter] = kpoint_object.as_dict()["fcoords"]
 
         # split the eigendisplacements to real and imaginary part for serialization
         dct["eigendisplacements"] = {
-            "real": np.real(self.eigendisplacements).tolist(),
-            "imag": np.imag(self.eigendisplacements).tolist(),
+            "real": encode_array(np.real(self.eigendisplacements), array_mode),
+            "imag": encode_array(np.imag(self.eigendisplacements), array_mode),
         }
         dct["nac_eigendisplacements"] = [
-            (direction, {"real": np.real(e).tolist(), "imag": np.imag(e).tolist()})
+            (
+                direction,
+                {"real": encode_array(np.real(e), array_mode), "imag": encode_array(np.imag(e), array_mode)},
+            )
             for direction, e in self.nac_eigendisplacements
         ]
-        dct["nac_frequencies"] = [(direction, f.tolist()) for direction, f in self.nac_frequencies]
+        dct["nac_frequencies"] = [(direction, encode_array(f, array_mode)) for direction, f in self.nac_frequencies]
 
         if self.structure:
             dct["structure"] = self.structure.as_dict()
@@ -399,40 +398,7 @@ class PhononBandStructureSymmLine(PhononBandStructure):
     def _reuse_init(
         self, eigendisplacements: ArrayLike, frequencies: ArrayLike, has_nac: bool, qpoints: Sequence[Kpoint]
     ) -> None:
-        self.distance = []
-        self.branches = []
-        one_group: list = []
-        branches_tmp = []
-        # get labels and distance for each qpoint
-        previous_qpoint = self.qpoints[0]
-        previous_distance = 0.0
-        previous_label = self.qpoints[0].label
-        for idx in range(self.nb_qpoints):
-            label = self.qpoints[idx].label
-            if label is not None and previous_label is not None:
-                self.distance += [previous_distance]
-            else:
-                self.distance += [
-                    np.linalg.norm(self.qpoints[idx].cart_coords - previous_qpoint.cart_coords) + previous_distance
-                ]
-            previous_qpoint = self.qpoints[idx]
-            previous_distance = self.distance[idx]
-            if label and previous_label:
-                if len(one_group) != 0:
-                    branches_tmp += [one_group]
-                one_group = []
-            previous_label = label
-            one_group += [idx]
-        if len(one_group) != 0:
-            branches_tmp += [one_group]
-        for branch in branches_tmp:
-            self.branches += [
-                {
-                    "start_index": branch[0],
-                    "end_index": branch[-1],
-                    "name": f"{self.qpoints[branch[0]].label}-{self.qpoints[branch[-1]].label}",
-                }
-            ]
+        self.distance, self.branches = self.qpoints.get_distances_and_branches()
         # extract the frequencies with non-analytical contribution at gamma
         if has_nac:
             naf = []
@@ -476,12 +442,8 @@ class PhononBandStructureSymmLine(PhononBandStructure):
         if self.qpoints[index].label is None:
             return [index]
 
-        list_index_qpoints = []
-        for idx in range(self.nb_qpoints):
-            if self.qpoints[idx].label == self.qpoints[index].label:
-                list_index_qpoints.append(idx)
-
-        return list_index_qpoints
+        label = self.qpoints[index].label
+        return [idx for idx, q_pt_label in enumerate(self.qpoints.labels) if q_pt_label == label]
 
     def get_branch(self, index: int) -> list[dict[str, str | int]]:
         r"""Get in what branch(es) is the qpoint. There can be several branches.
@@ -543,9 +505,7 @@ class PhononBandStructureSymmLine(PhononBandStructure):
         dct["name"] = self.structure.formula
 
         # get qpoints
-        qpoints = []
-        for q_pt in self.qpoints:
-            qpoints.append(list(q_pt.frac_coords))
+        qpoints = [list(frac_coords) for frac_coords in self.qpoints.frac_coords]
         dct["qpoints"] = qpoints
 
         # get labels
@@ -622,9 +582,15 @@ class PhononBandStructureSymmLine(PhononBandStructure):
             eigen_displacements[:, nq] = eivq[order[nq]]
             eig[:, nq] = eigq[order[nq]]
 
-    def as_dict(self) -> dict:
-        """Get MSONable dict."""
-        dct = super().as_dict()
+    def as_dict(self, array_mode: ArrayMode = "list") -> dict:
+        """Get MSONable dict.
+
+        Args:
+            array_mode ("list" | "numpy"): How to store the qpoints, frequencies and
+                eigendisplacements. "numpy" keeps them as arrays for binary serialization
+                with pymatgen.util.serialization.to_binary. Defaults to "list".
+        """
+        dct = super().as_dict(array_mode=array_mode)
         # remove nac_frequencies and nac_eigendisplacements as they are reconstructed
         # in the __init__ when the dict is deserialized
         nac_frequencies = dct.pop("nac_frequencies")
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, NamedTuple
+from typing import TYPE_CHECKING, Literal, NamedTuple, get_args
 
 import numpy as np
 import scipy.constants as const
@@ -21,12 +21,14 @@ if version.parse(np.__version__) < version.parse("2.0.0"):
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    from numpy.typing import NDArray
+    from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
 BOLTZ_THZ_PER_K = const.value("Boltzmann constant in Hz/K") / const.tera  # Boltzmann constant in THz/K
 THZ_TO_J = const.value("hertz-joule relationship") * const.tera
 
+ThermoProperty = Literal["cv", "entropy", "internal_energy", "helmholtz_free_energy"]
+
 
 class PhononDos(MSONable):
     """Basic DOS object. All other DOS objects are extended versions of this object."""
@@ -172,7 +174,7 @@ class PhononDos(MSONable):
         """Numpy array containing the list of densities corresponding to positive frequencies."""
         return self.densities[self.ind_zero_freq :]
 
-    def cv(self, temp: float | None = None, structure: Structure | None = None, **kwargs) -> float:
+    def cv(self, temp: ArrayLike | None = None, structure: Structure | None = None, **kwargs) -> float | NDArray:
         """Constant volume specific heat C_v at temperature T obtained from the integration of the DOS.
         Only positive frequencies will be used.
         Result in J/(K*mol-c). A mol-c is the abbreviation of a mole-cell, that is, the number
@@ -181,35 +183,17 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/(K*mol).
 
         Args:
-            temp: a temperature in K
+            temp: a temperature in K, or an array of temperatures
             structure: the structure of the system. If not None it will be used to determine the number of
                 formula units
             **kwargs: allows passing in deprecated t parameter for temp
 
         Returns:
-            float: Constant volume specific heat C_v
+            float | NDArray: Constant volume specific heat C_v, an array if temp is an array
         """
-        temp = kwargs.get("t", temp)
-        if temp == 0:
-            return 0
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        def csch2(x):
-            return 1.0 / (np.sinh(x) ** 2)
+        return self._get_thermo_property("cv", kwargs.get("t", temp), structure)
 
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temp)
-        cv = np.trapezoid(wd2kt**2 * csch2(wd2kt) * dens, x=freqs)
-        cv *= const.Boltzmann * const.Avogadro
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            cv /= formula_units
-
-        return cv
-
-    def entropy(self, temp: float | None = None, structure: Structure | None = None, **kwargs) -> float:
+    def entropy(self, temp: ArrayLike | None = None, structure: Structure | None = None, **kwargs) -> float | NDArray:
         """Vibrational entropy at temperature T obtained from the integration of the DOS.
         Only positive frequencies will be used.
         Result in J/(K*mol-c). A mol-c is the abbreviation of a mole-cell, that is, the number
@@ -218,33 +202,19 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/(K*mol).
 
         Args:
-            temp: a temperature in K
+            temp: a temperature in K, or an array of temperatures
             structure: the structure of the system. If not None it will be used to determine the number of
                 formula units
             **kwargs: allows passing in deprecated t parameter for temp
 
         Returns:
-            float: Vibrational entropy
+            float | NDArray: Vibrational entropy, an array if temp is an array
         """
-        temp = kwargs.get("t", temp)
-        if temp == 0:
-            return 0
+        return self._get_thermo_property("entropy", kwargs.get("t", temp), structure)
 
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temp)
-        entropy = np.trapezoid((wd2kt * 1 / np.tanh(wd2kt) - np.log(2 * np.sinh(wd2kt))) * dens, x=freqs)
-
-        entropy *= const.Boltzmann * const.Avogadro
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            entropy /= formula_units
-
-        return entropy
-
-    def internal_energy(self, temp: float | None = None, structure: Structure | None = None, **kwargs) -> float:
+    def internal_energy(
+        self, temp: ArrayLike | None = None, structure: Structure | None = None, **kwargs
+    ) -> float | NDArray:
         """Phonon contribution to the internal energy at temperature T obtained from the integration of the DOS.
         Only positive frequencies will be used.
         Result in J/mol-c. A mol-c is the abbreviation of a mole-cell, that is, the number
@@ -253,33 +223,19 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/mol.
 
         Args:
-            temp: a temperature in K
+            temp: a temperature in K, or an array of temperatures
             structure: the structure of the system. If not None it will be used to determine the number of
                 formula units
             **kwargs: allows passing in deprecated t parameter for temp
 
         Returns:
-            float: Phonon contribution to the internal energy
+            float | NDArray: Phonon contribution to the internal energy, an array if temp is an array
         """
-        temp = kwargs.get("t", temp)
-        if temp == 0:
-            return self.zero_point_energy(structure=structure)
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temp)
-        e_phonon = np.trapezoid(freqs * 1 / np.tanh(wd2kt) * dens, x=freqs) / 2
-
-        e_phonon *= THZ_TO_J * const.Avogadro
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            e_phonon /= formula_units
+        return self._get_thermo_property("internal_energy", kwargs.get("t", temp), structure)
 
-        return e_phonon
-
-    def helmholtz_free_energy(self, temp: float | None = None, structure: Structure | None = None, **kwargs) -> float:
+    def helmholtz_free_energy(
+        self, temp: ArrayLike | None = None, structure: Structure | None = None, **kwargs
+    ) -> float | NDArray:
         """Phonon contribution to the Helmholtz free energy at temperature T obtained from the integration of the DOS.
         Only positive frequencies will be used.
         Result in J/mol-c. A mol-c is the abbreviation of a mole-cell, that is, the number
@@ -288,31 +244,89 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/mol.
 
         Args:
-            temp: a temperature in K
+            temp: a temperature in K, or an array of temperatures
             structure: the structure of the system. If not None it will be used to determine the number of
                 formula units
             **kwargs: allows passing in deprecated t parameter for temp
 
         Returns:
-            float: Phonon contribution to the Helmholtz free energy
+            float | NDArray: Phonon contribution to the Helmholtz free energy, an array if temp is an array
         """
-        temp = kwargs.get("t", temp)
-        if temp == 0:
-            return self.zero_point_energy(structure=structure)
+        return self._get_thermo_property("helmholtz_free_energy", kwargs.get("t", temp), structure)
+
+    def thermodynamic_properties(
+        self, temps: ArrayLike, structure: Structure | None = None
+    ) -> dict[ThermoProperty, NDArray]:
+        """Constant volume specific heat, vibrational entropy, and phonon contributions to
+        the internal and Helmholtz free energies at several temperatures, evaluated in one
+        pass over the temperatures and the positive frequencies of the DOS.
+
+        Units are those of the cv, entropy, internal_energy and helmholtz_free_energy methods:
+        per mol-c, or per mol of formula units if the structure is provided.
 
+        Args:
+            temps: temperatures in K
+            structure: the structure of the system. If not None it will be used to determine the number of
+                formula units
+
+        Returns:
+            dict[str, NDArray]: The properties keyed by "cv", "entropy", "internal_energy" and
+                "helmholtz_free_energy", each with the shape of temps.
+        """
+        return self._get_thermo_properties(temps, structure, properties=get_args(ThermoProperty))
+
+    def _get_thermo_property(
+        self, prop: ThermoProperty, temp: ArrayLike, structure: Structure | None
+    ) -> float | NDArray:
+        """A single thermodynamic property, as a float for a scalar temperature."""
+        values = self._get_thermo_properties(temp, structure, properties=(prop,))[prop]
+        return float(values) if values.ndim == 0 else values
+
+    def _get_thermo_properties(
+        self, temps: ArrayLike, structure: Structure | None, properties: Sequence[ThermoProperty]
+    ) -> dict[ThermoProperty, NDArray]:
+        """Integrate the DOS for the requested thermodynamic properties, broadcast over temps.
+
+        At T = 0, C_v and the entropy vanish and both energies are the zero point energy.
+        """
+        temps = np.asarray(temps, dtype=float)
+        is_zero = temps == 0
         freqs = self._positive_frequencies
         dens = self._positive_densities
 
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temp)
-        e_free = np.trapezoid(np.log(2 * np.sinh(wd2kt)) * dens, x=freqs)
+        # Temperatures along the first axes and frequencies along the last one
+        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * np.where(is_zero, 1, temps)[..., None])
+        sinh = np.sinh(wd2kt)
+        tanh = np.tanh(wd2kt)
+        log_2sinh = np.log(2 * sinh) if {"entropy", "helmholtz_free_energy"} & {*properties} else None
+
+        results: dict[ThermoProperty, NDArray] = {}
+        for prop in properties:
+            if prop == "cv":
+                values = np.trapezoid(wd2kt**2 * (1.0 / sinh**2) * dens, x=freqs)
+                values *= const.Boltzmann * const.Avogadro
+            elif prop == "entropy":
+                values = np.trapezoid((wd2kt / tanh - log_2sinh) * dens, x=freqs)
+                values *= const.Boltzmann * const.Avogadro
+            elif prop == "internal_energy":
+                values = np.trapezoid(freqs / tanh * dens, x=freqs) / 2
+                values *= THZ_TO_J * const.Avogadro
+            elif prop == "helmholtz_free_energy":
+                values = np.trapezoid(log_2sinh * dens, x=freqs)
+                values *= const.Boltzmann * const.Avogadro * temps
+            else:
+                raise ValueError(f"Invalid {prop=}, must be one of {get_args(ThermoProperty)}")
 
-        e_free *= const.Boltzmann * const.Avogadro * temp
+            zero_temp_value = 0 if prop in ("cv", "entropy") else self.zero_point_energy()
+            values = np.where(is_zero, zero_temp_value, values)
 
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            e_free /= formula_units
+            if structure:
+                formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
+                values /= formula_units
+
+            results[prop] = values
 
-        return e_free
+        return results
 
     def zero_point_energy(self, structure: Structure | None = None) -> float:
         """Zero point energy of the system. Only positive frequencies will be used.
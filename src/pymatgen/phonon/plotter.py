@@ -25,6 +25,7 @@ if TYPE_CHECKING:
 
     from matplotlib.axes import Axes
     from matplotlib.figure import Figure
+    from numpy.typing import NDArray
 
     from pymatgen.core import Structure
     from pymatgen.phonon.dos import PhononDos
@@ -742,7 +743,7 @@ class ThermoPlotter:
 
     def _plot_thermo(
         self,
-        func: Callable[[float, Structure | None], float],
+        func: Callable[[NDArray, Structure | None], NDArray],
         temperatures: Sequence[float],
         factor: float = 1,
         ax: Axes = None,
@@ -754,8 +755,9 @@ class ThermoPlotter:
         """Plots a thermodynamic property for a generic function from a PhononDos instance.
 
         Args:
-            func (Callable[[float, Structure | None], float]): Takes a temperature and structure (in that order)
-                and returns a thermodynamic property (e.g., heat capacity, entropy, etc.).
+            func (Callable[[NDArray, Structure | None], NDArray]): Takes an array of temperatures and structure
+                (in that order) and returns a thermodynamic property (e.g., heat capacity, entropy, etc.) at
+                each temperature.
             temperatures (list[float]): temperatures (in K) at which to evaluate func.
             factor: a multiplicative factor applied to the thermodynamic property calculated. Used to change
                 the units. Defaults to 1.
@@ -770,10 +772,8 @@ class ThermoPlotter:
         """
         ax, fig = get_ax_fig(ax)
 
-        values = []
-
-        for temp in temperatures:
-            values.append(func(temp, self.structure) * factor)
+        # The PhononDos methods evaluate all temperatures at once
+        values = func(np.asarray(temperatures), self.structure) * factor
 
         ax.plot(temperatures, values, label=label, **kwargs)
 
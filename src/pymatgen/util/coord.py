@@ -208,6 +208,26 @@ def pbc_shortest_vectors(lattice, frac_coords1, frac_coords2, mask=None, return_
     return coord_cython.pbc_shortest_vectors(lattice, frac_coords1, frac_coords2, mask, return_d2)
 
 
+def pbc_shortest_vectors_batch(lattices, frac_coords1, frac_coords2, return_d2: bool = False):
+    """Batched version of pbc_shortest_vectors for many independent (lattice,
+    frac_coords1, frac_coords2) problems, solved in a single compiled call.
+    Much faster than calling pbc_shortest_vectors in a loop when each problem
+    is small, e.g. in structure matching.
+
+    Args:
+        lattices: Sequence of lattices, one per problem.
+        frac_coords1: Sequence of first sets of fractional coordinates.
+        frac_coords2: Sequence of second sets of fractional coordinates.
+        return_d2 (bool): whether to also return the squared distances
+
+    Returns:
+        list[np.ndarray]: displacement vectors for each problem, equal (up to
+            rounding) to pbc_shortest_vectors(lattices[i], frac_coords1[i], frac_coords2[i]).
+            If return_d2, a second list of squared distances is also returned.
+    """
+    return coord_cython.pbc_shortest_vectors_batch(lattices, frac_coords1, frac_coords2, return_d2)
+
+
 def find_in_coord_list_pbc(
     frac_coord_list, frac_coord, atol: float = 1e-8, pbc: PbcLike = (True, True, True)
 ) -> np.ndarray:
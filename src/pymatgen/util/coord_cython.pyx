@@ -15,6 +15,7 @@ import numpy as np
 
 cimport cython
 cimport numpy as np
+from cython.parallel cimport prange
 from libc.math cimport fabs, round
 from libc.stdlib cimport free, malloc
 
@@ -191,6 +192,150 @@ def pbc_shortest_vectors(lattice, fcoords1, fcoords2, mask=None, return_d2=False
     else:
         return vectors
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _frac_to_cart_mod(np.float_t[:, ::1] fc, np.float_t[:, ::1] basis, np.float_t[:, ::1] lat,
+                            np.float_t[:, ::1] out, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    """Change fractional coords in rows start:stop to the given basis, wrap
+    them into the unit cell and convert them to Cartesian coords.
+    """
+    cdef Py_ssize_t i, j, k
+    cdef np.float_t f[3]
+    for i in range(start, stop):
+        for j in range(3):
+            f[j] = 0
+            for k in range(3):
+                f[j] += fc[i, k] * basis[k, j]
+        for j in range(3):
+            out[i, j] = 0
+            for k in range(3):
+                out[i, j] += f[k] % 1 * lat[k, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _shortest_vectors_block(np.float_t[:, ::1] cart_f1, np.float_t[:, ::1] cart_f2,
+                                  np.float_t[:, ::1] cart_im, Py_ssize_t n_im,
+                                  Py_ssize_t start1, Py_ssize_t stop1, Py_ssize_t start2, Py_ssize_t stop2,
+                                  np.float_t[:, ::1] vs, np.float_t[::1] ds, Py_ssize_t out_start) noexcept nogil:
+    """Minimum image vectors between two blocks of Cartesian coords. cart_im holds
+    the Cartesian image translations of this block's lattice in its first n_im rows.
+    """
+    cdef Py_ssize_t i, j, k, l, best_k = 0, out_idx = out_start
+    cdef np.float_t best, d, da, db, dc
+    cdef np.float_t pre[3]
+    for i in range(start1, stop1):
+        for j in range(start2, stop2):
+            for l in range(3):
+                pre[l] = cart_f2[j, l] - cart_f1[i, l]
+            best = 1e100
+            for k in range(n_im):
+                da = pre[0] + cart_im[k, 0]
+                db = pre[1] + cart_im[k, 1]
+                dc = pre[2] + cart_im[k, 2]
+                d = da * da + db * db + dc * dc
+                # Written so that compilers emit conditional moves rather than a branch
+                best_k = k if d < best else best_k
+                best = d if d < best else best
+            ds[out_idx] = best
+            for l in range(3):
+                vs[out_idx, l] = pre[l] + cart_im[best_k, l]
+            out_idx += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def pbc_shortest_vectors_batch(lattices, fcoords1_list, fcoords2_list, return_d2=False):
+    """Batched version of pbc_shortest_vectors for many independent problems,
+    e.g. one per structure. All problems are packed into contiguous arrays and
+    solved in a single call to a compiled kernel that runs without the GIL
+    (and in parallel over problems if the extension is built with OpenMP).
+
+    Args:
+        lattices: Sequence of lattices, one per problem.
+        fcoords1_list: Sequence of first sets of fractional coordinates.
+        fcoords2_list: Sequence of second sets of fractional coordinates.
+        return_d2 (bool): Whether to also return the squared distances.
+
+    Returns:
+        list[np.array]: displacement vectors for each problem, with the same
+            shape and values (up to rounding) as returned by pbc_shortest_vectors. If return_d2,
+            a second list with the squared distances is returned too.
+    """
+    cdef Py_ssize_t n_prob = len(lattices)
+    if len(fcoords1_list) != n_prob or len(fcoords2_list) != n_prob:
+        raise ValueError("lattices, fcoords1_list and fcoords2_list must have the same length")
+
+    # Per problem: basis change to the reduced (LLL) cell if fully periodic, the
+    # lattice matrix used for Cartesian coords and the periodic images to search
+    basis_arr = np.empty((n_prob, 3, 3))
+    lat_arr = np.empty((n_prob, 3, 3))
+    im_arr = np.zeros((n_prob, 27, 3))
+    n_im_arr = np.empty(n_prob, dtype=np.int64)
+    for p, lattice in enumerate(lattices):
+        pbc = np.asarray(lattice.pbc, dtype=bool)
+        if pbc.all():
+            basis_arr[p] = lattice.lll_inverse
+            lat_arr[p] = lattice.lll_matrix
+            frac_im = images
+        else:
+            basis_arr[p] = np.eye(3)
+            lat_arr[p] = lattice.matrix
+            frac_im = images[np.all((images == 0) | pbc, axis=1)]
+        n_im_arr[p] = len(frac_im)
+        im_arr[p, :len(frac_im)] = frac_im
+
+    fc1_blocks = [np.reshape(np.asarray(fc, dtype=np.float64), (-1, 3)) for fc in fcoords1_list]
+    fc2_blocks = [np.reshape(np.asarray(fc, dtype=np.float64), (-1, 3)) for fc in fcoords2_list]
+    sizes1 = np.array([len(fc) for fc in fc1_blocks], dtype=np.int64)
+    sizes2 = np.array([len(fc) for fc in fc2_blocks], dtype=np.int64)
+    off1_arr = np.concatenate([[0], np.cumsum(sizes1)])
+    off2_arr = np.concatenate([[0], np.cumsum(sizes2)])
+    off_out_arr = np.concatenate([[0], np.cumsum(sizes1 * sizes2)])
+
+    cdef np.float_t[:, ::1] fc1 = np.ascontiguousarray(np.concatenate(fc1_blocks) if n_prob else np.empty((0, 3)))
+    cdef np.float_t[:, ::1] fc2 = np.ascontiguousarray(np.concatenate(fc2_blocks) if n_prob else np.empty((0, 3)))
+    cdef np.float_t[:, :, ::1] bases = basis_arr
+    cdef np.float_t[:, :, ::1] lats = lat_arr
+    cdef np.float_t[:, :, ::1] frac_ims = im_arr
+    cdef np.int64_t[::1] n_ims = n_im_arr
+    cdef np.int64_t[::1] off1 = off1_arr
+    cdef np.int64_t[::1] off2 = off2_arr
+    cdef np.int64_t[::1] off_out = off_out_arr
+
+    cdef np.float_t[:, ::1] cart_f1 = np.empty((fc1.shape[0], 3))
+    cdef np.float_t[:, ::1] cart_f2 = np.empty((fc2.shape[0], 3))
+    cdef np.float_t[:, :, ::1] cart_ims = np.zeros((n_prob, 27, 3))
+    vectors = np.empty((off_out_arr[-1], 3))
+    d2 = np.empty(off_out_arr[-1])
+    cdef np.float_t[:, ::1] vs = vectors
+    cdef np.float_t[::1] ds = d2
+    cdef Py_ssize_t p_idx, i, j, k
+
+    for p_idx in prange(n_prob, nogil=True, schedule="dynamic"):
+        _frac_to_cart_mod(fc1, bases[p_idx], lats[p_idx], cart_f1, off1[p_idx], off1[p_idx + 1])
+        _frac_to_cart_mod(fc2, bases[p_idx], lats[p_idx], cart_f2, off2[p_idx], off2[p_idx + 1])
+        for i in range(n_ims[p_idx]):
+            for j in range(3):
+                for k in range(3):
+                    cart_ims[p_idx, i, j] += frac_ims[p_idx, i, k] * lats[p_idx, k, j]
+        _shortest_vectors_block(
+            cart_f1, cart_f2, cart_ims[p_idx], n_ims[p_idx],
+            off1[p_idx], off1[p_idx + 1], off2[p_idx], off2[p_idx + 1], vs, ds, off_out[p_idx],
+        )
+
+    vectors_list, d2_list = [], []
+    for p, (n1, n2) in enumerate(zip(sizes1, sizes2)):
+        vectors_list.append(vectors[off_out_arr[p]:off_out_arr[p + 1]].reshape(n1, n2, 3))
+        d2_list.append(d2[off_out_arr[p]:off_out_arr[p + 1]].reshape(n1, n2))
+
+    if return_d2:
+        return vectors_list, d2_list
+    return vectors_list
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.initializedcheck(False)
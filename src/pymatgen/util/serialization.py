@@ -0,0 +1,111 @@
+"""Binary serialization of MSONable objects holding large NumPy arrays.
+
+The JSON representation of objects such as band structures converts every array to
+nested lists, which is slow and bloated for large data. Classes whose ``as_dict``
+accepts an ``array_mode`` argument can instead keep their arrays as NumPy arrays,
+which ``to_binary`` stores as raw buffers in an NPZ archive next to the JSON encoded
+remainder of the dict. Other MSONable objects are serialized through their regular
+``as_dict``.
+"""
+
+from __future__ import annotations
+
+import inspect
+import io
+import json
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+from monty.json import MontyDecoder, MontyEncoder
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from typing import Any
+
+    from numpy.typing import ArrayLike, NDArray
+
+ArrayMode = Literal["list", "numpy"]
+
+# Name of the NPZ entry holding the JSON encoded dict
+_JSON_KEY = "__json__"
+# Key of the placeholder dicts referencing an array entry
+_ARRAY_KEY = "@npz_array"
+
+
+def encode_array(array: ArrayLike, array_mode: ArrayMode = "list") -> list | NDArray:
+    """Encode an array for an as_dict representation.
+
+    Args:
+        array (ArrayLike): The array to encode.
+        array_mode ("list" | "numpy"): "list" gives a JSON-serializable nested
+            list, "numpy" keeps the NumPy array for binary serialization.
+
+    Returns:
+        list | NDArray: The encoded array.
+    """
+    if array_mode == "list":
+        return np.asarray(array).tolist()
+    if array_mode == "numpy":
+        return np.asarray(array)
+    raise ValueError(f"Invalid {array_mode=}, must be 'list' or 'numpy'")
+
+
+def to_binary(obj: Any, compress: bool = False) -> bytes:
+    """Serialize an MSONable object to bytes, keeping its arrays as raw buffers.
+
+    Args:
+        obj (MSONable): The object to serialize. If its as_dict method accepts an
+            array_mode argument, the arrays are stored as NPZ entries instead of
+            being converted to lists.
+        compress (bool): Whether to compress the NPZ archive. Defaults to False,
+            which is faster to write and read.
+
+    Returns:
+        bytes: The NPZ archive, to be read back with from_binary.
+    """
+    if "array_mode" in inspect.signature(obj.as_dict).parameters:
+        dct = obj.as_dict(array_mode="numpy")
+    else:
+        dct = obj.as_dict()
+
+    arrays: dict[str, NDArray] = {}
+
+    def extract_arrays(value: Any) -> Any:
+        """Replace the non-object arrays in value by references to NPZ entries."""
+        if isinstance(value, dict):
+            return {key: extract_arrays(val) for key, val in value.items()}
+        if isinstance(value, list | tuple):
+            return [extract_arrays(val) for val in value]
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            name = f"arr_{len(arrays)}"
+            arrays[name] = value
+            return {_ARRAY_KEY: name}
+        return value
+
+    header = json.dumps(extract_arrays(dct), cls=MontyEncoder).encode()
+    buffer = io.BytesIO()
+    save = np.savez_compressed if compress else np.savez
+    save(buffer, **{_JSON_KEY: np.frombuffer(header, dtype=np.uint8)}, **arrays)
+    return buffer.getvalue()
+
+
+def from_binary(data: bytes | str | PathLike) -> Any:
+    """Deserialize an object written by to_binary.
+
+    Args:
+        data (bytes | str | PathLike): The bytes returned by to_binary, or the
+            path to a file holding them.
+
+    Returns:
+        The deserialized object.
+    """
+    source = io.BytesIO(data) if isinstance(data, bytes) else data
+    with np.load(source, allow_pickle=False) as npz:
+        arrays = {key: npz[key] for key in npz.files}
+    header = arrays.pop(_JSON_KEY).tobytes().decode()
+
+    def restore_array(dct: dict) -> Any:
+        """Swap the array references back for the arrays."""
+        return arrays[dct[_ARRAY_KEY]] if dct.keys() == {_ARRAY_KEY} else dct
+
+    return MontyDecoder().process_decoded(json.loads(header, object_hook=restore_array))
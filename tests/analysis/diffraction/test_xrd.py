@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose
 from pytest import approx
 
-from pymatgen.analysis.diffraction.xrd import XRDCalculator
+from pymatgen.analysis.diffraction.core import get_scatterers, get_structure_factors
+from pymatgen.analysis.diffraction.xrd import XRDCalculator, get_atomic_scattering_factors
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Structure
 from pymatgen.util.testing import PymatgenTest
@@ -89,3 +92,32 @@ class TestXRDCalculator(PymatgenTest):
         assert xrd.x[0] == approx(40.294828554672264)
         assert xrd.y[0] == approx(2377745.2296686019)
         assert xrd.d_hkls[0] == approx(2.2382050944897789)
+
+    def test_get_patterns(self):
+        structs = [self.get_structure(name) for name in ("CsCl", "Graphite", "LiFePO4")]
+        xrd_calc = XRDCalculator()
+        expected = [xrd_calc.get_pattern(struct, two_theta_range=(10, 80)) for struct in structs]
+        for n_jobs in (1, 2):
+            patterns = xrd_calc.get_patterns(structs, two_theta_range=(10, 80), n_jobs=n_jobs)
+            assert len(patterns) == len(structs)
+            for pattern, ref in zip(patterns, expected, strict=True):
+                assert_allclose(pattern.x, ref.x)
+                assert_allclose(pattern.y, ref.y)
+                assert pattern.hkls == ref.hkls
+
+    def test_get_structure_factors(self):
+        # The vectorized kernel must agree with an explicit loop over reflections
+        struct = self.get_structure("LiFePO4")
+        hkls = np.array([[1, 0, 0], [1, 1, 1], [2, -1, 3], [0, 4, 1]])
+        species, species_indices, frac_coords, occus = get_scatterers(struct)
+        assert len(frac_coords) == len(struct)
+        assert [sp.symbol for sp in species] == ["Li", "Fe", "P", "O"]
+        s2 = np.linspace(0.01, 0.2, len(hkls))
+        species_factors = get_atomic_scattering_factors(species, s2)
+        f_hkl = get_structure_factors(hkls, frac_coords, species_factors, species_indices, occus, chunk_size=10)
+        for idx, hkl in enumerate(hkls):
+            expected = sum(
+                species_factors[idx, sp_idx] * np.exp(2j * np.pi * np.dot(hkl, site.frac_coords))
+                for sp_idx, site in zip(species_indices, struct, strict=True)
+            )
+            assert f_hkl[idx] == approx(expected)
@@ -18,6 +18,7 @@ from pymatgen.analysis.elasticity.elastic import (
     diff_fit,
     find_eq_stress,
     generate_pseudo,
+    get_batch_property_dict,
     get_diff_coeff,
     get_strain_state_dict,
 )
@@ -105,6 +106,10 @@ class TestElasticTensor(PymatgenTest):
     def test_directional_elastic_mod(self):
         assert self.elastic_tensor_1.directional_elastic_mod([1, 0, 0]) == approx(self.elastic_tensor_1.voigt[0, 0])
         assert self.elastic_tensor_1.directional_elastic_mod([1, 1, 1]) == approx(73.624444444)
+        directions = np.random.default_rng(0).normal(size=(20, 3))
+        moduli = self.elastic_tensor_1.directional_elastic_mod(directions)
+        assert moduli.shape == (20,)
+        assert moduli == approx([self.elastic_tensor_1.directional_elastic_mod(n) for n in directions])
 
     def test_compliance_tensor(self):
         stress = self.elastic_tensor_1.calculate_stress([0.01] + [0] * 5)
@@ -115,6 +120,14 @@ class TestElasticTensor(PymatgenTest):
     def test_directional_poisson_ratio(self):
         v_12 = self.elastic_tensor_1.directional_poisson_ratio([1, 0, 0], [0, 1, 0])
         assert v_12 == approx(0.321388)
+        directions, secondary = np.eye(3), np.roll(np.eye(3), -1, axis=0)
+        ratios = self.elastic_tensor_1.directional_poisson_ratio(directions, secondary)
+        assert ratios[0] == approx(v_12)
+        assert ratios == approx(
+            [self.elastic_tensor_1.directional_poisson_ratio(n, m) for n, m in zip(directions, secondary, strict=True)]
+        )
+        with pytest.raises(ValueError, match="n and m must be orthogonal"):
+            self.elastic_tensor_1.directional_poisson_ratio(np.eye(3), np.eye(3))
 
     def test_structure_based_methods(self):
         # trans_velocity
@@ -173,6 +186,27 @@ class TestElasticTensor(PymatgenTest):
         noval_sprop_dict = test_et.get_structure_property_dict(struct, ignore_errors=True)
         assert noval_sprop_dict["snyder_ac"] is None
 
+    def test_get_batch_property_dict(self):
+        unphysical = ElasticTensor.from_voigt(self.voigt_1)
+        unphysical[0, 0, 0, 0] = -100000
+        tensors = [self.elastic_tensor_1, ElasticTensor.from_voigt(2 * np.array(self.voigt_1)), unphysical]
+        structures = [self.structure, self.get_structure("Si"), self.structure]
+        props = get_batch_property_dict(tensors, structures)
+        for idx, (tensor, struct) in enumerate(zip(tensors, structures, strict=True)):
+            struct_prop_dict = tensor.get_structure_property_dict(struct, ignore_errors=True)
+            for key, values in props.items():
+                if struct_prop_dict[key] is None:
+                    assert np.isnan(values[idx])
+                else:
+                    assert values[idx] == approx(struct_prop_dict[key])
+        assert "debye_temperature" not in get_batch_property_dict(tensors)
+
+        voigt_props = get_batch_property_dict([tensor.voigt for tensor in tensors])
+        for key, values in voigt_props.items():
+            assert values == approx(props[key])
+        with pytest.raises(ValueError, match="Got 1 structures for 3 elastic tensors"):
+            get_batch_property_dict(tensors, structures[:1])
+
     def test_new(self):
         assert_allclose(self.elastic_tensor_1, ElasticTensor(self.ft))
         non_symm = self.ft
@@ -469,6 +503,10 @@ class TestDiffFit(PymatgenTest):
             assert len(pseudo_inverses) == order - 1
             assert pseudo_inverses[0].shape == (21, 36)
             assert len(absent_symbols) == len(pseudo_inverses)
+        assert absent_symbols[0] == set()
+        # only normal strains cannot determine the shear constants
+        _, absent_symbols = generate_pseudo(np.eye(6)[:3].tolist(), order=2)
+        assert {str(symbol) for symbol in absent_symbols[0]} == {"c_33", "c_34", "c_35", "c_44", "c_45", "c_55"}
 
     def test_fit(self):
         diff_fit(self.strains, self.pk_stresses, self.data_dict["eq_stress"])
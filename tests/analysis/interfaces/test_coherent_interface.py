@@ -50,6 +50,27 @@ class TestInterfaceBuilder(PymatgenTest):
         # no apparent reason. The author should fix this.
         assert len(list(builder.get_interfaces(termination=("O2_Pmmm_1", "Si_R-3m_1")))) >= 6
 
+    def test_get_interface(self):
+        builder = CoherentInterfaceBuilder(
+            film_structure=self.sio2_conventional,
+            substrate_structure=self.si_conventional,
+            film_miller=(1, 0, 0),
+            substrate_miller=(1, 1, 1),
+        )
+        termination = builder.terminations[0]
+        interfaces = list(builder.get_interfaces(termination, film_thickness=2))
+        assert len(interfaces) == len(builder.zsl_matches)
+
+        # slabs are generated once per termination and thickness
+        n_slabs = len(builder._slabs)
+        interface = builder.get_interface(termination, builder.zsl_matches[-1], film_thickness=2)
+        assert len(builder._slabs) == n_slabs
+        assert interface == interfaces[-1]
+        assert interface.interface_properties["termination"] == termination
+
+        parallel_interfaces = list(builder.get_interfaces(termination, film_thickness=2, n_jobs=2))
+        assert parallel_interfaces == interfaces
+
 
 class TestCoherentInterfaceBuilder(unittest.TestCase):
     def setUp(self):
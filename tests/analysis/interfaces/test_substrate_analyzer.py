@@ -35,6 +35,12 @@ def test_substrate_analyzer_init():
     for match in matches:
         assert isinstance(match.match_area, float)
 
+    parallel_matches = list(analyzer.calculate(film, substrate, film_elastic_tensor, lowest=True, n_jobs=2))
+    lowest_matches = list(analyzer.calculate(film, substrate, film_elastic_tensor, lowest=True))
+    assert [(m.film_miller, m.substrate_miller, m.match_area) for m in parallel_matches] == [
+        (m.film_miller, m.substrate_miller, m.match_area) for m in lowest_matches
+    ]
+
 
 def test_generate_surface_vectors():
     film_miller_indices = [(1, 0, 0)]
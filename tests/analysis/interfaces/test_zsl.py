@@ -9,7 +9,9 @@ from pymatgen.analysis.interfaces.zsl import (
     fast_norm,
     get_factors,
     is_same_vectors,
+    is_same_vectors_batch,
     reduce_vectors,
+    reduce_vectors_batch,
     vec_area,
 )
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
@@ -66,3 +68,39 @@ class TestZSLGen(PymatgenTest):
         for match in matches:
             assert match is not None
             assert isinstance(match.match_area, float)
+
+    def test_batch_functions(self):
+        rng = np.random.default_rng(0)
+        vector_sets = rng.integers(-4, 5, size=(200, 2, 3)) * rng.random((200, 1, 1))
+        vector_sets = vector_sets[np.linalg.norm(np.cross(vector_sets[:, 0], vector_sets[:, 1]), axis=1) > 1e-3]
+        reduced = reduce_vectors_batch(vector_sets)
+        assert_array_equal(reduced, [reduce_vectors(*vecs) for vecs in vector_sets])
+
+        for bidirectional in (False, True):
+            same = is_same_vectors_batch(
+                reduced[:50], reduced, bidirectional=bidirectional, max_length_tol=0.2, max_angle_tol=0.2
+            )
+            expected = [
+                [
+                    is_same_vectors(vecs1, vecs2, bidirectional=bidirectional, max_length_tol=0.2, max_angle_tol=0.2)
+                    for vecs2 in reduced
+                ]
+                for vecs1 in reduced[:50]
+            ]
+            assert_array_equal(same, expected)
+
+    def test_get_matches_batch(self):
+        zsl_gen = ZSLGenerator()
+        vector_sets = [
+            (self.film.lattice.matrix[:2], self.substrate.lattice.matrix[:2]),
+            (self.substrate.lattice.matrix[:2], self.film.lattice.matrix[:2]),
+        ]
+        for n_jobs in (1, 2):
+            batch = zsl_gen.get_matches_batch(vector_sets, n_jobs=n_jobs)
+            assert len(batch) == 2
+            for matches, (film_vectors, substrate_vectors) in zip(batch, vector_sets, strict=True):
+                expected = list(zsl_gen(film_vectors, substrate_vectors))
+                assert len(matches) == len(expected)
+                for match, expected_match in zip(matches, expected, strict=True):
+                    assert_array_equal(match.film_sl_vectors, expected_match.film_sl_vectors)
+                    assert_array_equal(match.substrate_transformation, expected_match.substrate_transformation)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from unittest import TestCase
 
+import numpy as np
 import pandas as pd
 
 from pymatgen.analysis.magnetism.heisenberg import HeisenbergMapper
@@ -49,6 +50,26 @@ class TestHeisenbergMapper(TestCase):
             dists = hm.dists
             assert dists["nn"] == 2.51
 
+    def test_connections(self):
+        for hm in self.hms:
+            for sgraph, (sites, neighbors, images, dists) in zip(hm.sgraphs, hm._connections, strict=True):
+                expected = []
+                for idx in range(len(sgraph.structure)):
+                    expected += [(idx, cs.index, cs.jimage, cs.dist) for cs in sgraph.get_connected_sites(idx)]
+                assert len(sites) == len(expected)
+                assert set(zip(sites, neighbors, map(tuple, images), strict=True)) == {con[:3] for con in expected}
+                assert np.allclose(dists, [con[3] for con in expected])
+
+    def test_exchange_matrix(self):
+        for hm in self.hms:
+            ex_mat = hm.ex_mat
+            assert list(ex_mat.columns) == ["E", "E0", "0-1-nn", "1-1-nnn", "0-0-nnnn", "1-1-nnnn"]
+            assert ex_mat.shape == (5, 6)
+            assert (ex_mat["E0"] == 1).all()
+
+            hm_parallel = HeisenbergMapper(hm.ordered_structures_, hm.energies_, cutoff=5.0, tol=0.02, n_jobs=2)
+            pd.testing.assert_frame_equal(hm_parallel.ex_mat, ex_mat)
+
     def test_exchange_params(self):
         for hm in self.hms:
             ex_params = hm.get_exchange()
@@ -4,7 +4,7 @@ import pytest
 from pytest import approx
 
 from pymatgen.analysis.bond_valence import BVAnalyzer, calculate_bv_sum, calculate_bv_sum_unordered
-from pymatgen.core import Composition, Species, Structure
+from pymatgen.core import Composition, Lattice, Species, Structure
 from pymatgen.util.testing import TEST_FILES_DIR, PymatgenTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/analysis/bond_valence"
@@ -34,6 +34,18 @@ class TestBVAnalyzer(PymatgenTest):
         with pytest.raises(ValueError, match="Structure contains elements not in set of BV parameters: {Element Xe}"):
             self.analyzer.get_valences(self.get_structure("Li10GeP2S12").replace_species({"Li": "Xe"}, in_place=False))
 
+    def test_get_valences_without_symmetry(self):
+        # every site is searched separately, which needs pruning to stay tractable
+        struct = self.get_structure("LiFePO4")
+        ans = [1] * 4 + [2] * 4 + [5] * 4 + [-2] * 16
+        assert BVAnalyzer(symm_tol=0).get_valences(struct) == ans
+
+    def test_get_valences_batch(self):
+        structs = [self.get_structure("LiFePO4"), Structure(Lattice.cubic(3), ["Na", "Na"], [[0, 0, 0], [0.5] * 3])]
+        expected = [[1] * 4 + [2] * 4 + [5] * 4 + [-2] * 16, None]
+        assert self.analyzer.get_valences_batch(structs) == expected
+        assert self.analyzer.get_valences_batch(structs, n_jobs=2) == expected
+
     def test_get_oxi_state_structure(self):
         struct = Structure.from_file(f"{TEST_DIR}/LiMn2O4.json")
         oxi_struct = self.analyzer.get_oxi_state_decorated_structure(struct)
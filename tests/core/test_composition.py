@@ -6,13 +6,15 @@ Created on Nov 10, 2012.
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 from pytest import approx
 
 from pymatgen.core import Composition, DummySpecies, Element, Species
-from pymatgen.core.composition import ChemicalPotential
+from pymatgen.core.composition import ChemicalPotential, oxi_state_guesses_batch
 from pymatgen.util.testing import PymatgenTest
 
 
@@ -653,6 +655,44 @@ class TestComposition(PymatgenTest):
         with pytest.raises(ValueError, match="Composition V2 O3 cannot accommodate max_sites setting"):
             Composition("V2O3").oxi_state_guesses(max_sites=1)
 
+    def test_oxi_state_guesses_large_compositions(self):
+        # many sites of multivalent elements are solved without max_sites
+        guesses = Composition("Fe60O80").oxi_state_guesses()
+        assert guesses == ({"Fe": approx(8 / 3), "O": -2},)
+        guesses = Composition("Mn20Fe20O70").oxi_state_guesses()
+        assert guesses[0] == {"Mn": 4, "Fe": 3, "O": -2}
+        _, oxid_combos = Composition("Fe30O40")._get_oxi_state_guesses(
+            all_oxi_states=False, max_sites=None, oxi_states_override=None, target_charge=0
+        )
+        assert sorted(oxid_combos[0]["Fe"]) == [2] * 10 + [3] * 20
+
+    def test_oxi_state_guesses_cache(self):
+        comp = Composition("Fe3O4")
+        guesses = comp.oxi_state_guesses()
+        # results are cached but returned as copies
+        guesses[0]["Fe"] = 42
+        assert comp.oxi_state_guesses() == ({"Fe": approx(8 / 3), "O": -2},)
+        assert Composition("Fe3O4").oxi_state_guesses(target_charge=1) != guesses
+
+    def test_oxi_state_guesses_subclass(self):
+        # subclasses rank guesses with the same priors, cached separately from Composition
+        class SubComposition(Composition):
+            pass
+
+        # priors not loaded yet, so the subclass loads its own
+        with patch.object(Composition, "oxi_prob", None):
+            guesses = SubComposition("Fe3O4").oxi_state_guesses(all_oxi_states=True)
+            assert SubComposition.oxi_prob is not None
+        assert guesses[0] == {"Fe": approx(8 / 3), "O": -2}
+        assert guesses == Composition("Fe3O4").oxi_state_guesses(all_oxi_states=True)
+
+    def test_oxi_state_guesses_batch(self):
+        formulas = ["LiFeO2", Composition("Fe4O5"), "V2O4", "NiAl", "LiFeO2"]
+        expected = [Composition(formula).oxi_state_guesses() for formula in formulas]
+        assert oxi_state_guesses_batch(formulas) == expected
+        assert oxi_state_guesses_batch(formulas, n_jobs=2) == expected
+        assert oxi_state_guesses_batch(["VO2"], oxi_states_override={"V": [2, 3, 5]}) == [()]
+
     def test_oxi_state_decoration(self):
         # Basic test: Get compositions where each element is in a single charge state
         decorated = Composition("H2O").add_charges_from_oxi_state_guesses()
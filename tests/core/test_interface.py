@@ -299,6 +299,16 @@ class TestGrainBoundaryGenerator(PymatgenTest):
 
         assert sorted(true_100) == sorted(sigma_100)
 
+    def test_enum_sigma_memoized(self):
+        sigmas = GrainBoundaryGenerator.enum_sigma_ort(50, [1, 0, 0], [270, 30, 29])
+        sigmas[3].append(0.0)
+        del sigmas[5]
+        # the cached results are not affected by changes to the returned dict
+        sigmas_again = GrainBoundaryGenerator.enum_sigma_ort(50, [1, 0, 0], (270, 30, 29))
+        assert 5 in sigmas_again
+        assert 0.0 not in sigmas_again[3]
+        assert sigmas_again == GrainBoundaryGenerator.enum_sigma_ort(50, np.array([1, 0, 0]), [270, 30, 29])
+
     def test_enum_possible_plane_cubic(self):
         all_plane = GrainBoundaryGenerator.enum_possible_plane_cubic(4, [1, 1, 1], 60)
         assert len(all_plane["Twist"]) == 1
@@ -7,7 +7,7 @@ import pytest
 from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
-from pymatgen.core.lattice import Lattice, get_points_in_spheres
+from pymatgen.core.lattice import Lattice, get_all_distances_batch, get_points_in_sphere_batch, get_points_in_spheres
 from pymatgen.core.operations import SymmOp
 from pymatgen.util.testing import PymatgenTest
 
@@ -389,6 +389,32 @@ class TestLattice(PymatgenTest):
         types = {*map(type, result)}
         assert types == {np.ndarray}, f"Expected only np.ndarray, got {[t.__name__ for t in types]}"
 
+    def test_get_points_in_sphere_batch(self):
+        points = np.array(list(itertools.product(range(5), repeat=3))) / 5
+        lattices = [
+            Lattice([[1, 5, 0], [0, 1, 0], [5, 0, 1]]),
+            Lattice([[1, 5, 0], [0, 1, 0], [5, 0, 1]], pbc=(True, True, False)),
+            Lattice.cubic(10),
+        ]
+        frac_points = [lattice.get_fractional_coords(points) for lattice in lattices]
+        centers = [[[0, 0, 0], [0.5, 0.5, 0.5]], [[0, 0, 0]], [[0.5, 0.5, 0.5]]]
+
+        results = get_points_in_sphere_batch(lattices, frac_points, centers, [1.0001, 0.20001, 0.0001])
+        assert [len(res) for res in results] == [2, 1, 1]
+        for lattice, fcoords, cents, res, radius in zip(
+            lattices, frac_points, centers, results, [1.0001, 0.20001, 0.0001], strict=True
+        ):
+            for center, neighbors in zip(cents, res, strict=True):
+                expected = lattice.get_points_in_sphere(fcoords, center, radius)
+                assert len(neighbors) == len(expected)
+                assert sorted(nn[2] for nn in neighbors) == sorted(nn[2] for nn in expected)
+                assert sorted(nn[1] for nn in neighbors) == approx(sorted(nn[1] for nn in expected))
+        assert len(results[0][1]) == 552
+        assert results[2] == [[]]
+
+        with pytest.raises(ValueError, match="must have the same length"):
+            get_points_in_sphere_batch(lattices, frac_points[:1], centers, 1)
+
     def test_get_all_distances(self):
         frac_coords = np.array(
             [
@@ -432,6 +458,14 @@ class TestLattice(PymatgenTest):
         output3 = lattice_pbc.get_all_distances(frac_coords[:-1], frac_coords)
         assert_allclose(output3, expected_pbc, 3)
 
+    def test_get_all_distances_batch(self):
+        frac_coords = np.array([[0.3, 0.3, 0.5], [0.1, 0.1, 0.3], [0.9, 0.9, 0.8], [0.1, 0.0, 0.5]])
+        lattices = [Lattice.from_parameters(8, 8, 4, 90, 76, 58), Lattice.cubic(3), self.tetragonal]
+        distances = get_all_distances_batch(lattices, [frac_coords, frac_coords[0], [0, 0, 17]], [frac_coords] * 3)
+        for lattice, fcoords, dists in zip(lattices, [frac_coords, frac_coords[0], [0, 0, 17]], distances, strict=True):
+            assert_allclose(dists, lattice.get_all_distances(fcoords, frac_coords), atol=1e-10)
+        assert distances[1].shape == (1, 4)
+
     def test_monoclinic(self):
         assert self.monoclinic.angles == approx([90, 66, 90])
         assert self.monoclinic.lengths == approx([10, 20, 30])
@@ -1359,6 +1359,20 @@ class TestStructure(PymatgenTest):
         assert struct.formula == "Si8"
         assert_allclose(struct.lattice.abc, [7.6803959, 17.5979979, 7.6803959])
 
+    def test_mul_site_order_and_properties(self):
+        self.struct.add_site_property("magmom", [1, -1])
+        supercell = self.struct * [[1, 1, 0], [-1, 1, 0], [0, 0, 3]]
+        n_images = 6
+        assert len(supercell) == 2 * n_images
+        # images of each site are contiguous and carry its properties
+        assert supercell.site_properties["magmom"] == [1] * n_images + [-1] * n_images
+        frac_coords = supercell.frac_coords
+        assert np.all((frac_coords >= 0) & (frac_coords < 1))
+        for idx, site in enumerate(self.struct):
+            images = Structure.from_sites(supercell[idx * n_images : (idx + 1) * n_images])
+            frac_diff = self.struct.lattice.get_fractional_coords(images.cart_coords) - site.frac_coords
+            assert_allclose(frac_diff, np.round(frac_diff), atol=1e-8)
+
     def test_make_supercell(self):
         supercell = self.struct.make_supercell([2, 1, 1])
         assert supercell.formula == "Si4"
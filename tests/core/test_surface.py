@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import itertools
 import json
+import math
 import os
 import unittest
 
@@ -445,6 +447,9 @@ class TestSlabGenerator(PymatgenTest):
 
         # If we allow some broken bonds, there are a few slabs.
         assert len(gen.get_slabs(bonds={("P", "O"): 3, ("Fe", "O"): 3}, max_broken_bonds=2)) == 2
+        assert gen.get_slabs(bonds={("P", "O"): 3}, repair=True, n_jobs=2) == gen.get_slabs(
+            bonds={("P", "O"): 3}, repair=True
+        )
 
         # At this threshold, only the origin and center Li results in
         # clustering. All other sites are non-clustered. So the of
@@ -735,6 +740,14 @@ class TestMillerIndexFinder(PymatgenTest):
         indices = get_symmetrically_distinct_miller_indices(self.p1, 1)
         assert len(indices) == 13
 
+        # At higher index, P1 only pairs up each reduced index with its inverse
+        indices = get_symmetrically_distinct_miller_indices(self.p1, 5)
+        rng = range(-5, 6)
+        reduced = {tuple(i // abs(math.gcd(*hkl)) for i in hkl) for hkl in itertools.product(rng, rng, rng) if any(hkl)}
+        assert len(indices) == len(reduced) // 2
+        # the result is shared with other structures with the same lattice symmetry
+        assert get_symmetrically_distinct_miller_indices(self.tei, 5) == indices
+
         indices = get_symmetrically_distinct_miller_indices(self.graphite, 2)
         assert len(indices) == 12
 
@@ -826,6 +839,13 @@ class TestMillerIndexFinder(PymatgenTest):
         # termination for each distinct Miller _index
         assert len(miller_list) == len(all_miller_list)
 
+        # parallel generation gives the same slabs in the same order
+        slabs1_repair_parallel = generate_all_slabs(
+            self.lifepo4, 1, 10, 10, tol=0.1, bonds={("P", "O"): 3}, repair=True, n_jobs=2
+        )
+        assert slabs1_repair_parallel == slabs1_repair
+        assert [slab.shift for slab in slabs1_repair_parallel] == [slab.shift for slab in slabs1_repair]
+
     def test_miller_index_from_sites(self):
         """Test surface miller index convenience function."""
         # test on a cubic system
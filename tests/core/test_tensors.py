@@ -443,6 +443,22 @@ class TestTensorCollection(PymatgenTest):
         for t_input, tensor in zip(tc_input, tc, strict=True):
             assert_allclose(Tensor.from_voigt(t_input), tensor)
 
+    def test_stacked_tensors(self):
+        # tensors of the same rank are views into a single array, in the original order
+        tc = TensorCollection([np.eye(3), SquareTensor(2 * np.eye(3)), np.ones((3, 3, 3)), 3 * np.eye(3)])
+        assert tc.ranks == [2, 2, 3, 2]
+        stack = tc[0].base.base
+        assert stack.shape == (3, 3, 3)
+        assert tc[1].base.base is stack
+        assert tc[3].base.base is stack
+        assert tc[2].base.base is not stack
+        assert isinstance(tc[1], SquareTensor)
+        assert tc[1].voigt == approx([2, 2, 2, 0, 0, 0])
+        assert [type(tensor) for tensor in tc.rotate(np.eye(3))] == [Tensor, SquareTensor, Tensor, Tensor]
+        for tensor, tensor_fit in zip(tc, tc.fit_to_structure(self.struct), strict=True):
+            assert_allclose(tensor_fit, tensor.fit_to_structure(self.struct))
+        assert len(TensorCollection([]).zeroed()) == 0
+
     def test_serialization(self):
         # Test base serialize-deserialize
         dct = self.seq_tc.as_dict()
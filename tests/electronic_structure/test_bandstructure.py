@@ -12,14 +12,17 @@ from pytest import approx
 
 from pymatgen.core.lattice import Lattice
 from pymatgen.electronic_structure.bandstructure import (
+    BandStructure,
     BandStructureSymmLine,
     Kpoint,
+    KpointArray,
     LobsterBandStructureSymmLine,
     get_reconstructed_band_structure,
 )
 from pymatgen.electronic_structure.core import Orbital, Spin
 from pymatgen.electronic_structure.plotter import BSPlotterProjected
 from pymatgen.io.vasp import BSVasprun
+from pymatgen.util.serialization import from_binary, to_binary
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, VASP_OUT_DIR, PymatgenTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/electronic_structure/bandstructure"
@@ -68,6 +71,43 @@ class TestKpoint(TestCase):
         assert kpoint.label == "X"
 
 
+class TestKpointArray(TestCase):
+    def setUp(self):
+        self.lattice = Lattice.cubic(10.0)
+        coords = [[0, 0, 0], [0.1, 0, 0], [0.25, 0, 0], [0.5, 0, 0], [0.5, 0, 0], [0.5, 0.25, 0]]
+        self.kpoints, self.labels_dict = KpointArray.from_coords(
+            coords, self.lattice, {"G": [0, 0, 0], "X": [0.5, 0, 0]}
+        )
+
+    def test_from_coords(self):
+        assert len(self.kpoints) == 6
+        assert self.kpoints.labels == ["G", None, None, "X", "X", None]
+        assert_allclose(self.kpoints.cart_coords[2], [2.5, 0, 0])
+        assert list(self.labels_dict) == ["G", "X"]
+        assert self.labels_dict["X"] == Kpoint([0.5, 0, 0], self.lattice, label="X")
+
+    def test_getitem(self):
+        kpoint = self.kpoints[3]
+        assert kpoint == Kpoint([0.5, 0, 0], self.lattice, label="X")
+        assert self.kpoints[-3] is kpoint
+        assert self.kpoints[1:3] == [self.kpoints[1], self.kpoints[2]]
+        assert list(self.kpoints) == [self.kpoints[idx] for idx in range(6)]
+        with pytest.raises(IndexError):
+            self.kpoints[6]
+
+        # label changes on the Kpoint views are kept
+        self.kpoints[1].label = "A"
+        assert self.kpoints.labels[1] == "A"
+
+    def test_get_distances_and_branches(self):
+        distances, branches = self.kpoints.get_distances_and_branches()
+        assert distances == approx([0, 1, 2.5, 5, 5, 7.5])
+        assert branches == [
+            {"start_index": 0, "end_index": 3, "name": "G-X"},
+            {"start_index": 4, "end_index": 5, "name": "X-None"},
+        ]
+
+
 class TestBandStructureSymmLine(PymatgenTest):
     def setUp(self):
         self.bs: BandStructureSymmLine = loadfn(f"{TEST_DIR}/Cu2O_361_bandstructure.json")
@@ -188,6 +228,27 @@ class TestBandStructureSymmLine(PymatgenTest):
         bg_cbm0 = self.bs_cbm0.get_band_gap()
         assert bg_cbm0["energy"] == approx(0, abs=1e-3), "wrong gap energy"
 
+    def test_get_band_edges_spin_ties(self):
+        # the VBM and CBM are degenerate between the spin channels, the first spin is used
+        bands = {
+            Spin.up: np.array([[-1, -0.5, -1], [1, 2, 0.5]]),
+            Spin.down: np.array([[-0.5, -0.7, -2], [0.5, 1, 1]]),
+        }
+        bs = BandStructure([[0, 0, 0], [0.25, 0, 0], [0.5, 0, 0]], bands, Lattice.cubic(1), 0)
+        assert not bs.is_metal()
+        vbm, cbm = bs.get_vbm(), bs.get_cbm()
+        assert (vbm["energy"], vbm["kpoint_index"], dict(vbm["band_index"])) == (-0.5, [1], {Spin.up: [0]})
+        assert (cbm["energy"], cbm["kpoint_index"], dict(cbm["band_index"])) == (0.5, [2], {Spin.up: [1]})
+        assert bs.get_band_gap() == {
+            "energy": 1.0,
+            "direct": False,
+            "transition": "(0.250,0.000,0.000)-(0.500,0.000,0.000)",
+        }
+        assert bs.get_direct_band_gap() == approx(1.0)
+
+        bands[Spin.down][0, 1] = 0.5
+        assert BandStructure([[0, 0, 0], [0.25, 0, 0], [0.5, 0, 0]], bands, Lattice.cubic(1), 0).is_metal()
+
     def test_get_sym_eq_kpoints_and_degeneracy(self):
         bs = self.bs2
         cbm_k = bs.get_cbm()["kpoint"].frac_coords
@@ -203,6 +264,12 @@ class TestBandStructureSymmLine(PymatgenTest):
         vbm_eqs = bs.get_sym_eq_kpoints(vbm_k)
         assert [0.0, 0.0, 0.0] in vbm_eqs
 
+        # the point group is recomputed when the structure is replaced
+        distorted = bs.structure.copy()
+        distorted.translate_sites([0], [0.05, 0.02, 0.01])
+        bs.structure = distorted
+        assert bs.get_kpoint_degeneracy(cbm_k) == 1
+
     def test_as_dict(self):
         expected_keys = {
             "@module",
@@ -228,6 +295,42 @@ class TestBandStructureSymmLine(PymatgenTest):
         d3 = self.bs_spin.as_dict()
         assert set(d3) >= expected_keys, f"{expected_keys - set(d3)=}"
 
+        d4 = self.bs.as_dict(array_mode="numpy")
+        assert isinstance(d4["kpoints"], np.ndarray)
+        assert d4["projections"]["1"] is self.bs.projections[Spin.up]
+        with pytest.raises(ValueError, match="Invalid array_mode='nested'"):
+            self.bs.as_dict(array_mode="nested")
+
+    def test_binary_round_trip(self):
+        for bs in (self.bs, self.bs_spin):
+            bs_loaded = from_binary(to_binary(bs))
+            assert isinstance(bs_loaded, BandStructureSymmLine)
+            assert_allclose(bs_loaded.kpoints.frac_coords, bs.kpoints.frac_coords)
+            assert bs_loaded.kpoints.labels == bs.kpoints.labels
+            assert bs_loaded.branches == bs.branches
+            assert_allclose(bs_loaded.distance, bs.distance)
+            for spin, bands in bs.bands.items():
+                assert_allclose(bs_loaded.bands[spin], bands)
+            for spin, projections in bs.projections.items():
+                assert_allclose(bs_loaded.projections[spin], projections)
+            assert bs_loaded.structure == bs.structure
+            assert bs_loaded.get_band_gap() == bs.get_band_gap()
+
+    def test_init_copies_arrays(self):
+        kpoints = np.array(self.bs.kpoints.frac_coords)
+        bands = {spin: np.array(bands) for spin, bands in self.bs.bands.items()}
+        projections = {spin: np.array(proj) for spin, proj in self.bs.projections.items()}
+        bs = BandStructure(
+            kpoints, bands, self.bs.lattice_rec, self.bs.efermi, structure=self.bs.structure, projections=projections
+        )
+        # the band structure does not share its arrays with the caller
+        kpoints[0] += 1
+        bands[Spin.up][0, 0] += 1
+        projections[Spin.up][0, 0] += 1
+        assert_allclose(bs.kpoints.frac_coords, self.bs.kpoints.frac_coords)
+        assert_allclose(bs.bands[Spin.up], self.bs.bands[Spin.up])
+        assert_allclose(bs.projections[Spin.up], self.bs.projections[Spin.up])
+
     def test_old_format_load(self):
         with open(f"{TEST_DIR}/bs_ZnS_old.json") as file:
             dct = json.load(file)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 import numpy as np
 import pytest
 from monty.serialization import loadfn
+from numpy.testing import assert_allclose
 from pytest import approx
 
 from pymatgen.electronic_structure.core import OrbitalType, Spin
@@ -163,6 +166,19 @@ class TestBztInterpolator(TestCase):
         assert self.bztInterp_sp.data.nelect_all == 10.0
         assert self.bztInterp_sp.data.ebands.shape == (10, 198)
 
+    def test_cache_dir(self):
+        with TemporaryDirectory() as cache_dir:
+            interp = BztInterpolator(self.loader, lpfac=2, cache_dir=cache_dir)
+            cache_file = f"bztInterp_{interp.get_cache_key(lpfac=2)}.json.gz"
+            assert os.listdir(cache_dir) == [cache_file]
+            interp_cached = BztInterpolator(self.loader, lpfac=2, cache_dir=cache_dir)
+            assert_allclose(interp_cached.coeffs, interp.coeffs)
+            assert_allclose(interp_cached.eband, interp.eband)
+
+            # a different lpfac gives a new interpolation
+            BztInterpolator(self.loader, lpfac=3, cache_dir=cache_dir)
+            assert len(os.listdir(cache_dir)) == 2
+
     def test_get_band_structure(self):
         sbs = self.bztInterp.get_band_structure()
         assert sbs is not None
@@ -285,6 +301,9 @@ class TestBztTransportProperties(TestCase):
 
     def test_compute_properties_doping(self):
         self.bztTransp.compute_properties_doping(doping=10.0 ** np.arange(20, 22))
+        conductivity = self.bztTransp.Conductivity_doping["n"]
+        self.bztTransp.compute_properties_doping(doping=10.0 ** np.arange(20, 22), n_jobs=2)
+        assert_allclose(self.bztTransp.Conductivity_doping["n"], conductivity)
         for p in [
             self.bztTransp.Conductivity_doping,
             self.bztTransp.Seebeck_doping,
@@ -13,7 +13,7 @@ from pytest import approx
 
 from pymatgen.core import Element, Structure
 from pymatgen.electronic_structure.core import Orbital, OrbitalType, Spin
-from pymatgen.electronic_structure.dos import DOS, CompleteDos, FermiDos, LobsterCompleteDos
+from pymatgen.electronic_structure.dos import DOS, CompleteDos, Dos, DosFingerprintMatrix, FermiDos, LobsterCompleteDos
 from pymatgen.util.testing import TEST_FILES_DIR, PymatgenTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/electronic_structure/dos"
@@ -166,6 +166,63 @@ class TestCompleteDos(TestCase):
         # The sums of the SPD or the element doses should be the same.
         assert (abs(sum_spd.energies - sum_element.energies) < 0.0001).all()
 
+    def test_pdos_array(self):
+        struct = Structure(
+            [[3, 0, 0], [0, 3, 0], [0, 0, 3]], ["Fe", "O", "Fe"], [[0, 0, 0], [0.5, 0.5, 0.5], [0, 0.5, 0]]
+        )
+        energies = np.linspace(-5, 5, 11)
+        rng = np.random.default_rng(0)
+        orbitals = {0: [Orbital.s, Orbital.dxy, Orbital.dz2], 1: [Orbital.s, Orbital.px], 2: [Orbital.dz2, Orbital.s]}
+        pdoss = {
+            struct[idx]: {orb: {Spin.up: rng.random(11), Spin.down: rng.random(11)} for orb in orbs}
+            for idx, orbs in orbitals.items()
+        }
+        total_dos = Dos(0, energies, {Spin.up: np.zeros(11), Spin.down: np.zeros(11)})
+        dos = CompleteDos(struct, total_dos, pdoss)
+
+        # the stored densities are views into one array
+        site_s_dos = dos.pdos[struct[0]][Orbital.s][Spin.up]
+        assert site_s_dos.base is dos.pdos[struct[2]][Orbital.s][Spin.down].base
+        assert site_s_dos.base.shape == (3, 4, 2, 11)
+
+        def manual_sum(pairs):
+            return {spin: sum(pdoss[struct[idx]][orb][spin] for idx, orb in pairs) for spin in (Spin.up, Spin.down)}
+
+        expected_spd = {
+            OrbitalType.s: manual_sum([(0, Orbital.s), (1, Orbital.s), (2, Orbital.s)]),
+            OrbitalType.d: manual_sum([(0, Orbital.dxy), (0, Orbital.dz2), (2, Orbital.dz2)]),
+            OrbitalType.p: manual_sum([(1, Orbital.px)]),
+        }
+        spd_dos = dos.get_spd_dos()
+        assert list(spd_dos) == list(expected_spd)
+        for orb_type, densities in expected_spd.items():
+            for spin, dens in densities.items():
+                assert_allclose(spd_dos[orb_type].densities[spin], dens)
+
+        # orbital types are only reported for sites and elements that have them
+        assert list(dos.get_site_spd_dos(struct[1])) == [OrbitalType.s, OrbitalType.p]
+        assert list(dos.get_element_spd_dos("Fe")) == [OrbitalType.s, OrbitalType.d]
+        assert dos.get_element_spd_dos("Li") == {}
+        assert_allclose(
+            dos.get_element_spd_dos("Fe")[OrbitalType.d].densities[Spin.up], expected_spd[OrbitalType.d][Spin.up]
+        )
+
+        el_dos = dos.get_element_dos()
+        assert list(el_dos) == [Element.Fe, Element.O]
+        fe_pairs = [(0, Orbital.s), (0, Orbital.dxy), (0, Orbital.dz2), (2, Orbital.dz2), (2, Orbital.s)]
+        assert_allclose(el_dos[Element.Fe].densities[Spin.down], manual_sum(fe_pairs)[Spin.down])
+        assert_allclose(
+            dos.get_site_dos(struct[2]).densities[Spin.up], manual_sum([(2, Orbital.dz2), (2, Orbital.s)])[Spin.up]
+        )
+
+        # cached results are not affected by changes to the returned DOS, but are reset with the PDOSs
+        el_dos[Element.O].densities[Spin.up][:] = 0
+        o_pairs = [(1, Orbital.s), (1, Orbital.px)]
+        assert_allclose(dos.get_element_dos()[Element.O].densities[Spin.up], manual_sum(o_pairs)[Spin.up])
+        dos.pdos = {struct[1]: {Orbital.s: {Spin.up: np.ones(11), Spin.down: np.ones(11)}}}
+        assert list(dos.get_element_dos()) == [Element.O]
+        assert_allclose(dos.get_spd_dos()[OrbitalType.s].densities[Spin.up], np.ones(11))
+
     def test_str(self):
         assert str(self.dos).startswith("Complete DOS for Full Formula (Li1 Fe4 P4 O16)\nReduced Formula: LiFe4(PO4)4")
 
@@ -307,6 +364,60 @@ class TestCompleteDos(TestCase):
             self.dos.get_dos_fp_similarity(dos_fp, dos_fp2, col=1, metric=metric, normalize=False)
 
 
+class TestDosFingerprintMatrix(TestCase):
+    def setUp(self):
+        with open(f"{TEST_DIR}/complete_dos.json") as file:
+            self.dos = CompleteDos.from_dict(json.load(file))
+        self.fps = [
+            self.dos.get_dos_fp(fp_type=fp_type, min_e=min_e, max_e=5, n_bins=64, normalize=normalize)
+            for fp_type in ("s", "p", "summed_pdos", "tdos")
+            for min_e in (-10, -8, -5)
+            for normalize in (True, False)
+        ]
+        self.fp_matrix = DosFingerprintMatrix.from_fingerprints(self.fps)
+
+    def test_from_fingerprints(self):
+        assert self.fp_matrix.densities.shape == (24, 64)
+        assert self.fp_matrix.n_fingerprints == 24
+        assert self.fp_matrix.bin_widths[1] == approx(self.fps[1].bin_width)
+        with pytest.raises(ValueError, match="All fingerprints must have the same number of bins"):
+            DosFingerprintMatrix.from_fingerprints([self.fps[0], self.dos.get_dos_fp(n_bins=32)])
+
+    def test_get_top_k_similar(self):
+        for metric, normalize in (
+            ("tanimoto", False),
+            ("cosine-sim", True),
+            ("cosine-sim", False),
+            ("wasserstein", False),
+        ):
+            expected = [
+                CompleteDos.get_dos_fp_similarity(self.fps[3], fp, metric=metric, normalize=normalize)
+                for fp in self.fps
+            ]
+            order = np.argsort(expected)
+            if metric != "wasserstein":
+                order = order[::-1]
+
+            # the chunks are smaller than the matrix and k
+            indices, similarities = self.fp_matrix.get_top_k_similar(
+                self.fps[3], k=5, metric=metric, normalize=normalize, chunk_size=4
+            )
+            assert_allclose(similarities, np.array(expected)[order[:5]])
+            assert_allclose(np.array(expected)[indices], similarities)
+
+        # several queries at once
+        queries = DosFingerprintMatrix.from_fingerprints(self.fps[:3])
+        indices, similarities = self.fp_matrix.get_top_k_similar(queries, k=30, chunk_size=7)
+        assert indices.shape == similarities.shape == (3, 24)
+        assert_allclose(indices[:, 0], [0, 1, 2])
+        assert_allclose(similarities[:, 0], 1)
+
+        with pytest.raises(ValueError, match="Cannot compute similarity index"):
+            self.fp_matrix.get_top_k_similar(self.fps[0], metric="tanimoto", normalize=True)
+        with pytest.raises(ValueError, match="Invalid metric='euclidean'"):
+            self.fp_matrix.get_top_k_similar(self.fps[0], metric="euclidean")
+
+
 class TestDOS(PymatgenTest):
     def setUp(self):
         with open(f"{TEST_DIR}/complete_dos.json") as file:
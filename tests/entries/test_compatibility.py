@@ -485,16 +485,23 @@ class TestMaterialsProjectCompatibility(TestCase):
         assert len(entries) == 2
 
     def test_parallel_process_entries(self):
-        with pytest.raises(ValueError, match="Parallel processing is not possible with for 'inplace=True'"):
-            entries = self.compat.process_entries(
-                [self.entry1, self.entry2, self.entry3, self.entry4], inplace=True, n_workers=2
-            )
-
         entries = self.compat.process_entries(
             [self.entry1, self.entry2, self.entry3, self.entry4], inplace=False, n_workers=2
         )
         assert len(entries) == 2
 
+        serial = self.compat.process_entries(copy.deepcopy([self.entry1, self.entry2, self.entry3, self.entry4]))
+        entries = self.compat.process_entries(
+            [self.entry1, self.entry2, self.entry3, self.entry4], inplace=True, n_workers=2
+        )
+        assert [entry.entry_id for entry in entries] == [entry.entry_id for entry in serial]
+        assert entries[0] is self.entry1
+        for entry, serial_entry in zip(entries, serial, strict=True):
+            assert [(ea.name, ea.value) for ea in entry.energy_adjustments] == [
+                (ea.name, ea.value) for ea in serial_entry.energy_adjustments
+            ]
+            assert entry.correction == approx(serial_entry.correction)
+
     def test_msonable(self):
         compat_dict = self.compat.as_dict()
         decoder = MontyDecoder()
@@ -996,6 +1003,24 @@ class TestMaterialsProjectCompatibility2020(TestCase):
         entries = self.compat.process_entries([self.entry1, self.entry2, self.entry3])
         assert len(entries) == 2
 
+    def test_parallel_process_entries_inplace(self):
+        serial = self.compat.process_entries(copy.deepcopy([self.entry1, self.entry2, self.entry3]))
+        for entry in (self.entry1, self.entry2, self.entry3):
+            entry.data.pop("oxidation_states", None)
+
+        entries = self.compat.process_entries([self.entry1, self.entry2, self.entry3], inplace=True, n_workers=2)
+        assert len(entries) == 2
+        assert entries[0] is self.entry1
+        # data filled in by the workers is copied back to the original entries
+        assert self.entry1.data["oxidation_states"] == serial[0].data["oxidation_states"]
+        for entry, serial_entry in zip(entries, serial, strict=True):
+            assert [(ea.name, ea.value) for ea in entry.energy_adjustments] == [
+                (ea.name, ea.value) for ea in serial_entry.energy_adjustments
+            ]
+
+        with pytest.raises(CompatibilityError, match="Invalid U value"):
+            self.compat.process_entries([self.entry3], inplace=True, n_workers=2, on_error="raise")
+
     def test_config_file(self):
         config_file = Path(f"{TEST_FILES_DIR}/entries/compatibility/MP2020Compatibility_alternate.yaml")
         compat = MaterialsProject2020Compatibility(config_file=config_file)
@@ -1903,12 +1928,15 @@ class TestMaterialsProjectAqueousCompatibility:
             o2_energy=-10, h2o_energy=-20, h2o_adjustments=-0.5, solid_compat=None
         )
 
-        with pytest.raises(ValueError, match="Parallel processing is not possible with for 'inplace=True'"):
-            entries = compat.process_entries(entry_list, inplace=True, n_workers=2)
-
         entries = compat.process_entries(entry_list, inplace=False, n_workers=2, on_error="raise")
         assert len(entries) == 2
 
+        serial = compat.process_entries(copy.deepcopy(entry_list), on_error="raise")
+        entries = compat.process_entries(entry_list, inplace=True, n_workers=2, on_error="raise")
+        assert entries == entry_list
+        for entry, serial_entry in zip(entries, serial, strict=True):
+            assert entry.correction == approx(serial_entry.correction)
+
 
 class TestAqueousCorrection(TestCase):
     def setUp(self):
@@ -22,6 +22,13 @@ class TestFunc(PymatgenTest):
         assert len(groups) < len(entries)
         # Make sure no entries are left behind
         assert sum(len(g) for g in groups) == len(entries)
+        # groups are ordered by their first entry and keep the input order
+        assert groups[0][0] is entries[0]
+        first_indices = [entries.index(g[0]) for g in groups]
+        assert first_indices == sorted(first_indices)
+
+        parallel_groups = group_entries_by_structure(entries, ncpus=2)
+        assert [[e.entry_id for e in g] for g in parallel_groups] == [[e.entry_id for e in g] for g in groups]
 
     def test_group_entries_by_composition(self):
         entries = [
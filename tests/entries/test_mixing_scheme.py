@@ -1179,6 +1179,43 @@ class TestMaterialsProjectDFTMixingSchemeArgs:
             assert entry.correction == 0
             assert entry.parameters["run_type"] == "R2SCAN"
 
+    def test_mixing_state_multiple_chemsys(self, mixing_scheme_no_compat, ms_complete):
+        """Mixing state data is computed per chemical system, in parallel and with a cache."""
+        li_entries = [
+            ComputedStructureEntry(
+                Structure(lattice1, ["Li"], [[0, 0, 0]]), -2, parameters={"run_type": "GGA"}, entry_id="gga-li"
+            ),
+            ComputedStructureEntry(
+                Structure(lattice1, ["Li"], [[0, 0, 0]]), -3, parameters={"run_type": "R2SCAN"}, entry_id="r2scan-li"
+            ),
+        ]
+        entries = ms_complete.all_entries + li_entries
+        state_data = mixing_scheme_no_compat.get_mixing_state_data(entries)
+        assert len(state_data) == len(ms_complete.state_data) + 1
+        # the Sn-Br rows are unaffected by the entries in the separate Li chemical system
+        sn_br_rows = state_data[state_data["formula"] != "Li"].reset_index(drop=True)
+        pd.testing.assert_frame_equal(sn_br_rows, ms_complete.state_data)
+
+        pd.testing.assert_frame_equal(mixing_scheme_no_compat.get_mixing_state_data(entries, n_workers=2), state_data)
+
+        cache: dict = {}
+        pd.testing.assert_frame_equal(
+            mixing_scheme_no_compat.get_mixing_state_data(entries, mixing_state_cache=cache), state_data
+        )
+        assert len(cache) == 2
+        cached = {key[1]: val for key, val in cache.items()}
+
+        # a new R2SCAN entry for Li only invalidates the Li chemical system
+        new_entry = ComputedStructureEntry(
+            Structure(lattice2, ["Li"], [[0, 0, 0]]), -4, parameters={"run_type": "R2SCAN"}, entry_id="r2scan-li-2"
+        )
+        state_data = mixing_scheme_no_compat.get_mixing_state_data([*entries, new_entry], mixing_state_cache=cache)
+        assert "r2scan-li-2" in state_data["entry_id_2"].to_numpy()
+        assert len(cache) == 2
+        new_cached = {key[1]: val for key, val in cache.items()}
+        assert new_cached[frozenset({"Sn", "Br"})] is cached[frozenset({"Sn", "Br"})]
+        assert new_cached[frozenset({"Li"})] is not cached[frozenset({"Li"})]
+
     def test_alternate_structure_matcher(self, ms_complete):
         """
         Test alternate structure matcher kwargs. By setting scale to False, entries
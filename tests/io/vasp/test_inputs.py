@@ -35,6 +35,8 @@ from pymatgen.io.vasp.inputs import (
     UnknownPotcarWarning,
     VaspInput,
     _gen_potcar_summary_stats,
+    _load_potcar_summary_stats,
+    _load_potcar_summary_stats_file,
 )
 from pymatgen.util.testing import FAKE_POTCAR_DIR, TEST_FILES_DIR, VASP_IN_DIR, VASP_OUT_DIR, PymatgenTest
 
@@ -1465,6 +1467,40 @@ def test_potcar_summary_stats() -> None:
         assert actual == expected, f"{key=}, {expected=}, {actual=}"
 
 
+def test_potcar_summary_stats_cache(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    # the on-disk cache is opt-in
+    monkeypatch.delitem(SETTINGS, "PMG_CACHE_DIR", raising=False)
+    monkeypatch.setattr("pymatgen.io.vasp.inputs._POTCAR_SUMMARY_STATS_CACHE", {})
+    monkeypatch.setenv("HOME", str(tmp_path))
+    _load_potcar_summary_stats_file.cache_clear()
+    _load_potcar_summary_stats()
+    PotcarSingle.from_file(f"{FAKE_POTCAR_DIR}/POT_GGA_PAW_PBE/POTCAR.Fe.gz")._data_summary_stats()
+    assert os.listdir(tmp_path) == []
+
+    monkeypatch.setitem(SETTINGS, "PMG_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("pymatgen.io.vasp.inputs._POTCAR_SUMMARY_STATS_CACHE", {})
+
+    # reference stats are decompressed once and persisted in the cache dir
+    _load_potcar_summary_stats_file.cache_clear()
+    ref_stats = _load_potcar_summary_stats()
+    assert ref_stats == loadfn(POTCAR_STATS_PATH)
+    assert _load_potcar_summary_stats() is ref_stats
+    assert any(file.startswith("potcar-summary-stats-") for file in os.listdir(tmp_path))
+
+    psp = PotcarSingle.from_file(f"{FAKE_POTCAR_DIR}/POT_GGA_PAW_PBE/POTCAR.Fe.gz")
+    cache_files = os.listdir(f"{tmp_path}/potcar-summary-stats")
+    assert cache_files == [f"{psp.md5_computed_file_hash}-v1.json"]
+
+    # new instances with the same contents reuse the stats, also across processes (on-disk cache)
+    data_summary_stats = psp._data_summary_stats()
+    assert PotcarSingle(psp.data)._data_summary_stats() is data_summary_stats
+    monkeypatch.setattr("pymatgen.io.vasp.inputs._POTCAR_SUMMARY_STATS_CACHE", {})
+    psp_from_disk = PotcarSingle(psp.data)
+    assert psp_from_disk._data_summary_stats() is not data_summary_stats
+    assert psp_from_disk._summary_stats == psp._summary_stats
+    assert psp_from_disk.is_valid
+
+
 def test_gen_potcar_summary_stats(monkeypatch: pytest.MonkeyPatch) -> None:
     assert set(_summ_stats) == set(PotcarSingle.functional_dir)
 
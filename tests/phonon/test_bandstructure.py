@@ -8,6 +8,7 @@ from pytest import approx
 
 from pymatgen.electronic_structure.bandstructure import Kpoint
 from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
+from pymatgen.util.serialization import from_binary, to_binary
 from pymatgen.util.testing import TEST_FILES_DIR, PymatgenTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/electronic_structure/bandstructure"
@@ -100,6 +101,16 @@ class TestPhononBandStructureSymmLine(PymatgenTest):
         self.assert_msonable(self.bs)
         self.assert_msonable(self.bs2)
 
+    def test_binary_round_trip(self):
+        for bs in (self.bs, self.bs2):
+            bs_loaded = from_binary(to_binary(bs, compress=True))
+            assert bs_loaded == bs
+            assert_array_equal(bs_loaded.bands, bs.bands)
+            assert_array_equal(bs_loaded.eigendisplacements, bs.eigendisplacements)
+            assert_array_equal(bs_loaded.qpoints.frac_coords, bs.qpoints.frac_coords)
+            assert bs_loaded.has_nac == bs.has_nac
+            assert bs_loaded.branches == bs.branches
+
     def test_write_methods(self):
         self.bs2.write_phononwebsite(f"{self.tmp_path}/test.json")
 
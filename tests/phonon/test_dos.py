@@ -8,6 +8,7 @@ import pytest
 from pytest import approx
 
 from pymatgen.core import Element
+from pymatgen.electronic_structure.dos import DosFingerprintMatrix
 from pymatgen.phonon.dos import CompletePhononDos, PhononDos
 from pymatgen.util.testing import TEST_FILES_DIR, PymatgenTest
 
@@ -57,6 +58,24 @@ class TestPhononDos(PymatgenTest):
         assert self.dos.entropy(300, structure=self.structure) == approx(75.08543723748751, abs=1e-4)
         assert self.dos.zero_point_energy(structure=self.structure) == approx(4847.462485708741, abs=1e-4)
 
+    def test_thermodynamic_functions_array(self):
+        temps = np.array([[0, 10], [300, 1000]])
+        properties = self.dos.thermodynamic_properties(temps, structure=self.structure)
+        assert set(properties) == {"cv", "entropy", "internal_energy", "helmholtz_free_energy"}
+        for name, values in properties.items():
+            assert values.shape == temps.shape
+            func = getattr(self.dos, name)
+            assert func(temps, structure=self.structure) == approx(values)
+            for temp, value in zip(temps.ravel(), values.ravel(), strict=True):
+                assert func(temp, structure=self.structure) == approx(value)
+
+        assert properties["cv"][1, 0] == approx(48.049366665412485, abs=1e-4)
+        # at 0 K there is only the zero point energy
+        assert properties["cv"][0, 0] == properties["entropy"][0, 0] == 0
+        zpe = self.dos.zero_point_energy(structure=self.structure)
+        assert properties["internal_energy"][0, 0] == properties["helmholtz_free_energy"][0, 0] == approx(zpe)
+        assert isinstance(self.dos.cv(300), float)
+
     def test_add(self):
         dos_2x = self.dos + self.dos
         assert dos_2x.frequencies == approx(self.dos.frequencies)
@@ -162,6 +181,16 @@ class TestPhononDos(PymatgenTest):
         similarity_index = self.dos.get_dos_fp_similarity(dos_fp, dos_fp2, col=1, metric="wasserstein")
         assert similarity_index == approx(0)
 
+    def test_dos_fp_matrix(self):
+        fps = [self.dos.get_dos_fp(min_f=-1, max_f=max_f, n_bins=56, normalize=True) for max_f in (4, 5, 6, 7)]
+        fp_matrix = DosFingerprintMatrix.from_fingerprints(fps)
+        indices, similarities = fp_matrix.get_top_k_similar(fps[2], k=2, chunk_size=3)
+        assert indices[0] == 2
+        assert similarities[0] == approx(1)
+        expected = [self.dos.get_dos_fp_similarity(fps[2], fp, col=1, metric="tanimoto") for fp in fps]
+        assert indices[1] == np.argsort(expected)[-2]
+        assert similarities[1] == approx(expected[indices[1]])
+
     def test_dos_fp_exceptions(self):
         dos_fp = self.dos.get_dos_fp(min_f=-1, max_f=5, n_bins=56, normalize=True)
         dos_fp2 = self.dos.get_dos_fp(min_f=-1, max_f=5, n_bins=56, normalize=True)
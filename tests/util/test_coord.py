@@ -228,6 +228,31 @@ class TestCoordUtils:
         dists = np.sum(vectors**2, axis=-1) ** 0.5
         assert_allclose(dists, expected_pbc, 3)
 
+    def test_pbc_shortest_vectors_batch(self):
+        rng = np.random.default_rng(42)
+        lattices = [
+            Lattice.from_parameters(8, 8, 4, 90, 76, 58),
+            Lattice.from_parameters(8, 8, 4, 90, 76, 58, pbc=(True, True, False)),
+            Lattice.hexagonal(3, 5),
+        ]
+        frac_coords1 = [rng.uniform(-1, 2, size=(n_sites, 3)) for n_sites in (4, 1, 7)]
+        frac_coords2 = [rng.uniform(-1, 2, size=(n_sites, 3)) for n_sites in (5, 3, 2)]
+        frac_coords1[1] = frac_coords1[1][0]  # a single coord
+
+        vectors, d2 = coord.pbc_shortest_vectors_batch(lattices, frac_coords1, frac_coords2, return_d2=True)
+        assert len(vectors) == len(d2) == 3
+        for idx, lattice in enumerate(lattices):
+            expected_vecs, expected_d2 = coord.pbc_shortest_vectors(
+                lattice, frac_coords1[idx], frac_coords2[idx], return_d2=True
+            )
+            assert vectors[idx].shape == expected_vecs.shape
+            assert_allclose(vectors[idx], expected_vecs, atol=1e-10)
+            assert_allclose(d2[idx], expected_d2, atol=1e-10)
+
+        assert coord.pbc_shortest_vectors_batch([], [], []) == []
+        with pytest.raises(ValueError, match="must have the same length"):
+            coord.pbc_shortest_vectors_batch(lattices, frac_coords1[:2], frac_coords2)
+
     def test_get_angle(self):
         v1 = (1, 0, 0)
         v2 = (1, 1, 1)
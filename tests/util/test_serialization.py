@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+from monty.json import MontyEncoder
+from monty.serialization import loadfn
+from numpy.testing import assert_array_equal
+
+from pymatgen.core import Lattice, Structure
+from pymatgen.core.trajectory import Trajectory
+from pymatgen.electronic_structure.core import Spin
+from pymatgen.electronic_structure.dos import CompleteDos
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+from pymatgen.io.vasp.outputs import Chgcar
+from pymatgen.util.serialization import encode_array, from_binary, to_binary
+from pymatgen.util.testing import TEST_FILES_DIR, VASP_OUT_DIR, PymatgenTest
+
+
+class TestSerialization(PymatgenTest):
+    def setUp(self):
+        self.struct = Structure(Lattice.cubic(3), ["Fe", "O"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+
+    def assert_round_trip(self, obj, compress: bool = False):
+        """Check that obj survives a binary round trip and give back the copy."""
+        obj_loaded = from_binary(to_binary(obj, compress=compress))
+        assert type(obj_loaded) is type(obj)
+        assert json.dumps(obj_loaded.as_dict(), cls=MontyEncoder) == json.dumps(obj.as_dict(), cls=MontyEncoder)
+        return obj_loaded
+
+    def test_encode_array(self):
+        array = np.arange(6).reshape(2, 3)
+        assert encode_array(array) == [[0, 1, 2], [3, 4, 5]]
+        assert encode_array(array, array_mode="numpy") is array
+        assert isinstance(encode_array([1.0, 2.0], array_mode="numpy"), np.ndarray)
+        with pytest.raises(ValueError, match="Invalid array_mode='bytes', must be 'list' or 'numpy'"):
+            encode_array(array, array_mode="bytes")
+
+    def test_complete_dos(self):
+        dos = CompleteDos.from_dict(loadfn(f"{TEST_FILES_DIR}/electronic_structure/dos/complete_dos.json"))
+        assert isinstance(dos.as_dict(array_mode="numpy")["energies"], np.ndarray)
+        dos_loaded = self.assert_round_trip(dos)
+        assert isinstance(dos_loaded, CompleteDos)
+        site = dos.structure[0]
+        assert_array_equal(dos_loaded.get_site_dos(site).densities[Spin.up], dos.get_site_dos(site).densities[Spin.up])
+
+    def test_trajectory(self):
+        structures = [self.struct.copy() for _ in range(5)]
+        for idx, struct in enumerate(structures):
+            struct.perturb(0.01 * idx, min_distance=0.005 * idx)
+        traj = Trajectory.from_structures(structures, constant_lattice=False)
+        traj_loaded = self.assert_round_trip(traj, compress=True)
+        assert_array_equal(traj_loaded.coords, traj.coords)
+        assert_array_equal(traj_loaded.lattice, traj.lattice)
+        assert traj_loaded.get_structure(3) == traj.get_structure(3)
+
+    def test_chgcar(self):
+        chgcar = Chgcar.from_file(f"{VASP_OUT_DIR}/CHGCAR.spin.gz")
+        chgcar_loaded = from_binary(to_binary(chgcar))
+        assert isinstance(chgcar_loaded, Chgcar)
+        assert chgcar_loaded.structure == chgcar.structure
+        for key, data in chgcar.data.items():
+            assert_array_equal(chgcar_loaded.data[key], data)
+
+    def test_entry_without_array_mode(self):
+        # objects whose as_dict has no array_mode argument use their regular dict
+        entry = ComputedStructureEntry(
+            self.struct, -10.5, parameters={"run_type": "GGA"}, data={"forces": np.ones((2, 3))}, entry_id="mp-1"
+        )
+        entry_loaded = self.assert_round_trip(entry)
+        assert entry_loaded.structure == entry.structure
+        assert entry_loaded.energy == entry.energy
+
+    def test_from_file(self):
+        traj = Trajectory.from_structures([self.struct, self.struct], constant_lattice=True)
+        path = f"{self.tmp_path}/traj.npz"
+        with open(path, mode="wb") as file:
+            file.write(to_binary(traj))
+        assert_array_equal(from_binary(path).coords, traj.coords)